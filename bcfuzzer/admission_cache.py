@@ -0,0 +1,265 @@
+"""Cross-campaign admission verdicts, keyed by config content.
+
+`MeiState` is per campaign and keyed by (item, rule, normalized value), so
+every campaign relearned from zero that chainmaker `net.seeds` reordered
+does not boot, or that geth `PriceBump=1e6` boots fine — each lesson paid
+for with a restart and a 30-120 s admission probe.  An AdmissionCache is a
+shared append-only file (one JSON line per observed verdict) keyed by
+
+    sha256(target + binary content hash + probe context
+           + name and sha256 of every materialized config file)
+
+i.e. by what the node actually booted, after sanitizing, on which build.
+A line carries the verdict, the probe latency, a log excerpt for
+rejections and the (item, rule, value) mutations the files held.
+Campaigns use it twice:
+
+  - before a restart: a config whose every recorded verdict is a
+    rejection is skipped like a pre-admission prediction (preadmission.py;
+    one in `sample_every` still goes live and refreshes the entry, so a
+    verdict that came from a flaky probe cannot stick);
+  - at the start of a fresh campaign: every unanimous entry for the same
+    target and binary is folded into the MEI, so item status starts where
+    the previous runs left it.
+
+Calibration records its preset nodes that came up, so the dangerous-legal
+presets are known admitted before the first fuzzing round.  A key whose
+verdicts disagree is never used.  Other processes' appends (launcher legs)
+are picked up on every lookup.  The probe context separates probes that
+test different things (geth's producer must also seal blocks).
+
+Appends hold a shared flock on a `<file>.lock` sidecar and a load-time
+compaction holds it exclusively, so no line is lost in the swap; a reader
+whose file was swapped under it (new inode, or shorter than its offset)
+re-reads it from the start.
+
+Set BCFZ_ADMISSION_CACHE (bcfuzzer_campaign.py --admission-cache) to a
+file path to enable.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import fcntl
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any
+
+from .common import json_line, parse_json_line
+from .preadmission import SAMPLE_EVERY, live_sample
+from .snapshot import file_digest
+
+CACHE_ENV = "BCFZ_ADMISSION_CACHE"
+EXCERPT_LINES = 8
+EXCERPT_BYTES = 1024
+COMPACT_RATIO = 4               # lines per key before a load rewrites
+
+
+def binary_digest(identity: dict) -> str:
+    """Content hash of a network's binaries (its snapshot_identity())."""
+    digest = hashlib.sha256()
+    for binary in identity.get("binaries", []):
+        digest.update(file_digest(Path(binary)).encode())
+    return digest.hexdigest()[:32]
+
+
+def config_key(target: str, binary: str, context: str,
+               files: list[Path]) -> str | None:
+    """Cache key of a node's materialized config (None: nothing on disk)."""
+    material = []
+    for path in sorted(files, key=lambda p: p.name):
+        try:
+            data = Path(path).read_bytes()
+        except OSError:
+            return None
+        material.append([path.name, hashlib.sha256(data).hexdigest()])
+    if not material:
+        return None
+    return hashlib.sha256(json.dumps(
+        [target, binary, context, material]).encode()).hexdigest()
+
+
+def log_excerpt(net, index: int) -> str:
+    """Tail of node `index`'s newest log (networks with log_files)."""
+    log_files = getattr(net, "log_files", None)
+    if log_files is None:
+        return ""
+    try:
+        files = log_files(index)
+        if not files:
+            return ""
+        with Path(files[-1]).open("rb") as fh:
+            fh.seek(0, os.SEEK_END)
+            fh.seek(max(0, fh.tell() - EXCERPT_BYTES * 4))
+            text = fh.read().decode("utf-8", errors="replace")
+    except OSError:
+        return ""
+    return "\n".join(text.splitlines()[-EXCERPT_LINES:])[-EXCERPT_BYTES:]
+
+
+class AdmissionCache:
+    """One shared verdict file; safe to use from the lanes' threads."""
+
+    def __init__(self, path: Path, sample_every: int = SAMPLE_EVERY) -> None:
+        self.path = Path(path)
+        self.sample_every = sample_every
+        self.entries: dict[str, dict[str, Any]] = {}
+        self.stats = {"hits": 0, "misses": 0, "skipped": 0, "sampled": 0,
+                      "recorded": 0, "warmed": 0}
+        self._ident: tuple[int, int] | None = None
+        self._offset = 0
+        self._lines = 0
+        self._lock = threading.Lock()
+        self._refresh()
+        if self._lines > COMPACT_RATIO * max(len(self.entries), 256):
+            with self._file_lock(fcntl.LOCK_EX):
+                self._refresh()
+                self._compact()
+
+    @classmethod
+    def from_env(cls) -> "AdmissionCache | None":
+        path = os.environ.get(CACHE_ENV)
+        return cls(Path(path)) if path else None
+
+    # --------------------------------------------------------------- file
+
+    @contextlib.contextmanager
+    def _file_lock(self, mode: int):
+        """Shared (appends) or exclusive (compaction) lock across
+        processes, on a sidecar that compaction never replaces."""
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        lock_path = self.path.with_suffix(self.path.suffix + ".lock")
+        with lock_path.open("a") as fh:
+            fcntl.flock(fh, mode)
+            try:
+                yield
+            finally:
+                fcntl.flock(fh, fcntl.LOCK_UN)
+
+    def _refresh(self) -> None:
+        """Fold in lines appended since the last read (ours or another
+        process's); a torn last line is left for the next refresh.  A file
+        another process compacted is read again from the start."""
+        try:
+            st = self.path.stat()
+        except OSError:
+            return
+        ident = (st.st_dev, st.st_ino)
+        if ident != self._ident or st.st_size < self._offset:
+            self._ident = ident
+            self._offset = self._lines = 0
+            self.entries.clear()
+        if st.st_size <= self._offset:
+            return
+        with self.path.open("rb") as fh:
+            fh.seek(self._offset)
+            for raw in fh:
+                if not raw.endswith(b"\n"):
+                    break
+                self._offset += len(raw)
+                try:
+                    line = parse_json_line(raw.decode("utf-8"))
+                except ValueError:
+                    continue
+                self._fold(line)
+                self._lines += 1
+
+    def _fold(self, line: dict[str, Any]) -> None:
+        entry = self.entries.setdefault(line["key"], {
+            "target": line.get("target"), "binary": line.get("binary"),
+            "context": line.get("context"), "ops": line.get("ops", []),
+            "admitted": 0, "rejected": 0})
+        verdict = "admitted" if line.get("admitted") else "rejected"
+        entry[verdict] += line.get("count", 1)
+        for field in ("latency", "excerpt", "at"):
+            if line.get(field) is not None:
+                entry[field] = line[field]
+
+    def _compact(self) -> None:
+        """Rewrite the file as one line per key and verdict (under the
+        exclusive file lock, after a final refresh)."""
+        tmp = self.path.with_suffix(self.path.suffix + ".tmp")
+        with tmp.open("w", encoding="utf-8") as fh:
+            for key, entry in self.entries.items():
+                for verdict in ("admitted", "rejected"):
+                    if entry[verdict]:
+                        fh.write(json_line(
+                            {"key": key, **{k: v for k, v in entry.items()
+                                            if k not in ("admitted",
+                                                         "rejected")},
+                             "admitted": verdict == "admitted",
+                             "count": entry[verdict]}))
+        tmp.replace(self.path)
+        st = self.path.stat()
+        self._ident = (st.st_dev, st.st_ino)
+        self._offset = st.st_size
+        self._lines = sum(bool(e["admitted"]) + bool(e["rejected"])
+                          for e in self.entries.values())
+
+    # ------------------------------------------------------------ verdicts
+
+    def verdict(self, key: str | None) -> dict[str, Any] | None:
+        """The entry for `key` when all its verdicts agree."""
+        if key is None:
+            return None
+        with self._lock:
+            self._refresh()         # one stat() unless someone appended
+            entry = self.entries.get(key)
+            if entry is None or (entry["admitted"] and entry["rejected"]):
+                self.stats["misses"] += 1
+                return None
+            self.stats["hits"] += 1
+            return entry
+
+    def rejection(self, key: str | None, round_id: int,
+                  node: int) -> dict[str, Any] | None:
+        """A prediction (campaign.preadmit's shape) for a config known to
+        be rejected; None when it is not, or unknown."""
+        entry = self.verdict(key)
+        if entry is None or entry["admitted"]:
+            return None
+        sampled = live_sample(round_id, node, self.sample_every)
+        with self._lock:
+            self.stats["sampled" if sampled else "skipped"] += 1
+        excerpt = (entry.get("excerpt") or "").strip().splitlines()
+        return {"reason": "cached rejection"
+                          + (f": {excerpt[-1]}" if excerpt else ""),
+                "sampled": sampled, "source": "cache"}
+
+    def record(self, key: str | None, admitted: bool, *, target: str,
+               binary: str, context: str, ops: list, latency: float,
+               excerpt: str = "") -> None:
+        if key is None:
+            return
+        line = {"key": key, "target": target, "binary": binary,
+                "context": context, "ops": ops, "admitted": bool(admitted),
+                "latency": round(latency, 3), "at": round(time.time())}
+        if not admitted and excerpt:
+            line["excerpt"] = excerpt
+        text = json_line(line)
+        with self._lock:
+            # one O_APPEND write per line: concurrent writers interleave
+            # whole lines, and the refresh folds ours in with theirs
+            with self._file_lock(fcntl.LOCK_SH), \
+                    self.path.open("a", encoding="utf-8") as fh:
+                fh.write(text)
+            self._refresh()
+            self.stats["recorded"] += 1
+
+    def known(self, target: str, binary: str) -> list[dict[str, Any]]:
+        """Unanimous entries for one target build (MEI warm start)."""
+        with self._lock:
+            self._refresh()
+            return [entry for entry in self.entries.values()
+                    if entry["target"] == target
+                    and entry["binary"] == binary
+                    and bool(entry["admitted"]) != bool(entry["rejected"])]
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {**self.stats, "path": str(self.path),
+                    "entries": len(self.entries)}
@@ -36,6 +36,9 @@ from .targets.geth_adapter import GethAdapter  # noqa: E402
 from .targets.fisco_adapter import FiscoAdapter  # noqa: E402
 from .targets.chainmaker_adapter import ChainMakerAdapter  # noqa: E402
 from .targets.aptos_adapter import AptosAdapter  # noqa: E402
+from .admission_cache import (  # noqa: E402
+    AdmissionCache, binary_digest, config_key)
+from .snapshot import SnapshotStore, provision  # noqa: E402
 
 # A geth calibration leg may need to run while another geth network (e.g.
 # the stage-G campaign, networkid 1337) is live: kill_stale_geth_processes
@@ -75,7 +78,7 @@ def _geth_setup(spec: CalibSpec, seed: int, controlled_config: Path,
     """Shared geth harness: 13 nodes, controlled producer with preset config."""
     from .targets.geth_net import GethNetwork
     net = GethNetwork(Path(f"/tmp/calib-geth-{seed}"), n_nodes=13)
-    net.setup()
+    provision(net, "geth", net.work, net.setup)
     ok = net.start_all({0: controlled_config}, {0}, log_dir)
     return net, ok
 
@@ -142,8 +145,8 @@ def _sync_all_verified(net, exclude: set[int], attempts: int = 3) -> dict:
                 results[i] = False
                 continue
             try:
-                results[i] = net.drive_beacon(
-                    i, "update", 8, head_hash, api_version="v3")
+                results[i] = net.engine(i).sync_to(
+                    head_hash, timeout=30)["status"] == "VALID"
             except Exception:
                 results[i] = False
     results["_heights"] = {i: net.height(i) for i in range(net.n)}
@@ -272,7 +275,7 @@ def _fisco_setup(spec: CalibSpec, seed: int, node_index: int = 0):
     from . import item_catalog as ic
     import random as _random
     net = FiscoNetwork(Path(f"/tmp/calib-fisco-{seed}"), n_nodes=13)
-    net.build()
+    provision(net, "fisco", net.runtime, net.build)
     genesis_preset = [(item, rule, value) for item, rule, value
                       in spec.preset if item in FISCO_GENESIS_ITEMS]
     if genesis_preset:
@@ -445,7 +448,7 @@ def verify_fs07(net, adapter: FiscoAdapter, obs: dict) -> tuple[bool, dict]:
 def _cm_setup(spec: CalibSpec, seed: int):
     from .targets.chainmaker_net import ChainMakerNetwork
     net = ChainMakerNetwork(Path(f"/tmp/calib-cm-{seed}"))
-    net.prepare()
+    provision(net, "chainmaker", net.runtime, net.prepare)
     if spec.chain_patch == "batch_pools":
         # PoC 06: the index-OOB verifier panic lives in the batch recovery
         # path — victims are batch-pool nodes, so ALL orgs run batch pools
@@ -536,7 +539,13 @@ def _aptos_setup(spec: CalibSpec, seed: int):
     from . import item_catalog as ic
     import random as _random
     net = AptosNetwork(Path(f"/tmp/calib-aptos-{seed}"), n_validators=13)
-    net.launch()
+    if SnapshotStore.from_env() is None:
+        net.launch()
+    else:
+        # the launched swarm is the template: stopped to freeze, restarted
+        provision(net, "aptos", net.runtime,
+                  lambda: (net.launch(), net.stop_all()), stage="warm")
+        net.start_all()
     if spec.preset:
         # node.yaml is read at (re)start; mutate then restart node 0 so the
         # preset takes effect (admission may legitimately fail for ap-12)
@@ -787,6 +796,21 @@ def _placement_for(spec: CalibSpec):
     }]})
 
 
+def _record_preset(spec: CalibSpec, net, files: list[Path],
+                   latency: float) -> None:
+    """A preset node that came up booted its config: an admitted verdict
+    for the shared admission cache (admission_cache.py).  A failed start
+    is not recorded — any of the 13 nodes may be the one that failed."""
+    cache = AdmissionCache.from_env()
+    if cache is None or not spec.preset:
+        return
+    binary = binary_digest(net.snapshot_identity())
+    cache.record(config_key(spec.target, binary, "calibration", files),
+                 True, target=spec.target, binary=binary,
+                 context="calibration",
+                 ops=[list(op) for op in spec.preset], latency=latency)
+
+
 def run_spec(spec: CalibSpec, seed: int, out_dir: Path) -> dict:
     import random
     from .oracle import BcbOracle
@@ -802,6 +826,7 @@ def run_spec(spec: CalibSpec, seed: int, out_dir: Path) -> dict:
         }[spec.bug]
     setup = SETUPS[spec.target]
     net = None
+    started = time.monotonic()
     try:
         if spec.target == "geth":
             from .targets.geth_net import GethNetwork
@@ -813,7 +838,7 @@ def run_spec(spec: CalibSpec, seed: int, out_dir: Path) -> dict:
             net = GethNetwork(work, n_nodes=13,
                               networkid=GETH_CALIB_NETWORKID,
                               kill_stale=GETH_CALIB_KILL_STALE)
-            net.setup()
+            provision(net, "geth", work, net.setup)
             ops = adapter.apply_mutations(
                 work / "node0", base, spec.preset,
                 __import__("bcfuzzer.item_catalog", fromlist=["catalog_for"]).catalog_for("geth"),
@@ -824,11 +849,17 @@ def run_spec(spec: CalibSpec, seed: int, out_dir: Path) -> dict:
                     "geth 13-node start_all failed: one or more nodes did "
                     "not come up — the 13-node calibration is invalid on "
                     "a degraded network")
+            _record_preset(spec, net, [target_cfg],
+                           time.monotonic() - started)
         else:
             # fisco/chainmaker/aptos setups apply spec.preset themselves
             # (after build, before start_all — genesis configs must carry
             # the preset at first launch)
             net, ok = setup(spec, seed)
+            if ok:
+                _record_preset(spec, net, adapter.pristine_files(
+                    net, 4 if spec.target == "chainmaker" else 0),
+                    time.monotonic() - started)
         # plan E: the oracle's own signal must fire, not just the
         # verifier's — baseline registered while the network is still
         # healthy, then observe after the bug has manifested
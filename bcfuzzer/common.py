@@ -149,6 +149,16 @@ def load_json(path: Path, default: Any = None) -> Any:
     return json.loads(path.read_text(encoding="utf-8"), object_hook=_json_hook)
 
 
+def json_line(obj: Any) -> str:
+    """One compact JSON line (journals), same encoding as save_json."""
+    return json.dumps(obj, separators=(",", ":"),
+                      default=_json_default) + "\n"
+
+
+def parse_json_line(line: str) -> Any:
+    return json.loads(line, object_hook=_json_hook)
+
+
 def stable_hash(text: str) -> str:
     import hashlib
     return hashlib.sha256(text.encode("utf-8")).hexdigest()[:16]
@@ -14,6 +14,8 @@ Protocol-message-level seeds targeting the controlled node directly:
   geth:       fake-beacon drive variants (mode / rounds / period) against
               the controlled node's engine port.
   aptos:      malformed BCS transactions against the controlled API.
+  sim:        malformed messages the model node rejects (engine overhead
+              only; no planted fault behind them).
 """
 
 from __future__ import annotations
@@ -117,12 +119,22 @@ def aptos_m_seeds() -> list[Seed]:
     ]
 
 
+def sim_m_seeds() -> list[Seed]:
+    return [
+        Seed(seed_id="sim-m-malformed", corpus="M", role="controlled",
+             target="sim",
+             payload={"kind": "malformed", "count": 4},
+             bug_tags=[]),
+    ]
+
+
 def corpus_m(target: str) -> list[Seed]:
     builders = {
         "geth": geth_m_seeds,
         "fisco": fisco_m_seeds,
         "chainmaker": chainmaker_m_seeds,
         "aptos": aptos_m_seeds,
+        "sim": sim_m_seeds,
     }
     if target not in builders:
         raise ValueError(f"unknown target: {target}")
@@ -14,6 +14,7 @@ Seeds are the PoC-verified workload shapes:
               65-zero-byte bad-signature tx (#5)
   chainmaker: cmc contract invoke wave
   aptos:      signed transfer wave / malformed BCS probes
+  sim:        transfer wave / batch wave on a batch-pool leader (sim-03)
 """
 
 from __future__ import annotations
@@ -112,12 +113,27 @@ def aptos_t_seeds() -> list[Seed]:
     ]
 
 
+def sim_t_seeds() -> list[Seed]:
+    return [
+        Seed(seed_id="sim-t-transfer-wave", corpus="T", role="normal",
+             target="sim",
+             payload={"kind": "transfer_wave", "count": 30},
+             bug_tags=[]),
+        Seed(seed_id="sim-t-batch-wave", corpus="T", role="controlled",
+             target="sim",
+             payload={"kind": "batch_wave", "count": 120},
+             preconditions={"config": "verifier.pool_type=batch"},
+             bug_tags=["sim-03"]),
+    ]
+
+
 def corpus_t(target: str) -> list[Seed]:
     builders = {
         "geth": geth_t_seeds,
         "fisco": fisco_t_seeds,
         "chainmaker": chainmaker_t_seeds,
         "aptos": aptos_t_seeds,
+        "sim": sim_t_seeds,
     }
     if target not in builders:
         raise ValueError(f"unknown target: {target}")
@@ -7,7 +7,9 @@ fisco min_seal_time 60000); the campaign exempts those exact keys so the
 values reach the running node.
 
 Bug tags refer to the paper's Table 1 BCBs: cm-01..03 (ChainMaker),
-fs-04..07 (FISCO-BCOS), ge-08..09 (geth), ap-10..12 (Aptos).
+fs-04..07 (FISCO-BCOS), ge-08..09 (geth), ap-10..12 (Aptos).  The `sim`
+catalog drives the in-process model network (targets/sim_net.py); its
+sim-01..03 tags name the model's planted faults, not real bugs.
 """
 
 from __future__ import annotations
@@ -144,6 +146,42 @@ APTOS_ITEMS: list[ItemSpec] = [
              default=4, bounds=(1, 128)),
 ]
 
+# --------------------------------------------------------------------------
+# sim — in-process model network (targets/sim_net.py), config.ini per node.
+# Admission is derived from this catalog: a value outside `bounds`/`enum`
+# is rejected at node start, like a real node's config validation.
+# --------------------------------------------------------------------------
+
+SIM_ITEMS: list[ItemSpec] = [
+    ItemSpec(path="consensus.block_interval_ms", kind="int", file="config.ini",
+             default=1000, bounds=(1, 600_000),
+             dangerous_legal=[60_000],
+             bug_tags=["sim-01"],
+             cross_constraint="leader waits the interval before sealing; "
+                              ">= 60 s stalls the chain while it leads"),
+    ItemSpec(path="miner.gas_ceil", kind="int", file="config.ini",
+             default=30_000_000, bounds=(0, 4_000_000_000),
+             dangerous_legal=[5_000],
+             bug_tags=["sim-02"],
+             cross_constraint="gas limit recovers at most parent/1024 per block"),
+    ItemSpec(path="verifier.pool_type", kind="enum", file="config.ini",
+             default="normal", enum=["normal", "batch"],
+             dangerous_legal=["batch"],
+             bug_tags=["sim-03"],
+             cross_constraint="batch wave on the leader panics the verifiers"),
+    ItemSpec(path="txpool.limit", kind="int", file="config.ini",
+             default=8000, bounds=(1, 1_000_000)),
+    ItemSpec(path="txpool.lifetime_sec", kind="int", file="config.ini",
+             default=300, bounds=(1, 86_400)),
+    ItemSpec(path="p2p.max_peers", kind="int", file="config.ini",
+             default=50, bounds=(1, 1_000),
+             cross_constraint="fewer than 2 peers: the node never rejoins"),
+    ItemSpec(path="rpc.enabled", kind="bool", file="config.ini",
+             default=True),
+    ItemSpec(path="sync.tree_width", kind="int", file="config.ini",
+             default=2, bounds=(1, 256)),
+]
+
 # --------------------------------------------------------------------------
 # Registry
 # --------------------------------------------------------------------------
@@ -153,6 +191,7 @@ CATALOGS: dict[str, list[ItemSpec]] = {
     "chainmaker": CHAINMAKER_ITEMS,
     "fisco": FISCO_ITEMS,
     "aptos": APTOS_ITEMS,
+    "sim": SIM_ITEMS,
 }
 
 
@@ -0,0 +1,144 @@
+"""Run the per-target campaign legs concurrently (run_campaign.sh driver).
+
+Each leg is one `bcfuzzer_campaign.py --target <t>` process.  Legs are
+admitted in order through a ResourcePool: a leg starts once its CPU/memory
+reservation fits next to the legs already running, with its own port
+offset (--port-offset) and scratch root (BCFZ_SCRATCH/TMPDIR).  Starts are
+staggered so two 13-node boots never overlap their first minute.
+
+  python3 -m bcfuzzer.launcher --output /tmp/bcfz-campaign --minutes 360
+
+Layout under --output: <target>/ and <target>.log exactly as the serial
+script wrote them, plus launcher.json (per-leg lease, exit code, wall time).
+"""
+
+from __future__ import annotations
+
+import argparse
+import os
+import shutil
+import subprocess
+import sys
+import threading
+import time
+from pathlib import Path
+
+from .common import save_json
+from .resources import LEG_COST, RESOURCE_ENV, ResourcePool
+
+ROOT = Path(__file__).resolve().parent.parent
+LEGS = ("geth", "fisco", "aptos", "chainmaker")
+BOOT_STAGGER_SEC = 60.0
+
+
+def _leg_argv(target: str, out: Path, args: argparse.Namespace,
+              port_offset: int) -> list[str]:
+    argv = [sys.executable, "-u", str(ROOT / "bcfuzzer_campaign.py"),
+            "--target", target, "--output", str(out / target),
+            "--nodes", str(args.nodes), "--controlled", str(args.controlled),
+            "--budget-minutes", str(args.minutes), "--seed", str(args.seed),
+            "--port-offset", str(port_offset),
+            "--instances", str(args.instances)]
+    if args.snapshot_dir is not None:
+        argv += ["--snapshot-dir", str(args.snapshot_dir)]
+    return argv
+
+
+def run_legs(targets: list[str], args: argparse.Namespace,
+             pool: ResourcePool | None = None) -> dict:
+    pool = pool or ResourcePool()
+    out = Path(args.output)
+    out.mkdir(parents=True, exist_ok=True)
+    t0 = time.monotonic()
+    legs: dict[str, dict] = {}
+    threads: list[threading.Thread] = []
+
+    def run(target: str, lease) -> None:
+        log = out / f"{target}.log"
+        record = legs[target]
+        try:
+            with log.open("w", encoding="utf-8") as fh:
+                proc = subprocess.run(
+                    _leg_argv(target, out, args, lease.port_offset),
+                    cwd=ROOT, stdout=fh, stderr=subprocess.STDOUT,
+                    env={**os.environ, **lease.env(),
+                         RESOURCE_ENV: str(pool.root)})
+            record["exit"] = proc.returncode
+        finally:
+            record["wall_sec"] = round(time.monotonic() - record["_t0"], 1)
+            pool.release(lease)
+            with log.open("a", encoding="utf-8") as fh:
+                fh.write(f"{target} exit={record.get('exit')} "
+                         f"{time.strftime('%F %H:%M:%S')}\n")
+
+    last_start = None
+    for target in targets:
+        shutil.rmtree(out / target, ignore_errors=True)
+        (out / f"{target}.log").unlink(missing_ok=True)
+        if last_start is not None:
+            time.sleep(max(0.0, args.stagger - (time.monotonic() - last_start)))
+        waited = time.monotonic()
+        lease = pool.acquire(f"{args.seed}-{target}", target, args.nodes,
+                             scratch_base=out / "scratch",
+                             instances=args.instances)
+        print(f"=== {time.strftime('%F %H:%M:%S')} {target} admitted "
+              f"(waited {time.monotonic() - waited:.0f}s, "
+              f"port_offset={lease.port_offset}, "
+              f"reserve={lease.cores:g} cores/{lease.mem_gib:g} GiB) ===",
+              flush=True)
+        legs[target] = {"port_offset": lease.port_offset,
+                        "scratch": lease.scratch,
+                        "admitted_after_sec": round(
+                            time.monotonic() - t0, 1),
+                        "_t0": time.monotonic()}
+        thread = threading.Thread(target=run, args=(target, lease),
+                                  name=f"leg-{target}")
+        thread.start()
+        threads.append(thread)
+        last_start = time.monotonic()
+    for thread in threads:
+        thread.join()
+    for record in legs.values():
+        record.pop("_t0", None)
+    summary = {"targets": targets, "legs": legs,
+               "wall_sec": round(time.monotonic() - t0, 1),
+               "serial_sec": round(sum(r.get("wall_sec", 0.0)
+                                       for r in legs.values()), 1)}
+    save_json(out / "launcher.json", summary)
+    return summary
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--output", required=True, type=Path)
+    parser.add_argument("--targets", default=",".join(LEGS))
+    parser.add_argument("--minutes", type=int, default=360)
+    parser.add_argument("--seed", type=int, default=42)
+    parser.add_argument("--nodes", type=int, default=13)
+    parser.add_argument("--controlled", type=int, default=4)
+    parser.add_argument("--stagger", type=float, default=BOOT_STAGGER_SEC,
+                        help="minimum seconds between two leg starts")
+    parser.add_argument("--snapshot-dir", type=Path, default=None)
+    parser.add_argument("--instances", type=int, default=1,
+                        help="network instances per leg (each reserves one "
+                             "leg cost and port block)")
+    parser.add_argument("--leg-cost", action="append", default=[],
+                        metavar="TARGET=CORES:GIB",
+                        help=f"override a leg reservation (default {LEG_COST})")
+    args = parser.parse_args()
+    costs = {}
+    for spec in args.leg_cost:
+        target, _, value = spec.partition("=")
+        cores, _, mem = value.partition(":")
+        costs[target] = (float(cores), float(mem))
+    targets = [t.strip() for t in args.targets.split(",") if t.strip()]
+    summary = run_legs(targets, args, ResourcePool(costs=costs))
+    print(f"=== {time.strftime('%F %H:%M:%S')} ALL DONE "
+          f"wall={summary['wall_sec']:.0f}s "
+          f"(serial sum {summary['serial_sec']:.0f}s) ===", flush=True)
+    return 0 if all(leg.get("exit") == 0 for leg in summary["legs"].values()) \
+        else 1
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
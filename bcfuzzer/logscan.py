@@ -0,0 +1,86 @@
+"""Compiled multi-signature log scanner shared by the log tails (design §3.4).
+
+Every signature the oracle keys off — the PANIC_SIGNAL_MAP fragments, the
+adapters' PANIC_SIGNATURES / NODE_LOG_SIGNATURES, fisco's view-change
+markers and the consensusTimeout=(\\d+) capture — is compiled once per
+target into a LogScanner, and one scan() call over a chunk of new bytes
+returns every count and every captured value together.
+
+Matching strategy (benchmarks/bench_logscan.py, 1 GiB synthetic log, 19
+signatures): under CPython one combined alternation regex runs at ~58 MB/s
+and a C Aho-Corasick automaton (pyahocorasick) at ~59 MB/s, while
+str.count's fastsearch runs at ~2.3 GB/s per literal.  The scanner
+therefore keeps literal counting on fastsearch (~90 MB/s for all 19,
+against ~71 MB/s for the old read-and-count) and compiles the
+*containment* structure instead: a signature that contains another
+registered signature ("index out of range [1" ⊃ "index out of range",
+"propose timeout" ⊃ "timeout") is only counted when its base occurred in
+the chunk.  On healthy logs almost every base count is 0 and the
+dependent signatures cost nothing; counts stay exact.
+"""
+
+from __future__ import annotations
+
+import re
+from collections import Counter
+from typing import Iterable
+
+from .oracle import PANIC_SIGNAL_MAP
+
+
+class LogScanner:
+    """Counts `patterns` (plain substrings, non-overlapping occurrences as
+    str.count) and collects the distinct group-1 values of `captures`."""
+
+    def __init__(self, patterns: Iterable[str] = (),
+                 captures: dict[str, str] | None = None) -> None:
+        self.patterns: list[str] = list(dict.fromkeys(p for p in patterns if p))
+        self.capture_rx = {name: re.compile(rx)
+                           for name, rx in (captures or {}).items()}
+        # shortest-first, each pattern linked to the longest registered
+        # pattern it contains (its gate); bases are always counted first
+        plan: list[tuple[str, str | None]] = []
+        for pattern in sorted(self.patterns, key=len):
+            bases = [p for p, _ in plan if p in pattern]
+            plan.append((pattern, max(bases, key=len) if bases else None))
+        self._plan = plan
+
+    def with_pattern(self, pattern: str) -> "LogScanner":
+        return LogScanner(self.patterns + [pattern],
+                          {n: rx.pattern for n, rx in self.capture_rx.items()})
+
+    def scan(self, text: str, counts: Counter | None = None,
+             captures: dict[str, set[str]] | None = None
+             ) -> tuple[Counter, dict[str, set[str]]]:
+        """Fold one chunk into `counts`/`captures` (fresh ones if None)."""
+        counts = Counter() if counts is None else counts
+        captures = {} if captures is None else captures
+        hits: dict[str, int] = {}
+        for pattern, base in self._plan:
+            if base is not None and not hits[base]:
+                hits[pattern] = 0
+                continue
+            hits[pattern] = n = text.count(pattern)
+            if n:
+                counts[pattern] += n
+        for name, rx in self.capture_rx.items():
+            found = rx.findall(text)
+            if found:
+                captures.setdefault(name, set()).update(found)
+        return counts, captures
+
+
+_SCANNERS: dict[tuple, LogScanner] = {}
+
+
+def scanner_for(target: str, patterns: Iterable[str] = (),
+                captures: dict[str, str] | None = None) -> LogScanner:
+    """The target's scanner: its PANIC_SIGNAL_MAP fragments plus the
+    caller's signatures, compiled once per distinct signature set."""
+    merged = tuple(dict.fromkeys(
+        [*patterns, *PANIC_SIGNAL_MAP.get(target, {})]))
+    key = (target, merged, tuple(sorted((captures or {}).items())))
+    scanner = _SCANNERS.get(key)
+    if scanner is None:
+        scanner = _SCANNERS.setdefault(key, LogScanner(merged, captures))
+    return scanner
@@ -12,10 +12,28 @@ resulting configuration survived admission:
 network and feeds the verdict back here, so MEI state and observed behavior
 cannot drift apart (the upstream prototype's stale-set bug, fixed per the
 revised design).
+
+Indexes.  The scheduler queries the MEI several times per controlled node
+per round, and auto-extracted catalogs run to thousands of keys, so every
+query is answered from indexes kept current by `record_admission` instead
+of rescanning the catalog:
+
+  - per-item status and a hashed (rule, value) set behind `valid`, so the
+    admitted-pair dedup and `status` are O(1);
+  - per catalog (`_CatalogIndex`, built once per catalog object): live
+    status counters, a lazy min-heap of (explored count, path) for the
+    least-explored pick, and the inconsistent items in catalog order for
+    the fuzzing pick — O(log n) per query, same results and same
+    tie-breaking as the scans they replace.
+
+`valid`/`invalid`/`explored` stay the persisted source of truth; the
+indexes are rebuilt from them on construction and load.
 """
 
 from __future__ import annotations
 
+import heapq
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any
@@ -24,6 +42,59 @@ from .common import ItemSpec, load_json, save_json
 
 CONSISTENT_THRESHOLD = 10      # rejected times with zero admission
 INCONSISTENT_THRESHOLD = 1     # one admission is enough
+STATUSES = ("consistent", "inconsistent", "unexplored")
+
+
+class _CatalogIndex:
+    """Status counters, least-explored heap and ordered inconsistent list
+    for one catalog.  The heap is lazy: a bump pushes a fresh entry and
+    stale ones (count no longer current) are dropped when they surface."""
+
+    def __init__(self, catalog: list[ItemSpec], mei: "MeiState") -> None:
+        self.catalog = catalog
+        self.size = len(catalog)
+        self.items: dict[str, ItemSpec] = {}
+        self.positions: dict[str, list[int]] = {}
+        for index, item in enumerate(catalog):
+            # first occurrence wins, as it does for min() over the catalog
+            self.items.setdefault(item.path, item)
+            self.positions.setdefault(item.path, []).append(index)
+        self.counts = dict.fromkeys(STATUSES, 0)
+        self.inconsistent: list[int] = []
+        for index, item in enumerate(catalog):
+            status = mei.status(item)
+            self.counts[status] += 1
+            if status == "inconsistent":
+                self.inconsistent.append(index)
+        self.inconsistent_items = [catalog[i] for i in self.inconsistent]
+        self.heap = [(mei.explored_count_of(path), path)
+                     for path in self.items]
+        heapq.heapify(self.heap)
+
+    def explored(self, mei: "MeiState", path: str, count: int) -> None:
+        if path not in self.items:
+            return
+        heapq.heappush(self.heap, (count, path))
+        if len(self.heap) > 4 * len(self.items) + 64:
+            self.heap = [(mei.explored_count_of(p), p) for p in self.items]
+            heapq.heapify(self.heap)
+
+    def moved(self, path: str, before: str, after: str) -> None:
+        """An item changed status; happens at most twice per item."""
+        for index in self.positions.get(path, ()):
+            self.counts[before] -= 1
+            self.counts[after] += 1
+            if after == "inconsistent":
+                at = bisect_left(self.inconsistent, index)
+                self.inconsistent.insert(at, index)
+                self.inconsistent_items.insert(at, self.catalog[index])
+
+    def least_explored(self, mei: "MeiState") -> ItemSpec:
+        while True:
+            count, path = self.heap[0]
+            if count == mei.explored_count_of(path):
+                return self.items[path]
+            heapq.heappop(self.heap)
 
 
 @dataclass
@@ -31,43 +102,110 @@ class MeiState:
     valid: dict[str, list[tuple[str, Any]]] = field(default_factory=dict)
     invalid: dict[str, dict[str, int]] = field(default_factory=dict)
     explored: dict[str, set[Any]] = field(default_factory=dict)
+    _valid_keys: dict[str, set[tuple[str, Any]]] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _status: dict[str, str] = field(
+        default_factory=dict, init=False, repr=False, compare=False)
+    _index: _CatalogIndex | None = field(
+        default=None, init=False, repr=False, compare=False)
 
-    # -- the only write path ------------------------------------------------
+    def __post_init__(self) -> None:
+        self._valid_keys = {
+            item_id: {(rule, self._norm(value)) for rule, value in pairs}
+            for item_id, pairs in self.valid.items()}
+        self._status = {}
+        for item_id in set(self.valid) | set(self.invalid):
+            status = self._classify(item_id)
+            if status != "unexplored":
+                self._status[item_id] = status
+        self._index = None
+
+    # -- the only write path (and its journal replay) ------------------------
 
     def record_admission(self, item: ItemSpec, rule: str, value: Any,
                          admitted: bool) -> None:
-        item_id = item.path
-        key = f"{rule}={self._norm(value)}"
+        self._record(item.path, rule, value, admitted)
+
+    def restore_admission(self, item_id: str, rule: str, value: Any,
+                          admitted: bool, rejected: int) -> None:
+        """Journal replay (journal.py): re-apply one admission whose
+        rejected count after the write was `rejected`.  Idempotent, so a
+        journal may be replayed over a snapshot that already holds it."""
+        self._record(item_id, rule, value, admitted, rejected)
+
+    def rejected_times(self, item_id: str, rule: str, value: Any) -> int:
+        return self.invalid.get(item_id, {}).get(
+            f"{rule}={self._norm(value)}", 0)
+
+    def _record(self, item_id: str, rule: str, value: Any, admitted: bool,
+                rejected: int | None = None) -> None:
+        norm = self._norm(value)
         if admitted:
             # valid keeps the exact (rule, value) pair so the fuzzing phase
             # can REPLAY the admitted mutation — storing the value alone
             # (the old format) lost the rule and made the exploit branch
             # re-wrap every op under rule="dangerous"
-            pairs = self.valid.setdefault(item_id, [])
-            if not any(r == rule and self._norm(v) == self._norm(value)
-                       for r, v in pairs):
-                pairs.append((rule, value))
+            keys = self._valid_keys.setdefault(item_id, set())
+            if (rule, norm) not in keys:
+                keys.add((rule, norm))
+                self.valid.setdefault(item_id, []).append((rule, value))
         else:
             counts = self.invalid.setdefault(item_id, {})
-            counts[key] = counts.get(key, 0) + 1
-        self.explored.setdefault(item_id, set()).add((rule, self._norm(value)))
+            key = f"{rule}={norm}"
+            counts[key] = counts.get(key, 0) + 1 if rejected is None \
+                else max(counts.get(key, 0), rejected)
+        explored = self.explored.setdefault(item_id, set())
+        if (rule, norm) not in explored:
+            explored.add((rule, norm))
+            if self._index is not None:
+                self._index.explored(self, item_id, len(explored))
+        before = self._status.get(item_id, "unexplored")
+        after = self._classify(item_id)
+        if after != before:
+            self._status[item_id] = after
+            if self._index is not None:
+                self._index.moved(item_id, before, after)
 
     # -- classification ------------------------------------------------------
 
-    def status(self, item: ItemSpec) -> str:
-        item_id = item.path
+    def _classify(self, item_id: str) -> str:
         if self.valid.get(item_id):
             return "inconsistent"
         if len(self.invalid.get(item_id, {})) >= CONSISTENT_THRESHOLD:
             return "consistent"
         return "unexplored"
 
+    def status(self, item: ItemSpec) -> str:
+        return self._status.get(item.path, "unexplored")
+
+    def _indexed(self, catalog: list[ItemSpec]) -> _CatalogIndex:
+        # one catalog per campaign: rebuilt only if another list (or the
+        # same list resized) is passed in
+        index = self._index
+        if index is None or index.catalog is not catalog \
+                or index.size != len(catalog):
+            index = self._index = _CatalogIndex(catalog, self)
+        return index
+
     def status_counts(self, target: str,
                       catalog: list[ItemSpec]) -> dict[str, int]:
-        counts = {"consistent": 0, "inconsistent": 0, "unexplored": 0}
-        for item in catalog:
-            counts[self.status(item)] += 1
-        return counts
+        return dict(self._indexed(catalog).counts)
+
+    def least_explored(self, catalog: list[ItemSpec]) -> ItemSpec:
+        """Catalog item with the fewest explored (rule, value) pairs, ties
+        broken by path — min() over (explored count, path)."""
+        return self._indexed(catalog).least_explored(self)
+
+    def inconsistent_items(self, catalog: list[ItemSpec]) -> list[ItemSpec]:
+        """Inconsistent items in catalog order (shared list: do not
+        mutate)."""
+        return self._indexed(catalog).inconsistent_items
+
+    def explored_count(self, item: ItemSpec) -> int:
+        return self.explored_count_of(item.path)
+
+    def explored_count_of(self, item_id: str) -> int:
+        return len(self.explored.get(item_id, ()))
 
     def rejected_count(self, item: ItemSpec) -> int:
         return len(self.invalid.get(item.path, {}))
@@ -0,0 +1,456 @@
+"""Minimize mode: delta-debug a BugReport down to the steps that trigger it.
+
+`BcbOracle.report` used to file every op of the round as the report's
+`minimized_ops`, unminimized — and the round's ops are often not even the
+cause: a durable signal fires PERSISTENCE_WINDOWS observations after its
+trigger (sim: the gas collapse reported in round 5 was armed by round 3's
+`miner.gas_ceil=5000`), and the stage-G fisco node5 deadlock followed
+three rounds of mutations, a restart_cycle and workloads with its
+attribution "noted as future work".  Minimization replays a report's
+history from the campaign's own records and shrinks it with ddmin:
+
+  - history: the report round and the `history` rounds before it on the
+    same lane (timeline.jsonl); every round is replayed, in order, on a
+    fresh network instance (NetSession, cloned from a warm template) with
+    a fresh oracle, then its last plan is re-run for up to `windows` more
+    observations while the signal has not fired;
+  - steps: what ddmin may drop — each (round, node, item, rule, value)
+    mutation, each submitted seed (round, seed id, target node) and each
+    sequence primitive the round ran.  A controlled node left without
+    mutations keeps its previous config, exactly as in the campaign;
+  - verdict: the trial reproduces when the oracle fires the report's
+    signal on the report's node.  A trial stops at its first
+    reproduction;
+  - parallel trials: the candidate subsets of one ddmin step run on
+    `workers` network slots (bcfuzzer_campaign.py --instances) at once,
+    each slot its own runtime and port block; the first candidate that
+    reproduces wins and the others stop after their current round.  Boots
+    are serial, as in boot_lanes;
+  - memo: trial outcomes are kept per history, so the sibling reports of
+    one network-wide failure (the same signal on every normal node)
+    reuse each other's trials.  They are keyed on the step sequence, not
+    the step set: a round often submits the same seed to the same node
+    twice, and `[A, X]` is not the trial `[A, A, X]`;
+  - broken trials: a trial that errors (boot failure, a round error) is
+    not a verdict and is run again, up to TRIAL_ATTEMPTS times.  One that
+    never completes counts as unresolved: ddmin keeps the candidate's
+    complement (nothing is dropped on its account), the record reports
+    `unresolved` trials, and a report whose full-history check is
+    unresolved gets status "trial error" and keeps its `verified`.
+
+The smallest reproducing set is written back: `minimized_ops` holds its
+mutations as applied by the last reproducing trial, `observed["minimized"]`
+all of its steps, `verified=True` and `repro` the command that re-checks
+it (minimizing an already verified report replays its set once).  A full
+history that does not reproduce leaves the report as it was with
+`verified=False`.  Results: minimize.json in the campaign directory, the
+reports in state/oracle.json.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import queue
+import random
+import shlex
+import shutil
+import threading
+import traceback
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+from dataclasses import asdict, dataclass
+from typing import Any, Callable
+
+from .common import BugReport, load_json, save_json
+from .oracle import PERSISTENCE_WINDOWS, BcbOracle
+from .resources import TARGET_PORTS, lane_offsets
+from .scheduler import NodePlan, RoundPlan
+from .snapshot import SnapshotStore
+
+HISTORY_ROUNDS = PERSISTENCE_WINDOWS - 1     # rounds before the report's
+EXTRA_WINDOWS = 2                            # re-runs of the last plan
+TRIAL_ATTEMPTS = 3                           # runs of a trial that errors
+
+
+@dataclass(frozen=True)
+class Step:
+    """One droppable element of a report's history."""
+
+    kind: str                 # op | seed | seq
+    round_id: int
+    name: str                 # item path | seed id | sequence primitive
+    node: int | None = None
+    rule: str = ""
+    value: str = ""           # JSON of the op's value (hashable)
+
+    def describe(self) -> str:
+        if self.kind == "op":
+            return (f"r{self.round_id} node{self.node} {self.rule}"
+                    f"({self.name} = {self.value})")
+        if self.kind == "seed":
+            return f"r{self.round_id} seed {self.name} -> node{self.node}"
+        return f"r{self.round_id} {self.name}"
+
+
+def ddmin(items: list, test: Callable[[list[list]], int | None]) -> list:
+    """Zeller's ddmin over `items`, which must reproduce.  `test` gets
+    every candidate subset of one step (the n chunks, then their
+    complements) and returns the index of one that reproduces, or None;
+    the result is 1-minimal."""
+    n = 2
+    while len(items) >= 2:
+        size = len(items)
+        bounds = [size * k // n for k in range(n + 1)]
+        chunks = [items[bounds[k]:bounds[k + 1]] for k in range(n)]
+        candidates = list(chunks)
+        if n > 2:
+            # with two chunks the complements are the chunks
+            candidates += [items[:bounds[k]] + items[bounds[k + 1]:]
+                           for k in range(n)]
+        hit = test(candidates)
+        if hit is not None and hit < n:
+            items, n = candidates[hit], 2
+        elif hit is not None:
+            items, n = candidates[hit], max(n - 1, 2)
+        elif n >= size:
+            break
+        else:
+            n = min(size, 2 * n)
+    return items
+
+
+def history_rows(rows: list[dict], report: BugReport,
+                 history: int) -> list[dict]:
+    """The timeline rows replayed for `report`: its round and up to
+    `history` earlier rounds of the same lane, oldest first."""
+    by_round = {row["round_id"]: row for row in rows
+                if not row.get("error")}
+    last = by_round.get(report.round_id)
+    if last is None:
+        return []
+    lane = last.get("lane", 0)
+    return [by_round[r] for r in range(report.round_id - history,
+                                       report.round_id + 1)
+            if r in by_round and by_round[r].get("lane", 0) == lane]
+
+
+def history_steps(campaign: Any, rows: list[dict]) -> list[Step]:
+    steps: list[Step] = []
+    for row in rows:
+        round_id = row["round_id"]
+        for node, ops in sorted(row.get("mutations", {}).items(),
+                                key=lambda kv: int(kv[0])):
+            for item_path, rule, value in ops:
+                steps.append(Step("op", round_id, item_path, int(node), rule,
+                                  json.dumps(value, sort_keys=True,
+                                             default=str)))
+        for seed in row.get("seeds", []):
+            if seed.get("seed_id"):
+                steps.append(Step("seed", round_id, seed["seed_id"],
+                                  seed.get("node")))
+        for name in campaign.round_sequences(round_id):
+            steps.append(Step("seq", round_id, name))
+    return steps
+
+
+def trial_key(rounds: list[int], steps: list[Step]) -> tuple:
+    """Memo key of one trial: its rounds and its steps in replay order,
+    repeated steps counted (ddmin candidates keep the history's order)."""
+    return tuple(rounds), tuple(steps)
+
+
+class Minimizer:
+    """Trials of one campaign's reports on `workers` network slots."""
+
+    def __init__(self, campaign: Any, rows: list[dict], workers: int = 1,
+                 history: int = HISTORY_ROUNDS,
+                 windows: int = EXTRA_WINDOWS,
+                 store: SnapshotStore | None = None) -> None:
+        self.campaign = campaign
+        self.rows = rows
+        self.workers = max(1, workers)
+        self.history = history
+        self.windows = windows
+        self.root = campaign.out_dir / "minimize"
+        self.store = store or SnapshotStore(self.root / "snapshots")
+        self.seeds = {seed.seed_id: seed for seed in campaign.seeds}
+        self.stats = {"trials": 0, "reproduced": 0, "stopped": 0,
+                      "memo_hits": 0, "errors": 0, "retries": 0,
+                      "unresolved": 0}
+        self._unresolved = 0        # of the report being minimized
+        self.offsets: list[int | None] = [campaign.port_offset]
+        if self.workers > 1:
+            self.offsets = lane_offsets(
+                TARGET_PORTS.get(campaign.target,
+                                 lambda n: [])(campaign.n_nodes),
+                campaign.port_offset or 0, self.workers)
+        self._slots: queue.Queue[int] = queue.Queue()
+        for slot in range(self.workers):
+            self._slots.put(slot)
+        self._boot_lock = threading.Lock()
+        self._lock = threading.Lock()
+        # trial_key(rounds, steps) -> {"failures", "complete", "ops"}
+        self._memo: dict[tuple, dict] = {}
+
+    # ------------------------------------------------------------- trials
+
+    def _plans(self, steps: list[Step], rounds: list[int]
+               ) -> list[tuple[RoundPlan, list, list[str]]]:
+        controlled = set(self.campaign.controlled)
+        plans = []
+        for round_id in rounds:
+            placements = [NodePlan(i, "fuzzing" if i in controlled
+                                   else "normal", "minimize")
+                          for i in range(self.campaign.n_nodes)]
+            plan = RoundPlan(round_id, placements, f"minimize-{round_id}")
+            picks, names = [], []
+            for step in steps:
+                if step.round_id != round_id:
+                    continue
+                if step.kind == "op":
+                    plan.placement_for(step.node).mutations.append(
+                        (step.name, step.rule, json.loads(step.value)))
+                elif step.kind == "seed" and step.name in self.seeds:
+                    # controlled-role seeds go to their node plan's node,
+                    # the others to the first normal node (run_seeds)
+                    owner = step.node if step.node in controlled \
+                        else self.campaign.controlled[0]
+                    picks.append((plan.placement_for(owner),
+                                  self.seeds[step.name]))
+                elif step.kind == "seq":
+                    names.append(step.name)
+            plans.append((plan, picks, names))
+        return plans
+
+    def _trial(self, steps: list[Step], rounds: list[int],
+               want: tuple[str, Any],
+               stop: threading.Event) -> dict | None:
+        """Replay `steps` on a fresh network; None when stopped early,
+        {"error": ...} when broken (no verdict either way)."""
+        campaign = self.campaign
+        slot = self._slots.get()
+        lanes: list = []
+        prefetcher = None
+        try:
+            with self._boot_lock:
+                if stop.is_set():
+                    return None
+                with self._lock:
+                    self.stats["trials"] += 1
+                adapter = type(campaign.adapter)(random.Random(
+                    campaign.seed * 1000 + 500 + slot))
+                oracle = BcbOracle(campaign.target, campaign.normal_nodes())
+                lane = campaign.boot_lane(
+                    slot, self.root / f"runtime-{slot}", self.offsets[slot],
+                    adapter, oracle, lanes, store=self.store)
+            prefetcher = campaign.make_prefetcher(
+                self.root / f"staging-{slot}", 900 + slot)
+            plans = self._plans(steps, rounds)
+            schedule = plans + [plans[-1]] * self.windows
+            seen: set[tuple[str, Any]] = set()
+            ops: list = []
+            for k, (plan, picks, names) in enumerate(schedule):
+                if stop.is_set():
+                    with self._lock:
+                        self.stats["stopped"] += 1
+                    return None
+                staged = prefetcher.materialize(plan) \
+                    if prefetcher is not None else None
+                record, effects = campaign.run_round(lane, plan, picks,
+                                                     staged, names)
+                if record.get("error"):
+                    raise RuntimeError(f"round {plan.round_id}: "
+                                       f"{record['error']}")
+                seen.update((f.signal, f.node) for f in effects["failures"])
+                if k < len(plans):
+                    ops.extend(effects["ops"])
+                if want in seen:
+                    with self._lock:
+                        self.stats["reproduced"] += 1
+                    return {"failures": seen, "complete": False, "ops": ops}
+            return {"failures": seen, "complete": True, "ops": ops}
+        except Exception as exc:
+            traceback.print_exc()
+            with self._lock:
+                self.stats["errors"] += 1
+            return {"error": f"{type(exc).__name__}: {exc}"}
+        finally:
+            for lane in lanes:
+                lane.session.teardown()
+            if prefetcher is not None:
+                prefetcher.close()
+            self._slots.put(slot)
+
+    def replay(self, steps: list[Step], rounds: list[int],
+               want: tuple[str, Any]) -> dict | None:
+        """One trial of `steps` on the first free slot (replay mode);
+        None when every attempt errored."""
+        for _ in range(TRIAL_ATTEMPTS):
+            outcome = self._trial(steps, rounds, want, threading.Event())
+            if outcome is not None and "error" not in outcome:
+                return outcome
+        return None
+
+    def _known(self, key: tuple, want: tuple[str, Any]) -> bool | None:
+        outcome = self._memo.get(key)
+        if outcome is None:
+            return None
+        if want in outcome["failures"]:
+            return True
+        return False if outcome["complete"] else None
+
+    def first_reproducing(self, candidates: list[list[Step]],
+                          rounds: list[int],
+                          want: tuple[str, Any]) -> int | None:
+        """Index of a candidate that reproduces `want` (None: none does,
+        or could not be told).  Known outcomes answer first; the rest run
+        concurrently, an errored trial runs again, and the first
+        reproduction stops the others."""
+        pending = []
+        for index, steps in enumerate(candidates):
+            key = trial_key(rounds, steps)
+            known = self._known(key, want)
+            if known is not None:
+                self.stats["memo_hits"] += 1
+            if known:
+                return index
+            if known is None:
+                pending.append((index, steps, key))
+        if not pending:
+            return None
+        stop = threading.Event()
+        hit = None
+        with ThreadPoolExecutor(max_workers=self.workers,
+                                thread_name_prefix="minimize") as pool:
+            futures = {pool.submit(self._trial, steps, rounds, want, stop):
+                       (index, steps, key, 1)
+                       for index, steps, key in pending}
+            while futures and hit is None:
+                done, _ = wait(futures, return_when=FIRST_COMPLETED)
+                for future in done:
+                    index, steps, key, attempt = futures.pop(future)
+                    outcome = future.result()
+                    if outcome is None or hit is not None:
+                        continue
+                    if "error" in outcome:
+                        if attempt < TRIAL_ATTEMPTS:
+                            self.stats["retries"] += 1
+                            futures[pool.submit(
+                                self._trial, steps, rounds, want, stop)] = \
+                                (index, steps, key, attempt + 1)
+                        else:
+                            self.stats["unresolved"] += 1
+                            self._unresolved += 1
+                        continue
+                    self._memo[key] = outcome
+                    if want in outcome["failures"]:
+                        hit = index
+                        stop.set()
+                        for other in futures:
+                            other.cancel()
+        return hit
+
+    # ------------------------------------------------------------ reports
+
+    def minimize(self, report: BugReport) -> dict:
+        want = (report.signal, report.observed.get("node"))
+        rows = history_rows(self.rows, report, self.history)
+        rounds = [row["round_id"] for row in rows]
+        steps = history_steps(self.campaign, rows)
+        summary = {"bug_id": report.bug_id, "signal": report.signal,
+                   "node": want[1], "rounds": rounds,
+                   "steps_before": len(steps)}
+        if not rows:
+            return {**summary, "status": "no timeline"}
+        self._unresolved = 0
+        previous = (report.observed.get("minimized") or {}).get("steps")
+        if report.verified and previous is not None:
+            kept = [Step(**step) for step in previous]
+            reproduced = self.first_reproducing([kept], rounds, want) == 0
+            if not reproduced and self._unresolved:
+                return {**summary, "status": "trial error",
+                        "verified": report.verified,
+                        "unresolved": self._unresolved}
+            report.verified = reproduced
+            return {**summary, "status": "rechecked",
+                    "verified": report.verified, "steps_after": len(kept)}
+        if self.first_reproducing([steps], rounds, want) != 0:
+            if self._unresolved:
+                return {**summary, "status": "trial error",
+                        "verified": report.verified,
+                        "unresolved": self._unresolved}
+            report.verified = False
+            return {**summary, "status": "not reproduced",
+                    "verified": False}
+        kept = ddmin(steps, lambda candidates: self.first_reproducing(
+            candidates, rounds, want))
+        outcome = self._memo[trial_key(rounds, kept)]
+        report.minimized_ops = list(outcome["ops"])
+        report.observed["minimized"] = {
+            "rounds": rounds, "steps": [asdict(step) for step in kept],
+            "from_steps": len(steps)}
+        report.verified = True
+        report.repro = self.repro_command(report)
+        return {**summary, "status": "minimized", "verified": True,
+                "steps_after": len(kept),
+                "steps": [step.describe() for step in kept],
+                **({"unresolved": self._unresolved}
+                   if self._unresolved else {})}
+
+    def repro_command(self, report: BugReport) -> str:
+        campaign = self.campaign
+        argv = ["python3", "bcfuzzer_campaign.py", "--mode", "minimize",
+                "--target", campaign.target,
+                "--output", str(campaign.out_dir),
+                "--nodes", str(campaign.n_nodes),
+                "--controlled", str(len(campaign.controlled)),
+                "--bugs", report.bug_id]
+        if self.history != HISTORY_ROUNDS:
+            argv += ["--history-rounds", str(self.history)]
+        return shlex.join(argv)
+
+    def close(self) -> None:
+        if os.environ.get("BCFZ_KEEP_RUNTIME") != "1":
+            shutil.rmtree(self.root, ignore_errors=True)
+
+
+def run_minimization(campaign: Any, bugs: list[str] | None,
+                     history: int = HISTORY_ROUNDS,
+                     windows: int = EXTRA_WINDOWS) -> list[dict]:
+    """Minimize the selected reports of a resumed campaign (default: all
+    not yet verified), one after another; each report's trials run on
+    campaign.instances slots."""
+    out_dir = campaign.out_dir
+    timeline = out_dir / "timeline.jsonl"
+    rows = [json.loads(line) for line in
+            timeline.read_text(encoding="utf-8").splitlines()
+            if line.strip()] if timeline.is_file() else []
+    reports = [r for r in campaign.oracle.reports
+               if (r.bug_id in bugs if bugs else r.verified is None)]
+    minimizer = Minimizer(campaign, rows, workers=campaign.instances,
+                          history=history, windows=windows,
+                          store=SnapshotStore.from_env())
+    records = []
+    try:
+        for report in reports:
+            print(f"[minimize] {report.bug_id} {report.signal} "
+                  f"node{report.observed.get('node')} "
+                  f"(round {report.round_id})", flush=True)
+            record = minimizer.minimize(report)
+            records.append(record)
+            print(f"[minimize] {report.bug_id}: {record['status']} "
+                  f"{record.get('steps_before')} -> "
+                  f"{record.get('steps_after', '-')} steps", flush=True)
+    finally:
+        minimizer.close()
+        campaign.compact_state()
+    result_path = out_dir / "result.json"
+    result = load_json(result_path)
+    if isinstance(result, dict):
+        result["reports"] = campaign.oracle.reports
+        save_json(result_path, result)
+    save_json(out_dir / "minimize.json",
+              {"reports": records, "stats": minimizer.stats,
+               "workers": minimizer.workers, "history": history,
+               "windows": windows})
+    return records
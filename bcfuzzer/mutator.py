@@ -8,7 +8,9 @@ Three config formats are handled by the same editor interface:
     with a dotted-path setter that understands lists and nested blocks.
 
 Every edit is recorded as a MutationOp carrying the old value, so a round's
-config can be rolled back exactly.  Values drawn from an item's
+config can be rolled back exactly.  Adapters apply a round's mutations and
+their sanitizer inside one `ConfigEditor.batch()`: one parse and one
+write per file, however many items the round mutates.  Values drawn from an item's
 `dangerous_legal` list are marked exempt_sanitize; the campaign passes that
 set to the target's sanitizer so legal-but-extreme values (the paper's
 Table 1 triggers) are not clamped away.
@@ -16,11 +18,13 @@ Table 1 triggers) are not clamped away.
 
 from __future__ import annotations
 
+import copy
 import json
 import random
 import shutil
+from contextlib import contextmanager
 from pathlib import Path
-from typing import Any
+from typing import Any, Iterator
 
 import yaml
 
@@ -204,12 +208,96 @@ def _format_leaf(value: Any, fmt: str) -> str:
     return str(value)
 
 
+class _Document:
+    """One config file parsed once: a YAML tree, or INI/TOML lines with
+    their parse_lines entries (kept current across in-place line edits,
+    re-parsed only after an insertion)."""
+
+    def __init__(self, path: Path) -> None:
+        self.path = path
+        self.fmt = ConfigEditor._format_of(path)
+        text = path.read_text(encoding="utf-8", errors="replace")
+        self.dirty = False
+        if self.fmt == "yaml":
+            self.data: Any = yaml.safe_load(text) or {}
+        else:
+            self._text = text
+            self._lines: list[str] | None = None
+            self._entries: list[dict] | None = None
+
+    @property
+    def lines(self) -> list[str]:
+        if self._lines is None:
+            self._lines = self._text.splitlines()
+        return self._lines
+
+    def entries(self) -> list[dict]:
+        if self._entries is None:
+            self._entries = parse_lines(self._text if self._lines is None
+                                        else "\n".join(self._lines))
+        return self._entries
+
+    def find(self, section: str, key: str) -> dict | None:
+        for entry in self.entries():
+            if entry["section"] == section and entry["key"] == key:
+                return entry
+        return None
+
+    def set_line(self, index: int, line: str) -> bool:
+        """Replace line `index` in place; False when it already reads so."""
+        lines = self.lines
+        if lines[index] == line:
+            return False
+        lines[index] = line
+        self.dirty = True
+        if self._entries is not None:
+            self._reparse_line(index, line)
+        return True
+
+    def _reparse_line(self, index: int, line: str) -> None:
+        """A `key = value` line rewritten as another one keeps its section,
+        so its entry is updated in place; anything else re-parses."""
+        entry = next((e for e in self._entries if e["line"] == index), None)
+        fresh = parse_lines(line)
+        if entry is None or len(fresh) != 1 or fresh[0]["key"] != entry["key"] \
+                or entry["sep"] == ":" and not entry["value"] \
+                or fresh[0]["sep"] == ":" and not fresh[0]["value"]:
+            self._entries = None
+            return
+        entry.update(indent=fresh[0]["indent"], sep=fresh[0]["sep"],
+                     value=fresh[0]["value"])
+
+    def touch(self) -> None:
+        """The tree was edited in place (YAML sanitizers)."""
+        self.dirty = True
+
+    def insert_line(self, index: int, line: str) -> None:
+        self.lines.insert(index, line)
+        self._entries = None
+        self.dirty = True
+
+    def serialize(self) -> str:
+        if self.fmt == "yaml":
+            return yaml.safe_dump(self.data, sort_keys=False)
+        return "\n".join(self.lines) + "\n"
+
+
 class ConfigEditor:
-    """Per-round editor over one node's config files with rollback."""
+    """Per-round editor over one node's config files with rollback.
+
+    Every call parses its file, edits it and writes it back.  Inside
+    `batch()` a file is parsed once on first touch, every read, edit and
+    sanitizer pass of the batch works on that in-memory document, and each
+    edited file is serialized once when the batch ends — the same bytes
+    the call-by-call path leaves, without the per-item parse/rewrite of
+    large chainmaker.yml/node.yaml files.  The rollback log holds each
+    file's bytes from before its first edit either way."""
 
     def __init__(self, node_dir: Path) -> None:
         self.node_dir = Path(node_dir)
         self._backups: dict[Path, bytes | None] = {}
+        self._open: dict[Path, _Document] | None = None
+        self.stats = {"parsed": 0, "written": 0}
 
     # -- snapshots ---------------------------------------------------------
 
@@ -218,6 +306,8 @@ class ConfigEditor:
             self._backups[path] = path.read_bytes() if path.is_file() else None
 
     def rollback(self) -> None:
+        if self._open is not None:
+            self._open.clear()
         for path, original in self._backups.items():
             if original is None:
                 path.unlink(missing_ok=True)
@@ -225,54 +315,103 @@ class ConfigEditor:
                 path.write_bytes(original)
         self._backups.clear()
 
+    # -- documents ---------------------------------------------------------
+
+    @contextmanager
+    def batch(self) -> Iterator["ConfigEditor"]:
+        """Parse each touched file once, serialize each edited one once on
+        exit.  Nested batches join the outermost; an exception leaves the
+        files as they were (nothing is written)."""
+        if self._open is not None:
+            yield self
+            return
+        self._open = {}
+        try:
+            yield self
+            for doc in self._open.values():
+                self._write(doc)
+        finally:
+            self._open = None
+
+    def document(self, path: Path) -> _Document:
+        """`path` parsed for editing (the batch's copy inside a batch),
+        with its bytes in the rollback log.  Sanitizers edit it in place
+        and call `done(doc)`."""
+        self.snapshot(path)
+        return self._parsed(path)
+
+    def _parsed(self, path: Path) -> _Document:
+        if self._open is not None and path in self._open:
+            return self._open[path]
+        doc = _Document(path)
+        self.stats["parsed"] += 1
+        if self._open is not None:
+            self._open[path] = doc
+        return doc
+
+    def done(self, doc: _Document) -> None:
+        """Outside a batch, write an edited document back now."""
+        if self._open is None:
+            self._write(doc)
+
+    def _write(self, doc: _Document) -> None:
+        if doc.dirty:
+            doc.path.write_text(doc.serialize(), encoding="utf-8")
+            doc.dirty = False
+            self.stats["written"] += 1
+
+    def _edit(self, path: Path) -> _Document:
+        doc = self.document(path)
+        # an edit always rewrites its file, as the call-by-call editor did
+        doc.dirty = True
+        return doc
+
     # -- read --------------------------------------------------------------
 
     def read_value(self, path: Path, item: ItemSpec) -> Any:
-        text = path.read_text(encoding="utf-8", errors="replace")
-        fmt = self._format_of(path)
-        if fmt == "yaml":
-            data = yaml.safe_load(text) or {}
-            return _get_dotted(data, item.path)
-        section, key = self._split_path(item)
-        for entry in parse_lines(text):
-            if entry["section"] == section and entry["key"] == key:
-                return entry["value"]
-        return None
+        doc = self._parsed(path)
+        if doc.fmt == "yaml":
+            # a copy: later edits of the batch must not reach an op's
+            # recorded old value
+            return copy.deepcopy(_get_dotted(doc.data, item.path))
+        entry = doc.find(*self._split_path(item))
+        return entry["value"] if entry is not None else None
 
     # -- write -------------------------------------------------------------
 
     def write_value(self, path: Path, item: ItemSpec, value: Any) -> None:
-        self.snapshot(path)
-        fmt = self._format_of(path)
-        if fmt == "yaml":
-            self._write_yaml(path, item.path, value)
+        doc = self._edit(path)
+        if doc.fmt == "yaml":
+            _set_dotted_path(doc.data, item.path, copy.deepcopy(value))
         else:
-            self._write_line(path, item, value, fmt)
+            self._write_line(doc, item, value)
+        self.done(doc)
 
     def apply_list_op(self, path: Path, item: ItemSpec, rule: str,
                       rng: random.Random) -> None:
-        self.snapshot(path)
         fmt = self._format_of(path)
         if fmt != "yaml":
+            self.snapshot(path)
             raise NotImplementedError(f"list ops on {fmt} not supported")
-        data = yaml.safe_load(path.read_text(encoding="utf-8", errors="replace")) or {}
-        _apply_list_op(data, item.path, rule, rng)
-        path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+        doc = self._edit(path)
+        _apply_list_op(doc.data, item.path, rule, rng)
+        self.done(doc)
 
     def apply_nested_op(self, path: Path, item: ItemSpec, rule: str,
                         value: Any) -> None:
-        self.snapshot(path)
-        data = yaml.safe_load(path.read_text(encoding="utf-8", errors="replace")) or {}
+        doc = self._edit(path)
         if rule == "delete_member":
-            _set_dotted_path(data, item.path, None, delete=True)
+            _set_dotted_path(doc.data, item.path, None, delete=True)
         elif rule == "replace_member":
             member = value.get("member") if isinstance(value, dict) else None
             if not member:
+                self.done(doc)
                 return
-            _set_dotted_path(data, f"{item.path}.{member}", value.get("value"))
+            _set_dotted_path(doc.data, f"{item.path}.{member}",
+                             copy.deepcopy(value.get("value")))
         else:  # switch_variant / dangerous: whole nested object
-            _set_dotted_path(data, item.path, value)
-        path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+            _set_dotted_path(doc.data, item.path, copy.deepcopy(value))
+        self.done(doc)
 
     # -- internals ---------------------------------------------------------
 
@@ -290,36 +429,23 @@ class ConfigEditor:
         parts = item.path.split(".")
         return ".".join(parts[:-1]), parts[-1]
 
-    def _write_line(self, path: Path, item: ItemSpec, value: Any, fmt: str) -> None:
+    def _write_line(self, doc: _Document, item: ItemSpec, value: Any) -> None:
         section, key = self._split_path(item)
-        text = path.read_text(encoding="utf-8", errors="replace")
-        lines = text.splitlines()
-        entries = parse_lines(text)
-        target = None
-        for entry in entries:
-            if entry["section"] == section and entry["key"] == key:
-                target = entry
-                break
-        new_line = f"{target['indent'] if target else ''}{key} = {_format_leaf(value, fmt)}"
+        target = doc.find(section, key)
+        new_line = f"{target['indent'] if target else ''}{key} = {_format_leaf(value, doc.fmt)}"
         if target is not None:
-            lines[target["line"]] = new_line
-        else:
-            insert_at = len(lines)
-            for i, entry in enumerate(entries):
-                if entry["section"] == section:
-                    insert_at = entry["line"] + 1
-            header = f"[{section}]"
-            if not any(l.strip() == header for l in lines):
-                lines.append("")
-                lines.append(header)
-                insert_at = len(lines)
-            lines.insert(insert_at, new_line)
-        path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-
-    def _write_yaml(self, path: Path, dotted: str, value: Any) -> None:
-        data = yaml.safe_load(path.read_text(encoding="utf-8", errors="replace")) or {}
-        _set_dotted_path(data, dotted, value)
-        path.write_text(yaml.safe_dump(data, sort_keys=False), encoding="utf-8")
+            doc.set_line(target["line"], new_line)
+            return
+        insert_at = len(doc.lines)
+        for entry in doc.entries():
+            if entry["section"] == section:
+                insert_at = entry["line"] + 1
+        header = f"[{section}]"
+        if not any(l.strip() == header for l in doc.lines):
+            doc.insert_line(len(doc.lines), "")
+            doc.insert_line(len(doc.lines), header)
+            insert_at = len(doc.lines)
+        doc.insert_line(insert_at, new_line)
 
 
 def _get_dotted(root: Any, dotted: str) -> Any:
@@ -16,10 +16,10 @@ classifies failures:
   transaction_failure  tx-level anomalies: bad-signature txs accepted
                      into the pool (#5), expired txs accepted (#6),
                      replacement rejected while the old tx finalizes (#9)
-  capacity           geth-only: gasLimit/21000 nominal capacity.  A gas
-                     limit below the PoC collapse threshold (300k) that
-                     PERSISTS across rounds (durable window) is the
-                     paper #8 oracle.
+  capacity           geth (and the sim model): gasLimit/21000 nominal
+                     capacity.  A gas limit below the PoC collapse
+                     threshold (300k) that PERSISTS across rounds (durable
+                     window) is the paper #8 oracle.
 
 BugReport is emitted once per failure signature (dedup); minimization and
 regression recheck are driven by the campaign.
@@ -28,22 +28,47 @@ regression recheck are driven by the campaign.
 from __future__ import annotations
 
 import hashlib
+import math
 import time
-from dataclasses import dataclass, field
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures import TimeoutError as FutureTimeout
+from dataclasses import asdict, dataclass, field
 from typing import Any
 
 from .common import BugReport, MutationOp
+from .profiler import profiled
+from .readiness import wait_until
 
 WINDOW_SEC = 20.0
+# the sim model runs on ticks, not wall time: a near-zero window makes
+# every observe one stall window
+TARGET_WINDOW_SEC = {"sim": 0.001}
 PERSISTENCE_WINDOWS = 3
 GETH_COLLAPSE_THRESHOLD = 300_000  # PoC geth/01 success threshold
 FISCO_TIMEOUT_GROWTH_FACTOR = 3    # consensusTimeout >= 3x baseline (#4)
+# targets whose probes carry "gaslimit" -> their durable-collapse signal
+CAPACITY_TARGETS = {"geth": "geth_gaslimit_collapse",
+                    "sim": "sim_gaslimit_collapse"}
+# normal-node probes fan out concurrently: a probe is several blocking RPCs
+# (fisco: getBlockNumber + getPbftView + getPendingTxSize) or a cmc
+# subprocess per height read (chainmaker), so a serial sweep over 9 normal
+# nodes let one slow node stretch the observation and smeared the sample
+# over tens of seconds.  A probe that misses its deadline is reported as
+# {"probe_timeout": True} — no height, so the stall windows keep their
+# state exactly as for an rpc error.
+PROBE_WORKERS = 16
+PROBE_TIMEOUT_SEC = 20.0
 FISCO_VIEW_CHANGE_GROWTH = 10      # triggerTimeout+broadcastViewChange >= 10x baseline
 # when the healthy baseline rate is 0 (an idle network logs ~0 timeout
 # events per window), a sustained burst still has to be detectable:
 # >= 2 events/window per normal node (paper #4/#6/#7 evidence: each
 # consensus stall logs triggerTimeout + broadcastViewChange)
 FISCO_VIEW_CHANGE_FLOOR_PER_SEC = 0.1
+# settle_after_restarts: the aftershocks are over once no normal node's
+# view-change counter moved for SETTLE_QUIET_SEC (probed every
+# SETTLE_POLL_SEC), instead of always sleeping the 45 s worst case
+SETTLE_QUIET_SEC = 15.0
+SETTLE_POLL_SEC = 3.0
 
 # panic-log fragment -> per-bug signal (the generic panic_<sig> signal
 # stays available for fragments with no mapping).  The TXCOUNT bug (cm-02)
@@ -65,6 +90,9 @@ PANIC_SIGNAL_MAP: dict[str, dict[str, str]] = {
     "aptos": {
         "safety": "aptos_safety_rules_process_failure",
     },
+    "sim": {
+        "index out of range": "sim_verifier_panic",
+    },
 }
 
 # signal -> (targets, severity, description); calibration asserts each fired
@@ -117,6 +145,12 @@ SIGNAL_LIBRARY: dict[str, dict[str, Any]] = {
     "aptos_safety_rules_process_failure": {
         "targets": {"aptos"}, "severity": "critical", "bug": "ap-12",
         "desc": "safety_rules.service=process fails startup / panics"},
+    "sim_verifier_panic": {
+        "targets": {"sim"}, "severity": "critical", "bug": "sim-03",
+        "desc": "batch-pool leader's block panics the verifiers"},
+    "sim_gaslimit_collapse": {
+        "targets": {"sim"}, "severity": "critical", "bug": "sim-02",
+        "desc": "normal-node gasLimit < 300k persisting across rounds"},
 }
 
 
@@ -153,10 +187,17 @@ def _height_of(probe: dict) -> int:
 
 class BcbOracle:
     def __init__(self, target: str, normal_indices: list[int],
-                 window_sec: float = WINDOW_SEC) -> None:
+                 window_sec: float | None = None,
+                 probe_workers: int = PROBE_WORKERS,
+                 probe_timeout: float = PROBE_TIMEOUT_SEC) -> None:
         self.target = target
         self.normal_indices = list(normal_indices)
-        self.window = window_sec
+        self.window = TARGET_WINDOW_SEC.get(target, WINDOW_SEC) \
+            if window_sec is None else window_sec
+        self.probe_workers = probe_workers
+        self.probe_timeout = probe_timeout
+        # per-node wall time of the latest probe_all (None = timed out)
+        self.last_probe_latency: dict[int, float | None] = {}
         # 13-org TBFT block production is slower than the other targets;
         # require more consecutive stalled windows before declaring a
         # durable stall so the slow-but-healthy chain never false-fires
@@ -175,14 +216,62 @@ class BcbOracle:
         self._seen_signatures: set[str] = set()
         self._reports_by_sig: dict[str, BugReport] = {}
         self._round = 0
+        # changes since the last drain_delta() (journal.py)
+        self._dirty_signatures: set[str] = set()
+        self._journaled_baseline: Baseline | None = None
+        self._journaled_ids: set[str] = set()
 
     # ------------------------------------------------------------- baseline
 
+    @profiled()
+    def probe_all(self, net, adapter,
+                  indices: list[int] | None = None) -> dict[int, dict]:
+        """adapter.node_probes on every node concurrently (bounded pool),
+        each with probe_timeout; latencies land in last_probe_latency."""
+        indices = list(self.normal_indices if indices is None else indices)
+        if not indices:
+            self.last_probe_latency = {}
+            return {}
+        workers = max(1, min(self.probe_workers, len(indices)))
+
+        def timed(index: int) -> tuple[dict, float]:
+            start = time.monotonic()
+            probe = adapter.node_probes(net, index)
+            return probe, time.monotonic() - start
+
+        pool = ThreadPoolExecutor(max_workers=workers,
+                                  thread_name_prefix="bcfz-probe")
+        started = time.monotonic()
+        # queued probes start a wave later, so the deadline scales with
+        # the number of waves rather than cutting the last wave short
+        deadline = started + self.probe_timeout * math.ceil(
+            len(indices) / workers)
+        futures = {i: pool.submit(timed, i) for i in indices}
+        probes: dict[int, dict] = {}
+        latency: dict[int, float | None] = {}
+        for i, future in futures.items():
+            try:
+                probes[i], took = future.result(
+                    timeout=max(0.0, deadline - time.monotonic()))
+                latency[i] = round(took, 3)
+            except FutureTimeout:
+                probes[i] = {"probe_timeout": True}
+                latency[i] = None
+            except Exception as exc:  # noqa: BLE001
+                probes[i] = {"probe_error": str(exc)}
+                latency[i] = round(time.monotonic() - started, 3)
+        # a hung probe thread is abandoned, not joined: its rpc/cmc call
+        # carries its own timeout and the next observe gets a fresh pool
+        pool.shutdown(wait=False, cancel_futures=True)
+        self.last_probe_latency = latency
+        return probes
+
+    @profiled()
     def register_baseline(self, net, adapter) -> Baseline:
-        probes = {i: adapter.node_probes(net, i) for i in self.normal_indices}
+        probes = self.probe_all(net, adapter)
         t0 = time.monotonic()
         time.sleep(self.window)
-        probes2 = {i: adapter.node_probes(net, i) for i in self.normal_indices}
+        probes2 = self.probe_all(net, adapter)
         heights = [max(0, _height_of(probes2[i]) - _height_of(probes[i]))
                    for i in self.normal_indices]
         rate = (sum(heights) / len(heights)) if heights else 0.0
@@ -191,7 +280,7 @@ class BcbOracle:
             for sig, count in self._panic_signatures(probes2[i]).items():
                 panics[sig] = panics.get(sig, 0) + count
         gaslimit = 0
-        if self.target == "geth":
+        if self.target in CAPACITY_TARGETS:
             gaslimit = max((probes2[i].get("gaslimit", 0)
                             for i in self.normal_indices), default=0)
         timeouts = sorted({str(t)
@@ -213,6 +302,7 @@ class BcbOracle:
             self._last[i] = (time.monotonic(), _height_of(probes2[i]))
         return self.baseline
 
+    @profiled()
     def settle_after_restarts(self, net, adapter,
                               settle_sec: float = 45.0) -> None:
         """Re-baseline the view-change counters after the round's serial
@@ -223,23 +313,41 @@ class BcbOracle:
         36-69 events on a round with benign mutations).  A true
         min_seal_time=60000 (#4) storm keeps bursting every ~60 s for
         the whole round, so the post-settle observation window — seeds,
-        sequences, then observe() — still catches it."""
+        sequences, then observe() — still catches it.  `settle_sec` is
+        the budget: the wait ends once the counters have been quiet for
+        SETTLE_QUIET_SEC."""
         if self.target != "fisco":
             return
-        time.sleep(settle_sec)
-        for i in self.normal_indices:
-            probe = adapter.node_probes(net, i)
-            self._view_change_last[i] = probe.get("timeout_events", 0)
+        state: dict[str, Any] = {"counts": None, "since": time.monotonic()}
+
+        def quiet() -> bool:
+            counts = {i: probe["timeout_events"] for i, probe
+                      in self.probe_all(net, adapter).items()
+                      if "timeout_events" in probe}
+            now = time.monotonic()
+            if counts != state["counts"]:
+                state["counts"], state["since"] = counts, now
+                return False
+            return now - state["since"] >= SETTLE_QUIET_SEC
+
+        wait_until("oracle.settle", quiet, settle_sec,
+                   interval=SETTLE_POLL_SEC, max_interval=SETTLE_POLL_SEC)
+        self._view_change_last.update(state["counts"] or {})
 
     # ----------------------------------------------------------- observation
 
+    @profiled()
     def observe(self, net, adapter, round_id: int,
                 seed_results: list[dict] | None = None,
                 placement=None) -> list[Failure]:
         self._round = round_id
         failures: list[Failure] = []
-        probes = {i: adapter.node_probes(net, i) for i in self.normal_indices}
+        probes = self.probe_all(net, adapter)
         now = time.monotonic()
+        # timed-out / raising probes carry no counters: the fisco and
+        # capacity windows below must keep their state for those nodes
+        blind = {i for i, probe in probes.items()
+                 if "probe_timeout" in probe or "probe_error" in probe}
 
         # peer_failure: death or language panics
         for i, probe in probes.items():
@@ -299,6 +407,8 @@ class BcbOracle:
             bl1_active = (self._bl1_armed_round is not None
                           and round_id - self._bl1_armed_round <= 1)
             for i, probe in probes.items():
+                if i in blind:
+                    continue
                 timeouts = sorted({str(t) for t in
                                    probe.get("consensus_timeouts", [])})
                 base_timeouts = (self.baseline.consensus_timeouts
@@ -348,15 +458,17 @@ class BcbOracle:
             if failure is not None:
                 failures.append(failure)
 
-        # capacity (geth, durable window)
-        if self.target == "geth":
+        # capacity (geth / sim, durable window)
+        if self.target in CAPACITY_TARGETS:
             for i in probes:
+                if i in blind:
+                    continue
                 gaslimit = probes[i].get("gaslimit", 0)
                 if gaslimit and gaslimit < GETH_COLLAPSE_THRESHOLD:
                     self._collapse_rounds[i] = self._collapse_rounds.get(i, 0) + 1
                     if self._collapse_rounds.get(i, 0) >= PERSISTENCE_WINDOWS:
                         failures.append(Failure(
-                            "capacity", "geth_gaslimit_collapse", i,
+                            "capacity", CAPACITY_TARGETS[self.target], i,
                             {"gaslimit": gaslimit,
                              "rounds_below": self._collapse_rounds[i]}))
                 else:
@@ -476,6 +588,7 @@ class BcbOracle:
             observed = existing.observed
             observed["occurrences"] = observed.get("occurrences", 1) + 1
             observed["last_round"] = round_id
+            self._dirty_signatures.add(signature)
             return None
         info = SIGNAL_LIBRARY.get(failure.signal, {})
         bug_tags = [info.get("bug", "")]
@@ -497,6 +610,7 @@ class BcbOracle:
         )
         self._reports_by_sig[signature] = report
         self.reports.append(report)
+        self._dirty_signatures.add(signature)
         return report
 
     # ------------------------------------------------------------- helpers
@@ -508,20 +622,60 @@ class BcbOracle:
         return {str(k): int(v) for k, v in signatures.items() if v}
 
     def capacity(self, net, adapter, index: int) -> int | None:
-        if self.target == "geth" and hasattr(net, "nominal_capacity"):
+        if self.target in CAPACITY_TARGETS and \
+                hasattr(net, "nominal_capacity"):
             return net.nominal_capacity(index)
         return None
 
     def save(self, path) -> None:
         from .common import save_json
-        save_json(path, {"baseline": self.baseline,
+        save_json(path, {"baseline": asdict(self.baseline)
+                         if self.baseline is not None else None,
                          "reports": self.reports,
                          "seen": sorted(self._reports_by_sig)})
 
     def load(self, path) -> None:
         from .common import load_json
         data = load_json(path)
-        if data.get("baseline"):
+        # older state files hold the baseline's repr, not its fields
+        if isinstance(data.get("baseline"), dict):
             self.baseline = Baseline(**data["baseline"])
         self.reports = data.get("reports", [])
         self._reports_by_sig = {r.signature: r for r in self.reports}
+        self._journaled_baseline = self.baseline
+        self._journaled_ids = {r.bug_id for r in self.reports}
+
+    def drain_delta(self) -> dict:
+        """Reports created since the last drain (whole), occurrence bumps
+        of older ones ([signature, occurrences, last_round]) and a newly
+        registered baseline — absolute values, so replay is idempotent."""
+        delta: dict = {"reports": [], "touched": []}
+        for signature in sorted(self._dirty_signatures):
+            report = self._reports_by_sig[signature]
+            if report.bug_id in self._journaled_ids:
+                delta["touched"].append(
+                    [signature, report.observed["occurrences"],
+                     report.observed["last_round"]])
+            else:
+                delta["reports"].append(report)
+                self._journaled_ids.add(report.bug_id)
+        self._dirty_signatures.clear()
+        if self.baseline is not self._journaled_baseline:
+            delta["baseline"] = asdict(self.baseline)
+            self._journaled_baseline = self.baseline
+        return delta
+
+    def apply_delta(self, delta: dict) -> None:
+        if delta.get("baseline"):
+            self.baseline = Baseline(**delta["baseline"])
+            self._journaled_baseline = self.baseline
+        for report in delta.get("reports", []):
+            self._journaled_ids.add(report.bug_id)
+            if report.signature not in self._reports_by_sig:
+                self.reports.append(report)
+                self._reports_by_sig[report.signature] = report
+        for signature, occurrences, last_round in delta.get("touched", []):
+            observed = self._reports_by_sig[signature].observed
+            if occurrences >= observed.get("occurrences", 1):
+                observed["occurrences"] = occurrences
+                observed["last_round"] = last_round
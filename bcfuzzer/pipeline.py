@@ -0,0 +1,142 @@
+"""Pipelined round preparation: stage the next round's configs while the
+current round runs on the network.
+
+A geth round used to start with host work on its critical path: one
+`build_default_config` per controlled node (apply_case into a fresh
+scratch dir), then the scheduler's mutations and the sanitizer on a copy
+of it — all before the first node restart.  None of that touches the
+network, so a ConfigPrefetcher does it on one background worker:
+
+  - speculate(plan') — right after round r is dispatched, the campaign
+    plans round r+1 on a scheduler fork (the MEI verdicts of round r are
+    not in yet) and the worker builds its base configs and applies the
+    speculative mutations into per-node staging dirs;
+  - materialize(plan) — once round r is committed the real plan for r+1
+    exists; a node whose mutations match the speculation (same signature)
+    reuses its staged config and ops, any other node is re-staged from the
+    already-built base config.  Base configs depend only on (round, node),
+    so they are never wasted.
+
+Speculation is only ever a cache: what a round runs is decided by the real
+plan, i.e. by the committed MEI.  Everything runs on the single worker in
+submission (= round) order, so the materializing adapter's rng and op
+counter see the same sequence on every run.
+"""
+
+from __future__ import annotations
+
+import shutil
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from .common import stable_hash
+from .scheduler import NodePlan, RoundPlan
+
+
+@dataclass
+class StagedNode:
+    base: Path
+    signature: str
+    config: Path
+    ops: list
+
+
+@dataclass
+class StagedRound:
+    round_id: int
+    nodes: dict[int, StagedNode] = field(default_factory=dict)
+    hits: int = 0
+    misses: int = 0
+    materialize_sec: float = 0.0     # worker time spent on this round
+
+
+def mutation_signature(node_plan: NodePlan) -> str:
+    return stable_hash(repr(node_plan.mutations))[:12]
+
+
+class ConfigPrefetcher:
+    """base_config(round_id, node) -> base config path;
+    apply(node_plan, base, node_dir) -> ops, writing node_dir/conf.toml."""
+
+    def __init__(self, root: Path,
+                 base_config: Callable[[int, int], Path],
+                 apply: Callable[[NodePlan, Path, Path], list]) -> None:
+        self.root = Path(root)
+        self._base_config = base_config
+        self._apply = apply
+        self._worker = ThreadPoolExecutor(max_workers=1,
+                                          thread_name_prefix="prefetch")
+        self._speculative: dict[int, Future] = {}
+        self.stats = {"speculated": 0, "hits": 0, "misses": 0,
+                      "materialize_sec": 0.0}
+
+    def _stage(self, round_id: int, node_plan: NodePlan,
+               base: Path | None) -> StagedNode:
+        if base is None:
+            base = self._base_config(round_id, node_plan.node_index)
+        signature = mutation_signature(node_plan)
+        node_dir = self.root / f"round-{round_id}" / \
+            f"node{node_plan.node_index}-{signature}"
+        shutil.rmtree(node_dir, ignore_errors=True)
+        ops = self._apply(node_plan, base, node_dir)
+        return StagedNode(base, signature, node_dir / "conf.toml", ops)
+
+    def _speculate(self, plan: RoundPlan) -> StagedRound:
+        t0 = time.monotonic()
+        staged = StagedRound(plan.round_id)
+        for node_plan in plan.placements:
+            if node_plan.role != "normal":
+                staged.nodes[node_plan.node_index] = self._stage(
+                    plan.round_id, node_plan, None)
+        staged.materialize_sec = time.monotonic() - t0
+        return staged
+
+    def _materialize(self, plan: RoundPlan) -> StagedRound:
+        t0 = time.monotonic()
+        guess = self._speculative.pop(plan.round_id, None)
+        # submitted earlier to this same worker, so already finished
+        spec = guess.result() if guess is not None else None
+        staged = StagedRound(plan.round_id)
+        for node_plan in plan.placements:
+            if node_plan.role == "normal":
+                continue
+            index = node_plan.node_index
+            prior = spec.nodes.get(index) if spec is not None else None
+            if prior is not None and \
+                    prior.signature == mutation_signature(node_plan):
+                staged.nodes[index] = prior
+                staged.hits += 1
+                continue
+            if prior is not None:
+                shutil.rmtree(prior.config.parent, ignore_errors=True)
+            staged.nodes[index] = self._stage(
+                plan.round_id, node_plan,
+                prior.base if prior is not None else None)
+            staged.misses += 1
+        staged.materialize_sec = time.monotonic() - t0 + \
+            (spec.materialize_sec if spec is not None else 0.0)
+        self.stats["hits"] += staged.hits
+        self.stats["misses"] += staged.misses
+        self.stats["materialize_sec"] += staged.materialize_sec
+        return staged
+
+    def speculate(self, plan: RoundPlan) -> None:
+        """Start staging a guessed plan for `plan.round_id`."""
+        if plan.round_id in self._speculative:
+            return
+        self.stats["speculated"] += 1
+        self._speculative[plan.round_id] = self._worker.submit(
+            self._speculate, plan)
+
+    def materialize(self, plan: RoundPlan) -> "Future[StagedRound]":
+        """Configs and ops for the real plan (reusing the speculation)."""
+        return self._worker.submit(self._materialize, plan)
+
+    def close(self, remove: bool = True) -> None:
+        self._worker.shutdown(wait=True, cancel_futures=True)
+        self._speculative.clear()
+        if remove:
+            shutil.rmtree(self.root, ignore_errors=True)
@@ -0,0 +1,244 @@
+"""Standalone PoC test cases generated from minimized bug reports.
+
+A fuzzer finding used to become a `test_cases/<target>/NN_*/poc.sh` by
+hand, and its `BugSpec` in full_bcfuzzer.BUG_SPECS too — so regression
+only ever re-ran the hand-curated Table-1 bugs, never what the campaigns
+had found since.  pocgen turns a verified report of minimize mode
+(bcfuzzer/minimize.py) into a case directory:
+
+  poc.sh         self-contained: the replay case (target, node layout,
+                 campaign seed, replayed rounds, the minimized steps, the
+                 report's signal and node) is embedded as a heredoc and
+                 replayed once by `bcfuzzer_campaign.py --mode replay` on
+                 a fresh network — minutes, not a campaign.  It prints one
+                 `[ORACLE] <signal> node<i>` line per oracle failure, then
+                 `[POC PASS]` (exit 0) or `[POC FAIL]` (exit 1);
+  bugspec.json   the matching BugSpec (success pattern: the oracle
+                 signal's line), loaded by full_bcfuzzer.
+                 load_generated_specs, so `--mode regress` runs it with
+                 the target's hand-written cases;
+  README.md      what triggers it and where it came from.
+
+Generation is deterministic: the same report gives the same bytes, and a
+case whose (target, signal, steps) already has a directory is rewritten
+in place by its own report and left alone by any other, so the sibling
+reports of one network-wide failure share the first one's case.  New
+cases take the next NN of their target directory and the spec id
+<prefix>-fzNN.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import textwrap
+from pathlib import Path
+from typing import Any
+
+from .common import BugReport, save_json
+from .minimize import EXTRA_WINDOWS, Minimizer, Step
+from .oracle import SIGNAL_LIBRARY
+
+TEST_CASES = Path(__file__).resolve().parent.parent / "test_cases"
+SPEC_NAME = "bugspec.json"
+SPEC_PREFIX = {"geth": "ge", "fisco": "fs", "chainmaker": "cm",
+               "aptos": "ap", "sim": "sm"}
+# a replay is one trial: boot, the replayed rounds and the extra windows
+POC_TIMEOUT = {"sim": 120}
+DEFAULT_TIMEOUT = 1800
+
+
+def oracle_line(signal: str, node: Any) -> str:
+    return f"[ORACLE] {signal} node{node}"
+
+
+def case_of(report: BugReport, campaign: Any,
+            windows: int = EXTRA_WINDOWS) -> dict:
+    """The replay case of a verified, minimized report."""
+    minimized = report.observed.get("minimized")
+    if not report.verified or not minimized:
+        raise ValueError(f"{report.bug_id} is not a verified minimized "
+                         "report (run --mode minimize first)")
+    return {"target": report.target,
+            "nodes": campaign.n_nodes,
+            "controlled": list(campaign.controlled),
+            "seed": campaign.seed,
+            "rounds": minimized["rounds"],
+            "steps": minimized["steps"],
+            "windows": windows,
+            "signal": report.signal,
+            "node": report.observed.get("node"),
+            "source": {"bug_id": report.bug_id,
+                       "signature": report.signature,
+                       "round_id": report.round_id}}
+
+
+def case_key(case: dict) -> str:
+    material = [case["target"], case["signal"], case["rounds"],
+                case["steps"]]
+    return hashlib.sha256(json.dumps(
+        material, sort_keys=True).encode()).hexdigest()[:16]
+
+
+def _category(steps: list[Step]) -> str:
+    kinds = {step.kind for step in steps}
+    parts = [name for kind, name in (("op", "config"), ("seed", "workload"),
+                                     ("seq", "sequence")) if kind in kinds]
+    return "+".join(parts) or "baseline"
+
+
+def _slug(case: dict) -> str:
+    signal = case["signal"]
+    prefix = f"{case['target']}_"
+    return signal[len(prefix):] if signal.startswith(prefix) else signal
+
+
+def render_script(case: dict, spec: dict) -> str:
+    steps = [Step(**step) for step in case["steps"]]
+    desc = SIGNAL_LIBRARY.get(case["signal"], {}).get("desc", "")
+    trigger = "\n".join(f"#    - {step.describe()}" for step in steps)
+    body = json.dumps(case, indent=2, sort_keys=True)
+    return f"""#!/bin/bash
+#
+# =============================================================================
+#  BCFuzzer generated PoC {spec["bug_id"]}: {case["signal"]} ({case["target"]})
+#
+#  Generated by bcfuzzer/pocgen.py from the minimized report
+#  {case["source"]["bug_id"]} ({case["source"]["signature"]}); regenerate rather than edit.
+#
+#  Trigger ({len(steps)} steps, replayed over rounds {case["rounds"]}):
+{trigger}
+#
+#  Oracle: {case["signal"]} on node{case["node"]}{f" — {desc}" if desc else ""}
+#
+#  Execute: bash poc.sh   (BCFZ_REPO overrides the artifact checkout)
+# =============================================================================
+set -euo pipefail
+
+SCRIPT_DIR="$(cd "$(dirname "${{BASH_SOURCE[0]}}")" && pwd)"
+BCFZ_REPO="${{BCFZ_REPO:-$(cd "$SCRIPT_DIR/../../.." && pwd)}}"
+WORK="$(mktemp -d "${{TMPDIR:-/tmp}}/bcfz-{spec["bug_id"]}.XXXXXX")"
+trap 'rm -rf "$WORK"' EXIT
+
+cat > "$WORK/case.json" <<'BCFZ_CASE'
+{body}
+BCFZ_CASE
+
+python3 "$BCFZ_REPO/bcfuzzer_campaign.py" --mode replay \\
+    --target {case["target"]} --case "$WORK/case.json" --output "$WORK/out"
+"""
+
+
+def render_readme(case: dict, spec: dict) -> str:
+    steps = [Step(**step) for step in case["steps"]]
+    desc = SIGNAL_LIBRARY.get(case["signal"], {}).get("desc", "")
+    lines = [f"# {spec['bug_id']}: {case['signal']} ({case['target']})", "",
+             textwrap.fill(
+                 f"Generated by `bcfuzzer/pocgen.py` from the minimized "
+                 f"fuzzer report {case['source']['bug_id']} "
+                 f"(`{case['source']['signature']}`, round "
+                 f"{case['source']['round_id']}).  `poc.sh` replays the "
+                 "steps below once on a fresh network and passes when the "
+                 f"oracle reports `{case['signal']}` on "
+                 f"node{case['node']}" + (f" ({desc})." if desc else "."),
+                 width=76),
+             "", "| Round | Step |", "|---:|---|"]
+    lines += [f"| {step.round_id} | `{step.describe().split(' ', 1)[1]}` |"
+              for step in steps]
+    lines += ["", "```", "bash poc.sh", "```", ""]
+    return "\n".join(lines)
+
+
+def _existing(target_dir: Path, key: str) -> dict | None:
+    for path in sorted(target_dir.glob(f"*/{SPEC_NAME}")):
+        data = json.loads(path.read_text(encoding="utf-8"))
+        if data.get("case_key") == key:
+            return {**data, "dir": str(path.parent)}
+    return None
+
+
+def _next_number(target_dir: Path) -> int:
+    numbers = [int(path.name.split("_", 1)[0])
+               for path in target_dir.iterdir()
+               if path.is_dir() and path.name.split("_", 1)[0].isdigit()] \
+        if target_dir.is_dir() else []
+    return max(numbers, default=0) + 1
+
+
+def write_case(case: dict, cases_dir: Path = TEST_CASES) -> dict:
+    """Write (or rewrite) the case directory; returns its BugSpec dict.
+    A case already generated from another report is left as it is."""
+    target_dir = Path(cases_dir) / case["target"]
+    key = case_key(case)
+    source = f"{case['source']['bug_id']}@{case['source']['signature']}"
+    existing = _existing(target_dir, key)
+    if existing is not None and existing.get("source") != source:
+        return existing
+    case_dir = Path(existing["dir"]) if existing is not None else \
+        target_dir / f"{_next_number(target_dir):02d}_{_slug(case)}"
+    number = int(case_dir.name.split("_", 1)[0])
+    steps = [Step(**step) for step in case["steps"]]
+    spec = {"bug_id": f"{SPEC_PREFIX.get(case['target'], case['target'])}"
+                      f"-fz{number:02d}",
+            "target": case["target"],
+            "title": f"{case['signal']} on node{case['node']}",
+            "category": _category(steps),
+            "rel_script": f"{case['target']}/{case_dir.name}/poc.sh",
+            "timeout_seconds": POC_TIMEOUT.get(case["target"],
+                                               DEFAULT_TIMEOUT),
+            "success_patterns": [oracle_line(case["signal"], case["node"])],
+            "source": source,
+            "case_key": key}
+    case_dir.mkdir(parents=True, exist_ok=True)
+    script = case_dir / "poc.sh"
+    script.write_text(render_script(case, spec), encoding="utf-8")
+    script.chmod(0o755)
+    (case_dir / "README.md").write_text(render_readme(case, spec),
+                                        encoding="utf-8")
+    save_json(case_dir / SPEC_NAME, spec)
+    return {**spec, "dir": str(case_dir)}
+
+
+def run_pocgen(campaign: Any, bugs: list[str] | None,
+               cases_dir: Path = TEST_CASES) -> list[dict]:
+    """Test cases for the selected verified reports (default: all)."""
+    written = []
+    for report in campaign.oracle.reports:
+        if bugs and report.bug_id not in bugs:
+            continue
+        if not report.verified or not report.observed.get("minimized"):
+            if bugs:
+                print(f"[pocgen] {report.bug_id}: not minimized, skipped",
+                      flush=True)
+            continue
+        spec = write_case(case_of(report, campaign), cases_dir)
+        print(f"[pocgen] {report.bug_id} -> {spec['bug_id']} "
+              f"{spec['dir']}", flush=True)
+        if all(spec["bug_id"] != seen["bug_id"] for seen in written):
+            written.append(spec)
+    return written
+
+
+def run_replay(campaign: Any, case: dict) -> dict:
+    """Replay one case on a fresh network; prints the oracle's failures
+    and the verdict line."""
+    want = (case["signal"], case["node"])
+    minimizer = Minimizer(campaign, [], workers=1,
+                          windows=case.get("windows", EXTRA_WINDOWS))
+    try:
+        outcome = minimizer.replay([Step(**step) for step in case["steps"]],
+                                   case["rounds"], want)
+    finally:
+        minimizer.close()
+    failures = sorted(outcome["failures"], key=str) if outcome else []
+    for signal, node in failures:
+        print(oracle_line(signal, node), flush=True)
+    reproduced = outcome is not None and want in outcome["failures"]
+    print(f"[POC {'PASS' if reproduced else 'FAIL'}] {case['signal']} "
+          f"node{case['node']} ({case['source']['bug_id']})", flush=True)
+    record = {"reproduced": reproduced, "signal": case["signal"],
+              "node": case["node"], "source": case["source"],
+              "failures": [list(f) for f in failures],
+              "trial": minimizer.stats}
+    save_json(campaign.out_dir / "replay.json", record)
+    return record
@@ -0,0 +1,203 @@
+"""Static pre-admission: skip restarts of configs that cannot be admitted.
+
+Admission used to be learned only by restarting the mutated node and
+waiting on `probe_admission` — up to 90-120 s on chainmaker/aptos, and
+with chainmaker admitting 42% of mutated configs (stage-G report) most of
+those restarts were spent on configs the node refuses outright.  Before a
+controlled node is restarted, `PreAdmission.check` now reads the mutated
+items back from the files on disk and applies the rules known to hold:
+
+  - type: int/float/bool/enum/list/nested values must parse as their kind
+    (INI/TOML values arrive as raw text and are coerced first);
+  - range: ints/floats inside `ItemSpec.bounds`, enums inside `enum`;
+    `dangerous_legal` values are legal by definition and always pass;
+  - shape: list items with a known element format (chainmaker `net.seeds`
+    multiaddrs), nested variants with their required members (aptos
+    safety_rules.service: `process` needs `server_address`);
+  - dry run: the adapter's `dry_run_config(net, index, files)` when the
+    target has one (geth `dumpconfig`, the sim model's own validation).
+
+An unreadable or missing value is never a prediction — only a violated
+rule is.  A predicted rejection is recorded in the MEI as rejected, with
+no restart; one in `sample_every` of them (chosen by a hash of round and
+node, so lanes and reruns agree) still goes live.  A sampled node that IS
+admitted contradicts the checker: the items involved are marked untrusted
+and never predicted again, so a wrong rule costs at most a sample's worth
+of MEI entries.  `cross_constraint` strings in the catalog are prose for
+humans; the machine-checked cross rules are the dry runs.
+"""
+
+from __future__ import annotations
+
+import contextlib
+import os
+import re
+import threading
+from pathlib import Path
+from typing import Any, Callable
+
+from .common import ItemSpec, MutationOp, stable_hash
+from .mutator import ConfigEditor
+
+SAMPLE_EVERY = 10               # one predicted rejection in N goes live
+SAMPLE_ENV = "BCFZ_PREADMIT_SAMPLE"     # 0 disables the checker
+MULTIADDR = re.compile(
+    r"^/(ip4|ip6|dns|dns4|dns6)/[^/\s]+/tcp/\d{1,5}"
+    r"(/p2p/[1-9A-HJ-NP-Za-km-z]{20,})?$")
+LIST_SHAPES: dict[str, re.Pattern] = {
+    "net.seeds": MULTIADDR,
+}
+
+
+def _coerce(raw: Any, item: ItemSpec) -> Any:
+    """Typed value of an INI/TOML raw string (YAML values are typed)."""
+    if not isinstance(raw, str) or item.kind in ("list", "nested"):
+        return raw
+    text = raw.strip()
+    if len(text) >= 2 and text[0] == text[-1] and text[0] in "\"'":
+        return text[1:-1]               # quoted: a string, whatever it says
+    if item.kind == "bool" and text.lower() in ("true", "false"):
+        return text.lower() == "true"
+    if item.kind == "int":
+        try:
+            return int(text)
+        except ValueError:
+            return text
+    if item.kind == "float":
+        try:
+            return float(text)
+        except ValueError:
+            return text
+    return text
+
+
+def value_error(item: ItemSpec, value: Any) -> str | None:
+    """The rule `value` breaks for `item` (None: no known rule broken)."""
+    if value is None:
+        return None
+    if item.dangerous_legal and value in item.dangerous_legal:
+        return None
+    kind = item.kind
+    if kind == "bool":
+        return None if isinstance(value, bool) else f"not a bool: {value!r}"
+    if kind in ("int", "float"):
+        numeric = (int,) if kind == "int" else (int, float)
+        if isinstance(value, bool) or not isinstance(value, numeric):
+            return f"not an {kind}: {value!r}"
+        if item.bounds is not None:
+            low, high = item.bounds
+            if not low <= value <= high:
+                return f"{value} outside [{low}, {high}]"
+        return None
+    if kind == "enum":
+        members = item.enum or []
+        return None if not members or value in members \
+            else f"{value!r} not in {members}"
+    if kind == "list":
+        if not isinstance(value, list):
+            return f"not a list: {value!r}"
+        shape = LIST_SHAPES.get(item.path)
+        if shape is not None:
+            for element in value:
+                if not isinstance(element, str) or not shape.match(element):
+                    return f"malformed element {element!r}"
+        return None
+    if kind == "nested":
+        return _nested_error(item, value)
+    return None
+
+
+def _nested_error(item: ItemSpec, value: Any) -> str | None:
+    variants = {v.get("type"): set(v) for v in item.enum or []
+                if isinstance(v, dict)}
+    if not variants:
+        return None
+    if not isinstance(value, dict):
+        return f"not a mapping: {value!r}"
+    required = variants.get(value.get("type"))
+    if required is None:
+        return f"unknown variant {value.get('type')!r}"
+    missing = required - set(value)
+    if missing:
+        return f"variant {value['type']!r} missing {sorted(missing)}"
+    extra = set(value) - set(item.nested_members or value) - {"type"}
+    if extra:
+        return f"unknown members {sorted(extra)}"
+    return None
+
+
+def live_sample(round_id: int, node: int, every: int) -> bool:
+    """Does a predicted rejection still go live?  Stable across lanes and
+    reruns: a hash of round and node, not an rng draw."""
+    return int(stable_hash(f"{round_id}:{node}"), 16) % every == 0
+
+
+class PreAdmission:
+    """Per-campaign checker; safe to call from the lanes' threads."""
+
+    def __init__(self, catalog: list[ItemSpec],
+                 sample_every: int | None = None) -> None:
+        self.items = {item.path: item for item in catalog}
+        self.sample_every = sample_every if sample_every is not None \
+            else int(os.environ.get(SAMPLE_ENV, SAMPLE_EVERY))
+        self.untrusted: set[str] = set()
+        self.stats = {"checked": 0, "predicted": 0, "skipped": 0,
+                      "sampled": 0, "confirmed": 0, "contradicted": 0}
+        self._lock = threading.Lock()
+
+    @property
+    def enabled(self) -> bool:
+        return self.sample_every > 0
+
+    def check(self, files: list[Path], ops: list[MutationOp],
+              dry_run: Callable[[], str | None] | None = None) -> str | None:
+        """Why this node's mutated config will be rejected (None: no
+        known reason, restart it)."""
+        if not self.enabled or not ops:
+            return None
+        with self._lock:
+            self.stats["checked"] += 1
+            if any(op.item_path in self.untrusted for op in ops):
+                return None
+        by_name = {path.name: path for path in files}
+        editor = ConfigEditor(files[0].parent) if files else None
+        with editor.batch() if editor else contextlib.nullcontext():
+            # one parse per file for all of the node's ops
+            for op in ops:
+                item = self.items.get(op.item_path)
+                path = by_name.get(op.file)
+                if item is None or path is None or not path.is_file():
+                    continue
+                try:
+                    value = editor.read_value(path, item)
+                except Exception:  # noqa: BLE001 - unreadable: no verdict
+                    continue
+                reason = value_error(item, _coerce(value, item))
+                if reason is not None:
+                    return f"{item.path}: {reason}"
+        if dry_run is not None:
+            reason = dry_run()
+            if reason:
+                return f"dry run: {reason}"
+        return None
+
+    def sampled(self, round_id: int, node: int) -> bool:
+        """Does this predicted rejection still go live?  Counts it."""
+        sample = live_sample(round_id, node, self.sample_every)
+        with self._lock:
+            self.stats["predicted"] += 1
+            self.stats["sampled" if sample else "skipped"] += 1
+        return sample
+
+    def settle(self, ops: list[MutationOp], admitted: bool) -> None:
+        """A sampled prediction met the live verdict."""
+        with self._lock:
+            if admitted:
+                self.stats["contradicted"] += 1
+                self.untrusted.update(op.item_path for op in ops)
+            else:
+                self.stats["confirmed"] += 1
+
+    def summary(self) -> dict:
+        with self._lock:
+            return {**self.stats, "untrusted": sorted(self.untrusted)}
@@ -0,0 +1,122 @@
+"""Span profiler for campaign rounds (timeline.jsonl "profile").
+
+A round record used to carry one `elapsed`; a slow round could not say
+whether it went to config materialization, restarts, admission probes,
+seeds, a sequence, geth's sync_normals, the oracle or persistence.
+
+    with profiling("round", target="geth") as root:   # one per round
+        with span("admission"):
+            adapter.probe_admission(...)               # @profiled() inside
+
+`span()` and `@profiled()` nest under the innermost open span of the
+calling thread; with no profile open on the thread they cost one
+thread-local lookup, so the decorators stay on the adapter/network/oracle
+methods permanently.  Work fanned out to helper threads (probe_all,
+sync_all) is covered by its caller's span, not split per worker.
+
+`root.to_dict()` is the nested tree stored per round; `aggregate()` folds
+many trees into per-stack totals (bcfuzzer_profile.py prints them).
+"""
+
+from __future__ import annotations
+
+import functools
+import threading
+import time
+from contextlib import contextmanager
+from typing import Any, Callable, Iterable, Iterator
+
+_local = threading.local()
+
+
+class Span:
+    __slots__ = ("name", "attrs", "sec", "children")
+
+    def __init__(self, name: str, attrs: dict | None = None) -> None:
+        self.name = name
+        self.attrs = attrs or {}
+        self.sec = 0.0
+        self.children: list[Span] = []
+
+    def to_dict(self) -> dict:
+        out: dict[str, Any] = {"name": self.name, "sec": round(self.sec, 4)}
+        if self.attrs:
+            out.update(self.attrs)
+        if self.children:
+            out["children"] = [c.to_dict() for c in self.children]
+        return out
+
+
+@contextmanager
+def span(name: str, **attrs: Any) -> Iterator[Span | None]:
+    stack = getattr(_local, "stack", None)
+    if not stack:
+        yield None
+        return
+    node = Span(name, attrs)
+    stack[-1].children.append(node)
+    stack.append(node)
+    t0 = time.perf_counter()
+    try:
+        yield node
+    finally:
+        node.sec = time.perf_counter() - t0
+        stack.pop()
+
+
+def profiled(name: str | None = None) -> Callable:
+    """Decorator: run the function inside span(name or its qualname)."""
+    def wrap(fn: Callable) -> Callable:
+        label = name or fn.__qualname__
+
+        @functools.wraps(fn)
+        def inner(*args: Any, **kwargs: Any) -> Any:
+            if not getattr(_local, "stack", None):
+                return fn(*args, **kwargs)
+            with span(label):
+                return fn(*args, **kwargs)
+        return inner
+    return wrap
+
+
+@contextmanager
+def profiling(name: str = "round", **attrs: Any) -> Iterator[Span]:
+    """Open a root span on this thread (nested under an outer profile,
+    if one is open)."""
+    root = Span(name, attrs)
+    outer = getattr(_local, "stack", None)
+    _local.stack = [root]
+    t0 = time.perf_counter()
+    try:
+        yield root
+    finally:
+        root.sec = time.perf_counter() - t0
+        _local.stack = outer
+        if outer:
+            outer[-1].children.append(root)
+
+
+# ------------------------------------------------------------ aggregation
+
+def walk(tree: dict, prefix: tuple[str, ...] = ()
+         ) -> Iterator[tuple[tuple[str, ...], float, float]]:
+    """(stack, total sec, self sec) for every span of a profile tree."""
+    path = prefix + (tree["name"],)
+    children = tree.get("children", [])
+    child_sec = sum(c.get("sec", 0.0) for c in children)
+    total = tree.get("sec", 0.0)
+    yield path, total, max(0.0, total - child_sec)
+    for child in children:
+        yield from walk(child, path)
+
+
+def aggregate(trees: Iterable[dict]) -> dict[tuple[str, ...], dict]:
+    """{stack: {n, sec, self}} summed over trees."""
+    out: dict[tuple[str, ...], dict] = {}
+    for tree in trees:
+        for path, total, own in walk(tree):
+            entry = out.setdefault(path, {"n": 0, "sec": 0.0, "self": 0.0})
+            entry["n"] += 1
+            entry["sec"] += total
+            entry["self"] += own
+    return out
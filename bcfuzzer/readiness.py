@@ -0,0 +1,226 @@
+"""Readiness waits: block until a real condition holds, bounded by a budget.
+
+Round latency used to be dominated by fixed sleeps sized for the worst
+case — 10 s after a chainmaker start_all, 2 s after every stop, a flat
+45 s fisco settle, 6 s per geth mesh pass, 3 s between peer probes.  Each
+of those now waits on the condition the sleep stood in for and returns as
+soon as it holds:
+
+  wait_until(name, condition, timeout)   poll with backoff (0.2 s -> 2 s);
+                                         `fail` aborts early (process died)
+  port_open / wait_port / wait_closed    a TCP listener is (not) accepting
+  wait_log(name, tail, pattern, count)   a LogTail pattern count reached,
+                                         woken by inotify on the log dirs
+  DirWatch                               inotify on directories (ctypes,
+                                         Linux); degrades to plain polling
+
+The timeout is the old sleep's worst case or the caller's deadline, never
+a pause: a condition that holds at once costs one check.
+
+Every wait is recorded (name, budget, elapsed, ok) into the calling
+thread's recorder; the campaign opens one per round (`recording()`) and
+stores `summarize(...)` in the round record, so the timeline shows how
+long each readiness step took against its budget.  Waits made on helper
+threads (sync/probe fan-outs) are not attributed to the round.
+"""
+
+from __future__ import annotations
+
+import ctypes
+import os
+import select
+import socket
+import threading
+import time
+from contextlib import contextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Callable, Iterable, Iterator
+
+from .profiler import span
+
+INTERVAL = 0.2
+MAX_INTERVAL = 2.0
+
+_IN_MODIFY = 0x002
+_IN_CLOSE_WRITE = 0x008
+_IN_MOVED_TO = 0x080
+_IN_CREATE = 0x100
+_local = threading.local()
+
+
+@dataclass
+class WaitRecord:
+    name: str
+    budget: float
+    elapsed: float
+    ok: bool
+
+
+@contextmanager
+def recording() -> Iterator[list[WaitRecord]]:
+    """Collect the waits this thread makes inside the block (nested
+    blocks also report to the enclosing one)."""
+    outer = getattr(_local, "records", None)
+    records: list[WaitRecord] = []
+    _local.records = records
+    try:
+        yield records
+    finally:
+        _local.records = outer
+        if outer is not None:
+            outer.extend(records)
+
+
+def _note(name: str, budget: float, elapsed: float, ok: bool) -> None:
+    records = getattr(_local, "records", None)
+    if records is not None:
+        records.append(WaitRecord(name, round(budget, 3),
+                                  round(elapsed, 3), ok))
+
+
+def summarize(records: Iterable[WaitRecord]) -> dict[str, dict]:
+    """{name: {n, sec, budget, timeouts}} for a round record."""
+    out: dict[str, dict] = {}
+    for rec in records:
+        entry = out.setdefault(rec.name, {"n": 0, "sec": 0.0, "budget": 0.0,
+                                          "timeouts": 0})
+        entry["n"] += 1
+        entry["sec"] = round(entry["sec"] + rec.elapsed, 3)
+        entry["budget"] = round(entry["budget"] + rec.budget, 3)
+        entry["timeouts"] += 0 if rec.ok else 1
+    return out
+
+
+# ---------------------------------------------------------------- inotify
+
+class DirWatch:
+    """Wake on any write/create/rename inside `directories`.  Missing
+    directories are skipped; without inotify wait() just sleeps."""
+
+    def __init__(self, directories: Iterable[Path]) -> None:
+        self.fd = -1
+        try:
+            libc = ctypes.CDLL(None, use_errno=True)
+            fd = libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+        except (OSError, AttributeError):
+            return
+        if fd < 0:
+            return
+        mask = _IN_MODIFY | _IN_CLOSE_WRITE | _IN_MOVED_TO | _IN_CREATE
+        watched = 0
+        for directory in {str(d) for d in directories}:
+            if os.path.isdir(directory) and \
+                    libc.inotify_add_watch(fd, directory.encode(), mask) >= 0:
+                watched += 1
+        if watched:
+            self.fd = fd
+        else:
+            os.close(fd)
+
+    def wait(self, timeout: float) -> bool:
+        """True if something changed before `timeout` elapsed."""
+        if self.fd < 0:
+            time.sleep(timeout)
+            return False
+        ready, _, _ = select.select([self.fd], [], [], max(0.0, timeout))
+        if not ready:
+            return False
+        try:
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        return True
+
+    def close(self) -> None:
+        if self.fd >= 0:
+            os.close(self.fd)
+            self.fd = -1
+
+    def __enter__(self) -> "DirWatch":
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.close()
+
+
+# ------------------------------------------------------------------ waits
+
+def wait_until(name: str, condition: Callable[[], object], timeout: float,
+               interval: float = INTERVAL,
+               max_interval: float = MAX_INTERVAL,
+               fail: Callable[[], object] | None = None,
+               wake: DirWatch | None = None) -> bool:
+    """True as soon as `condition()` is truthy, False at the deadline or
+    once `fail()` is truthy.  A raising condition counts as not yet.
+    With `wake`, file events cut the pause short (re-checked at least
+    every max_interval)."""
+    start = time.monotonic()
+    with span(f"wait.{name}"):
+        ok = _poll(condition, start + timeout, interval, max_interval,
+                   fail, wake)
+    _note(name, timeout, time.monotonic() - start, ok)
+    return ok
+
+
+def _poll(condition: Callable[[], object], deadline: float,
+          interval: float, max_interval: float,
+          fail: Callable[[], object] | None,
+          wake: DirWatch | None) -> bool:
+    pause = interval
+    ok = False
+    while True:
+        try:
+            ok = bool(condition())
+        except Exception:
+            ok = False
+        if ok:
+            break
+        try:
+            if fail is not None and fail():
+                break
+        except Exception:
+            pass
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            break
+        if wake is not None:
+            wake.wait(min(remaining, max_interval))
+        else:
+            time.sleep(min(remaining, pause))
+            pause = min(pause * 2, max_interval)
+    return ok
+
+
+def port_open(port: int, host: str = "127.0.0.1",
+              timeout: float = 0.5) -> bool:
+    try:
+        with socket.create_connection((host, port), timeout=timeout):
+            return True
+    except OSError:
+        return False
+
+
+def wait_port(name: str, port: int, timeout: float,
+              host: str = "127.0.0.1") -> bool:
+    return wait_until(name, lambda: port_open(port, host), timeout)
+
+
+def wait_closed(name: str, port: int, timeout: float,
+                host: str = "127.0.0.1") -> bool:
+    """The listener is gone (the old process released its port)."""
+    return wait_until(name, lambda: not port_open(port, host), timeout)
+
+
+def wait_log(name: str, tail, pattern: str, count: int = 1,
+             timeout: float = 60.0,
+             directories: Iterable[Path] | None = None) -> bool:
+    """`tail.count(pattern) >= count` (a logtail.LogTail), re-checked
+    whenever a file in `directories` (default: the tail's current files'
+    directories) changes."""
+    if directories is None:
+        directories = {Path(p).parent for p in tail.source()}
+    with DirWatch(directories) as watch:
+        return wait_until(name, lambda: tail.count(pattern) >= count,
+                          timeout, wake=watch)
@@ -13,6 +13,13 @@ were added to the artifact as test_cases/chainmaker/11_* and 12_* with
 BUG_SPECS ids cm-11 / cm-12 (the original corpus numbering).  BCB #2/#3
 may not reproduce on ChainMaker v3.0.0 (RWMutex-hardened); the PoC scripts
 print [POC VERSION-GUARDED] and point to the original issue evidence.
+
+Test cases generated from the fuzzer's own minimized reports
+(bcfuzzer/pocgen.py, spec ids like sm-fz01) are part of a target's
+default set.  The cases run through full_bcfuzzer.run_suite: a target's
+PoCs share fixed ports and stay serial, while generated sim replays run
+up to `jobs` (--instances) at once.  BCFZ_VERDICT_GRACE=<s> stops each
+PoC that many seconds after its verdict line.
 """
 
 from __future__ import annotations
@@ -23,7 +30,9 @@ from pathlib import Path
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from full_bcfuzzer import BUG_INDEX, selected_specs, run_bug  # noqa: E402
+from full_bcfuzzer import (  # noqa: E402
+    BUG_INDEX, BUG_SPECS, run_suite, selected_specs,
+    verdict_grace_from_env)
 
 PAPER_TO_POC = {
     "ge-08": "ge-10", "ge-09": "ge-13",
@@ -37,7 +46,9 @@ def resolve_bugs(target: str, bugs: list[str] | None) -> list[str]:
     """Paper bug ids -> PoC bug ids for the target."""
     if bugs is None:
         return [poc for paper, poc in PAPER_TO_POC.items()
-                if BUG_INDEX[poc].target == target]
+                if BUG_INDEX[poc].target == target] + \
+            [spec.bug_id for spec in BUG_SPECS
+             if spec.source and spec.target == target]
     resolved = []
     for bug in bugs:
         poc = PAPER_TO_POC.get(bug, bug)  # allow PoC ids directly
@@ -47,19 +58,21 @@ def resolve_bugs(target: str, bugs: list[str] | None) -> list[str]:
     return resolved
 
 
-def run_regression(target: str, bugs: list[str] | None, out_dir: Path) -> list[dict]:
+def run_regression(target: str, bugs: list[str] | None, out_dir: Path,
+                   jobs: int = 1) -> list[dict]:
     poc_ids = resolve_bugs(target, bugs)
     specs = selected_specs({target}, set(poc_ids))
     out_dir.mkdir(parents=True, exist_ok=True)
-    records = []
     for spec in specs:
-        print(f"[regress] {spec.bug_id} ({spec.target}): {spec.description}",
+        print(f"[regress] {spec.bug_id} ({spec.target}): {spec.title}",
               flush=True)
-        record = run_bug(spec, out_dir)
-        records.append(record)
-        (out_dir / f"{spec.bug_id}.json").write_text(
+    records = run_suite(specs, out_dir, jobs,
+                        grace=verdict_grace_from_env())
+    for record in records:
+        (out_dir / f"{record['bug_id']}.json").write_text(
             json.dumps(record, indent=2, default=str), encoding="utf-8")
-        print(f"[regress] {spec.bug_id}: {record.get('status')}", flush=True)
+        print(f"[regress] {record['bug_id']}: {record.get('status')}",
+              flush=True)
     summary = {"total": len(records),
                "passed": sum(1 for r in records if r.get("status") == "pass"),
                "records": records}
@@ -0,0 +1,293 @@
+"""Host resource leases for concurrent campaign legs (ports, scratch, CPU/RAM).
+
+run_campaign.sh ran the four 13-node legs back to back because two
+factories booting at once fought over ports: geth's p2p range (30310+i)
+sits inside fisco's (30300+i) at offset 0, chainmaker's vm ports
+(22351/23351) land in fisco's RPC range for some hashed offsets, and the
+path-hashed offsets of geth/fisco can collide outright.
+
+A ResourcePool hands each leg a Lease:
+
+  - a port offset chosen so every port family of the leg's target
+    (TARGET_PORTS, shifted by the offset) is disjoint from all live
+    leases; the network factories take it as `port_offset`;
+  - a private scratch root (exported as BCFZ_SCRATCH / TMPDIR to the leg);
+  - a CPU/memory reservation (LEG_COST) — acquire() blocks until the
+    reservation fits next to the live leases (admission control), except
+    that a leg is always admitted onto an otherwise idle host.
+
+Leases are JSON files under one directory guarded by an flock, so several
+launchers on one host share the same accounting; a lease whose owner pid
+is gone is reclaimed.
+
+Aptos ports cannot be shifted by an offset: forge picks them at launch
+and writes the validator network addresses into genesis.  An aptos leg
+therefore leases no block up front and claims the ports its swarm bound
+once it is up (claim_ports, from the leg process: the launcher exports
+the leg name as BCFZ_LEASE); the claimed ports join the lease's ranges,
+so every later offset steers clear of them exactly as of a leased block.
+"""
+
+from __future__ import annotations
+
+import fcntl
+import json
+import os
+import tempfile
+import time
+from contextlib import contextmanager
+from dataclasses import asdict, dataclass, field
+from pathlib import Path
+from typing import Callable, Iterator
+
+RESOURCE_ENV = "BCFZ_RESOURCE_DIR"
+SCRATCH_ENV = "BCFZ_SCRATCH"
+LEASE_ENV = "BCFZ_LEASE"
+DEFAULT_ROOT = Path("/tmp/bcfuzzer-resources")
+
+# port families at offset 0, as (first port, count) for an n-node network
+TARGET_PORTS: dict[str, Callable[[int], list[tuple[int, int]]]] = {
+    "geth": lambda n: [(30310, n), (8545, n), (8551 + n, n)],
+    "fisco": lambda n: [(30300, n), (20200, n)],
+    "chainmaker": lambda n: [(11301, n), (12301, n), (22351, n),
+                             (23351, n), (32351, n)],
+    "aptos": lambda n: [],          # forge-picked; claimed after launch
+    "sim": lambda n: [],
+}
+# (cores, GiB) one 13-node leg keeps busy; stage-G host measurements,
+# rounded up
+LEG_COST: dict[str, tuple[float, float]] = {
+    "geth": (4.0, 6.0),
+    "fisco": (4.0, 4.0),
+    "chainmaker": (6.0, 8.0),
+    "aptos": (8.0, 16.0),
+    "sim": (1.0, 0.5),
+}
+PORT_STEP = 100
+PORT_LIMIT = 61000
+HEADROOM = (1.0, 2.0)           # cores, GiB left to the host itself
+
+
+def scratch_root() -> Path:
+    """The leg's private scratch directory (BCFZ_SCRATCH), else the
+    process temp dir."""
+    root = Path(os.environ.get(SCRATCH_ENV) or tempfile.gettempdir())
+    root.mkdir(parents=True, exist_ok=True)
+    return root
+
+
+def host_capacity() -> tuple[float, float]:
+    """(cores, GiB available) of this host."""
+    cores = float(os.cpu_count() or 1)
+    mem_gib = 0.0
+    try:
+        for line in Path("/proc/meminfo").read_text().splitlines():
+            if line.startswith("MemAvailable:"):
+                mem_gib = int(line.split()[1]) / (1 << 20)
+                break
+    except OSError:
+        pass
+    if not mem_gib:
+        mem_gib = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES") \
+            / (1 << 30)
+    return cores, mem_gib
+
+
+def _overlaps(a: tuple[int, int], b: tuple[int, int]) -> bool:
+    return a[0] < b[0] + b[1] and b[0] < a[0] + a[1]
+
+
+def free_offset(families: list[tuple[int, int]],
+                taken: list[tuple[int, int]]) -> int:
+    """Smallest multiple of PORT_STEP that shifts every family clear of
+    `taken` and below PORT_LIMIT."""
+    for offset in range(0, PORT_LIMIT, PORT_STEP):
+        shifted = [(base + offset, count) for base, count in families]
+        if any(base + count > PORT_LIMIT for base, count in shifted):
+            break
+        if not any(_overlaps(s, t) for s in shifted for t in taken):
+            return offset
+    raise RuntimeError("no free port block left below PORT_LIMIT")
+
+
+def lane_stride(families: list[tuple[int, int]]) -> int:
+    """Port shift between two instances of one target (a campaign's
+    --instances lanes): the smallest PORT_STEP multiple at which the
+    families clear themselves."""
+    for offset in range(PORT_STEP, PORT_LIMIT, PORT_STEP):
+        shifted = [(base + offset, count) for base, count in families]
+        if not any(_overlaps(s, f) for s in shifted for f in families):
+            return offset
+    raise RuntimeError("port families too wide to stack instances")
+
+
+def lane_families(families: list[tuple[int, int]],
+                  instances: int) -> list[tuple[int, int]]:
+    """The families of `instances` stacked lanes, lane k shifted by
+    k * lane_stride (lane_offsets)."""
+    if instances <= 1 or not families:
+        return list(families)
+    stride = lane_stride(families)
+    return [(base + k * stride, count) for k in range(instances)
+            for base, count in families]
+
+
+def lane_offsets(families: list[tuple[int, int]], base: int,
+                 instances: int) -> list[int]:
+    """Port offset of every lane of a leg leased at offset `base`."""
+    if instances <= 1 or not families:
+        return [base] * max(instances, 1)
+    stride = lane_stride(families)
+    return [base + k * stride for k in range(instances)]
+
+
+@dataclass
+class Lease:
+    leg: str
+    target: str
+    pid: int
+    port_offset: int
+    scratch: str
+    cores: float
+    mem_gib: float
+    ranges: list = field(default_factory=list)
+    acquired: float = 0.0
+
+    def env(self) -> dict[str, str]:
+        """Environment for the leg's processes."""
+        return {SCRATCH_ENV: self.scratch, "TMPDIR": self.scratch,
+                LEASE_ENV: self.leg}
+
+
+def _pid_alive(pid: int) -> bool:
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    return True
+
+
+class ResourcePool:
+    def __init__(self, root: Path | None = None,
+                 capacity: tuple[float, float] | None = None,
+                 headroom: tuple[float, float] = HEADROOM,
+                 costs: dict[str, tuple[float, float]] | None = None) -> None:
+        self.root = Path(root or os.environ.get(RESOURCE_ENV) or DEFAULT_ROOT)
+        self.capacity = capacity or host_capacity()
+        self.headroom = headroom
+        self.costs = {**LEG_COST, **(costs or {})}
+
+    @contextmanager
+    def _locked(self) -> Iterator[None]:
+        self.root.mkdir(parents=True, exist_ok=True)
+        with (self.root / "pool.lock").open("w") as lock_fh:
+            fcntl.flock(lock_fh.fileno(), fcntl.LOCK_EX)
+            yield
+
+    def _lease_path(self, leg: str) -> Path:
+        return self.root / "leases" / f"{leg}.json"
+
+    def _live_leases(self) -> list[Lease]:
+        leases: list[Lease] = []
+        for path in sorted((self.root / "leases").glob("*.json")):
+            try:
+                lease = Lease(**json.loads(path.read_text(encoding="utf-8")))
+            except (OSError, ValueError, TypeError):
+                path.unlink(missing_ok=True)
+                continue
+            if _pid_alive(lease.pid):
+                leases.append(lease)
+            else:
+                path.unlink(missing_ok=True)   # owner died: reclaim
+        return leases
+
+    def leases(self) -> list[Lease]:
+        with self._locked():
+            return self._live_leases()
+
+    def fits(self, cores: float, mem_gib: float, live: list[Lease]) -> bool:
+        if not live:
+            return True         # an idle host always takes one leg
+        used_cores = sum(lease.cores for lease in live)
+        used_mem = sum(lease.mem_gib for lease in live)
+        return (used_cores + cores <= self.capacity[0] - self.headroom[0]
+                and used_mem + mem_gib <= self.capacity[1] - self.headroom[1])
+
+    def try_acquire(self, leg: str, target: str, n_nodes: int = 13,
+                    scratch_base: Path | None = None,
+                    pid: int | None = None,
+                    instances: int = 1) -> Lease | None:
+        """A leg running `instances` network lanes reserves that many
+        LEG_COSTs and port blocks (lane_offsets from the lease offset)."""
+        cores, mem_gib = self.costs.get(target, (1.0, 1.0))
+        cores, mem_gib = cores * instances, mem_gib * instances
+        with self._locked():
+            live = self._live_leases()
+            if any(lease.leg == leg for lease in live):
+                raise RuntimeError(f"leg {leg!r} already holds a lease")
+            if not self.fits(cores, mem_gib, live):
+                return None
+            families = lane_families(
+                TARGET_PORTS.get(target, lambda n: [])(n_nodes), instances)
+            taken = [tuple(r) for lease in live for r in lease.ranges]
+            offset = free_offset(families, taken)
+            scratch = Path(scratch_base or self.root / "scratch") / leg
+            scratch.mkdir(parents=True, exist_ok=True)
+            lease = Lease(leg=leg, target=target, pid=pid or os.getpid(),
+                          port_offset=offset, scratch=str(scratch),
+                          cores=cores, mem_gib=mem_gib,
+                          ranges=[[base + offset, count]
+                                  for base, count in families],
+                          acquired=time.time())
+            path = self._lease_path(leg)
+            path.parent.mkdir(parents=True, exist_ok=True)
+            path.write_text(json.dumps(asdict(lease)), encoding="utf-8")
+            return lease
+
+    def acquire(self, leg: str, target: str, n_nodes: int = 13,
+                scratch_base: Path | None = None, poll: float = 10.0,
+                timeout: float | None = None, instances: int = 1) -> Lease:
+        """Block until the leg is admitted (see try_acquire)."""
+        deadline = time.monotonic() + timeout if timeout else None
+        while True:
+            lease = self.try_acquire(leg, target, n_nodes, scratch_base,
+                                     instances=instances)
+            if lease is not None:
+                return lease
+            if deadline is not None and time.monotonic() > deadline:
+                raise TimeoutError(f"leg {leg!r} not admitted in {timeout}s")
+            time.sleep(poll)
+
+    def claim(self, leg: str, ports: list[tuple[int, int]]
+              ) -> list[tuple[int, int]]:
+        """Add ports a leg's network picked itself (aptos) to its lease;
+        returns the ones another live lease already holds."""
+        with self._locked():
+            live = self._live_leases()
+            mine = next((lease for lease in live if lease.leg == leg), None)
+            if mine is None:
+                return []
+            taken = [tuple(r) for lease in live if lease.leg != leg
+                     for r in lease.ranges]
+            clashes = [tuple(p) for p in ports
+                       if any(_overlaps(tuple(p), t) for t in taken)]
+            known = {tuple(r) for r in mine.ranges}
+            mine.ranges += [list(p) for p in ports if tuple(p) not in known]
+            self._lease_path(leg).write_text(json.dumps(asdict(mine)),
+                                             encoding="utf-8")
+            return clashes
+
+    def release(self, lease: Lease) -> None:
+        with self._locked():
+            self._lease_path(lease.leg).unlink(missing_ok=True)
+
+
+def claim_ports(ports: list[tuple[int, int]]) -> list[tuple[int, int]]:
+    """ResourcePool.claim for this process's leg (BCFZ_LEASE); a no-op
+    outside the launcher."""
+    leg = os.environ.get(LEASE_ENV)
+    if not leg or not ports:
+        return []
+    return ResourcePool().claim(leg, ports)
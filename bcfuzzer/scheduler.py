@@ -13,7 +13,14 @@ Inner level — workload placement:
     identical placements share a test counter.
   - Each seed's execution count is tracked per (placement_hash, seed_id);
     the least-tested seed whose preconditions hold is chosen (max_scan=8 to
-    avoid starvation).
+    avoid starvation).  Fuzzing placements draw from a pool of hundreds of
+    configs, so nearly every round is a new placement: the counters live in
+    a bounded LRU (SeedCounters) whose evicted rows fold into per-seed
+    aggregate counts.
+  - Seeds are indexed by their precondition key (the canonical form of
+    Seed.preconditions; a corpus has a handful of distinct ones).  A pick
+    decides each key it meets once against the node's mutations and skips
+    the other candidates of a failing key by lookup.
 
 The scheduler is pure: it proposes (item, rule, value) edits and seed ids;
 the campaign materializes them on disk and feeds admission verdicts back
@@ -22,7 +29,10 @@ into the MEI (the only feedback path — design's feedback separation).
 
 from __future__ import annotations
 
+import heapq
 import random
+from array import array
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import Any, Callable
@@ -71,6 +81,172 @@ def placement_hash(plans: list[NodePlan]) -> str:
     return stable_hash(assignment)
 
 
+PLACEMENT_CAPACITY = 4096       # live per-placement counter rows
+MAX_SCAN = 8                    # pick_seed starvation bound
+
+PreKey = tuple[tuple[str, str], ...]
+
+
+def precondition_key(preconditions: dict[str, Any] | None) -> PreKey:
+    """Canonical, hashable form of Seed.preconditions (() = none)."""
+    return tuple(sorted((str(k), str(v))
+                        for k, v in (preconditions or {}).items()))
+
+
+def preconditions_hold(target: str, key: PreKey, node: NodePlan) -> bool:
+    """Do the preconditions of `key` hold on this node's placement?
+
+    config=<path>=<value>  the node's mutations set path to value (case-
+                           insensitive: YAML/TOML booleans round-trip as
+                           True/true)
+    role=proposer          chainmaker only.  TBFT round-robins the proposer
+                           through all orgs; the capability flag takes
+                           effect on the restarted org's next proposal, and
+                           the malicious batch panics the VERIFIER orgs
+                           (detected by the oracle), so the seed need not
+                           wait for the controlled org to currently hold
+                           the role.  The prior `current_proposer() == org`
+                           gate starved every M seed in the stageG3
+                           chainmaker leg: cmc consensus status returns no
+                           proposer field (the org is base64-encoded inside
+                           protobuf vote signatures), so current_proposer()
+                           never resolved and 0/3 M seeds executed across
+                           50 rounds.
+    other keys hold."""
+    for name, expected in key:
+        if name == "config":
+            path, value = expected.split("=", 1)
+            if not any(p == path and str(v).lower() == value.lower()
+                       for p, _, v in node.mutations):
+                return False
+        elif name == "role" and expected == "proposer":
+            if target != "chainmaker":
+                return False
+    return True
+
+
+class SeedCounters:
+    """Per-placement seed execution counts, bounded.
+
+    Seed ids are interned (rank in sorted id order, which is also the
+    least-tested tie-break) and each placement holds one array of counts.
+    Rows are kept in LRU order; past `capacity` the coldest row is evicted
+    and its counts are added to `cold`, the per-seed aggregate over every
+    evicted placement.  `cold` breaks ties between seeds a placement has
+    run equally often (a new or re-created placement: all of them), so
+    seeds the campaign ran a lot elsewhere go last — and until the first
+    eviction it is all zeros and the order is exactly (count, seed_id).
+
+    Changes since the last drain() are reported as whole rows, evicted
+    placements and the whole `cold` vector: absolute values, replayed by
+    restore() (journal.py)."""
+
+    def __init__(self, seed_ids: list[str],
+                 capacity: int = PLACEMENT_CAPACITY) -> None:
+        self.ids = sorted(set(seed_ids))
+        self.rank = {seed_id: i for i, seed_id in enumerate(self.ids)}
+        self.capacity = capacity
+        self.rows: OrderedDict[str, array] = OrderedDict()
+        self.cold = array("I", bytes(4 * len(self.ids)))
+        self._dirty: set[str] = set()
+        self._evicted: set[str] = set()
+        self._cold_dirty = False
+        self.cold_used = False          # any non-zero aggregate count
+
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def row(self, placement: str) -> array:
+        """The placement's counts (created empty), marked most recent."""
+        row = self.rows.get(placement)
+        if row is not None:
+            self.rows.move_to_end(placement)
+            return row
+        row = self.rows[placement] = array("I", bytes(4 * len(self.ids)))
+        while len(self.rows) > self.capacity:
+            evicted, counts = self.rows.popitem(last=False)
+            for i, n in enumerate(counts):
+                if n:
+                    self.cold[i] += n
+                    self._cold_dirty = self.cold_used = True
+            self._evicted.add(evicted)
+        return row
+
+    def bump(self, placement: str, seed_id: str) -> None:
+        rank = self.rank.get(seed_id)
+        if rank is None:
+            return
+        self.row(placement)[rank] += 1
+        self._dirty.add(placement)
+
+    def get(self, placement: str, seed_id: str) -> int:
+        row = self.rows.get(placement)
+        rank = self.rank.get(seed_id)
+        return 0 if row is None or rank is None else row[rank]
+
+    def copy(self) -> "SeedCounters":
+        twin = SeedCounters([], self.capacity)
+        twin.ids, twin.rank = self.ids, self.rank
+        twin.rows = OrderedDict((p, array("I", row))
+                                for p, row in self.rows.items())
+        twin.cold = array("I", self.cold)
+        twin.cold_used = self.cold_used
+        return twin
+
+    # -- persistence (scheduler.json keeps its {placement: {seed: n}} map)
+
+    def _named(self, counts: array) -> dict[str, int]:
+        return {self.ids[i]: n for i, n in enumerate(counts) if n}
+
+    def to_json(self) -> tuple[dict[str, dict[str, int]], dict[str, int]]:
+        """({placement: {seed_id: n}} oldest first, {seed_id: cold n})."""
+        return ({p: self._named(row) for p, row in self.rows.items()},
+                self._named(self.cold))
+
+    def restore(self, rows: dict[str, dict[str, int]],
+                cold: dict[str, int] | None = None,
+                evicted: list[str] = ()) -> None:
+        """Set rows and the aggregate to saved/journaled values (whole
+        rows replace; no eviction folding — the values are final)."""
+        for placement in evicted:
+            self.rows.pop(placement, None)
+        for placement, counts in rows.items():
+            row = array("I", bytes(4 * len(self.ids)))
+            for seed_id, n in counts.items():
+                if seed_id in self.rank:
+                    row[self.rank[seed_id]] = n
+            self.rows.pop(placement, None)
+            self.rows[placement] = row
+        if cold is not None:
+            self.cold = array("I", bytes(4 * len(self.ids)))
+            for seed_id, n in cold.items():
+                if seed_id in self.rank:
+                    self.cold[self.rank[seed_id]] = n
+            self.cold_used = any(self.cold)
+
+    def trim(self) -> None:
+        """Evict down to capacity (a state file from before the bound)."""
+        while len(self.rows) > self.capacity:
+            _, counts = self.rows.popitem(last=False)
+            for i, n in enumerate(counts):
+                self.cold[i] += n
+            self.cold_used = any(self.cold)
+
+    def drain(self) -> dict:
+        delta: dict = {"counts": {p: self._named(self.rows[p])
+                                  for p in sorted(self._dirty)
+                                  if p in self.rows}}
+        evicted = sorted(p for p in self._evicted if p not in self.rows)
+        if evicted:
+            delta["evicted"] = evicted
+        if self._cold_dirty:
+            delta["cold"] = self._named(self.cold)
+        self._dirty.clear()
+        self._evicted.clear()
+        self._cold_dirty = False
+        return delta
+
+
 class TwoLevelScheduler:
     def __init__(self, target: str, catalog: list[ItemSpec], seeds: list[Seed],
                  n_nodes: int, controlled_indices: list[int],
@@ -85,8 +261,23 @@ class TwoLevelScheduler:
         self.exploration_rounds = exploration_rounds
         self.round_id = 0
         self.pool: list[str] = ["default"]
-        self.counts: dict[str, dict[str, int]] = {}
+        self.counts = SeedCounters([s.seed_id for s in seeds])
         self._last_plan: RoundPlan | None = None
+        # seed index: per node kind, the eligible seeds in seed-id order
+        # with their interned rank (the pick never re-filters or sorts),
+        # and their precondition keys
+        self._eligible = {
+            kind: [(self.counts.rank[s.seed_id], s) for s in sorted(
+                (s for s in seeds if s.role == "normal" or (
+                    kind == "controlled"
+                    and s.role in ("controlled", "proposer", "engine"))),
+                key=lambda s: s.seed_id)]
+            for kind in ("controlled", "normal")}
+        self._pre_keys = {
+            kind: [precondition_key(s.preconditions) for _, s in eligible]
+            for kind, eligible in self._eligible.items()}
+        # pool admits since the last drain_delta() (journal.py)
+        self._journaled_pool = len(self.pool)
 
     # ------------------------------------------------------------------ pool
 
@@ -115,14 +306,13 @@ class TwoLevelScheduler:
 
     def _p_unexplored(self, item: ItemSpec, mei: MeiState) -> float:
         """P_unexplored(i) = 1 / (|V_i| + 1) with |V_i| = explored values."""
-        vi = len(mei.explored.get(item.path, set()))
+        vi = mei.explored_count(item)
         return 1.0 / (vi + 1.0)
 
     def _pick_exploration_item(self, mei: MeiState) -> ItemSpec:
-        """Least-explored item first (deterministic tie-break by path)."""
-        def key(item: ItemSpec) -> tuple[int, str]:
-            return (len(mei.explored.get(item.path, set())), item.path)
-        return min(self.catalog, key=key)
+        """Least-explored item first (deterministic tie-break by path);
+        served from the MEI's heap, not a catalog scan."""
+        return mei.least_explored(self.catalog)
 
     def _pick_fuzzing_item(self, mei: MeiState) -> ItemSpec:
         """Fuzzing-phase item choice over the FULL catalog.
@@ -132,8 +322,7 @@ class TwoLevelScheduler:
         hogged every round while the rest of the catalog stayed untouched
         (chainmaker leg: 115 rounds, 3 of ~30 items mutated).  Now 25% of
         picks inject breadth by taking the least-explored item instead."""
-        inconsistent = [i for i in self.catalog
-                        if mei.status(i) == "inconsistent"]
+        inconsistent = mei.inconsistent_items(self.catalog)
         if self.rng.random() < 0.25 or not inconsistent:
             return self._pick_exploration_item(mei)
         return self.rng.choice(inconsistent)
@@ -185,43 +374,89 @@ class TwoLevelScheduler:
         self._last_plan = plan
         return plan
 
+    def fork(self) -> "TwoLevelScheduler":
+        """Throwaway copy for speculative planning (pipeline.py): same
+        round, pool and counts, rng at the same state — fork.next_round(mei)
+        is what next_round(mei) returns if nothing is committed first."""
+        rng = random.Random()
+        rng.setstate(self.rng.getstate())
+        twin = TwoLevelScheduler(self.target, self.catalog, self.seeds,
+                                 self.n_nodes, list(self.controlled), rng,
+                                 exploration_rounds=self.exploration_rounds)
+        twin.round_id = self.round_id
+        twin.pool = list(self.pool)
+        twin.counts = self.counts.copy()
+        return twin
+
     # ------------------------------------------------------- workload placement
 
     def pick_seed(self, plan: RoundPlan, node: NodePlan,
                   precondition_ok: Callable[[Seed], bool] | None = None) -> Seed | None:
-        """Least-tested seed for this placement hash; max_scan=8 starvation bound."""
-        counts = self.counts.setdefault(plan.placement_hash, {})
+        """Least-tested seed for this placement hash whose preconditions
+        hold on the node (and that `precondition_ok`, an extra per-seed
+        filter, accepts); max_scan=8 starvation bound."""
         node_kind = "controlled" if node.role in ("exploration", "fuzzing") else "normal"
-        eligible = [s for s in self.seeds
-                    if s.role == "normal"
-                    or (node_kind == "controlled"
-                        and s.role in ("controlled", "proposer", "engine"))]
+        eligible = self._eligible[node_kind]
         if not eligible:
             return None
-        eligible.sort(key=lambda s: (counts.get(s.seed_id, 0), s.seed_id))
-        scan = 0
-        for seed in eligible:
-            scan += 1
-            if scan > 8:  # starvation bound: stop scanning blocked seeds
-                break
+        keys = self._pre_keys[node_kind]
+        holds: dict[PreKey, bool] = {(): True}
+        row = self.counts.row(plan.placement_hash)
+        cold = self.counts.cold
+        if not self.counts.cold_used and row.count(0) == len(row):
+            # untouched placement, no aggregate counts: seed-id order
+            order: Any = range(min(MAX_SCAN, len(eligible)))
+        else:
+            # only the MAX_SCAN least-tested are ever looked at: select
+            # them (order (count, cold, seed_id)) rather than sort them all
+            def key(i: int) -> tuple[int, int, int]:
+                rank = eligible[i][0]
+                return (row[rank], cold[rank], i)
+            order = sorted(range(len(eligible)), key=key)[:MAX_SCAN] \
+                if len(eligible) <= 4 * MAX_SCAN else \
+                heapq.nsmallest(MAX_SCAN, range(len(eligible)), key=key)
+        for i in order:
+            key = keys[i]
+            if key not in holds:
+                holds[key] = preconditions_hold(self.target, key, node)
+            if not holds[key]:
+                continue
+            seed = eligible[i][1]
             if precondition_ok is not None and not precondition_ok(seed):
                 continue
-            counts[seed.seed_id] = counts.get(seed.seed_id, 0) + 1
+            self.counts.bump(plan.placement_hash, seed.seed_id)
             return seed
         return None
 
     def record_seed_execution(self, placement_hash: str, seed_id: str) -> None:
-        counts = self.counts.setdefault(placement_hash, {})
-        counts[seed_id] = counts.get(seed_id, 0) + 1
+        self.counts.bump(placement_hash, seed_id)
 
     # ------------------------------------------------------------- persistence
 
+    def drain_delta(self) -> dict:
+        """Round counter, pool admits and seed counter rows changed since
+        the last drain, as absolute values (replay is idempotent)."""
+        pool = self.pool[self._journaled_pool:]
+        self._journaled_pool = len(self.pool)
+        return {"round_id": self.round_id, "pool": pool,
+                **self.counts.drain()}
+
+    def apply_delta(self, delta: dict) -> None:
+        self.round_id = max(self.round_id, delta.get("round_id", 0))
+        for config_id in delta.get("pool", []):
+            self.admit_config(config_id)
+        self.counts.restore(delta.get("counts", {}), delta.get("cold"),
+                            delta.get("evicted", []))
+        self._journaled_pool = len(self.pool)
+
     def save(self, path: Path) -> None:
+        counts, cold = self.counts.to_json()
         save_json(path, {
             "target": self.target,
             "round_id": self.round_id,
             "pool": self.pool,
-            "counts": self.counts,
+            "counts": counts,
+            "cold_counts": cold,
             "controlled": self.controlled,
         })
 
@@ -235,5 +470,8 @@ class TwoLevelScheduler:
                     data["controlled"], rng)
         sched.round_id = data.get("round_id", 0)
         sched.pool = data.get("pool", ["default"])
-        sched.counts = data.get("counts", {})
+        sched.counts.restore(data.get("counts", {}),
+                             data.get("cold_counts", {}))
+        sched.counts.trim()
+        sched._journaled_pool = len(sched.pool)
         return sched
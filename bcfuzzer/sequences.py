@@ -17,6 +17,9 @@ counts, so least-tested scheduling covers them too).
   concurrent_workload  background transaction thread while a restart
                        cycle runs (overlap service for #2/#3)
   submit_pair          geth: nonce-equal replacement pair (paper #9)
+
+The sim target (targets/sim_net.py) runs every primitive on the model's
+tick clock: no thread or sleep stands in for network time.
 """
 
 from __future__ import annotations
@@ -26,6 +29,7 @@ import time
 
 from .corpus_t import corpus_t
 from .corpus_m import corpus_m
+from .readiness import wait_until
 
 
 def drive_blocks(net, adapter, target: str, count: int,
@@ -45,6 +49,8 @@ def drive_blocks(net, adapter, target: str, count: int,
     if target == "chainmaker":
         org = net.orgs[node_index]
         return {"invoked": net.invoke(org, max(4, count))}
+    if target == "sim":
+        return {"blocks": net.tick(count)}
     if target == "aptos":
         import asyncio
         from live_node_aptos import submit_transfers
@@ -66,33 +72,35 @@ def rotate_role(net, adapter, target: str, old_index: int, new_index: int,
         # TBFT rotates the proposer per round; wait until `new_index`
         # proposes (cmc consensus status polling), bounded by timeout.
         org = net.orgs[new_index]
-        deadline = time.monotonic() + 180
-        while time.monotonic() < deadline:
-            proposer = net.current_proposer()
-            if proposer == org:
-                return {"proposer": org, "waited": True}
-            time.sleep(3)
+        if wait_until("rotate.chainmaker_proposer",
+                      lambda: net.current_proposer() == org, 180):
+            return {"proposer": org, "waited": True}
         return {"proposer": net.current_proposer(), "timeout": True}
     if target == "fisco":
         # PBFT view rotation: wait until node new_index holds the view leader
         # slot (view % n == new_index), bounded.
-        deadline = time.monotonic() + 180
-        while time.monotonic() < deadline:
-            view = net.pbft_view(new_index)
-            if view >= 0 and view % net.n == new_index:
-                return {"view": view, "leader": new_index}
-            time.sleep(2)
+        seen = {"view": -1}
+
+        def leads() -> bool:
+            seen["view"] = net.pbft_view(new_index)
+            return seen["view"] >= 0 and seen["view"] % net.n == new_index
+
+        if wait_until("rotate.fisco_view", leads, 180):
+            return {"view": seen["view"], "leader": new_index}
         return {"view": net.pbft_view(new_index), "timeout": True}
     if target == "aptos":
         # aptos rotates by epoch; just wait for ledger growth on new_index
         before = net.ledger(new_index)
-        deadline = time.monotonic() + 60
-        while time.monotonic() < deadline:
-            if net.ledger(new_index) is not None and \
-                    (before is None or net.ledger(new_index) > before + 2):
-                return {"ledger": net.ledger(new_index)}
-            time.sleep(2)
+
+        def grew() -> bool:
+            ledger = net.ledger(new_index)
+            return ledger is not None and (before is None
+                                           or ledger > before + 2)
+
+        wait_until("rotate.aptos_ledger", grew, 60)
         return {"ledger": net.ledger(new_index)}
+    if target == "sim":
+        return net.rotate_leader(new_index)
     return {"skipped": True}
 
 
@@ -102,23 +110,29 @@ def restart_cycle(net, adapter, target: str, index: int, cycles: int,
     results = []
     for cycle in range(cycles):
         if target == "geth":
-            net.stop_all()  # geth restarts need the full net back up
-            ok = net.start_all(net.configs, net.miners,
-                               net.work / "logs")
+            # one node, same config and role; peers re-dialled directly
+            ok = net.restart_node(index, net.configs.get(index),
+                                  index in net.miners,
+                                  net.work / "logs" / f"node{index}.log")
+            net.reconnect([index])
             results.append(ok)
         elif target == "chainmaker":
             org = net.orgs[index]
             net.stop_org(org)
-            time.sleep(2)
+            net.wait_stopped(org)
             results.append(net.start_org(org))
         elif target == "fisco":
             net.stop_node(index)
             results.append(net.start_node(index))
         elif target == "aptos":
             net.stop_node(index)
-            time.sleep(2)
+            wait_until("aptos.stopped", lambda: not net.alive(index), 10)
+            results.append(net.start_node(index))
+        elif target == "sim":
+            net.stop_node(index)
             results.append(net.start_node(index))
-        time.sleep(1)
+        # start_* return once the node serves again: no settle pause
+        # between cycles
     return {"cycles": cycles, "results": results,
             "survived": sum(1 for r in results if r)}
 
@@ -131,6 +145,14 @@ def concurrent_workload(net, adapter, target: str, index: int,
     seed = seeds[0] if seeds else None
     if seed is None:
         return {"skipped": True}
+    if target == "sim":
+        # one wave per 0.5 s slot of `duration`, each followed by a tick
+        stats = {"submitted": 0}
+        for _ in range(max(1, int(duration / 0.5))):
+            stats["submitted"] += int(adapter.submit_seed(
+                net, seed, {"node_index": index}).get("sent", 0))
+            net.tick()
+        return stats
     stop = threading.Event()
     stats = {"submitted": 0}
 
@@ -0,0 +1,283 @@
+"""Warm-network templates: freeze a stopped runtime once, clone it per use.
+
+Every campaign and calibration leg used to rebuild its network from
+scratch — fisco build_chain.sh + start + up to 180 s waiting for block 1,
+13 chainmaker tarball extractions, 13 `geth init` runs, a 420 s forge
+launch for aptos.  A SnapshotStore keeps, per
+
+    target + stage + binary content hash + node layout
+
+one template directory: the stopped runtime (data dirs, configs, keys,
+committed blocks) minus its logs.  A new runtime is a `cp -a
+--reflink=auto` clone of the template (copy-on-write on btrfs/xfs, plain
+copy elsewhere; hardlinks would let the running nodes write through into
+the template).  Files that spell out the template's absolute root path
+(configs, start scripts, sdk yml) are rewritten to the new root, and so
+are symlinks that point into it.
+
+Stages:
+  built  provisioned but never started (calibration: presets are applied
+         to genesis/configs before the first launch)
+  warm   started, warmed up (committed blocks), then stopped (campaigns)
+
+The key leaves the port offset out — fisco/geth derive theirs from the
+runtime path, launcher legs and lanes lease theirs — so one template
+serves every --output and lane.  The manifest records the offset the
+template was built at, and adopt() hands a clone at a different offset
+to the network's rebase_ports(old_offset) before attach(): fisco and
+chainmaker move the ports baked into their node configs, geth passes its
+ports on the command line and has nothing to move.  Aptos keeps the
+ports forge picked; a clone whose ports are held by a live swarm is
+relaunched instead (NetSession).
+
+Set BCFZ_SNAPSHOT_DIR (bcfuzzer_campaign.py --snapshot-dir) to enable.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+import re
+import shutil
+import stat
+import subprocess
+import time
+from pathlib import Path
+from typing import Any, Callable
+
+from .common import load_json, save_json
+
+SNAPSHOT_ENV = "BCFZ_SNAPSHOT_DIR"
+LOG_DIRS = {"log", "logs"}
+LOG_SUFFIXES = (".log", ".ipc")
+REWRITE_MAX_BYTES = 4 << 20     # larger files are data, never configs
+BINARY_PROBE = 8192
+
+_digest_memo: dict[tuple[str, int, int], str] = {}
+# a port in a config: `listen_port=30300`, `port: 11301`, `127.0.0.1:20200`,
+# `/ip4/127.0.0.1/tcp/11301`
+_PORT_VALUE = re.compile(r"(?<=[:=/])(\s*)(\d{2,5})\b")
+
+
+def file_digest(path: Path) -> str:
+    """sha256 of a binary, memoized on (path, size, mtime)."""
+    path = Path(path)
+    try:
+        st = path.stat()
+    except OSError:
+        return "missing"
+    memo = (str(path.resolve()), st.st_size, st.st_mtime_ns)
+    if memo not in _digest_memo:
+        digest = hashlib.sha256()
+        with path.open("rb") as fh:
+            for block in iter(lambda: fh.read(1 << 20), b""):
+                digest.update(block)
+        _digest_memo[memo] = digest.hexdigest()
+    return _digest_memo[memo]
+
+
+def rebase_port_text(text: str, families: list[tuple[int, int]],
+                     old_offset: int, new_offset: int) -> str:
+    """Move every port of `families` (as at offset 0) from old_offset to
+    new_offset; other numbers are left alone."""
+    delta = new_offset - old_offset
+
+    def move(match: re.Match) -> str:
+        port = int(match.group(2))
+        if any(base + old_offset <= port < base + old_offset + count
+               for base, count in families):
+            return f"{match.group(1)}{port + delta}"
+        return match.group(0)
+
+    return _PORT_VALUE.sub(move, text) if delta else text
+
+
+def _ignore_logs(directory: str, names: list[str]) -> set[str]:
+    """copytree ignore: log dirs are kept but emptied, log files and
+    sockets dropped (a clone must not inherit the template's readiness
+    markers — fisco counts reachNewView in the logs)."""
+    if Path(directory).name in LOG_DIRS:
+        return set(names)
+    skipped = set()
+    for name in names:
+        path = os.path.join(directory, name)
+        if name.endswith(LOG_SUFFIXES):
+            skipped.add(name)
+            continue
+        try:
+            if stat.S_ISSOCK(os.lstat(path).st_mode):
+                skipped.add(name)
+        except OSError:
+            skipped.add(name)
+    return skipped
+
+
+def _roots(root: str) -> list[str]:
+    resolved = str(Path(root).resolve())
+    return [root] if resolved == root else [root, resolved]
+
+
+def _scan_rewrites(tree: Path, roots: list[str]) -> tuple[list[str], list[str]]:
+    """Relative paths of text files / symlinks that mention a root."""
+    needles = [r.encode() for r in roots]
+    files: list[str] = []
+    links: list[str] = []
+    for dirpath, dirnames, filenames in os.walk(tree):
+        for name in dirnames + filenames:
+            path = Path(dirpath) / name
+            rel = str(path.relative_to(tree))
+            if path.is_symlink():
+                if any(os.readlink(path).startswith(r) for r in roots):
+                    links.append(rel)
+                continue
+            if name in dirnames:
+                continue
+            try:
+                if path.stat().st_size > REWRITE_MAX_BYTES:
+                    continue
+                data = path.read_bytes()
+            except OSError:
+                continue
+            if b"\0" in data[:BINARY_PROBE]:
+                continue
+            if any(n in data for n in needles):
+                files.append(rel)
+    return files, links
+
+
+class SnapshotStore:
+    def __init__(self, root: Path) -> None:
+        self.root = Path(root)
+        self.stats = {"hits": 0, "misses": 0, "freezes": 0}
+
+    @classmethod
+    def from_env(cls) -> "SnapshotStore | None":
+        root = os.environ.get(SNAPSHOT_ENV)
+        return cls(Path(root)) if root else None
+
+    # ------------------------------------------------------------------ keys
+
+    def key(self, target: str, identity: dict, stage: str = "warm") -> str:
+        """identity = {"binaries": [paths], "layout": {...}} (the network's
+        snapshot_identity())."""
+        material = {
+            "target": target, "stage": stage,
+            "binaries": sorted(file_digest(Path(p))
+                               for p in identity.get("binaries", [])),
+            "layout": identity.get("layout", {}),
+        }
+        digest = hashlib.sha256(json.dumps(
+            material, sort_keys=True, default=str).encode()).hexdigest()
+        return f"{target}-{stage}-{digest[:16]}"
+
+    def path(self, key: str) -> Path:
+        return self.root / key
+
+    def has(self, key: str) -> bool:
+        return (self.path(key) / "manifest.json").is_file()
+
+    # ------------------------------------------------------------- templates
+
+    def freeze(self, key: str, runtime: Path, port_offset: int = 0) -> Path:
+        """Copy the (stopped) runtime into the template for `key`.  The
+        template is assembled next to its final place and renamed in, so
+        a concurrent freeze of the same key leaves one intact template."""
+        runtime = Path(runtime)
+        final = self.path(key)
+        if self.has(key):
+            return final
+        self.root.mkdir(parents=True, exist_ok=True)
+        staging = self.root / f".{key}.{os.getpid()}.tmp"
+        shutil.rmtree(staging, ignore_errors=True)
+        t0 = time.monotonic()
+        shutil.copytree(runtime, staging / "tree", symlinks=True,
+                        ignore=_ignore_logs)
+        roots = _roots(str(runtime))
+        files, links = _scan_rewrites(staging / "tree", roots)
+        save_json(staging / "manifest.json", {
+            "key": key, "roots": roots, "rewrite": files, "links": links,
+            "port_offset": port_offset, "created": time.time(),
+            "freeze_sec": round(time.monotonic() - t0, 3)})
+        try:
+            staging.rename(final)
+        except OSError:
+            shutil.rmtree(staging, ignore_errors=True)  # lost the race
+        self.stats["freezes"] += 1
+        return final
+
+    def clone(self, key: str, runtime: Path) -> dict | None:
+        """Replace `runtime` with a clone of the template; None on a miss."""
+        if not self.has(key):
+            self.stats["misses"] += 1
+            return None
+        runtime = Path(runtime)
+        template = self.path(key)
+        manifest = load_json(template / "manifest.json", {})
+        shutil.rmtree(runtime, ignore_errors=True)
+        runtime.parent.mkdir(parents=True, exist_ok=True)
+        t0 = time.monotonic()
+        copied = subprocess.run(
+            ["cp", "-a", "--reflink=auto", str(template / "tree"),
+             str(runtime)], capture_output=True)
+        if copied.returncode != 0:
+            shutil.rmtree(runtime, ignore_errors=True)
+            shutil.copytree(template / "tree", runtime, symlinks=True)
+        new_root = str(runtime)
+        old_roots = [r for r in manifest.get("roots", []) if r != new_root]
+        if old_roots:
+            for rel in manifest.get("rewrite", []):
+                path = runtime / rel
+                data = path.read_bytes()
+                for old in old_roots:
+                    data = data.replace(old.encode(), new_root.encode())
+                path.write_bytes(data)
+            for rel in manifest.get("links", []):
+                link = runtime / rel
+                target = os.readlink(link)
+                for old in old_roots:
+                    if target.startswith(old):
+                        target = new_root + target[len(old):]
+                        break
+                link.unlink()
+                link.symlink_to(target)
+        self.stats["hits"] += 1
+        return {**manifest, "clone_sec": round(time.monotonic() - t0, 3)}
+
+    @staticmethod
+    def adopt(network: Any, manifest: dict) -> None:
+        """Attach `network` to its freshly cloned runtime, first moving the
+        template's ports to the network's own offset."""
+        built = manifest.get("port_offset", 0)
+        rebase = getattr(network, "rebase_ports", None)
+        if rebase is not None and built != getattr(network, "port_offset", 0):
+            rebase(built)
+        network.attach()
+
+    # ------------------------------------------------------------- provision
+
+    def provision(self, network: Any, target: str, runtime: Path,
+                  build: Callable[[], Any], stage: str = "built") -> bool:
+        """Clone the `stage` template into `runtime` (then network.attach())
+        or run `build` and freeze its result.  The network must not be
+        running afterwards for a freeze — fine for the `built` stage, whose
+        builds only provision.  Returns True on a clone."""
+        key = self.key(target, network.snapshot_identity(), stage)
+        manifest = self.clone(key, runtime)
+        if manifest is not None:
+            self.adopt(network, manifest)
+            return True
+        build()
+        self.freeze(key, runtime, getattr(network, "port_offset", 0))
+        return False
+
+
+def provision(network: Any, target: str, runtime: Path,
+              build: Callable[[], Any], stage: str = "built") -> bool:
+    """SnapshotStore.provision through BCFZ_SNAPSHOT_DIR; plain `build()`
+    when snapshots are off."""
+    store = SnapshotStore.from_env()
+    if store is None:
+        build()
+        return False
+    return store.provision(network, target, runtime, build, stage)
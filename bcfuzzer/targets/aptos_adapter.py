@@ -17,19 +17,18 @@ from __future__ import annotations
 
 import asyncio
 import random
-import time
 from pathlib import Path
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-import yaml  # noqa: E402
-
 from live_node_aptos import (  # noqa: E402
     MEMPOOL_BOUNDS, MEMPOOL_INPUT, _bounded_int, ledger_version,
-    malformed_transaction_probes, read_yaml, submit_transfers)
+    malformed_transaction_probes, submit_transfers)
 
 from ..common import Seed  # noqa: E402
+from ..profiler import profiled  # noqa: E402
+from ..readiness import wait_until  # noqa: E402
 
 NODE_LOG_SIGNATURES = (
     "panic",
@@ -54,6 +53,7 @@ class AptosAdapter:
         path = net.runtime / f"{index}" / "node.yaml"
         return [path] if path.is_file() else []
 
+    @profiled()
     def apply_mutations(self, net, index: int, mutations, catalog,
                         exempt_keys: set[str]):
         """Mutate validator i's node.yaml in place (YAML)."""
@@ -63,20 +63,27 @@ class AptosAdapter:
         editor = ConfigEditor(cfg_dir)
         ops = []
         counter = 0
-        for item_path, rule, value in mutations:
-            item = next((i for i in catalog if i.path == item_path), None)
-            if item is None:
-                continue
-            config = cfg_dir / (item.file or "node.yaml")
-            counter += 1
-            ops.append(mutate_one(editor, config, item, rule, self.rng,
-                                  counter, force_value=value))
-        self.sanitize_with_exempt(cfg_dir / "node.yaml", exempt_keys)
+        with editor.batch():
+            for item_path, rule, value in mutations:
+                item = next((i for i in catalog if i.path == item_path), None)
+                if item is None:
+                    continue
+                config = cfg_dir / (item.file or "node.yaml")
+                counter += 1
+                ops.append(mutate_one(editor, config, item, rule, self.rng,
+                                      counter, force_value=value))
+            self.sanitize_with_exempt(cfg_dir / "node.yaml", exempt_keys,
+                                      editor)
         return ops
 
-    def sanitize_with_exempt(self, config: Path, exempt: set[str]) -> int:
+    def sanitize_with_exempt(self, config: Path, exempt: set[str],
+                             editor=None) -> int:
         """sanitize_mempool_config minus exempted dangerous keys."""
-        data = read_yaml(config)
+        from ..mutator import ConfigEditor
+
+        editor = editor or ConfigEditor(config.parent)
+        doc = editor.document(config)
+        data = doc.data
         mempool = data.setdefault("mempool", {})
         changed = 0
         for key, default in MEMPOOL_INPUT.items():
@@ -88,21 +95,23 @@ class AptosAdapter:
                 mempool[key] = new_value
                 changed += 1
         if changed:
-            config.write_text(yaml.safe_dump(data, sort_keys=False),
-                              encoding="utf-8")
+            doc.touch()
+        editor.done(doc)
         return changed
 
     # ----------------------------------------------------------- admission
 
+    @profiled()
     def probe_admission(self, net, index: int, timeout: int = 120) -> bool:
         """Mutated config admitted = validator restarts and serves its API
         (the PoC #12 kill-mutate-restart cycle)."""
         net.stop_node(index)
-        time.sleep(2)
+        wait_until("aptos.stopped", lambda: not net.alive(index), 10)
         return net.start_node(index, timeout=timeout)
 
     # -------------------------------------------------------------- seeds
 
+    @profiled()
     def submit_seed(self, net, seed: Seed, ctx: dict) -> dict:
         kind = seed.payload.get("kind", "transfer_wave")
         index = ctx.get("node_index", 0)
@@ -122,10 +131,10 @@ class AptosAdapter:
     # --------------------------------------------------------------- probes
 
     def node_probes(self, net, index: int) -> dict:
-        text = net.log_text(index)
+        counts = net.log_tail(index, NODE_LOG_SIGNATURES).counts()
         return {
             "alive": net.alive(index),
             "ledger": net.ledger(index),
-            "log_signatures": {sig: text.count(sig)
-                               for sig in NODE_LOG_SIGNATURES if sig in text},
+            "log_signatures": {sig: counts[sig]
+                               for sig in NODE_LOG_SIGNATURES if counts[sig]},
         }
@@ -7,16 +7,24 @@ API reports ledger_version > 0, then detach Forge (validators keep
 running) and restart any validator that did not survive detachment via
 `aptos-node -f <node.yaml>` — the exact PoC #12 restart pattern, which is
 also the per-round admission path for mutated node.yaml files.
+
+Forge picks the ports, so a swarm has no offset to lease: bound_ports()
+lists what its node.yaml files bind, for the leg to claim
+(resources.claim_ports), and ports_busy() tells a template clone whose
+ports another live swarm holds.
 """
 
 from __future__ import annotations
 
+import re
 import shutil
 import signal
 import subprocess
 import time
 from pathlib import Path
 
+import yaml
+
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
@@ -24,12 +32,42 @@ from live_node_aptos import (  # noqa: E402
     FORGE, PEER_NODE, api_url, kill_processes_under, ledger_version,
     pids_for_config, stop_config_processes, wait_for_network)
 
+from ..logscan import scanner_for  # noqa: E402
+from ..logtail import LogTail, glob_source  # noqa: E402
+from ..profiler import profiled  # noqa: E402
+from ..readiness import port_open, wait_until  # noqa: E402
+
+_ADDRESS_PORT = re.compile(r"(?:/tcp/|^[\w.\[\]:]+:)(\d+)$")
+
+
+def config_ports(node) -> set[int]:
+    """Ports a node.yaml binds: `port` / `*_port` keys and the port of
+    every address (`127.0.0.1:8080`, `/ip4/0.0.0.0/tcp/6180`)."""
+    ports: set[int] = set()
+    if isinstance(node, dict):
+        for key, value in node.items():
+            if isinstance(value, int) and not isinstance(value, bool) \
+                    and value > 0 and (key == "port"
+                                       or str(key).endswith("_port")):
+                ports.add(value)
+            else:
+                ports |= config_ports(value)
+    elif isinstance(node, list):
+        for item in node:
+            ports |= config_ports(item)
+    elif isinstance(node, str):
+        match = _ADDRESS_PORT.search(node)
+        if match and 0 < int(match.group(1)) < 65536:
+            ports.add(int(match.group(1)))
+    return ports
+
 
 class AptosNetwork:
     def __init__(self, runtime: Path, n_validators: int = 13) -> None:
         self.runtime = Path(runtime)
         self.n = n_validators
         self.root_key = ""
+        self._tails: dict[int, LogTail] = {}
 
     # ------------------------------------------------------------- lifecycle
 
@@ -98,6 +136,49 @@ class AptosNetwork:
             kill_processes_under(self.runtime)
         raise RuntimeError("; ".join(errors) if errors else "forge did not produce a live swarm")
 
+    def bound_ports(self) -> list[tuple[int, int]]:
+        """(port, 1) for every port the swarm's validators bind."""
+        ports: set[int] = set()
+        for index in range(self.n):
+            try:
+                data = yaml.safe_load(self.config_of(index).read_text(
+                    encoding="utf-8")) or {}
+            except (OSError, yaml.YAMLError):
+                continue
+            ports |= config_ports(data)
+        return [(port, 1) for port in sorted(ports)]
+
+    def ports_busy(self) -> bool:
+        """Some port of this (stopped, cloned) swarm is already serving —
+        another swarm cloned from the same template holds it."""
+        return any(port_open(port) for port, _ in self.bound_ports())
+
+    def snapshot_identity(self) -> dict:
+        """SnapshotStore key material: node + forge binaries, swarm size
+        (forge picks the ports; a template keeps them)."""
+        return {"binaries": [PEER_NODE, FORGE], "layout": {"n": self.n}}
+
+    def attach(self) -> None:
+        """Adopt a stopped swarm cloned from a snapshot (instead of
+        launch()); start_all() brings it up."""
+        self.root_key = (self.runtime / "root_key").read_text().strip()
+        self._tails.clear()
+
+    @profiled()
+    def start_all(self, timeout: int = 180) -> bool:
+        """Start every validator that is not running (snapshot clones)."""
+        configs = [self.config_of(i) for i in range(self.n)]
+        for index, cfg in enumerate(configs):
+            if pids_for_config(cfg):
+                continue
+            log_fh = (self.runtime / f"{index}" / "peer-restart.log").open(
+                "a", encoding="utf-8")
+            subprocess.Popen([str(PEER_NODE), "-f", str(cfg)], cwd=cfg.parent,
+                             stdout=log_fh, stderr=subprocess.STDOUT,
+                             start_new_session=True)
+        return wait_for_network(configs, timeout=timeout)
+
+    @profiled()
     def start_node(self, index: int, timeout: int = 120) -> bool:
         cfg = self.config_of(index)
         if pids_for_config(cfg):
@@ -106,15 +187,12 @@ class AptosNetwork:
         proc = subprocess.Popen([str(PEER_NODE), "-f", str(cfg)], cwd=cfg.parent,
                                 stdout=log_fh, stderr=subprocess.STDOUT,
                                 start_new_session=True)
-        deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
-            if ledger_version(cfg) is not None:
-                return True
-            if proc.poll() is not None:
-                return False  # mutated node.yaml rejected: fail fast
-            time.sleep(2)
-        return ledger_version(cfg) is not None
+        # a dead process = mutated node.yaml rejected: fail fast
+        return wait_until("aptos.start_node",
+                          lambda: ledger_version(cfg) is not None, timeout,
+                          fail=lambda: proc.poll() is not None)
 
+    @profiled()
     def stop_node(self, index: int) -> None:
         stop_config_processes(self.config_of(index))
 
@@ -141,6 +219,15 @@ class AptosNetwork:
                 continue
         return text
 
+    def log_tail(self, index: int, patterns: tuple[str, ...] = ()) -> LogTail:
+        """Incremental view of the same *.log files as log_text."""
+        tail = self._tails.get(index)
+        if tail is None:
+            tail = self._tails.setdefault(index, LogTail(
+                glob_source(lambda: self.runtime / f"{index}", "*.log"),
+                scanner=scanner_for("aptos", patterns)))
+        return tail
+
     def teardown(self) -> None:
         self.stop_all()
         shutil.rmtree(self.runtime, ignore_errors=True)
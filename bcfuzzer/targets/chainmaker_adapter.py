@@ -18,18 +18,17 @@ Seeds:
 from __future__ import annotations
 
 import random
-import time
 from pathlib import Path
 
 import sys
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-import yaml  # noqa: E402
-
 from live_node_chainmaker import (  # noqa: E402
     _bounded_int, _bool_value, org_domain, release_name)
 
 from ..common import Seed  # noqa: E402
+from ..profiler import profiled  # noqa: E402
+from ..readiness import wait_until  # noqa: E402
 
 # signature fragments the oracle greps panic.log for (PoC-verified)
 PANIC_SIGNATURES = (
@@ -68,6 +67,7 @@ class ChainMakerAdapter:
         cfg_dir = self.config_dir(net, index)
         return sorted(p for p in cfg_dir.glob("*.y*ml") if p.is_file())
 
+    @profiled()
     def apply_mutations(self, net, index: int, mutations, catalog,
                         exempt_keys: set[str]):
         """Mutate the controlled org's chainmaker.yml in place (YAML)."""
@@ -77,21 +77,27 @@ class ChainMakerAdapter:
         editor = ConfigEditor(cfg_dir)
         ops = []
         counter = 0
-        for item_path, rule, value in mutations:
-            item = next((i for i in catalog if i.path == item_path), None)
-            if item is None:
-                continue
-            config = cfg_dir / (item.file or "chainmaker.yml")
-            counter += 1
-            ops.append(mutate_one(editor, config, item, rule, self.rng,
-                                  counter, force_value=value))
-        self.sanitize_with_exempt(cfg_dir, exempt_keys)
+        with editor.batch():
+            for item_path, rule, value in mutations:
+                item = next((i for i in catalog if i.path == item_path), None)
+                if item is None:
+                    continue
+                config = cfg_dir / (item.file or "chainmaker.yml")
+                counter += 1
+                ops.append(mutate_one(editor, config, item, rule, self.rng,
+                                      counter, force_value=value))
+            self.sanitize_with_exempt(cfg_dir, exempt_keys, editor)
         return ops
 
-    def sanitize_with_exempt(self, cfg_dir: Path, exempt: set[str]) -> int:
-        """sanitize_chainmaker_config minus exempted dangerous keys."""
-        cfg = cfg_dir / "chainmaker.yml"
-        data = yaml.safe_load(cfg.read_text(encoding="utf-8")) or {}
+    def sanitize_with_exempt(self, cfg_dir: Path, exempt: set[str],
+                             editor=None) -> int:
+        """sanitize_chainmaker_config minus exempted dangerous keys, on the
+        round's parsed chainmaker.yml when `editor` is mid-batch."""
+        from ..mutator import ConfigEditor
+
+        editor = editor or ConfigEditor(cfg_dir)
+        doc = editor.document(cfg_dir / "chainmaker.yml")
+        data = doc.data
         changed = 0
 
         txpool = data.setdefault("txpool", {})
@@ -143,27 +149,24 @@ class ChainMakerAdapter:
                 changed += 1
 
         if changed:
-            cfg.write_text(yaml.safe_dump(data, sort_keys=False),
-                           encoding="utf-8")
+            doc.touch()
+        editor.done(doc)
         return changed
 
     # ----------------------------------------------------------- admission
 
+    @profiled()
     def probe_admission(self, net, index: int, timeout: int = 90) -> bool:
         """Mutated config admitted = controlled org restarts and serves RPC."""
         org = self.org_of(net, index)
         if not net.start_org(org):
             return False
-        deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
-            height = net.height(org)
-            if height >= 0:
-                return True
-            time.sleep(2)
-        return False
+        return wait_until("chainmaker.admission_rpc",
+                          lambda: net.height(org) >= 0, timeout)
 
     # -------------------------------------------------------------- seeds
 
+    @profiled()
     def submit_seed(self, net, seed: Seed, ctx: dict) -> dict:
         kind = seed.payload.get("kind", "invoke_wave")
         org = self.org_of(net, ctx.get("node_index", 0))
@@ -181,7 +184,7 @@ class ChainMakerAdapter:
             ok = net.restart_org_with_env(org, flags)
             return {"restarted": ok, "flags": flags}
         if kind == "gov_query":
-            ok, out = net.cmc_capture_org(org, "consensus", "status")
+            ok, out = net.client(org).status()
             return {"ok": ok, "output": out[-500:]}
         if kind == "net_seeds_race":
             # BCB #2: rewrite the controlled org's net.seeds (reorder/
@@ -222,22 +225,22 @@ class ChainMakerAdapter:
 
     def node_probes(self, net, index: int) -> dict:
         org = self.org_of(net, index)
-        panic = net.panic_log(org)
-        system = net.system_log(org)
+        panic = net.panic_tail(org, PANIC_SIGNATURES).counts()
+        system = net.system_tail(org).counts()
         sigs = {}
         for sig in PANIC_SIGNATURES:
-            if sig in panic:
+            if panic[sig]:
                 # a generic signature (e.g. "index out of range" → cm-01)
                 # is suppressed if a more-specific signature already matched
                 # whose text starts with this one ("index out of range [1"
                 # for the TXCOUNT bug → cm-02), so one panic yields one signal
                 if any(already.startswith(sig) for already in sigs):
                     continue
-                sigs[sig] = panic.count(sig)
+                sigs[sig] = panic[sig]
         return {
             "alive": net.alive(org),
             "height": net.height(org),
             "panic_signatures": sigs,
-            "round_advances": system.count("attempt enterNewRound"),
-            "propose_timeouts": system.count("propose timeout"),
+            "round_advances": system["attempt enterNewRound"],
+            "propose_timeouts": system["propose timeout"],
         }
@@ -0,0 +1,276 @@
+"""Long-lived per-org ChainMaker client (height / status / invoke / system).
+
+Every ChainMakerNetwork observer used to fork the Go `cmc` binary: process
+start + SDK config parse + TLS handshake per call, and `invoke` slept 0.2 s
+between calls.  With 9 normal orgs probed per observe, cmc forks were the
+dominant cost of the 6 h stage-G chainmaker leg (50 rounds).
+
+ChainMakerClient keeps one connection per org open for the network's
+lifetime.  Two backends, picked per client:
+
+  sdk   chainmaker-sdk-python 3.0 (requirements-chainmaker.txt pins the
+        3.0.7 release this client was checked against): a gRPC ChainClient
+        built once from the org's sdk-<org>.yml — connections stay open
+        across calls.  An invoke wave submits every transaction back to
+        back without waiting for its result (with_sync_result=False, own
+        tx ids), then collects the results of the whole wave in polling
+        passes: a wave of N sync invokes costs about one block interval,
+        not N.  Another 3.0 release is accepted; any other SDK is ignored.
+  cmc   fallback when the SDK is not installed (or a call through it
+        fails): the historical `cmc` subprocess path, minus the fixed
+        inter-invoke sleep, with invoke waves spread over a bounded pool
+        of concurrent cmc processes (live_node_chainmaker.parallel_cmc
+        pattern).  cmc is a one-shot CLI with no server mode, so this path
+        still forks per call; it only runs when the SDK cannot.
+
+An SDK error (org restarted, channel reset) drops the SDK client and serves
+that call — or the rest of the wave — through cmc; the next call rebuilds
+the channel.  Contract creation stays on cmc: it runs twice per runtime and
+needs the admin endorsement flow the cmc CLI already wraps.
+
+Benchmark: benchmarks/bench_chainmaker_invoke.py (live network).
+"""
+
+from __future__ import annotations
+
+import json
+import re
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from importlib import metadata
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+SDK_SERIES = "3.0"              # chainmaker-sdk-python API checked (3.0.7)
+
+try:  # optional: persistent gRPC backend
+    from chainmaker.chain_client import ChainClient
+    from chainmaker.exceptions import RequestError as SdkRequestError
+    from chainmaker.utils.common import gen_rand_tx_id
+    if not metadata.version("chainmaker").startswith(SDK_SERIES + "."):
+        raise ImportError("unsupported chainmaker-sdk-python release")
+except (ImportError, metadata.PackageNotFoundError):  # pragma: no cover
+    ChainClient = None  # type: ignore[assignment]
+    SdkRequestError = None  # type: ignore[assignment]
+    gen_rand_tx_id = None  # type: ignore[assignment]
+
+INVOKE_WORKERS = 4              # concurrent cmc processes (fallback only)
+RESULT_POLL_SEC = 0.2           # between result passes over a sdk wave
+
+
+def cmc_ok(out: str) -> bool:
+    """cmc exits 0 even when the rpc fails (error text goes to stdout via
+    2>&1), so judge success by the result markers instead (PoC scripts
+    grep for `"tx_id"` on create / `code:0` on sync invokes)."""
+    return bool(out) and "Error:" not in out and (
+        "code:0" in out.replace(" ", "") or '"tx_id"' in out)
+
+
+class ChainMakerClient:
+    def __init__(self, org: str, sdk_conf: Path,
+                 backend: str | None = None) -> None:
+        self.org = org
+        self.sdk_conf = Path(sdk_conf)
+        if backend is None:
+            backend = "sdk" if ChainClient is not None else "cmc"
+        self.backend = backend
+        self._sdk = None
+        self._lock = threading.Lock()
+        self.calls = {"sdk": 0, "cmc": 0, "sdk_errors": 0, "sdk_clients": 0}
+
+    # ------------------------------------------------------------- plumbing
+
+    def _chain_client(self):
+        """The org's ChainClient, built on first use; None on cmc."""
+        if self.backend != "sdk" or ChainClient is None:
+            return None
+        with self._lock:
+            if self._sdk is None:
+                try:
+                    self._sdk = ChainClient.from_conf(str(self.sdk_conf))
+                except Exception:  # noqa: BLE001
+                    self.calls["sdk_errors"] += 1
+                    return None
+                self.calls["sdk_clients"] += 1
+            return self._sdk
+
+    def _sdk_failed(self, client) -> None:
+        """Count an SDK error and drop `client` (unless already rebuilt).
+        gRPC channels are thread-safe, so calls share the client and
+        only building/dropping it takes the lock."""
+        with self._lock:
+            self.calls["sdk_errors"] += 1
+            if self._sdk is client:
+                self._drop_sdk()
+
+    def _sdk_call(self, name: str, *args, **kwargs):
+        """Run ChainClient.<name>; None means "use cmc for this call"."""
+        client = self._chain_client()
+        if client is None:
+            return None
+        try:
+            result = getattr(client, name)(*args, **kwargs)
+        except Exception:  # noqa: BLE001
+            self._sdk_failed(client)
+            return None
+        self.calls["sdk"] += 1
+        return result
+
+    def _drop_sdk(self) -> None:
+        client, self._sdk = self._sdk, None
+        stop = getattr(client, "stop", None)
+        if callable(stop):
+            try:
+                stop()
+            except Exception:  # noqa: BLE001
+                pass
+
+    def cmc(self, *args: str, timeout: int = 30) -> tuple[bool, str]:
+        from live_node_chainmaker import cmc_capture
+        self.calls["cmc"] += 1
+        return cmc_capture(self.sdk_conf, *args, timeout=timeout)
+
+    def close(self) -> None:
+        with self._lock:
+            self._drop_sdk()
+
+    # -------------------------------------------------------------- queries
+
+    def height(self) -> int:
+        """Current block height, -1 when the org does not answer."""
+        result = self._sdk_call("get_current_block_height")
+        if isinstance(result, int):
+            return result
+        ok, out = self.cmc("consensus", "height")
+        if not ok:
+            return -1
+        match = re.search(r'"Height"\s*:\s*"?(\d+)"?', out)
+        return int(match.group(1)) if match else -1
+
+    def status(self) -> tuple[bool, str]:
+        """Consensus status as text (`cmc consensus status` shape: the
+        SDK returns the same JSON document, parsed)."""
+        result = self._sdk_call("get_consensus_state_json")
+        if result is not None:
+            if isinstance(result, bytes):
+                result = result.decode("utf-8", errors="replace")
+            if not isinstance(result, str):
+                result = json.dumps(result)
+            return True, result
+        return self.cmc("consensus", "status")
+
+    def block_proposer(self, height: int) -> str | None:
+        """Proposer org id recorded in the block header at `height`."""
+        block = self._sdk_call("get_block_by_height", height)
+        if block is not None:
+            org_id = block.block.header.proposer.org_id
+            if org_id:
+                return org_id.split(".")[0]
+        ok, out = self.cmc("query", "block-by-height", str(height))
+        if ok:
+            match = re.search(r'"proposer"\s*:\s*"?([\w.-]+)"?', out)
+            if match:
+                return match.group(1).split(".")[0]
+        return None
+
+    def chain_config(self) -> tuple[bool, str]:
+        """System contract CHAIN_CONFIG get_chain_config."""
+        result = self._sdk_call("get_chain_config")
+        if result is not None:
+            return True, str(result)
+        return self.cmc("client", "chainconfig", "query")
+
+    # -------------------------------------------------------------- invokes
+
+    def _invoke_args(self, contract: str, method: str, sync: bool,
+                     gas_limit: int | None) -> list[str]:
+        args = ["client", "contract", "user", "invoke",
+                f"--contract-name={contract}", f"--method={method}",
+                "--params={}", f"--sync-result={str(sync).lower()}"]
+        if gas_limit is not None:
+            # PoC 07: on a gas-enabled chain every invoke must carry gas
+            args.append(f"--gas-limit={gas_limit}")
+        return args
+
+    def _sdk_wave(self, contract: str, method: str, count: int, sync: bool,
+                  gas_limit: int | None, timeout: int) -> tuple[int, int]:
+        """(invokes issued, accepted) through the SDK; issued < count means
+        the SDK is unusable and the rest of the wave belongs to cmc."""
+        client = self._chain_client()
+        if client is None:
+            return 0, 0
+        kwargs: dict = {"with_sync_result": False, "timeout": timeout}
+        if gas_limit is not None:
+            kwargs["gas_limit"] = gas_limit
+        issued = 0
+        pending: list[str] = []
+        for _ in range(count):
+            tx_id = gen_rand_tx_id()
+            try:
+                response = client.invoke_contract(contract, method, {},
+                                                  tx_id=tx_id, **kwargs)
+            except Exception:  # noqa: BLE001
+                self._sdk_failed(client)
+                break
+            issued += 1
+            if response.code == 0:
+                pending.append(tx_id)
+        self.calls["sdk"] += issued
+        if not sync:
+            return issued, len(pending)
+        # the whole wave is in the pool now: collect results in passes
+        accepted = 0
+        deadline = time.monotonic() + timeout
+        while pending:
+            waiting = []
+            for tx_id in pending:
+                try:
+                    info = client.get_tx_by_tx_id(tx_id)
+                except SdkRequestError:
+                    waiting.append(tx_id)       # not in a block yet
+                    continue
+                except Exception:  # noqa: BLE001
+                    self._sdk_failed(client)
+                    return issued, accepted
+                result = info.transaction.result
+                if result.code == 0 and result.contract_result.code == 0:
+                    accepted += 1
+            pending = waiting
+            if pending:
+                if time.monotonic() >= deadline:
+                    break
+                time.sleep(RESULT_POLL_SEC)
+        return issued, accepted
+
+    def _cmc_wave(self, contract: str, method: str, count: int, sync: bool,
+                  gas_limit: int | None, timeout: int) -> int:
+        args = self._invoke_args(contract, method, sync, gas_limit)
+        if count == 1:
+            return int(cmc_ok(self.cmc(*args, timeout=timeout)[1]))
+        with ThreadPoolExecutor(max_workers=min(INVOKE_WORKERS, count),
+                                thread_name_prefix=f"cmc-{self.org}") as pool:
+            results = pool.map(
+                lambda _: cmc_ok(self.cmc(*args, timeout=timeout)[1]),
+                range(count))
+            return sum(1 for ok in results if ok)
+
+    def invoke(self, contract: str, method: str, *, sync: bool = True,
+               gas_limit: int | None = None, timeout: int = 30) -> bool:
+        return self.invoke_many(contract, method, 1, sync=sync,
+                                gas_limit=gas_limit, timeout=timeout) == 1
+
+    def invoke_many(self, contract: str, method: str, count: int, *,
+                    sync: bool = True, gas_limit: int | None = None,
+                    timeout: int = 30) -> int:
+        """`count` invokes; returns how many were accepted."""
+        if count <= 0:
+            return 0
+        issued, accepted = self._sdk_wave(contract, method, count, sync,
+                                          gas_limit, timeout)
+        if issued < count:
+            accepted += self._cmc_wave(contract, method, count - issued,
+                                       sync, gas_limit, timeout)
+        return accepted
@@ -38,8 +38,14 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from live_node_chainmaker import (  # noqa: E402
     CMC, GOC_CENTER, RELEASE, chainmaker_env, cmc, cmc_capture,
-    kill_chainmaker_processes, node_running, org_domain, release_name,
-    write_sdk_config)
+    kill_chainmaker_processes, node_running, org_domain, org_p2p_port,
+    org_rpc_port, release_name, write_sdk_config)
+
+from ..logscan import scanner_for  # noqa: E402
+from .chainmaker_client import ChainMakerClient, cmc_ok  # noqa: E402
+from ..logtail import LogTail, glob_source  # noqa: E402
+from ..profiler import profiled  # noqa: E402
+from ..readiness import port_open, wait_until  # noqa: E402
 
 import os
 ROOT = Path(os.environ.get("BCFZ_WORKSPACE", "/home/geth/tse")) / "chainmaker-go"
@@ -53,6 +59,12 @@ CAP_BINARY = Path("/tmp/chainmaker-cap-cover")
 CAP_LOCK = Path("/tmp/chainmaker-goc-build.lock")
 RELEASE_LOCK = Path("/tmp/chainmaker-13org-build.lock")
 ORGS_13 = [f"wx-org{i}" for i in range(1, 14)]
+# system-log markers counted on every observe (node_probes, peers_connected)
+SYSTEM_LOG_PATTERNS = (
+    "attempt enterNewRound",
+    "propose timeout",
+    "all necessary peers connected",
+)
 
 # Verified PoC patch anchors + env-gated malicious blocks (PoC 06/07/08)
 BLOCK_HELPER = ROOT / "module/core/common/block_helper.go"
@@ -207,14 +219,6 @@ def build_13org_release() -> Path:
     return CM13_STASH
 
 
-def _cmc_ok(out: str) -> bool:
-    """cmc exits 0 even when the rpc fails (error text goes to stdout via
-    2>&1), so judge success by the result markers instead (PoC scripts
-    grep for `"tx_id"` on create / `code:0` on sync invokes)."""
-    return bool(out) and "Error:" not in out and (
-        "code:0" in out.replace(" ", "") or '"tx_id"' in out)
-
-
 _CENTER_PROC: subprocess.Popen | None = None
 
 
@@ -233,12 +237,21 @@ def ensure_center() -> None:
 
 class ChainMakerNetwork:
     def __init__(self, runtime: Path, orgs: list[str] | None = None,
-                 instrumented: bool = True) -> None:
+                 instrumented: bool = True, port_offset: int = 0) -> None:
         self.runtime = Path(runtime)
         self.orgs = orgs or ORGS_13
         self.instrumented = instrumented
+        # the 13-org release is built once at fixed ports (11301/12301/...);
+        # a launcher leg or lane shifts every port of its runtime copy by
+        # its leased offset (shift_ports), and this network's own port
+        # accessors and sdk configs carry the offset — so any number of
+        # chainmaker networks can share one process
+        self.port_offset = port_offset
         self.sdk_confs: dict[str, Path] = {}
         self._capability_env: dict[str, dict[str, str]] = {}
+        self._panic_tails: dict[str, LogTail] = {}
+        self._system_tails: dict[str, LogTail] = {}
+        self._clients: dict[str, ChainMakerClient] = {}
 
     # ------------------------------------------------------------- lifecycle
 
@@ -249,6 +262,7 @@ class ChainMakerNetwork:
         if cmc_binary.is_file() and not CMC.is_file():
             shutil.copy2(cmc_binary, CMC)
         stash = build_13org_release()
+        self.close_clients()
         shutil.rmtree(self.runtime, ignore_errors=True)
         self.runtime.mkdir(parents=True)
         binary = (ensure_capability_binary() if self.instrumented
@@ -262,6 +276,8 @@ class ChainMakerNetwork:
             if self.instrumented:
                 shutil.copy2(binary,
                              self.runtime / release_name(org) / "bin" / "chainmaker")
+            if self.port_offset:
+                self.shift_ports(org)
             sdk_conf = self.runtime / f"sdk-{org}.yml"
             write_sdk_config(self.runtime, sdk_conf, org=org)
             # write_sdk_config hardcodes chain_id "chainmaker", but the node
@@ -272,14 +288,14 @@ class ChainMakerNetwork:
                         / org_domain(org) / "chainmaker.yml")
             node_data = yaml.safe_load(node_cfg.read_text(encoding="utf-8")) or {}
             chains = node_data.get("blockchain") or []
+            sdk_data = yaml.safe_load(sdk_conf.read_text(encoding="utf-8")) or {}
+            client = sdk_data.setdefault("chain_client", {})
             if chains:
-                sdk_data = yaml.safe_load(
-                    sdk_conf.read_text(encoding="utf-8")) or {}
-                sdk_data.setdefault("chain_client", {})["chain_id"] = \
-                    chains[0].get("chainId", "chainmaker")
-                sdk_conf.write_text(
-                    yaml.safe_dump(sdk_data, sort_keys=False),
-                    encoding="utf-8")
+                client["chain_id"] = chains[0].get("chainId", "chainmaker")
+            # and to this network's (shifted) rpc port
+            self._point_sdk(client, org)
+            sdk_conf.write_text(yaml.safe_dump(sdk_data, sort_keys=False),
+                                encoding="utf-8")
             self.sdk_confs[org] = sdk_conf
         # arm the turbo+gas chainconfig that the CM_MALICIOUS_* capability
         # patches require to fire: the malicious cutBlock/index/TxCount
@@ -293,13 +309,94 @@ class ChainMakerNetwork:
             self.patch_bc1("turbo_gas")
         return self.runtime
 
+    def p2p_port(self, org: str) -> int:
+        return org_p2p_port(org) + self.port_offset
+
+    def rpc_port(self, org: str) -> int:
+        return org_rpc_port(org) + self.port_offset
+
+    def _point_sdk(self, client: dict, org: str) -> None:
+        for node in client.get("nodes", []):
+            node["node_addr"] = f"127.0.0.1:{self.rpc_port(org)}"
+
+    def shift_ports(self, org: str, delta: int | None = None) -> None:
+        """Move every port in the org's chainmaker.yml (`port` / `*_port`
+        keys and /tcp/<port> multiaddrs — listen addr, seeds) up by
+        `delta` (default port_offset, from the release's own ports)."""
+        cfg = (self.runtime / release_name(org) / "config" / org_domain(org)
+               / "chainmaker.yml")
+        offset = self.port_offset if delta is None else delta
+
+        def shift(node):
+            if isinstance(node, dict):
+                for key, value in node.items():
+                    if isinstance(value, int) and not isinstance(value, bool) \
+                            and value > 0 and (key == "port"
+                                               or str(key).endswith("_port")):
+                        node[key] = value + offset
+                    else:
+                        node[key] = shift(value)
+            elif isinstance(node, list):
+                return [shift(item) for item in node]
+            elif isinstance(node, str) and "/tcp/" in node:
+                return re.sub(r"/tcp/(\d+)",
+                              lambda m: f"/tcp/{int(m.group(1)) + offset}",
+                              node)
+            return node
+
+        data = yaml.safe_load(cfg.read_text(encoding="utf-8")) or {}
+        cfg.write_text(yaml.safe_dump(shift(data), sort_keys=False),
+                       encoding="utf-8")
+
+    def snapshot_identity(self) -> dict:
+        """SnapshotStore key material: node binary + org layout (a clone at
+        another offset is moved by rebase_ports)."""
+        binary = (CAP_BINARY if self.instrumented
+                  else RELEASE / release_name(self.orgs[0]) / "bin" / "chainmaker")
+        return {"binaries": [binary],
+                "layout": {"orgs": list(self.orgs),
+                           "instrumented": self.instrumented}}
+
+    def rebase_ports(self, old_offset: int) -> None:
+        """Move a clone built at old_offset to ours: every org's
+        chainmaker.yml and the rpc address of its sdk config."""
+        for org in self.orgs:
+            self.shift_ports(org, self.port_offset - old_offset)
+            sdk_conf = self.runtime / f"sdk-{org}.yml"
+            if not sdk_conf.is_file():
+                continue
+            sdk_data = yaml.safe_load(sdk_conf.read_text(encoding="utf-8")) or {}
+            self._point_sdk(sdk_data.setdefault("chain_client", {}), org)
+            sdk_conf.write_text(yaml.safe_dump(sdk_data, sort_keys=False),
+                                encoding="utf-8")
+
+    def attach(self) -> None:
+        """Adopt a runtime cloned from a snapshot (instead of prepare())."""
+        if self.instrumented:
+            ensure_center()
+        cmc_binary = ROOT / "tools" / "cmc" / "cmc"
+        if cmc_binary.is_file() and not CMC.is_file():
+            shutil.copy2(cmc_binary, CMC)
+        self.close_clients()
+        self._panic_tails.clear()
+        self._system_tails.clear()
+        self.sdk_confs = {org: self.runtime / f"sdk-{org}.yml"
+                          for org in self.orgs
+                          if (self.runtime / f"sdk-{org}.yml").is_file()}
+
     def org_bin_dir(self, org: str) -> Path:
         return self.runtime / release_name(org) / "bin"
 
-    def start_all(self) -> None:
+    @profiled()
+    def start_all(self, timeout: float = 60.0) -> bool:
+        """Launch every org and wait until all of them serve RPC (this
+        used to be a flat 10 s sleep; callers still check alive())."""
         for org in self.orgs:
             self.start_process(org, extra_env={})
-        time.sleep(10)
+        return wait_until(
+            "chainmaker.start_all",
+            lambda: all(port_open(self.rpc_port(org)) for org in self.orgs),
+            timeout)
 
     def start_process(self, org: str, extra_env: dict[str, str]) -> None:
         """Start one org with extra env (the M-corpus capability channel)."""
@@ -318,9 +415,21 @@ class ChainMakerNetwork:
     def stop_all(self) -> None:
         kill_chainmaker_processes(self.runtime)
 
+    @profiled()
     def stop_org(self, org: str) -> None:
         kill_chainmaker_processes(self.runtime, org)
 
+    def wait_stopped(self, org: str, timeout: float = 10.0) -> bool:
+        """The org's process is gone and its p2p/rpc listeners released,
+        so a relaunch can bind them (was a fixed 2 s sleep)."""
+        return wait_until(
+            "chainmaker.stopped",
+            lambda: not self.alive(org)
+            and not port_open(self.p2p_port(org))
+            and not port_open(self.rpc_port(org)),
+            timeout)
+
+    @profiled()
     def start_org(self, org: str, extra_env: dict[str, str] | None = None) -> bool:
         # re-apply any capability env armed by an M-seed this round so
         # that restart_cycle (which calls start_org with no env) does not
@@ -331,19 +440,15 @@ class ChainMakerNetwork:
         if extra_env:
             env.update(extra_env)
         self.start_process(org, env)
-        deadline = time.monotonic() + 30
-        while time.monotonic() < deadline:
-            if self.alive(org):
-                return True
-            time.sleep(1)
-        return False
+        return wait_until("chainmaker.start_org",
+                          lambda: self.alive(org), 30)
 
     def restart_org_with_env(self, org: str, extra_env: dict[str, str]) -> bool:
         # record the capability flags so subsequent start_org calls (e.g.
         # restart_cycle) preserve them for the rest of the round
         self._capability_env[org] = dict(extra_env)
         self.stop_org(org)
-        time.sleep(2)
+        self.wait_stopped(org)
         return self.start_org(org, extra_env)
 
     # ------------------------------------------------------------- observers
@@ -368,6 +473,40 @@ class ChainMakerNetwork:
                 continue
         return text
 
+    # incremental counterparts of panic_log/system_log for node_probes:
+    # panic.log is unlinked by start_process, which the tail sees as a new
+    # inode and re-reads from 0 — same totals as a fresh read_text
+
+    def panic_tail(self, org: str, patterns: tuple[str, ...] = ()) -> LogTail:
+        tail = self._panic_tails.get(org)
+        if tail is None:
+            path = self.org_bin_dir(org) / "panic.log"
+            tail = self._panic_tails.setdefault(org, LogTail(
+                lambda: [path], scanner=scanner_for("chainmaker", patterns)))
+        return tail
+
+    def system_tail(self, org: str) -> LogTail:
+        tail = self._system_tails.get(org)
+        if tail is None:
+            tail = self._system_tails.setdefault(org, LogTail(
+                glob_source(lambda: self.runtime / release_name(org) / "log",
+                            "*.log"),
+                SYSTEM_LOG_PATTERNS))
+        return tail
+
+    def client(self, org: str) -> ChainMakerClient:
+        """The org's long-lived client (see chainmaker_client)."""
+        client = self._clients.get(org)
+        if client is None:
+            client = self._clients.setdefault(
+                org, ChainMakerClient(org, self.sdk_confs[org]))
+        return client
+
+    def close_clients(self) -> None:
+        for client in self._clients.values():
+            client.close()
+        self._clients.clear()
+
     def cmc_capture_org(self, org: str, *args: str,
                         timeout: int = 30) -> tuple[bool, str]:
         return cmc_capture(self.sdk_confs[org], *args, timeout=timeout)
@@ -376,13 +515,9 @@ class ChainMakerNetwork:
         return cmc(self.sdk_confs[org], *args, timeout=timeout)
 
     def height(self, org: str = "wx-org1") -> int:
-        """Chain height via `cmc consensus height` (JSON output like
-        {"Height": 1} — capital H)."""
-        ok, out = self.cmc_capture_org(org, "consensus", "height")
-        if not ok:
-            return -1
-        match = re.search(r'"Height"\s*:\s*"?(\d+)"?', out)
-        return int(match.group(1)) if match else -1
+        """Chain height through the org's persistent client (cmc fallback
+        parses `cmc consensus height`, JSON like {"Height": 1})."""
+        return self.client(org).height()
 
     def current_proposer(self, org: str = "wx-org1") -> str | None:
         """Parse the proposer org id from `cmc consensus status`.
@@ -392,7 +527,7 @@ class ChainMakerNetwork:
         13-org TBFT release the primary parse kept returning None, which
         starved every M-corpus seed (their proposer precondition never
         matched in 115 rounds)."""
-        ok, out = self.cmc_capture_org(org, "consensus", "status")
+        ok, out = self.client(org).status()
         if ok:
             for pattern in (r'"(?:proposer|leader)"\s*:\s*"?(wx-org\d+)[."]',
                             r"proposer\s*=\s*(wx-org\d+)",
@@ -402,12 +537,7 @@ class ChainMakerNetwork:
                     return match.group(1).split(".")[0]
         height = self.height(org)
         if height > 0:
-            ok2, out2 = self.cmc_capture_org(org, "query",
-                                             "block-by-height", str(height))
-            if ok2:
-                match2 = re.search(r'"proposer"\s*:\s*"?([\w.-]+)"?', out2)
-                if match2:
-                    return match2.group(1).split(".")[0]
+            return self.client(org).block_proposer(height)
         return None
 
     def ensure_contracts(self, org: str) -> bool:
@@ -423,7 +553,7 @@ class ChainMakerNetwork:
                 f"--contract-name={name}", "--runtime-type=WASMER",
                 f"--byte-code-path={wasm}", "--version=1.0",
                 "--sync-result=true", "--params={}", timeout=60)
-            return _cmc_ok(out)
+            return cmc_ok(out)
 
         self._contracts_deployed = (
             _create("fact", FACT_WASM) and _create("counter", COUNTER_WASM))
@@ -433,19 +563,9 @@ class ChainMakerNetwork:
                gas_limit: int | None = None, sync: bool = True) -> int:
         if not self.ensure_contracts(org):
             return 0
-        accepted = 0
-        args = ["client", "contract", "user", "invoke",
-                "--contract-name=counter", "--method=increase",
-                "--params={}", f"--sync-result={str(sync).lower()}"]
-        if gas_limit is not None:
-            # PoC 07: on a gas-enabled chain every invoke must carry gas
-            args.append(f"--gas-limit={gas_limit}")
-        for _ in range(count):
-            ok, out = self.cmc_capture_org(org, *args, timeout=timeout)
-            if _cmc_ok(out):
-                accepted += 1
-            time.sleep(0.2)
-        return accepted
+        return self.client(org).invoke_many(
+            "counter", "increase", count, sync=sync, gas_limit=gas_limit,
+            timeout=timeout)
 
     def set_pool_type(self, org: str, pool_type: str) -> None:
         """Per-org txpool.pool_type rewrite (PoC 06 pattern: batch victims)."""
@@ -474,9 +594,10 @@ class ChainMakerNetwork:
                                encoding="utf-8")
 
     def peers_connected(self, org: str) -> bool:
-        return "all necessary peers connected" in self.system_log(org)
+        return self.system_tail(org).count("all necessary peers connected") > 0
 
     def teardown(self) -> None:
+        self.close_clients()
         self.stop_all()
         shutil.rmtree(self.runtime, ignore_errors=True)
 
@@ -32,6 +32,7 @@ from live_node_fisco import (  # noqa: E402
 from eth_account import Account  # noqa: E402
 
 from ..common import Seed  # noqa: E402
+from ..profiler import profiled  # noqa: E402
 
 
 def build_bad_signature_tx(priv_key: bytes, *, to: str,
@@ -68,6 +69,7 @@ class FiscoAdapter:
         return [node_dir / name for name in ("config.ini", "config.genesis")
                 if (node_dir / name).is_file()]
 
+    @profiled()
     def apply_mutations(self, net, index: int, mutations, catalog,
                         exempt_keys: set[str]):
         """Mutate node i's config.ini/config.genesis in place (INI editor)."""
@@ -77,29 +79,31 @@ class FiscoAdapter:
         editor = ConfigEditor(node_dir)
         ops = []
         counter = 0
-        for item_path, rule, value in mutations:
-            item = next((i for i in catalog if i.path == item_path), None)
-            if item is None:
-                continue
-            config = node_dir / (item.file or "config.ini")
-            counter += 1
-            ops.append(mutate_one(editor, config, item, rule, self.rng,
-                                  counter, force_value=value))
-        self.sanitize_with_exempt(node_dir, exempt_keys)
+        with editor.batch():
+            for item_path, rule, value in mutations:
+                item = next((i for i in catalog if i.path == item_path), None)
+                if item is None:
+                    continue
+                config = node_dir / (item.file or "config.ini")
+                counter += 1
+                ops.append(mutate_one(editor, config, item, rule, self.rng,
+                                      counter, force_value=value))
+            self.sanitize_with_exempt(node_dir, exempt_keys, editor)
         return ops
 
-    def sanitize_with_exempt(self, node_dir: Path, exempt: set[str]) -> int:
-        from config_mutators import parse_lines
+    def sanitize_with_exempt(self, node_dir: Path, exempt: set[str],
+                             editor=None) -> int:
         from live_node_fisco import _bounded_int, _bool_value
+        from ..mutator import ConfigEditor
 
+        editor = editor or ConfigEditor(node_dir)
         changed = 0
         for name in ("config.ini", "config.genesis"):
             config = node_dir / name
             if not config.is_file():
                 continue
-            text = config.read_text(encoding="utf-8", errors="replace")
-            lines = text.splitlines()
-            for entry in parse_lines(text):
+            doc = editor.document(config)
+            for entry in doc.entries():
                 key = (entry["section"], entry["key"])
                 if entry["section"] + "." + entry["key"] in exempt:
                     continue
@@ -113,16 +117,15 @@ class FiscoAdapter:
                     continue
                 new_line = (f"{entry['indent']}{entry['key']} "
                             f"{entry['sep']} {new_value}")
-                if (entry["line"] < len(lines)
-                        and lines[entry["line"]] != new_line):
-                    lines[entry["line"]] = new_line
+                if (entry["line"] < len(doc.lines)
+                        and doc.set_line(entry["line"], new_line)):
                     changed += 1
-            if changed:
-                config.write_text("\n".join(lines) + "\n", encoding="utf-8")
+            editor.done(doc)
         return changed
 
     # ----------------------------------------------------------- admission
 
+    @profiled()
     def probe_admission(self, net, index: int) -> bool:
         """Mutated config admitted = node restarts and rejoins consensus.
 
@@ -134,6 +137,7 @@ class FiscoAdapter:
 
     # -------------------------------------------------------------- seeds
 
+    @profiled()
     def submit_seed(self, net, seed: Seed, ctx: dict) -> dict:
         kind = seed.payload.get("kind", "transfer_wave")
         rpc = net.rpc_for(ctx.get("node_index", 0))
@@ -249,15 +253,16 @@ class FiscoAdapter:
     # --------------------------------------------------------------- probes
 
     def node_probes(self, net, index: int) -> dict:
+        # one incremental log poll serves every counter below
+        logs = net.log_counts(index)
         return {
             "alive": net.alive(index),
             "height": net.current_block_number(index),
             "pbft_view": net.pbft_view(index),
             "pending": net.pending_tx_size(index),
-            "reach_new_view": net.log_count(index, "reachNewView"),
-            "timeout_events": net.log_count(index, "triggerTimeout") +
-                              net.log_count(index, "broadcastViewChange"),
-            "verify_sender_failed": net.log_count(
-                index, "verify sender for tx failed"),
+            "reach_new_view": logs["reachNewView"],
+            "timeout_events": logs["triggerTimeout"] +
+                              logs["broadcastViewChange"],
+            "verify_sender_failed": logs["verify sender for tx failed"],
             "consensus_timeouts": net.consensus_timeout_values(index),
         }
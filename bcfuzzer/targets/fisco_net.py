@@ -28,10 +28,28 @@ from live_node_fisco import (  # noqa: E402
     configure_rpc_tls, cov_node_bin, coverage_env_exports,
     rpc_call, terminate_pids)
 
+from ..logscan import scanner_for  # noqa: E402
+from ..logtail import LogTail  # noqa: E402
+from ..profiler import profiled  # noqa: E402
+from ..readiness import DirWatch, wait_until  # noqa: E402
+from ..resources import TARGET_PORTS  # noqa: E402
+from ..snapshot import rebase_port_text  # noqa: E402
+
+# log markers node_probes / calibration count on every observe; served by a
+# per-node LogTail so each observe only reads the bytes appended since
+LOG_PATTERNS = (
+    "reachNewView",
+    "triggerTimeout",
+    "broadcastViewChange",
+    "verify sender for tx failed",
+)
+LOG_CAPTURES = {"consensus_timeout": r"consensusTimeout=(\d+)"}
+
 
 class FiscoNetwork:
     def __init__(self, runtime: Path, n_nodes: int = 13,
-                 instrumented: bool = False) -> None:
+                 instrumented: bool = False,
+                 port_offset: int | None = None) -> None:
         self.runtime = Path(runtime)
         self.n = n_nodes
         self.instrumented = instrumented
@@ -40,9 +58,12 @@ class FiscoNetwork:
         # range disjoint from the geth network's [6000, 11000) offset
         # range so concurrent fisco networks (or fisco + geth) never
         # fight over p2p/rpc ports (PORT_OFFSET is a fixed 0 and two
-        # 13-node networks then split the port space between them)
-        self.port_offset = int(hashlib.md5(
-            str(Path(runtime).resolve()).encode()).hexdigest()[:6], 16) % 5000
+        # 13-node networks then split the port space between them); a
+        # launcher leg passes its leased offset instead (resources.py)
+        self.port_offset = port_offset if port_offset is not None else int(
+            hashlib.md5(str(Path(runtime).resolve()).encode()).hexdigest()[:6],
+            16) % 5000
+        self._tails: dict[int, LogTail] = {}
 
     # ------------------------------------------------------------- lifecycle
 
@@ -80,6 +101,29 @@ class FiscoNetwork:
         self.net_dir = net_dir
         return net_dir
 
+    def snapshot_identity(self) -> dict:
+        """SnapshotStore key material: node binary + node count (a clone
+        at another offset is moved by rebase_ports)."""
+        return {"binaries": [PEER_NODE_BIN],
+                "layout": {"n": self.n, "instrumented": self.instrumented}}
+
+    def rebase_ports(self, old_offset: int) -> None:
+        """Move the p2p/rpc ports build_chain.sh wrote into every node's
+        config.ini and nodes.json (peer list) from old_offset to ours."""
+        families = TARGET_PORTS["fisco"](self.n)
+        net_dir = self.runtime / "nodes" / "127.0.0.1"
+        for name in ("config.ini", "nodes.json"):
+            for path in net_dir.glob(f"node*/{name}"):
+                text = path.read_text(encoding="utf-8")
+                path.write_text(rebase_port_text(
+                    text, families, old_offset, self.port_offset),
+                    encoding="utf-8")
+
+    def attach(self) -> None:
+        """Adopt a runtime cloned from a snapshot (instead of build())."""
+        self.net_dir = self.runtime / "nodes" / "127.0.0.1"
+        self._tails.clear()
+
     def node_dir(self, index: int) -> Path:
         assert self.net_dir is not None
         return self.net_dir / f"node{index}"
@@ -87,19 +131,23 @@ class FiscoNetwork:
     def rpc_for(self, index: int) -> str:
         return f"https://127.0.0.1:{20200 + self.port_offset + index}"
 
+    @profiled()
     def start_all(self, timeout: int = 240) -> bool:
         assert self.net_dir is not None
+        # a restarted runtime (snapshot freeze, clone) already has
+        # reachNewView lines from its previous run: require new ones
+        before = {i: self.log_count(i, "reachNewView") for i in range(self.n)}
         started = subprocess.run(
             ["bash", "start_all.sh"], cwd=self.net_dir, timeout=180,
             stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
         if started.returncode != 0:
             return False
-        deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
-            if all(self._reached_new_view(i) for i in range(self.n)):
-                return True
-            time.sleep(3)
-        return False
+        with DirWatch(self.node_dir(i) / "log" for i in range(self.n)) as watch:
+            return wait_until(
+                "fisco.start_all",
+                lambda: all(self.log_count(i, "reachNewView") > before[i]
+                            for i in range(self.n)),
+                timeout, wake=watch)
 
     def stop_all(self) -> None:
         if self.net_dir is None:
@@ -145,6 +193,7 @@ class FiscoNetwork:
                 return
             time.sleep(0.2)
 
+    @profiled()
     def start_node(self, index: int, timeout: int = 90) -> bool:
         """Restart semantics.  Two pitfalls fixed after the first smoke:
 
@@ -162,22 +211,23 @@ class FiscoNetwork:
         pre = {f.name for f in self.log_files(index)}
         subprocess.run(["bash", "start.sh"], cwd=node_dir, timeout=120,
                        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
-        deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
-            fresh = [f for f in self.log_files(index) if f.name not in pre]
-            if fresh and self.alive(index):
-                try:
-                    if "init PBFT success" in fresh[-1].read_text(
-                            errors="replace"):
-                        response = rpc_call(self.rpc_for(index),
-                                            "getBlockNumber", ["group0", ""])
-                        if "result" in response:
-                            return True
-                except OSError:
-                    pass
-            time.sleep(1)
-        return False
 
+        def ready() -> bool:
+            fresh = [f for f in self.log_files(index) if f.name not in pre]
+            if not (fresh and self.alive(index)):
+                return False
+            if "init PBFT success" not in fresh[-1].read_text(
+                    errors="replace"):
+                return False
+            response = rpc_call(self.rpc_for(index),
+                                "getBlockNumber", ["group0", ""])
+            return "result" in response
+
+        with DirWatch([node_dir / "log"]) as watch:
+            return wait_until("fisco.start_node", ready, timeout,
+                              max_interval=1.0, wake=watch)
+
+    @profiled()
     def stop_node(self, index: int) -> None:
         node_dir = self.node_dir(index)
         try:
@@ -197,20 +247,20 @@ class FiscoNetwork:
         log_dir = self.node_dir(index) / "log"
         return sorted(log_dir.glob("log*"))
 
-    def _log_text(self, index: int) -> str:
-        text = ""
-        for path in self.log_files(index):
-            try:
-                text += path.read_text(errors="replace")
-            except OSError:
-                continue
-        return text
-
-    def _reached_new_view(self, index: int) -> bool:
-        return "reachNewView" in self._log_text(index)
+    def log_tail(self, index: int) -> LogTail:
+        tail = self._tails.get(index)
+        if tail is None:
+            tail = self._tails.setdefault(index, LogTail(
+                lambda: self.log_files(index),
+                scanner=scanner_for("fisco", LOG_PATTERNS, LOG_CAPTURES)))
+        return tail
 
     def log_count(self, index: int, pattern: str) -> int:
-        return self._log_text(index).count(pattern)
+        return self.log_tail(index).count(pattern)
+
+    def log_counts(self, index: int) -> dict[str, int]:
+        """One poll, every LOG_PATTERNS total (node_probes' fast path)."""
+        return self.log_tail(index).counts()
 
     def alive(self, index: int) -> bool:
         return bool(self._node_pids(index))
@@ -261,8 +311,7 @@ class FiscoNetwork:
         return result if isinstance(result, list) else []
 
     def consensus_timeout_values(self, index: int) -> list[str]:
-        matches = re.findall(r"consensusTimeout=(\d+)", self._log_text(index))
-        return sorted(set(matches))
+        return sorted(self.log_tail(index).captured("consensus_timeout"))
 
     def teardown(self) -> None:
         self.stop_all()
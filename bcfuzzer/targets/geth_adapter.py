@@ -17,6 +17,7 @@ from __future__ import annotations
 
 import json
 import random
+import subprocess
 import time
 from pathlib import Path
 
@@ -31,6 +32,9 @@ from targets import apply_case  # noqa: E402
 
 from ..common import MutationOp, Seed  # noqa: E402
 from ..mutator import ConfigEditor, mutate_one  # noqa: E402
+from ..profiler import profiled  # noqa: E402
+from ..readiness import wait_until  # noqa: E402
+from ..resources import scratch_root  # noqa: E402
 
 DEFAULT_CASE = "miner-txpool-balanced"
 BLOB_CASE = "blobpool-constrained"
@@ -94,9 +98,10 @@ class GethAdapter:
         # so the runtime configs never accumulate mutations
         return []
 
+    @profiled()
     def build_default_config(self, seed: int,
                              case: str = DEFAULT_CASE) -> Path:
-        run_dir = Path("/tmp") / f"bcfuzzer-geth-{seed}-{time.time_ns()}"
+        run_dir = scratch_root() / f"bcfuzzer-geth-{seed}-{time.time_ns()}"
         run_dir.mkdir(parents=True, exist_ok=True)
         meta = apply_case("geth", ROOT, case, run_dir, seed)
         config = Path(meta["output"])
@@ -110,6 +115,7 @@ class GethAdapter:
             config.write_text(text, encoding="utf-8")
         return config
 
+    @profiled()
     def apply_mutations(self, node_dir: Path, base_config: Path,
                         mutations: list[tuple[str, str, object]],
                         catalog: list, exempt_keys: set[str],
@@ -121,26 +127,28 @@ class GethAdapter:
             shutil.copy2(base_config, target_path)
         editor = ConfigEditor(node_dir)
         ops: list[MutationOp] = []
-        for item_path, rule, value in mutations:
-            item = next((i for i in catalog if i.path == item_path), None)
-            if item is None:
-                continue
+        with editor.batch():
+            for item_path, rule, value in mutations:
+                item = next((i for i in catalog if i.path == item_path), None)
+                if item is None:
+                    continue
+                self._op_counter += 1
+                ops.append(mutate_one(editor, target_path, item, rule,
+                                      self.rng, self._op_counter,
+                                      force_value=value))
             self._op_counter += 1
-            ops.append(mutate_one(editor, target_path, item, rule, self.rng,
-                                  self._op_counter, force_value=value))
-        self._op_counter += 1
-        self.sanitize_with_exempt(target_path, exempt_keys)
+            self.sanitize_with_exempt(target_path, exempt_keys, editor)
         return ops
 
-    def sanitize_with_exempt(self, config: Path, exempt: set[str]) -> int:
+    def sanitize_with_exempt(self, config: Path, exempt: set[str],
+                             editor: ConfigEditor | None = None) -> int:
         """Stock sanitizer minus the dangerous-but-legal trigger keys."""
-        from config_mutators import parse_lines
         from live_node_geth import _bounded_int
 
-        text = config.read_text(encoding="utf-8", errors="replace")
-        lines = text.splitlines()
+        editor = editor or ConfigEditor(config.parent)
+        doc = editor.document(config)
         changed = 0
-        for entry in parse_lines(text):
+        for entry in doc.entries():
             key = (entry["section"], entry["key"])
             if key in GETH_NUMERIC_BOUNDS:
                 if entry["section"] + "." + entry["key"] in exempt:
@@ -154,15 +162,15 @@ class GethAdapter:
             else:
                 continue
             new_line = f"{entry['indent']}{entry['key']} {entry['sep']} {new_value}"
-            if entry["line"] < len(lines) and lines[entry["line"]] != new_line:
-                lines[entry["line"]] = new_line
+            if entry["line"] < len(doc.lines) and \
+                    doc.set_line(entry["line"], new_line):
                 changed += 1
-        if changed:
-            config.write_text("\n".join(lines) + "\n", encoding="utf-8")
+        editor.done(doc)
         return changed
 
     # ----------------------------------------------------------- admission
 
+    @profiled()
     def probe_admission(self, net, index: int, is_producer: bool) -> bool:
         """A mutated config is admitted only if the node lives and (for the
         producer role) actually seals blocks."""
@@ -179,15 +187,31 @@ class GethAdapter:
         if is_producer:
             result = net.engine_drive(index, 5)
             return result.get("blocks") == 5
-        deadline = time.monotonic() + 60
-        while time.monotonic() < deadline:
-            if net.peer_count(index) >= 1:
-                return True
-            time.sleep(3)
-        return False
+        return wait_until("geth.admission_peer",
+                          lambda: net.peer_count(index) >= 1, 60)
+
+    def dry_run_config(self, net, index: int,
+                       files: list[Path]) -> str | None:
+        """`geth --config X dumpconfig`: geth's own TOML decoding (unknown
+        fields, type mismatches) without starting a node.  Pre-admission
+        (campaign.preadmit) skips the restart when it fails."""
+        config = next((p for p in files if p.suffix == ".toml"), None)
+        if config is None:
+            return None
+        try:
+            proc = subprocess.run(
+                [str(net.binary), "--config", str(config), "dumpconfig"],
+                capture_output=True, text=True, timeout=30)
+        except (OSError, subprocess.TimeoutExpired):
+            return None             # no verdict, not a rejection
+        if proc.returncode == 0:
+            return None
+        lines = (proc.stderr or proc.stdout).strip().splitlines()
+        return lines[-1] if lines else f"exit {proc.returncode}"
 
     # -------------------------------------------------------------- seeds
 
+    @profiled()
     def submit_seed(self, net, seed: Seed, ctx: dict) -> dict:
         """Execute one T-corpus seed against a normal node's RPC."""
         url = net.rpc_url(ctx.get("node_index", 1))
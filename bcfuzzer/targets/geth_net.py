@@ -11,16 +11,15 @@ drives the engine API on that node's authrpc port.
 
 `engine_drive` replicates the fast block loop of
 inter-node-bugs-final/geth/01_miner_gaslimit_collapse/poc_bcb10_gaslimit_collapse.sh
-(FCU -> getPayload -> newPayload -> FCU, 0.15 s per block, explicit
-timestamps, gasLimit milestones) — the loop that collapses the chain gas
-limit under a `miner.gaslimit=5000` producer (paper bug #8).
+(FCU -> getPayload -> newPayload -> FCU, explicit timestamps, gasLimit
+milestones) — the loop that collapses the chain gas limit under a
+`miner.gaslimit=5000` producer (paper bug #8).  Engine calls go through one
+pooled, JWT-cached EngineClient per node (geth_engine).
 """
 
 from __future__ import annotations
 
-import base64
 import hashlib
-import hmac
 import json
 import os
 import shutil
@@ -28,26 +27,34 @@ import signal
 import subprocess
 import sys
 import time
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import requests
-
 sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
 from live_node_geth import (  # noqa: E402
     FAKE_CL, BLOB_FAKE_CL, GENESIS, PEER_GETH, PASSWORD,
     drive_fake_beacon, kill_stale_geth_processes, make_keys, rpc_call)
+from ..profiler import profiled  # noqa: E402
+from ..readiness import wait_until  # noqa: E402
+from .geth_engine import (  # noqa: E402,F401
+    FAST_BLOCKS_PERIOD, EngineClient, EngineError, extract_blob_hashes)
 
 # Genesis gasLimit kept at 8M like the PoC: the 4000-block collapse then
 # lands below the 300k oracle threshold instead of ~603k with a 30M start.
 GENESIS_GAS_LIMIT_HEX = "0x7a1200"  # 8_000_000
 CLIQUE_PERIOD = 5                   # seconds; block timestamp must advance
 
-FAST_BLOCKS_PERIOD = 0.15
 COLLAPSE_BLOCKS = 4000              # phase-1 attack blocks (PoC ROUNDS_A)
 STICKY_BLOCKS = 500                 # phase-2 normal-producer blocks (PoC ROUNDS_B)
 COLLAPSE_THRESHOLD = 300_000        # PoC success threshold
 
+SYNC_WORKERS = 4                    # nodes fetching from the source at once
+SYNC_TIMEOUT_SEC = 180.0            # whole sync_all pass
+SYNC_POLL_SEC = 0.5                 # height poll while a node imports
+SYNC_REFCU_SEC = 5.0                # re-issue FCU to a node still behind
+SYNC_STALL_SEC = 15.0               # no height progress -> re-add source peer
+
 
 def patch_genesis_gaslimit() -> None:
     data = json.loads(GENESIS.read_text(encoding="utf-8"))
@@ -55,33 +62,13 @@ def patch_genesis_gaslimit() -> None:
     GENESIS.write_text(json.dumps(data), encoding="utf-8")
 
 
-def extract_blob_hashes(transactions: list) -> list[str]:
-    """Blob versioned hashes of type-3 txs in a payload (PoC geth/02 helper)."""
-    import rlp
-    hashes: list[str] = []
-    for raw in transactions:
-        if isinstance(raw, str):
-            data = bytes.fromhex(raw[2:]) if raw.startswith("0x") else bytes.fromhex(raw)
-        else:
-            data = bytes(raw)
-        if not data or data[0] != 0x03:
-            continue
-        try:
-            body = rlp.decode(data[1:])
-            inner = body[0] if isinstance(body[0], list) else body
-            for h in inner[10]:
-                hashes.append("0x" + h.hex())
-        except Exception:
-            continue
-    return hashes
-
-
 class GethNetwork:
     def __init__(self, work: Path, n_nodes: int = 13,
                  instrumented: bool = False,
                  binary: Path | None = None,
                  networkid: int = 1337,
-                 kill_stale: bool = True) -> None:
+                 kill_stale: bool = True,
+                 port_offset: int | None = None) -> None:
         # networkid/kill_stale let concurrent geth networks coexist:
         # live_node_geth.kill_stale_geth_processes matches every process
         # whose cmdline contains "--networkid 1337", so a parallel network
@@ -100,11 +87,18 @@ class GethNetwork:
             self.binary = ensure_instrumented_binary()
         self.configs: dict[int, Path | None] = {i: None for i in range(n_nodes)}
         self.miners: set[int] = set()
+        self._engines: dict[int, EngineClient] = {}
+        # differential restart bookkeeping (apply_configs)
+        self._launch_hash: dict[int, str] = {}
+        self.last_full_start_sec: float | None = None
+        self.restart_totals = {"restarted": 0, "kept": 0, "saved_sec": 0.0}
         # per-instance port offset derived from the work dir, in a range
         # disjoint from the fisco network's [0, 5000) offset range so
-        # concurrent campaigns can never fight over p2p/rpc ports
-        self.port_offset = 6000 + int(hashlib.md5(
-            str(Path(work).resolve()).encode()).hexdigest()[:6], 16) % 5000
+        # concurrent campaigns can never fight over p2p/rpc ports; a
+        # launcher leg passes its leased offset instead (resources.py)
+        self.port_offset = port_offset if port_offset is not None else \
+            6000 + int(hashlib.md5(
+                str(Path(work).resolve()).encode()).hexdigest()[:6], 16) % 5000
 
     # ------------------------------------------------------------- lifecycle
 
@@ -124,6 +118,22 @@ class GethNetwork:
                 check=True, capture_output=True, text=True, timeout=120)
         return signer
 
+    def snapshot_identity(self) -> dict:
+        """SnapshotStore key material: binary + node count (+ genesis).
+        Ports and networkid are launch flags (start_node), not datadir
+        state, so a template serves any offset."""
+        return {"binaries": [self.binary],
+                "layout": {"n": self.n,
+                           "genesis_gas_limit": GENESIS_GAS_LIMIT_HEX}}
+
+    def attach(self) -> None:
+        """Adopt a runtime cloned from a snapshot (instead of setup())."""
+        patch_genesis_gaslimit()
+        self.procs.clear()
+        self.miners.clear()
+        self._launch_hash.clear()
+        self.close_engines()
+
     def rpc_url(self, index: int) -> str:
         return f"http://127.0.0.1:{8545 + self.port_offset + index}"
 
@@ -154,12 +164,15 @@ class GethNetwork:
                                 env=env)
         self.procs[index] = proc
         self.configs[index] = config
+        self._launch_hash[index] = self.config_hash(config, mine)
         if mine:
             self.miners.add(index)
         return proc
 
+    @profiled()
     def start_all(self, configs: dict[int, Path | None],
                   miners: set[int], logs_dir: Path) -> bool:
+        t0 = time.monotonic()
         logs_dir.mkdir(parents=True, exist_ok=True)
         if self.kill_stale:
             kill_stale_geth_processes()
@@ -176,8 +189,146 @@ class GethNetwork:
         # must not strand the other twelve (smoke4 round 1: a config-fatal
         # node made ok=False and skipped the mesh entirely)
         self.connect_mesh()
+        self.last_full_start_sec = round(time.monotonic() - t0, 3)
         return ok
 
+    # ------------------------------------------------ differential restart
+
+    @staticmethod
+    def config_hash(config: Path | None, mine: bool) -> str:
+        """Launch identity of a node: config bytes (not path — every round
+        writes a fresh round-N/nodeI/conf.toml) plus the mining flag."""
+        digest = hashlib.sha256(b"mine\0" if mine else b"\0")
+        if config is not None:
+            digest.update(Path(config).read_bytes())
+        return digest.hexdigest()
+
+    def stop_nodes(self, indices: list[int]) -> None:
+        """SIGTERM the given nodes together, then reap them (stop_all for a
+        subset, without the networkid-wide stale-process sweep)."""
+        procs = [(i, self.procs.pop(i, None)) for i in indices]
+        for _, proc in procs:
+            if proc is not None and proc.poll() is None:
+                try:
+                    proc.send_signal(signal.SIGTERM)
+                except ProcessLookupError:
+                    pass
+        for index, proc in procs:
+            if proc is not None:
+                try:
+                    proc.wait(timeout=30)
+                except subprocess.TimeoutExpired:
+                    proc.kill()
+            self.miners.discard(index)
+            self._launch_hash.pop(index, None)
+            client = self._engines.pop(index, None)
+            if client is not None:
+                client.close()
+
+    @profiled()
+    def restart_node(self, index: int, config: Path | None, mine: bool,
+                     log_path: Path) -> bool:
+        self.stop_nodes([index])
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        self.start_node(index, config, mine, log_path)
+        return self.wait_http(index, timeout=90)
+
+    @profiled()
+    def apply_configs(self, configs: dict[int, Path | None],
+                      miners: set[int], logs_dir: Path,
+                      hold: set[int] = frozenset()) -> dict:
+        """Bring the network to (configs, miners), restarting only nodes
+        whose launch hash changed or that are not running.  Nodes in
+        `hold` (configs pre-admission predicts geth rejects) are stopped
+        and left down.
+
+        start_all restarts all 13 nodes and rebuilds the whole mesh; per
+        round only the controlled nodes get new configs, so the normals
+        keep running (and keep their peers and chain head).  The first
+        call — nothing running yet — falls back to a full start_all.
+
+        Returns {"mode", "ok", "restarted", "kept", "elapsed",
+        "saved_sec_est"}; the saving is estimated against the last full
+        start_all on this network."""
+        t0 = time.monotonic()
+        if not any(self.alive(i) for i in range(self.n)):
+            self.stop_all()
+            ok = self.start_all(configs, miners, logs_dir)
+            if hold:
+                self.stop_nodes(sorted(hold))
+            self.restart_totals["restarted"] += self.n
+            return {"mode": "full", "ok": ok,
+                    "restarted": list(range(self.n)), "kept": [],
+                    "elapsed": round(time.monotonic() - t0, 3),
+                    "saved_sec_est": 0.0}
+        changed = [i for i in range(self.n) if i not in hold and (
+                   not self.alive(i) or self._launch_hash.get(i)
+                   != self.config_hash(configs.get(i), i in miners))]
+        kept = [i for i in range(self.n)
+                if i not in changed and i not in hold]
+        held = [i for i in sorted(hold) if self.alive(i)]
+        if held:
+            self.stop_nodes(held)
+        ok = True
+        if changed:
+            logs_dir.mkdir(parents=True, exist_ok=True)
+            self.stop_nodes(changed)
+            for index in changed:
+                self.start_node(index, configs.get(index), index in miners,
+                                logs_dir / f"{self.nodes[index]}.log")
+            for index in changed:
+                if not self.wait_http(index, timeout=90):
+                    ok = False
+            self.reconnect(changed)
+        elapsed = round(time.monotonic() - t0, 3)
+        saved = max(0.0, self.last_full_start_sec - elapsed) \
+            if self.last_full_start_sec is not None else 0.0
+        self.restart_totals["restarted"] += len(changed)
+        self.restart_totals["kept"] += len(kept)
+        self.restart_totals["saved_sec"] = round(
+            self.restart_totals["saved_sec"] + saved, 3)
+        return {"mode": "differential", "ok": ok, "restarted": changed,
+                "kept": kept, "held": sorted(hold), "elapsed": elapsed,
+                "saved_sec_est": round(saved, 3)}
+
+    @profiled()
+    def reconnect(self, indices: list[int], timeout: float = 60.0) -> None:
+        """Targeted re-mesh for restarted nodes: each one dials the star
+        center (node0) and its ring neighbours, and those dial it back —
+        the same edges connect_mesh would create, without touching the
+        rest of the mesh.  Polls until every live restarted node has a
+        peer (addPeer no-ops while the fresh P2P listener is coming up)."""
+        deadline = time.monotonic() + timeout
+        while True:
+            enodes: dict[int, str] = {}
+            for index in range(self.n):
+                if not self.alive(index):
+                    continue
+                info = rpc_call(self.rpc_url(index), "admin_nodeInfo") or {}
+                if isinstance(info, dict) and info.get("enode"):
+                    enodes[index] = info["enode"]
+            for index in indices:
+                if index not in enodes:
+                    continue
+                for other in {0, (index + 1) % self.n, (index - 1) % self.n}:
+                    if other == index or other not in enodes:
+                        continue
+                    rpc_call(self.rpc_url(index), "admin_addPeer",
+                             [enodes[other]])
+                    rpc_call(self.rpc_url(other), "admin_addPeer",
+                             [enodes[index]])
+            if self._await_peers(indices, "geth.reconnect", 1.0) or \
+                    time.monotonic() > deadline:
+                return
+
+    def _await_peers(self, indices, name: str, budget: float) -> bool:
+        """Every live node of `indices` has a peer (addPeer dials are
+        asynchronous: give them up to `budget` before re-dialling)."""
+        return wait_until(
+            name, lambda: all(self.peer_count(i) >= 1 for i in indices
+                              if self.alive(i)), budget)
+
+    @profiled()
     def connect_mesh(self, wait: float = 6.0) -> None:
         """Star around node0 plus a ring among all nodes.
 
@@ -207,27 +358,23 @@ class GethNetwork:
                 if ring in enodes and self.alive(index):
                     rpc_call(self.rpc_url(index), "admin_addPeer",
                              [enodes[ring]])
-            time.sleep(wait)
-            unmeshed = [i for i in range(self.n)
-                        if self.alive(i) and self.peer_count(i) < 1]
-            if not unmeshed or time.monotonic() > deadline:
+            if self._await_peers(range(self.n), "geth.mesh", wait) or \
+                    time.monotonic() > deadline:
                 return
 
     def wait_http(self, index: int, timeout: int = 60) -> bool:
-        deadline = time.monotonic() + timeout
-        while time.monotonic() < deadline:
-            if rpc_call(self.rpc_url(index), "eth_blockNumber") is not None:
-                return True
-            proc = self.procs.get(index)
-            if proc is not None and proc.poll() is not None:
-                # the process died (mutated config rejected at parse,
-                # e.g. blobpool.datacap=-1) — stop polling and let the
-                # round record the failed admission instead of burning
-                # the full timeout (smoke4 round 1: a config-fatal node
-                # ate 90s of start_all and skipped the mesh entirely)
-                return False
-            time.sleep(1)
-        return False
+        # a dead process (mutated config rejected at parse, e.g.
+        # blobpool.datacap=-1) stops the wait so the round records the
+        # failed admission instead of burning the full timeout (smoke4
+        # round 1: a config-fatal node ate 90s of start_all and skipped
+        # the mesh entirely)
+        proc = self.procs.get(index)
+        return wait_until(
+            "geth.http",
+            lambda: rpc_call(self.rpc_url(index),
+                             "eth_blockNumber") is not None,
+            timeout,
+            fail=lambda: proc is not None and proc.poll() is not None)
 
     def alive(self, index: int) -> bool:
         proc = self.procs.get(index)
@@ -248,6 +395,8 @@ class GethNetwork:
                     proc.kill()
         self.procs.clear()
         self.miners.clear()
+        self._launch_hash.clear()
+        self.close_engines()
         if self.kill_stale:
             kill_stale_geth_processes()
 
@@ -278,83 +427,49 @@ class GethNetwork:
 
     # ------------------------------------------------------- engine driving
 
-    def _engine_rpc(self, port: int, jwtfile: Path, method: str,
-                    params: list) -> dict:
-        raw = jwtfile.read_bytes().strip()
-        secret = bytes.fromhex(raw[2:].decode()) if raw.startswith(b"0x") \
-            else bytes.fromhex(raw.decode())
-        header = base64.urlsafe_b64encode(
-            json.dumps({"alg": "HS256", "typ": "JWT"}).encode()).rstrip(b"=")
-        payload = base64.urlsafe_b64encode(
-            json.dumps({"iat": int(time.time())}).encode()).rstrip(b"=")
-        signing = header + b"." + payload
-        token = (signing + b"." + base64.urlsafe_b64encode(
-            hmac.new(secret, signing, hashlib.sha256).digest()).rstrip(b"=")
-                 ).decode()
-        response = requests.post(
-            f"http://127.0.0.1:{port}",
-            json={"jsonrpc": "2.0", "method": method, "params": params,
-                  "id": 1},
-            headers={"Authorization": f"Bearer {token}"}, timeout=30)
-        data = response.json()
-        if "error" in data:
-            raise RuntimeError(f"engine {method}: {data['error']}")
-        return data["result"]
-
+    def engine(self, index: int) -> EngineClient:
+        """The node's pooled engine client (see geth_engine); rebuilt when
+        the node's authrpc port or jwtsecret path changed."""
+        client = self._engines.get(index)
+        port, jwtfile = self.authrpc_port(index), self.jwtsecret(index)
+        if client is None or client.port != port or client.jwtfile != jwtfile:
+            if client is not None:
+                client.close()
+            client = EngineClient(port, jwtfile, http_url=self.rpc_url(index))
+            self._engines[index] = client
+        return client
+
+    def close_engines(self) -> None:
+        for client in self._engines.values():
+            client.close()
+        self._engines.clear()
+
+    @profiled()
     def engine_drive(self, index: int, rounds: int,
-                     period: float = FAST_BLOCKS_PERIOD,
+                     period: float | None = FAST_BLOCKS_PERIOD,
                      start_ts: int = 0) -> dict:
         """Fast block loop (PoC fast_blocks) on the post-prague engine API:
         FCUv3 -> getPayloadV5 -> newPayloadV4 -> FCUv3.  The genesis has
         shanghai/cancun/prague active at block 0, so V1 is rejected
         ("fcuV1 called post-shanghai") and newPayload must carry the
         executionRequests field ("nil executionRequests post-prague") —
-        exactly the v5 flow the geth/02 blob PoC client uses."""
-        port = self.authrpc_port(index)
-        jwtfile = self.jwtsecret(index)
-        if not jwtfile.is_file():
+        exactly the v5 flow the geth/02 blob PoC client uses.
+
+        The default keeps the PoC's fixed per-block sleep (engine_rapid
+        seeds mutate it; calibration and drive_blocks rely on its pacing);
+        callers opt in to the adaptive mode with `period=None` (payload
+        fetched as soon as it is final, see EngineClient.build_blocks)."""
+        if not self.jwtsecret(index).is_file():
             return {"error": "no jwtsecret", "milestones": {}}
-        head = self.head(index).get("hash")
+        head_block = self.head(index)
+        head = head_block.get("hash")
         if not head:
             return {"error": "no head", "milestones": {}}
-        head0 = head
-        ts = start_ts or (int(self.head(index).get("timestamp", "0x0"), 16) + 1)
-        milestones: dict[int, int] = {}
-        for i in range(rounds):
-            attrs = {
-                "timestamp": hex(ts),
-                "prevRandao": "0x" + f"{i:064x}"[-64:],
-                "suggestedFeeRecipient":
-                    "0x0000000000000000000000000000000000000001",
-                "withdrawals": [],
-                "parentBeaconBlockRoot": "0x" + "11" * 32,
-            }
-            fcu = self._engine_rpc(
-                port, jwtfile, "engine_forkchoiceUpdatedV3",
-                [{"headBlockHash": head, "safeBlockHash": head,
-                  "finalizedBlockHash": head0}, attrs])
-            pid = fcu.get("payloadId")
-            if not pid:
-                return {"error": "no payloadId", "milestones": milestones,
-                        "blocks": i}
-            time.sleep(period)
-            env = self._engine_rpc(port, jwtfile, "engine_getPayloadV5", [pid])
-            exec_payload = env["executionPayload"]
-            block_hash = exec_payload["blockHash"]
-            gas_limit = int(exec_payload["gasLimit"], 16)
-            vhashes = extract_blob_hashes(exec_payload["transactions"])
-            self._engine_rpc(
-                port, jwtfile, "engine_newPayloadV4",
-                [exec_payload, vhashes, "0x" + "11" * 32, []])
-            self._engine_rpc(
-                port, jwtfile, "engine_forkchoiceUpdatedV3",
-                [{"headBlockHash": block_hash, "safeBlockHash": block_hash,
-                  "finalizedBlockHash": head0}, None])
-            head = block_hash
-            ts += 1
-            if i in (0, rounds // 4, rounds // 2, 3 * rounds // 4, rounds - 1):
-                milestones[i + 1] = gas_limit
-        return {"blocks": rounds, "milestones": milestones, "final_head": head}
+        ts = start_ts or (int(head_block.get("timestamp", "0x0"), 16) + 1)
+        milestone_at = {0, rounds // 4, rounds // 2, 3 * rounds // 4,
+                        rounds - 1}
+        return self.engine(index).build_blocks(
+            head, rounds, ts, period=period, milestone_at=milestone_at)
 
     def drive_beacon(self, index: int, mode: str, rounds: int,
                      head_hash: str | None = None, period: int = 1,
@@ -395,30 +510,67 @@ class GethNetwork:
             time.sleep(delay)
         return block
 
-    def sync_all(self, exclude: set[int], rounds: int = 8,
-                 api_version: str = "v3",
-                 source: int | None = None) -> dict[int, bool]:
-        """Bring every non-excluded node to the current chain head via the
-        fake beacon (post-merge blocks are not p2p-announced; this is how
-        the PoCs make the normal node accept the attacker's blocks).
-
-        13-node note: driving every target at once makes the source serve
-        12 concurrent full-chain downloads and starves its HTTP RPC, so
-        targets are driven in small batches with a settle pause; a node
-        whose import outlasts the beacon timeout is marked False instead
-        of raising.
-
-        The FCU-to-unknown-head fetch only succeeds once the node is
-        connected to a peer that carries the chain (smoke: round 1 raced
-        the mesh and every node stayed at genesis), and the fake client
-        exits 0 even when every engine call failed, so "the beacon ran"
-        is not evidence of sync.  We therefore poll heights after the
-        batch pass and re-drive laggards until they converge."""
+    def _sync_node(self, index: int, head_hash: str, head_number: int,
+                   deadline: float, src_enode: str | None) -> float | None:
+        """In-process fake beacon for one node: FCU (no attributes) to the
+        source head, then poll the node's height until it reaches
+        `head_number`.  The FCU is re-issued every SYNC_REFCU_SEC while the
+        node is behind (the FCU-triggered fetch can be dropped when the
+        node had no useful peer at the time), and a node whose height has
+        not moved for SYNC_STALL_SEC gets a fresh admin_addPeer to the
+        source.  Returns seconds to convergence, None on timeout/death."""
+        start = time.monotonic()
+        client = self.engine(index)
+        last_fcu = -SYNC_REFCU_SEC
+        last_height, last_progress = -1, start
+        while time.monotonic() < deadline:
+            if not self.alive(index):
+                return None
+            now = time.monotonic()
+            if now - last_fcu >= SYNC_REFCU_SEC:
+                last_fcu = now
+                try:
+                    client.forkchoice(head_hash)
+                except (EngineError, OSError, ValueError):
+                    pass  # authrpc busy/restarting: the height poll decides
+            height = self.height(index)
+            if height >= head_number:
+                return round(time.monotonic() - start, 3)
+            if height > last_height:
+                last_height, last_progress = height, now
+            elif src_enode and now - last_progress >= SYNC_STALL_SEC:
+                rpc_call(self.rpc_url(index), "admin_addPeer", [src_enode])
+                last_progress = now
+            time.sleep(SYNC_POLL_SEC)
+        return None
+
+    @profiled()
+    def sync_all(self, exclude: set[int], source: int | None = None,
+                 timeout: float = SYNC_TIMEOUT_SEC,
+                 workers: int = SYNC_WORKERS) -> dict:
+        """Bring every non-excluded node to the current chain head (post-
+        merge blocks are not p2p-announced; this is how the PoCs make the
+        normal node accept the attacker's blocks).
+
+        Each node is driven by _sync_node through its pooled engine client
+        — no fake beacon subprocesses, no fixed batch/settle sleeps.  At
+        most `workers` nodes sync at once: driving all 12 targets together
+        makes the source serve 12 concurrent full-chain downloads and
+        starves its HTTP RPC.  The call returns as soon as every target
+        has converged (or died, or hit `timeout`).
+
+        Convergence is judged by the node's own height, never by an FCU
+        reply: the FCU-to-unknown-head fetch only succeeds once the node
+        is connected to a peer that carries the chain (smoke: round 1
+        raced the mesh and every node stayed at genesis).
+
+        Result: {index: converged} plus `_heights`, `_converged` and
+        `_timings` ({index: seconds to converge, None if it did not})."""
         if source is None:
             source = next(iter(exclude)) if exclude else 0
         head_block = self._head_with_retries(source)
         head_hash = head_block.get("hash")
-        results: dict[int, bool] = {}
+        results: dict = {}
         if not head_hash:
             results["_error"] = True
             results["_raw"] = head_block
@@ -434,6 +586,7 @@ class GethNetwork:
         # the round-end teardown kills before it completes (stageG3 geth
         # leg: convergence fell to 1/9 once node3 replaced node0 as the
         # highest-head source and stopped being the star center)
+        src_enode = None
         src_info = rpc_call(self.rpc_url(source), "admin_nodeInfo") or {}
         if isinstance(src_info, dict) and src_info.get("enode"):
             src_enode = src_info["enode"]
@@ -442,40 +595,30 @@ class GethNetwork:
                     rpc_call(self.rpc_url(index), "admin_addPeer",
                              [src_enode])
 
-        def _drive_batch(batch: list[int]) -> None:
-            for index in batch:
-                try:
-                    results[index] = self.drive_beacon(
-                        index, "update", rounds, head_hash,
-                        api_version=api_version)
-                except subprocess.TimeoutExpired:
-                    results[index] = False
-            time.sleep(5)
-
-        for start in range(0, len(targets), 3):
-            _drive_batch(targets[start:start + 3])
-        # convergence: poll, re-mesh and re-drive the laggards up to
-        # three extra passes; the fetch runs async after the beacon
-        # client exits, so wait for real import progress between passes
-        for _pass in range(3):
-            laggards = [i for i in targets
-                        if self.alive(i) and self.height(i) < head_number]
-            if not laggards:
-                break
-            self.connect_mesh(wait=2.0)
-            _drive_batch(laggards)
-            deadline = time.monotonic() + 45
-            while time.monotonic() < deadline:
-                if not [i for i in laggards
-                        if self.alive(i) and self.height(i) < head_number]:
-                    break
-                time.sleep(5)
-        time.sleep(2)
-        results["_heights"] = {i: self.height(i) for i in targets}
-        results["_converged"] = [
-            i for i in targets if self.height(i) >= head_number]
+        deadline = time.monotonic() + timeout
+        timings: dict[int, float | None] = {}
+        if targets:
+            with ThreadPoolExecutor(max_workers=max(1, min(workers, len(targets))),
+                                    thread_name_prefix="geth-sync") as pool:
+                futures = {index: pool.submit(self._sync_node, index,
+                                              head_hash, head_number,
+                                              deadline, src_enode)
+                           for index in targets}
+                for index, future in futures.items():
+                    try:
+                        timings[index] = future.result()
+                    except Exception:  # noqa: BLE001 - one node, not the pass
+                        timings[index] = None
+        heights = {i: self.height(i) for i in targets}
+        for index in targets:
+            results[index] = timings.get(index) is not None
+        results["_heights"] = heights
+        results["_converged"] = [i for i in targets
+                                 if heights[i] >= head_number]
+        results["_timings"] = timings
         return results
 
+    @profiled()
     def rotate_producer(self, old_index: int, new_index: int,
                         rounds: int = STICKY_BLOCKS) -> dict:
         """Hand the producer role over (PoC phase 2): sync the new producer to
@@ -485,10 +628,14 @@ class GethNetwork:
         if not head_hash:
             return {"error": "no head on old producer", "raw": old_head,
                     "alive": self.alive(old_index), "milestones": {}}
-        self.drive_beacon(new_index, "update", 8, head_hash, api_version="v3")
-        time.sleep(3)
+        # FCU-to-head until VALID replaces the 8-round fake beacon
+        # subprocess + fixed 3 s settle; a head that never validates
+        # surfaces as the usual engine_drive error below
+        sync = self.engine(new_index).sync_to(head_hash, timeout=60)
         start_ts = int(old_head.get("timestamp", "0x0"), 16) + 1
-        return self.engine_drive(new_index, rounds, start_ts=start_ts)
+        result = self.engine_drive(new_index, rounds, start_ts=start_ts)
+        result["sync"] = sync
+        return result
 
     # ------------------------------------------------------------- capacity
 
@@ -509,6 +656,9 @@ def main() -> int:
     parser = argparse.ArgumentParser(description="geth 13-node net smoke test")
     parser.add_argument("--nodes", type=int, default=13)
     parser.add_argument("--rounds", type=int, default=20)
+    parser.add_argument("--adaptive", action="store_true",
+                        help="adaptive block pacing instead of the fixed "
+                             "FAST_BLOCKS_PERIOD sleep")
     args = parser.parse_args()
     work = Path(tempfile.mkdtemp(prefix="geth13-net-", dir="/tmp"))
     logs = work / "logs"
@@ -520,7 +670,9 @@ def main() -> int:
         for i in range(args.nodes):
             print(f"node{i}: peers={net.peer_count(i)} height={net.height(i)} "
                   f"gaslimit={net.gaslimit(i)}")
-        result = net.engine_drive(0, args.rounds)
+        result = net.engine_drive(
+            0, args.rounds,
+            period=None if args.adaptive else FAST_BLOCKS_PERIOD)
         print("engine_drive:", json.dumps(result, indent=2))
         return 0 if ok and result.get("blocks") == args.rounds else 1
     finally:
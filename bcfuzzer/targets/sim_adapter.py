@@ -0,0 +1,107 @@
+"""Campaign adapter for the in-process `sim` network (targets/sim_net.py).
+
+Configs are the model nodes' config.ini files, edited by the same INI
+ConfigEditor as fisco's; there is no sanitizer, since the model node
+validates its config itself (sim_net.admission_error) and every mutated
+key is exempt anyway.
+
+Seeds:
+  - T: transfer wave through any node; batch wave through a controlled
+    node, which arms sim-03 when that node runs verifier.pool_type=batch.
+  - M: malformed messages, rejected by the node (engine overhead only).
+"""
+
+from __future__ import annotations
+
+import random
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from ..common import Seed  # noqa: E402
+from ..oracle import PANIC_SIGNAL_MAP  # noqa: E402
+from ..profiler import profiled  # noqa: E402
+
+
+class SimAdapter:
+    target = "sim"
+
+    def __init__(self, rng: random.Random) -> None:
+        self.rng = rng
+
+    # ------------------------------------------------------- config plumbing
+
+    def pristine_files(self, net, index: int) -> list[Path]:
+        """Config files restored from the campaign-start snapshot before
+        each round (see campaign.restore_pristine)."""
+        config = net.node_dir(index) / "config.ini"
+        return [config] if config.is_file() else []
+
+    @profiled()
+    def apply_mutations(self, net, index: int, mutations, catalog,
+                        exempt_keys: set[str]):
+        """Mutate node i's config.ini in place (INI editor)."""
+        from ..mutator import ConfigEditor, mutate_one
+
+        node_dir = net.node_dir(index)
+        editor = ConfigEditor(node_dir)
+        ops = []
+        counter = 0
+        with editor.batch():
+            for item_path, rule, value in mutations:
+                item = next((i for i in catalog if i.path == item_path), None)
+                if item is None:
+                    continue
+                counter += 1
+                ops.append(mutate_one(
+                    editor, node_dir / (item.file or "config.ini"), item,
+                    rule, self.rng, counter, force_value=value))
+        return ops
+
+    # ----------------------------------------------------------- admission
+
+    @profiled()
+    def probe_admission(self, net, index: int) -> bool:
+        """Admitted = the node starts on its config, serves RPC and
+        rejoins its peers."""
+        return net.start_node(index)
+
+    def dry_run_config(self, net, index: int,
+                       files: list[Path]) -> str | None:
+        """The model node's own config validation, without a start."""
+        from .sim_net import admission_error
+        return admission_error(net.read_config(index))
+
+    # -------------------------------------------------------------- seeds
+
+    @profiled()
+    def submit_seed(self, net, seed: Seed, ctx: dict) -> dict:
+        kind = seed.payload.get("kind", "transfer_wave")
+        index = ctx.get("node_index", 0)
+        count = seed.payload.get("count", 30)
+        if kind == "transfer_wave":
+            return {"sent": net.submit(index, count)}
+        if kind == "batch_wave":
+            return {"invoked": net.submit(index, count, batch=True),
+                    "node": index}
+        if kind == "malformed":
+            return {"kind": kind,
+                    "rejected": count if net.alive(index) else 0}
+        return {"skipped": True}
+
+    # --------------------------------------------------------------- probes
+
+    def node_probes(self, net, index: int) -> dict:
+        logs = net.log_counts(index)
+        return {
+            "alive": net.alive(index),
+            "height": net.height(index),
+            "gaslimit": net.gas_limit(index),
+            "pending": net.pending,
+            "view": net.current_view(index),
+            "timeout_events": logs["triggerTimeout"],
+            "config_rejected": logs["config rejected"],
+            "panic_signatures": {fragment: logs.get(fragment, 0)
+                                 for fragment in PANIC_SIGNAL_MAP["sim"]},
+        }
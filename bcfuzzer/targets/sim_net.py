@@ -0,0 +1,455 @@
+"""In-process model network for the `sim` target (engine benchmarking).
+
+A round against a real target costs minutes of node restarts and chain
+driving, so a scheduler, MEI or oracle change could only be measured on
+live 13-node networks.  SimNetwork models one network in memory,
+deterministically, behind the surface the campaign, the sequence
+primitives and the oracle use (build/attach/start/stop, per-node heights,
+logs):
+
+  - time is a tick counter advanced by the calls that take time on a real
+    network (drive, restarts, workload); `tick_sec` optionally sleeps per
+    tick to emulate wall time (lane-scaling runs);
+  - consensus is round-robin: the leader of view v is node v % n.  A dead
+    or hung leader costs the tick a view change ("triggerTimeout" in every
+    serving node's log); a sealed block moves the view on.  Leaders seal
+    `block_rate` blocks per tick at the default interval, scaled by their
+    consensus.block_interval_ms; at >= STALL_INTERVAL_MS the leader holds
+    its view without sealing (sim-01);
+  - the head gas limit drops to the leader's miner.gas_ceil at once and
+    recovers by at most parent/1024 per block (sim-02, geth's rule);
+  - a batch wave accepted by a verifier.pool_type=batch node makes the
+    next block it seals panic every verifier (sim-03; logged, the
+    verifiers stay up);
+  - admission is derived from item_catalog.SIM_ITEMS: a value outside its
+    bounds/enum fails the node start ("config rejected"); rpc.enabled=false
+    or fewer than MIN_PEERS peers start a node the admission probe cannot
+    reach;
+  - injected faults (SimFault; SimProfile.faults or BCFZ_SIM_FAULTS):
+    stall (node hangs; "*" halts consensus), panic, crash, collapse;
+  - every serving node appends `log_lines_per_block` synthetic lines per
+    block to node<i>/log/node.log, counted back through a LogTail exactly
+    like the real targets' panic and view-change markers.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import shutil
+import threading
+import time
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from config_mutators import parse_lines  # noqa: E402
+
+from ..item_catalog import SIM_ITEMS  # noqa: E402
+from ..logscan import scanner_for  # noqa: E402
+from ..logtail import LogTail  # noqa: E402
+from ..profiler import profiled  # noqa: E402
+
+DEFAULT_INTERVAL_MS = 1000
+STALL_INTERVAL_MS = 60_000
+DEFAULT_GAS_LIMIT = 30_000_000
+MIN_GAS_LIMIT = 5_000
+MAX_BLOCKS_PER_TICK = 4
+TXS_PER_BLOCK = 50
+MIN_PEERS = 2
+FAULT_KINDS = ("stall", "panic", "crash", "collapse")
+FAULT_ENV = "BCFZ_SIM_FAULTS"
+
+LOG_PATTERNS = ("triggerTimeout", "config rejected")
+PANIC_LINE = "panic: runtime error: index out of range [101]"
+
+
+@dataclass
+class SimProfile:
+    block_rate: float = 1.0          # blocks per tick at the default interval
+    tick_sec: float = 0.0            # wall time slept per tick (0: flat out)
+    restart_ticks: int = 2           # ticks one node (re)start takes
+    log_lines_per_block: int = 4     # per serving node
+    faults: list[str] = field(default_factory=list)
+
+    @classmethod
+    def from_env(cls) -> "SimProfile":
+        env = os.environ
+        return cls(
+            block_rate=float(env.get("BCFZ_SIM_BLOCK_RATE", 1.0)),
+            tick_sec=float(env.get("BCFZ_SIM_TICK_SEC", 0.0)),
+            restart_ticks=int(env.get("BCFZ_SIM_RESTART_TICKS", 2)),
+            log_lines_per_block=int(env.get("BCFZ_SIM_LOG_LINES", 4)),
+            faults=[f for f in env.get(FAULT_ENV, "").split(",")
+                    if f.strip()])
+
+
+@dataclass
+class SimFault:
+    """`kind@node+tick[/ticks]`, e.g. "stall@*+100/40" (consensus halted
+    for ticks 100-139) or "panic@5+30" (node 5 panics at tick 30)."""
+
+    kind: str
+    node: int | None                 # None: the whole network (stall)
+    at: int = 0
+    ticks: int | None = None         # None: until the end of the run
+
+    @classmethod
+    def parse(cls, spec: str) -> "SimFault":
+        kind, _, rest = spec.strip().partition("@")
+        where, _, when = rest.partition("+")
+        at, _, ticks = when.partition("/")
+        if kind not in FAULT_KINDS:
+            raise ValueError(f"unknown sim fault {spec!r} "
+                             f"(expected one of {FAULT_KINDS})")
+        return cls(kind, None if where in ("", "*") else int(where),
+                   int(at or 0), int(ticks) if ticks else None)
+
+    def active(self, tick: int) -> bool:
+        return tick >= self.at and (self.ticks is None
+                                    or tick < self.at + self.ticks)
+
+
+@dataclass
+class SimNode:
+    index: int
+    alive: bool = False
+    height: int = 0
+    gaslimit: int = DEFAULT_GAS_LIMIT
+    config: dict[str, str] = field(default_factory=dict)
+    rpc: bool = True
+    peered: bool = True
+    poisoned: bool = False           # holds an accepted batch wave
+
+
+def _config_text() -> str:
+    sections: dict[str, list[str]] = {}
+    for item in SIM_ITEMS:
+        section, key = item.path.rsplit(".", 1)
+        value = item.default
+        if isinstance(value, bool):
+            value = "true" if value else "false"
+        sections.setdefault(section, []).append(f"    {key} = {value}")
+    return "".join(f"[{section}]\n" + "\n".join(lines) + "\n\n"
+                   for section, lines in sections.items())
+
+
+def admission_error(config: dict[str, str]) -> str | None:
+    """Why a node refuses to start with `config` (None: it starts)."""
+    for item in SIM_ITEMS:
+        raw = config.get(item.path)
+        if raw is None:
+            continue
+        if item.kind == "bool":
+            if raw.lower() not in ("true", "false"):
+                return f"{item.path}: not a bool: {raw!r}"
+        elif item.kind == "int":
+            try:
+                value = int(raw)
+            except ValueError:
+                return f"{item.path}: not an int: {raw!r}"
+            low, high = item.bounds or (value, value)
+            if not low <= value <= high:
+                return f"{item.path}: {value} outside [{low}, {high}]"
+        elif item.kind == "enum" and raw not in (item.enum or []):
+            return f"{item.path}: {raw!r} not in {item.enum}"
+    return None
+
+
+class SimNetwork:
+    def __init__(self, runtime: Path, n_nodes: int = 13,
+                 port_offset: int | None = None,
+                 profile: SimProfile | None = None) -> None:
+        self.runtime = Path(runtime)
+        self.n = n_nodes
+        # no sockets; kept for the NetSession/lane interface
+        self.port_offset = port_offset or 0
+        self.profile = profile or SimProfile.from_env()
+        self.faults = [SimFault.parse(spec) for spec in self.profile.faults]
+        self.nodes = [SimNode(i) for i in range(n_nodes)]
+        self.tick_count = 0
+        self.view = 0
+        self.chain_height = 0
+        self.gaslimit = DEFAULT_GAS_LIMIT
+        self.pending = 0
+        self.credit = 0.0
+        self.stats = {"ticks": 0, "blocks": 0, "view_changes": 0,
+                      "restarts": 0}
+        self._lock = threading.RLock()
+        self._logs: dict[int, list[str]] = {}
+        self._tails: dict[int, LogTail] = {}
+
+    # ------------------------------------------------------------- lifecycle
+
+    def build(self) -> Path:
+        nodes = self.runtime / "nodes"
+        shutil.rmtree(nodes, ignore_errors=True)
+        text = _config_text()
+        for index in range(self.n):
+            node_dir = self.node_dir(index)
+            (node_dir / "log").mkdir(parents=True, exist_ok=True)
+            (node_dir / "config.ini").write_text(text, encoding="utf-8")
+        self._tails.clear()
+        return nodes
+
+    def snapshot_identity(self) -> dict:
+        """SnapshotStore key material: the model itself is the binary."""
+        return {"binaries": [Path(__file__)],
+                "layout": {"n": self.n, "model": "sim"}}
+
+    def attach(self) -> None:
+        """Adopt a runtime cloned from a snapshot (instead of build())."""
+        state = self.runtime / "chain.json"
+        if state.is_file():
+            data = json.loads(state.read_text(encoding="utf-8"))
+            self.chain_height = data["height"]
+            self.view = data["view"]
+            self.gaslimit = data["gaslimit"]
+        for node in self.nodes:
+            node.height = self.chain_height
+            node.gaslimit = self.gaslimit
+        self._tails.clear()
+
+    def node_dir(self, index: int) -> Path:
+        return self.runtime / "nodes" / f"node{index}"
+
+    @profiled()
+    def start_all(self) -> bool:
+        with self._lock:
+            for index in range(self.n):
+                self._boot(index)
+            self.tick(self.profile.restart_ticks)
+            return all(node.alive for node in self.nodes)
+
+    def stop_all(self) -> None:
+        with self._lock:
+            for node in self.nodes:
+                node.alive = False
+            self._flush()
+            if self.runtime.is_dir():
+                (self.runtime / "chain.json").write_text(json.dumps(
+                    {"height": self.chain_height, "view": self.view,
+                     "gaslimit": self.gaslimit}), encoding="utf-8")
+
+    def teardown(self) -> None:
+        self.stop_all()
+        shutil.rmtree(self.runtime, ignore_errors=True)
+
+    @profiled()
+    def start_node(self, index: int, timeout: float | None = None) -> bool:
+        """(Re)start node `index` on its on-disk config; True once it
+        serves RPC and has rejoined its peers."""
+        with self._lock:
+            self.stats["restarts"] += 1
+            self._boot(index)
+            self.tick(self.profile.restart_ticks)
+            node = self.nodes[index]
+            return node.alive and node.rpc and node.peered
+
+    @profiled()
+    def stop_node(self, index: int) -> None:
+        with self._lock:
+            self.nodes[index].alive = False
+            self._log(index, "INFO node stopped")
+
+    def _boot(self, index: int) -> None:
+        node = self.nodes[index]
+        node.config = self.read_config(index)
+        error = admission_error(node.config)
+        if error is not None:
+            node.alive = False
+            self._log(index, f"ERROR config rejected: {error}")
+            return
+        node.alive = True
+        node.poisoned = False
+        node.rpc = node.config.get("rpc.enabled", "true").lower() == "true"
+        node.peered = int(node.config.get("p2p.max_peers", 50)) >= MIN_PEERS
+        if node.peered:
+            node.height = self.chain_height
+            node.gaslimit = self.gaslimit
+        self._log(index, f"INFO node started height={node.height}")
+
+    def read_config(self, index: int) -> dict[str, str]:
+        path = self.node_dir(index) / "config.ini"
+        if not path.is_file():
+            return {}
+        return {f"{entry['section']}.{entry['key']}": entry["value"]
+                for entry in parse_lines(path.read_text(encoding="utf-8"))}
+
+    # ------------------------------------------------------------ consensus
+
+    def tick(self, count: int = 1) -> int:
+        """Advance the model by `count` ticks; returns blocks sealed."""
+        with self._lock:
+            before = self.chain_height
+            for _ in range(count):
+                self._step()
+            self._flush()
+        if self.profile.tick_sec > 0:
+            time.sleep(self.profile.tick_sec * count)
+        return self.chain_height - before
+
+    def _serving(self, node: SimNode) -> bool:
+        return node.alive and node.peered and not any(
+            f.kind == "stall" and f.node == node.index
+            and f.active(self.tick_count) for f in self.faults)
+
+    def _step(self) -> None:
+        tick = self.tick_count
+        self.tick_count += 1
+        self.stats["ticks"] += 1
+        for fault in self.faults:
+            if fault.node is None or fault.at != tick:
+                continue
+            if fault.kind in ("panic", "crash"):
+                if fault.kind == "panic":
+                    self._log(fault.node, PANIC_LINE)
+                self.nodes[fault.node].alive = False
+        if any(f.kind == "stall" and f.node is None and f.active(tick)
+               for f in self.faults):
+            self._view_change("consensus halted")
+            return
+        self.credit += self.profile.block_rate
+        cost = 1.0
+        for sealed in range(MAX_BLOCKS_PER_TICK):
+            leader = self.nodes[self.view % self.n]
+            if sealed and not self._serving(leader):
+                break           # its view starts on the next tick
+            # a tick lost to a view change or a waiting leader seals
+            # nothing and banks no credit
+            if not self._serving(leader):
+                self.credit = 0.0
+                self._view_change(f"leader {leader.index} unreachable")
+                return
+            interval = int(leader.config.get("consensus.block_interval_ms",
+                                             DEFAULT_INTERVAL_MS))
+            if interval >= STALL_INTERVAL_MS:
+                self.credit = 0.0
+                self._log(leader.index,
+                          f"DEBUG waiting seal time interval={interval}")
+                return
+            cost = max(interval, 1) / DEFAULT_INTERVAL_MS
+            if self.credit < cost:
+                break
+            self.credit -= cost
+            self._seal(leader)
+        self.credit = min(self.credit, max(float(MAX_BLOCKS_PER_TICK), cost))
+
+    def _view_change(self, reason: str) -> None:
+        self.view += 1
+        self.stats["view_changes"] += 1
+        for node in self.nodes:
+            if self._serving(node):
+                self._log(node.index,
+                          f"WARN triggerTimeout view={self.view} {reason}")
+
+    def _seal(self, leader: SimNode) -> None:
+        ceil = max(int(leader.config.get("miner.gas_ceil", DEFAULT_GAS_LIMIT)),
+                   MIN_GAS_LIMIT)
+        if any(f.kind == "collapse" and f.node == leader.index
+               and f.active(self.tick_count) for f in self.faults):
+            ceil = MIN_GAS_LIMIT
+        if ceil < self.gaslimit:
+            self.gaslimit = ceil
+        else:
+            self.gaslimit = min(ceil, self.gaslimit +
+                                max(self.gaslimit // 1024, 1))
+        txs = min(self.pending, TXS_PER_BLOCK)
+        self.pending -= txs
+        self.chain_height += 1
+        self.stats["blocks"] += 1
+        height = self.chain_height
+        for node in self.nodes:
+            if not self._serving(node):
+                continue
+            node.height = height
+            node.gaslimit = self.gaslimit
+            self._log(node.index,
+                      f"INFO commit block height={height} "
+                      f"leader={leader.index} gaslimit={self.gaslimit} "
+                      f"txs={txs}")
+            for k in range(1, self.profile.log_lines_per_block):
+                self._log(node.index,
+                          f"DEBUG p2p gossip height={height} "
+                          f"peer={(node.index + k) % self.n}")
+            if leader.poisoned and node is not leader:
+                self._log(node.index, f"{PANIC_LINE} proposer="
+                          f"{leader.index} height={height}")
+        leader.poisoned = False
+        self.view += 1
+
+    def rotate_leader(self, index: int, ticks: int | None = None) -> dict:
+        """Drive until `index` holds the view (bounded by 2n ticks)."""
+        budget = 2 * self.n if ticks is None else ticks
+        for _ in range(budget):
+            if self.view % self.n == index:
+                return {"view": self.view, "leader": index}
+            self.tick()
+        return {"view": self.view, "timeout": True}
+
+    # ------------------------------------------------------------- workload
+
+    def submit(self, index: int, count: int, batch: bool = False) -> int:
+        """Pool `count` txs through node `index`; returns the accepted
+        count.  A batch wave on a batch-pool node arms sim-03."""
+        with self._lock:
+            node = self.nodes[index]
+            if not (node.alive and node.rpc):
+                return 0
+            limit = int(node.config.get("txpool.limit", 8000))
+            accepted = max(0, min(count, limit - self.pending))
+            self.pending += accepted
+            if batch and accepted and \
+                    node.config.get("verifier.pool_type") == "batch":
+                node.poisoned = True
+            return accepted
+
+    # ------------------------------------------------------------- observers
+
+    def alive(self, index: int) -> bool:
+        return self.nodes[index].alive
+
+    def height(self, index: int) -> int:
+        node = self.nodes[index]
+        return node.height if node.alive and node.rpc else -1
+
+    def gas_limit(self, index: int) -> int:
+        node = self.nodes[index]
+        return node.gaslimit if node.alive and node.rpc else 0
+
+    def nominal_capacity(self, index: int) -> int:
+        return self.gas_limit(index) // 21_000
+
+    def current_view(self, index: int) -> int:
+        return self.view if self.nodes[index].alive else -1
+
+    def log_files(self, index: int) -> list[Path]:
+        return sorted((self.node_dir(index) / "log").glob("*.log"))
+
+    def log_tail(self, index: int) -> LogTail:
+        tail = self._tails.get(index)
+        if tail is None:
+            tail = self._tails.setdefault(index, LogTail(
+                lambda: self.log_files(index),
+                scanner=scanner_for("sim", LOG_PATTERNS)))
+        return tail
+
+    def log_counts(self, index: int) -> dict[str, int]:
+        return self.log_tail(index).counts()
+
+    # ----------------------------------------------------------------- logs
+
+    def _log(self, index: int, line: str) -> None:
+        self._logs.setdefault(index, []).append(
+            f"t={self.tick_count} {line}\n")
+
+    def _flush(self) -> None:
+        for index, lines in self._logs.items():
+            log_dir = self.node_dir(index) / "log"
+            if not log_dir.is_dir():
+                continue
+            with (log_dir / "node.log").open("a", encoding="utf-8") as fh:
+                fh.write("".join(lines))
+        self._logs.clear()
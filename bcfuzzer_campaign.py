@@ -1,16 +1,29 @@
 #!/usr/bin/env python3
 """BCFuzzer fuzzing engine campaign driver (design §3).
 
-Three modes:
+Six modes:
   fuzz       run the full engine: 13-node network per target, two-level
              scheduler, T/M corpora, sequence primitives, BCB oracle.
+             --target sim runs it against the in-process model network
+             (bcfuzzer/targets/sim_net.py) to benchmark the engine itself.
   calibrate  replay every paper bug through the fuzzer's own primitives
              and assert the oracle signal fires (bcfuzzer/calibration.py).
   regress    re-run the inter-node-bugs-final PoCs via full_bcfuzzer's
-             BUG_SPECS (bcfuzzer/regression.py).
+             BUG_SPECS (bcfuzzer/regression.py); independent PoCs run
+             --instances at a time.
+  minimize   ddmin a finished campaign's reports (--output) down to the
+             mutations, seeds and sequences that trigger them, on
+             --instances parallel network slots (bcfuzzer/minimize.py).
+  pocgen     write test_cases/<target>/NN_*/ (poc.sh + BugSpec) for the
+             minimized reports of --output (bcfuzzer/pocgen.py).
+  replay     replay one generated case (--case) once on a fresh network;
+             what a generated poc.sh runs.
 
-Layout under --output:  state/ (mei.json, scheduler.json, oracle.json,
-campaign.json), timeline.jsonl, result.json, calibration/|regression/.
+Layout under --output:  state/ (journal.jsonl, plus the mei.json,
+scheduler.json, oracle.json and campaign.json snapshots it is compacted
+into — bcfuzzer/journal.py), timeline.jsonl, result.json,
+calibration/|regression/, minimize.json, runtime/ (plus runtime-<k>/ per
+extra --instances lane).
 
 Exit code 0 = clean run (failures found or none); 2 = engine crash.
 """
@@ -20,19 +33,33 @@ from __future__ import annotations
 import argparse
 import json
 import os
+import queue
 import random
 import shutil
 import sys
 import time
 import traceback
+from concurrent.futures import Future, ThreadPoolExecutor
 from pathlib import Path
-from typing import Any
+from typing import Any, Callable
 
 sys.path.insert(0, str(Path(__file__).parent))
 
+from bcfuzzer.admission_cache import (  # noqa: E402
+    CACHE_ENV, AdmissionCache, binary_digest, config_key, log_excerpt)
 from bcfuzzer.common import BugReport, save_json  # noqa: E402
+from bcfuzzer.journal import (  # noqa: E402
+    JOURNAL_NAME, StateJournal, replay, round_delta)
 from bcfuzzer.mei import MeiState, summarize  # noqa: E402
+from bcfuzzer.pipeline import ConfigPrefetcher, StagedRound  # noqa: E402
+from bcfuzzer.preadmission import PreAdmission  # noqa: E402
+from bcfuzzer.profiler import profiling, span  # noqa: E402
+from bcfuzzer.readiness import recording, wait_until  # noqa: E402
+from bcfuzzer.readiness import summarize as summarize_waits  # noqa: E402
+from bcfuzzer.resources import (  # noqa: E402
+    TARGET_PORTS, claim_ports, lane_offsets)
 from bcfuzzer.scheduler import RoundPlan, TwoLevelScheduler  # noqa: E402
+from bcfuzzer.snapshot import SNAPSHOT_ENV, SnapshotStore  # noqa: E402
 from bcfuzzer.corpus_t import corpus_t  # noqa: E402
 from bcfuzzer.corpus_m import corpus_m  # noqa: E402
 from bcfuzzer.oracle import BcbOracle  # noqa: E402
@@ -46,7 +73,10 @@ ADAPTERS = {
     "fisco": "bcfuzzer.targets.fisco_adapter:FiscoAdapter",
     "chainmaker": "bcfuzzer.targets.chainmaker_adapter:ChainMakerAdapter",
     "aptos": "bcfuzzer.targets.aptos_adapter:AptosAdapter",
+    "sim": "bcfuzzer.targets.sim_adapter:SimAdapter",
 }
+# lane k (k >= 1) of a multi-instance geth leg runs --networkid 1337+k
+GETH_NETWORKID = 1337
 
 
 def load_adapter(target: str, rng: random.Random):
@@ -59,54 +89,129 @@ class NetSession:
     """Per-target network lifecycle across rounds."""
 
     def __init__(self, target: str, runtime: Path, n_nodes: int,
-                 seed: int) -> None:
+                 seed: int, port_offset: int | None = None,
+                 networkid: int | None = None,
+                 store: SnapshotStore | None = None) -> None:
         self.target = target
         self.runtime = Path(runtime)
         self.n = n_nodes
         self.seed = seed
+        # leased by bcfuzzer.launcher for concurrent legs; None keeps the
+        # factories' own path-derived offsets
+        self.port_offset = port_offset
+        # geth only: a non-default networkid marks a sibling instance,
+        # which must also skip the "--networkid 1337" stale-process sweep
+        self.networkid = networkid
+        # template store; None falls back to BCFZ_SNAPSHOT_DIR
+        self.store = store
         self.net = None
         self.network: Any = None
+        self.ready_info: dict = {}
 
     def build(self):
         if self.target == "geth":
             from bcfuzzer.targets.geth_net import GethNetwork
-            return GethNetwork(self.runtime, n_nodes=self.n)
+            extra = {} if self.networkid is None else \
+                {"networkid": self.networkid, "kill_stale": False}
+            return GethNetwork(self.runtime, n_nodes=self.n,
+                               port_offset=self.port_offset, **extra)
         if self.target == "fisco":
             from bcfuzzer.targets.fisco_net import FiscoNetwork
-            return FiscoNetwork(self.runtime, n_nodes=self.n)
+            return FiscoNetwork(self.runtime, n_nodes=self.n,
+                                port_offset=self.port_offset)
         if self.target == "chainmaker":
             from bcfuzzer.targets.chainmaker_net import ChainMakerNetwork
-            return ChainMakerNetwork(self.runtime)
+            return ChainMakerNetwork(self.runtime,
+                                     port_offset=self.port_offset or 0)
         if self.target == "aptos":
             from bcfuzzer.targets.aptos_net import AptosNetwork
             return AptosNetwork(self.runtime, n_validators=self.n)
+        if self.target == "sim":
+            from bcfuzzer.targets.sim_net import SimNetwork
+            return SimNetwork(self.runtime, n_nodes=self.n,
+                              port_offset=self.port_offset)
         raise ValueError(self.target)
 
-    def ensure_ready(self) -> Any:
-        if self.network is not None:
-            return self.network
-        network = self.build()
+    def provision(self, network: Any) -> None:
+        """Build the runtime from scratch (no snapshot)."""
         if self.target == "geth":
             network.setup()
+        elif self.target == "fisco":
+            network.build()
+        elif self.target == "chainmaker":
+            network.prepare()
+        elif self.target == "aptos":
+            network.launch()
+        elif self.target == "sim":
+            network.build()
+
+    def start(self, network: Any) -> None:
+        if self.target == "geth":
             # default-config network for the baseline window; round 1
             # replaces the producer config with the mutated one
             network.start_all({}, {0}, self.runtime / "baseline-logs")
         elif self.target == "fisco":
-            network.build()
             network.start_all(timeout=240)
         elif self.target == "chainmaker":
-            network.prepare()
             network.start_all()
-            deadline = time.monotonic() + 240
-            while time.monotonic() < deadline:
-                if all(network.alive(o) for o in network.orgs):
-                    break
-                time.sleep(2)
+            wait_until("chainmaker.alive",
+                       lambda: all(network.alive(o) for o in network.orgs),
+                       240)
         elif self.target == "aptos":
-            network.launch()
+            network.start_all()     # no-op right after launch()
+        elif self.target == "sim":
+            network.start_all()
+
+    def ensure_ready(self, warmup: Callable[[Any], Any] | None = None) -> Any:
+        """Network up, warmed and ready for the baseline window.
+
+        With a snapshot store (BCFZ_SNAPSHOT_DIR) the runtime is cloned
+        from the target's `warm` template when one exists; otherwise it is
+        built, started and warmed, then stopped once to freeze the
+        template and started again."""
+        if self.network is not None:
+            return self.network
+        with recording() as waits:
+            network = self._bring_up(warmup)
+        self.ready_info["waits"] = summarize_waits(waits)
         self.network = network
         return network
 
+    def _bring_up(self, warmup: Callable[[Any], Any] | None) -> Any:
+        t0 = time.monotonic()
+        network = self.build()
+        store = self.store or SnapshotStore.from_env()
+        key = store.key(self.target, network.snapshot_identity(), "warm") \
+            if store is not None else None
+        manifest = store.clone(key, self.runtime) \
+            if store is not None else None
+        cloned = manifest is not None
+        if cloned and getattr(network, "ports_busy", None) is not None \
+                and network.ports_busy():
+            # aptos: the template's forge-picked ports are held by a live
+            # swarm cloned from it; launch a fresh one instead
+            cloned = False
+        if cloned:
+            store.adopt(network, manifest)
+        else:
+            self.provision(network)
+        self.start(network)
+        if getattr(network, "bound_ports", None) is not None:
+            clashes = claim_ports(network.bound_ports())
+            if clashes:
+                print(f"[resources] {self.target} ports {clashes} overlap "
+                      "another leg's lease", flush=True)
+        if warmup is not None:
+            warmup(network)     # returns at once on a warm clone
+        if store is not None and not cloned:
+            network.stop_all()
+            store.freeze(key, self.runtime,
+                         getattr(network, "port_offset", 0))
+            self.start(network)
+        self.ready_info = {"snapshot": key, "cloned": cloned,
+                           "ready_sec": round(time.monotonic() - t0, 3)}
+        return network
+
     def teardown(self) -> None:
         if self.network is not None:
             if os.environ.get("BCFZ_KEEP_RUNTIME") == "1":
@@ -118,11 +223,47 @@ class NetSession:
             self.network = None
 
 
+def _graft_span(record: dict, name: str, sec: float) -> None:
+    """Append a main-thread phase (commit, persist) to the round's profile
+    tree, which was closed on the lane's thread."""
+    profile = record.get("profile")
+    if profile is None:
+        return
+    profile.setdefault("children", []).append(
+        {"name": name, "sec": round(sec, 4)})
+    profile["sec"] = round(profile["sec"] + sec, 4)
+
+
+class Lane:
+    """One network instance of a campaign (--instances): its own session,
+    adapter (nonces, accounts), observing oracle (baseline, per-node
+    windows) and pristine config capture."""
+
+    def __init__(self, index: int, session: NetSession, adapter: Any,
+                 oracle: BcbOracle) -> None:
+        self.index = index
+        self.session = session
+        self.adapter = adapter
+        self.oracle = oracle
+        self.pristine: dict[int, dict[str, bytes | None]] = {}
+        # content hash of the lane's node binaries (admission-cache keys)
+        self.binary = ""
+
+    @property
+    def network(self) -> Any:
+        return self.session.network
+
+
 class Campaign:
     def __init__(self, target: str, out_dir: Path, n_nodes: int,
                  controlled: list[int], seed: int, resume_state: Path | None,
-                 exploration_rounds: int = 2) -> None:
+                 exploration_rounds: int = 2,
+                 port_offset: int | None = None,
+                 instances: int = 1) -> None:
         self.target = target
+        self.port_offset = port_offset
+        self.instances = max(1, instances)
+        self.seed = seed
         self.out_dir = out_dir
         self.state_dir = out_dir / "state"
         self.state_dir.mkdir(parents=True, exist_ok=True)
@@ -131,17 +272,29 @@ class Campaign:
         self.rng = random.Random(seed)
         self.catalog = item_catalog.catalog_for(target)
         self.seeds = corpus_t(target) + corpus_m(target)
-        self.adapter = load_adapter(target, self.rng)
+        # adapters draw from their own streams (lane k: seed*1000+k): the
+        # lanes and the config prefetcher consume them off the main
+        # thread, which must not shift the scheduler's rng
+        self.adapter = load_adapter(target, random.Random(seed * 1000))
         self.mei = MeiState()
         self.scheduler = TwoLevelScheduler(
             target, self.catalog, self.seeds, n_nodes, controlled, self.rng,
             exploration_rounds=exploration_rounds)
         self.oracle = BcbOracle(target, [i for i in range(n_nodes)
                                          if i not in set(controlled)])
-        self.timeline: list[dict] = []
-        self._pristine: dict[int, dict[str, bytes | None]] = {}
+        self.journal = StateJournal(self.state_dir)
+        self.preadmission = PreAdmission(self.catalog)
+        self.admission_cache = AdmissionCache.from_env()
+        self.resumed = resume_state is not None
+        self.lanes: list[Lane] = []
+        self.network: Any = None
+        self.prefetcher: ConfigPrefetcher | None = None
+        self.prefetch_stats: dict = {}
         if resume_state is not None:
             self._resume(resume_state)
+            self.compact_state()
+        else:
+            self.journal.reset()
 
     # ------------------------------------------------------------- state
 
@@ -154,63 +307,58 @@ class Campaign:
                 self.rng, self.n_nodes)
         if (state_dir / "oracle.json").is_file():
             self.oracle.load(state_dir / "oracle.json")
+        applied = replay(state_dir / JOURNAL_NAME, self.mei, self.scheduler,
+                         self.oracle)
+        print(f"[resume] {state_dir}: round {self.scheduler.round_id} "
+              f"({applied} journaled rounds replayed)", flush=True)
+
+    def persist(self, round_id: int, round_record: dict | None,
+                admissions: list) -> None:
+        """Journal the round's state delta (compacting into snapshots
+        every journal.compact_every rounds), then append the round to
+        timeline.jsonl.  Errored rounds (no record) still journal: their
+        admissions and pool admits are part of the state."""
+        t0 = time.monotonic()
+        if self.journal.append(round_delta(self.mei, self.scheduler,
+                                           self.oracle, admissions)):
+            self.compact_state()
+        if round_record is None:
+            return
+        _graft_span(round_record, "persist", time.monotonic() - t0)
+        with (self.out_dir / "timeline.jsonl").open("a",
+                                                    encoding="utf-8") as fh:
+            fh.write(json.dumps(round_record, default=str) + "\n")
 
-    def persist(self, round_id: int, round_record: dict) -> None:
+    def compact_state(self) -> None:
+        """Rewrite the snapshots, then start an empty journal (order
+        matters for crash safety, see journal.py)."""
         self.mei.save(self.state_dir / "mei.json")
         self.scheduler.save(self.state_dir / "scheduler.json")
         self.oracle.save(self.state_dir / "oracle.json")
         save_json(self.state_dir / "campaign.json",
-                  {"target": self.target, "round_id": round_id,
+                  {"target": self.target,
+                   "round_id": self.scheduler.round_id,
                    "controlled": self.controlled,
-                   "last_round": round_record})
-        with (self.out_dir / "timeline.jsonl").open("a",
-                                                    encoding="utf-8") as fh:
-            fh.write(json.dumps(round_record, default=str) + "\n")
-
-    # --------------------------------------------------------- precondition
-
-    def precondition_ok(self, seed, node_plan) -> bool:
-        pre = seed.preconditions or {}
-        if "config" in pre:
-            key, expected = str(pre["config"]).split("=", 1)
-            matched = any(
-                path == key and str(value).lower() == expected.lower()
-                for path, _, value in node_plan.mutations)
-            if not matched:
-                return False
-        if "role" in pre and pre["role"] == "proposer":
-            if self.target != "chainmaker":
-                return False
-            # TBFT round-robins the proposer through all orgs; the
-            # capability flag takes effect on the restarted org's next
-            # proposal, and the malicious batch panics the VERIFIER orgs
-            # (detected by the oracle), so the seed need not wait for the
-            # controlled org to currently hold the role.  The prior
-            # `current_proposer() == org` gate starved every M seed in the
-            # stageG3 chainmaker leg: cmc consensus status returns no
-            # proposer field (the org is base64-encoded inside protobuf
-            # vote signatures), so current_proposer() never resolved and
-            # 0/3 M seeds executed across 50 rounds.
-            return True
-        return True
+                   "journal": JOURNAL_NAME})
+        self.journal.reset()
 
     # ------------------------------------------------------------ one round
 
-    def snapshot_pristine(self, net) -> None:
+    def snapshot_pristine(self, lane: Lane) -> None:
         """Capture every controlled node's config files at campaign start.
 
         Non-geth targets edit the live runtime configs in place, so without
         a restore step mutations accumulate across rounds and the node
         config drifts into garbage (chainmaker leg: one item mutated 100+
         times, 94% of probed configs rejected)."""
-        self._pristine = {}
+        lane.pristine = {}
         for index in self.controlled:
-            self._pristine[index] = {
+            lane.pristine[index] = {
                 str(p): (p.read_bytes() if p.is_file() else None)
-                for p in self.adapter.pristine_files(net, index)}
+                for p in lane.adapter.pristine_files(lane.network, index)}
 
-    def restore_pristine(self, index: int) -> None:
-        for name, data in self._pristine.get(index, {}).items():
+    def restore_pristine(self, lane: Lane, index: int) -> None:
+        for name, data in lane.pristine.get(index, {}).items():
             path = Path(name)
             if data is None:
                 path.unlink(missing_ok=True)
@@ -218,88 +366,183 @@ class Campaign:
                 path.parent.mkdir(parents=True, exist_ok=True)
                 path.write_bytes(data)
 
-    def apply_placements(self, session: NetSession, plan: RoundPlan,
+    def apply_placements(self, lane: Lane, plan: RoundPlan,
                          round_work: Path) -> dict[int, list]:
         """Materialize per-node configs; returns {node: ops}."""
-        net = session.network
+        net = lane.network
+        adapter = lane.adapter
         ops_by_node: dict[int, list] = {}
         exempt_by_node: dict[int, set[str]] = {}
         for node_plan in plan.placements:
             if node_plan.role == "normal" or not node_plan.mutations:
                 continue
-            self.restore_pristine(node_plan.node_index)
+            self.restore_pristine(lane, node_plan.node_index)
             exempt = {path for path, _, _ in node_plan.mutations}
             exempt_by_node[node_plan.node_index] = exempt
             if self.target == "geth":
-                base = self.adapter.build_default_config(
-                    self.scheduler.round_id * 100 + node_plan.node_index)
+                base = adapter.build_default_config(
+                    plan.round_id * 100 + node_plan.node_index)
                 cfg = round_work / f"node{node_plan.node_index}" / "conf.toml"
-                ops = self.adapter.apply_mutations(
+                ops = adapter.apply_mutations(
                     round_work / f"node{node_plan.node_index}", base,
                     node_plan.mutations, self.catalog, exempt, cfg)
                 ops_by_node[node_plan.node_index] = ops
-            elif self.target == "fisco":
+            elif self.target in ("fisco", "sim"):
                 net.stop_node(node_plan.node_index)
-                ops = self.adapter.apply_mutations(
+                ops = adapter.apply_mutations(
                     net, node_plan.node_index, node_plan.mutations,
                     self.catalog, exempt)
                 ops_by_node[node_plan.node_index] = ops
             elif self.target == "chainmaker":
                 net.stop_org(net.orgs[node_plan.node_index])
-                ops = self.adapter.apply_mutations(
+                ops = adapter.apply_mutations(
                     net, node_plan.node_index, node_plan.mutations,
                     self.catalog, exempt)
                 ops_by_node[node_plan.node_index] = ops
             elif self.target == "aptos":
                 net.stop_node(node_plan.node_index)
-                ops = self.adapter.apply_mutations(
+                ops = adapter.apply_mutations(
                     net, node_plan.node_index, node_plan.mutations,
                     self.catalog, exempt)
                 ops_by_node[node_plan.node_index] = ops
         return ops_by_node
 
-    def admission_pass(self, session: NetSession, plan: RoundPlan,
-                       ops_by_node: dict[int, list]) -> dict[int, bool]:
+    def probe_context(self, index: int) -> str:
+        """What the admission probe of node `index` tests (cache keys)."""
+        return "producer" if self.target == "geth" and index == 0 \
+            else "node"
+
+    def admission_keys(self, lane: Lane, ops_by_node: dict[int, list],
+                       files_of: Callable[[int], list[Path]]
+                       ) -> dict[int, str]:
+        """Admission-cache keys of the mutated nodes' configs ({} without
+        a cache)."""
+        if self.admission_cache is None:
+            return {}
+        keys: dict[int, str] = {}
+        for index, ops in ops_by_node.items():
+            key = config_key(self.target, lane.binary,
+                             self.probe_context(index), files_of(index)) \
+                if ops else None
+            if key is not None:
+                keys[index] = key
+        return keys
+
+    def preadmit(self, lane: Lane, plan: RoundPlan,
+                 ops_by_node: dict[int, list],
+                 files_of: Callable[[int], list[Path]],
+                 keys: dict[int, str] | None = None) -> dict[int, dict]:
+        """Static pre-admission (preadmission.py) of every mutated node,
+        after the admission cache's known rejections: {node: {"reason",
+        "sampled"}} for the predicted rejections.  Only sampled ones are
+        restarted and probed."""
+        dry_run = getattr(lane.adapter, "dry_run_config", None)
+        predictions: dict[int, dict] = {}
+        keys = keys or {}
+        for index, ops in ops_by_node.items():
+            if index in keys:
+                cached = self.admission_cache.rejection(
+                    keys[index], plan.round_id, index)
+                if cached is not None:
+                    predictions[index] = cached
+                    continue
+            files = files_of(index)
+            reason = self.preadmission.check(
+                files, ops,
+                (lambda: dry_run(lane.network, index, files))
+                if dry_run is not None else None)
+            if reason is not None:
+                predictions[index] = {
+                    "reason": reason,
+                    "sampled": self.preadmission.sampled(plan.round_id,
+                                                         index)}
+        return predictions
+
+    def admission_pass(self, lane: Lane, plan: RoundPlan,
+                       ops_by_node: dict[int, list],
+                       effects: dict,
+                       predictions: dict[int, dict] | None = None,
+                       keys: dict[int, str] | None = None
+                       ) -> dict[int, bool]:
+        """Probe every controlled node; the MEI/pool updates are queued in
+        `effects` for commit_round.  A predicted rejection that was not
+        sampled is rejected without a probe (its node stays down).  Probed
+        verdicts of keyed configs go to the admission cache."""
         verdicts: dict[int, bool] = {}
+        predictions = predictions or {}
+        keys = keys or {}
         for node_plan in plan.placements:
             if node_plan.role == "normal":
                 continue
-            net = session.network
-            if self.target == "geth":
-                admitted = self.adapter.probe_admission(
-                    net, node_plan.node_index, node_plan.node_index == 0)
+            net = lane.network
+            index = node_plan.node_index
+            predicted = predictions.get(index)
+            probed = time.monotonic()
+            if predicted is not None and not predicted["sampled"]:
+                admitted = False
+                probed = None
+            elif self.target == "geth":
+                admitted = lane.adapter.probe_admission(net, index,
+                                                        index == 0)
             else:
-                admitted = self.adapter.probe_admission(
-                    net, node_plan.node_index)
+                admitted = lane.adapter.probe_admission(net, index)
+            if predicted is not None and predicted["sampled"] and \
+                    predicted.get("source") != "cache":
+                self.preadmission.settle(ops_by_node.get(index, []),
+                                         bool(admitted))
+            if probed is not None and index in keys:
+                self.admission_cache.record(
+                    keys[index], bool(admitted), target=self.target,
+                    binary=lane.binary, context=self.probe_context(index),
+                    ops=[[op.item_path, op.rule, op.new_value]
+                         for op in ops_by_node.get(index, [])],
+                    latency=time.monotonic() - probed,
+                    excerpt="" if admitted else log_excerpt(net, index))
             verdicts[node_plan.node_index] = bool(admitted)
             for op in ops_by_node.get(node_plan.node_index, []):
                 item = next(i for i in self.catalog
                             if i.path == op.item_path)
-                self.mei.record_admission(item, op.rule, op.new_value,
-                                          bool(admitted))
+                effects["admissions"].append(
+                    (item, op.rule, op.new_value, bool(admitted)))
             if admitted:
-                self.scheduler.admit_config(
+                effects["admitted"].append(
                     f"round{plan.round_id}-node{node_plan.node_index}")
         return verdicts
 
-    def run_seeds(self, plan: RoundPlan, seed_results: list) -> None:
-        normal_node = next(i for i in range(self.n_nodes)
-                           if i not in set(self.controlled))
+    def pick_seeds(self, plan: RoundPlan) -> list[tuple[Any, Any]]:
+        """Choose the round's seeds at plan time, in the dispatching thread.
+
+        The least-tested choice depends on the placement's counts, so with
+        several lanes in flight the picks must not race the lanes'
+        executions.  Every picked seed is submitted (a failing submit is a
+        result, not a skip), so its execution is counted right away too —
+        the same pick/record sequence run_seeds used to interleave."""
+        picks = []
         for node_plan in plan.placements:
             if node_plan.role == "normal":
                 continue
-            seed = self.scheduler.pick_seed(
-                plan, node_plan,
-                lambda s: self.precondition_ok(s, node_plan))
+            seed = self.scheduler.pick_seed(plan, node_plan)
             if seed is None:
                 continue
+            picks.append((node_plan, seed))
+            self.scheduler.record_seed_execution(
+                plan.placement_hash, seed.seed_id)
+        return picks
+
+    def run_seeds(self, lane: Lane, plan: RoundPlan, picks: list,
+                  seed_results: list) -> None:
+        normal_node = next(i for i in range(self.n_nodes)
+                           if i not in set(self.controlled))
+        for node_plan, seed in picks:
             target_node = node_plan.node_index \
                 if seed.role in ("controlled", "proposer", "engine") \
                 else normal_node
             ctx = {"node_index": target_node, "round": plan.round_id}
             try:
-                result = self.adapter.submit_seed(
-                    self.network, seed, ctx) or {}
+                with span(f"seed.{seed.payload.get('kind', '')}",
+                          seed=seed.seed_id):
+                    result = lane.adapter.submit_seed(
+                        lane.network, seed, ctx) or {}
             except Exception as exc:  # a seed must never kill the round
                 result = {"error": str(exc)}
             result = {**result,
@@ -307,106 +550,146 @@ class Campaign:
                       "seed_id": seed.seed_id,
                       "node": target_node}
             seed_results.append(result)
-            self.scheduler.record_seed_execution(
-                plan.placement_hash, seed.seed_id)
 
-    def run_sequences(self, plan: RoundPlan, round_work: Path) -> list[dict]:
+    @staticmethod
+    def _sequence(seq_out: list[dict], name: str,
+                  fn: Callable[..., dict], *args: Any, **kwargs: Any) -> None:
+        """Run one sequence primitive in its own span; a failing
+        sequence is recorded, never raised."""
+        with span(f"seq.{name}"):
+            try:
+                seq_out.append({"seq": name, **fn(*args, **kwargs)})
+            except Exception as exc:
+                seq_out.append({"seq": name, "error": str(exc)})
+
+    def round_sequences(self, round_id: int) -> list[str]:
+        """The sequence primitives round `round_id` runs, in order."""
+        names = ["drive_blocks"]
+        if round_id % 5 == 0:
+            names.append("rotate_role")
+        if round_id % 3 == 0:
+            names += ["restart_cycle", "concurrent_workload"]
+        if self.target == "geth" and round_id % 4 == 0:
+            names.append("submit_pair")
+        return names
+
+    def run_sequences(self, lane: Lane, plan: RoundPlan, round_work: Path,
+                      names: list[str] | None = None) -> list[dict]:
+        """Run the round's sequences (only those in `names` when given:
+        minimization replays a subset)."""
+        net, adapter = lane.network, lane.adapter
         seq_out: list[dict] = []
         controlled0 = self.controlled[0]
         normal_node = next(i for i in range(self.n_nodes)
                            if i not in set(self.controlled))
-        try:
-            seq_out.append({"seq": "drive_blocks", **drive_blocks(
-                self.network, self.adapter, self.target, 30,
-                node_index=normal_node)})
-        except Exception as exc:
-            seq_out.append({"seq": "drive_blocks", "error": str(exc)})
-        if plan.round_id % 5 == 0:
-            try:
-                rounds = 60 if self.target == "geth" else None
-                seq_out.append({"seq": "rotate_role", **rotate_role(
-                    self.network, self.adapter, self.target,
-                    controlled0, normal_node, rounds=rounds)})
-            except Exception as exc:
-                seq_out.append({"seq": "rotate_role", "error": str(exc)})
-        if plan.round_id % 3 == 0:
-            try:
-                seq_out.append({"seq": "restart_cycle", **restart_cycle(
-                    self.network, self.adapter, self.target, controlled0,
-                    2)})
-            except Exception as exc:
-                seq_out.append({"seq": "restart_cycle", "error": str(exc)})
-            try:
-                seq_out.append({"seq": "concurrent_workload",
-                                **concurrent_workload(
-                                    self.network, self.adapter, self.target,
-                                    normal_node, 8.0)})
-            except Exception as exc:
-                seq_out.append({"seq": "concurrent_workload",
-                                "error": str(exc)})
-        if self.target == "geth" and plan.round_id % 4 == 0:
-            try:
-                seq_out.append({"seq": "submit_pair", **submit_pair(
-                    self.network, self.adapter, self.target, normal_node)})
-            except Exception as exc:
-                seq_out.append({"seq": "submit_pair", "error": str(exc)})
+        scheduled = self.round_sequences(plan.round_id)
+        if names is not None:
+            scheduled = [name for name in scheduled if name in names]
+        if "drive_blocks" in scheduled:
+            self._sequence(seq_out, "drive_blocks", drive_blocks,
+                           net, adapter, self.target, 30,
+                           node_index=normal_node)
+        if "rotate_role" in scheduled:
+            rounds = 60 if self.target == "geth" else None
+            self._sequence(seq_out, "rotate_role", rotate_role,
+                           net, adapter, self.target, controlled0,
+                           normal_node, rounds=rounds)
+        if "restart_cycle" in scheduled:
+            self._sequence(seq_out, "restart_cycle", restart_cycle,
+                           net, adapter, self.target, controlled0, 2)
+        if "concurrent_workload" in scheduled:
+            self._sequence(seq_out, "concurrent_workload",
+                           concurrent_workload, net, adapter, self.target,
+                           normal_node, 8.0)
+        if "submit_pair" in scheduled:
+            self._sequence(seq_out, "submit_pair", submit_pair,
+                           net, adapter, self.target, normal_node)
         return seq_out
 
-    def run_round(self, session: NetSession, plan: RoundPlan) -> dict:
-        net = session.network
-        self.network = net
+    def run_round(self, lane: Lane, plan: RoundPlan, picks: list,
+                  staged: "Future[StagedRound] | None" = None,
+                  sequences: list[str] | None = None) -> tuple[dict, dict]:
+        """Execute one round on `lane`.  Touches only the lane's network,
+        adapter and oracle; the campaign-wide effects (MEI admissions,
+        admitted pool configs, failures to report) come back in the
+        second value and are applied by commit_round in round order.
+        `staged` is the prefetcher's materialization of the plan (geth);
+        `sequences` restricts the round's sequence primitives."""
+        net = lane.network
+        adapter = lane.adapter
         t0 = time.monotonic()
-        round_work = session.runtime / f"round-{plan.round_id}"
+        round_work = lane.session.runtime / f"round-{plan.round_id}"
         seed_results: list[dict] = []
+        effects: dict = {"admissions": [], "admitted": [], "failures": [],
+                         "ops": []}
+        restart = None
+        predictions: dict[int, dict] = {}
+        # host-side work vs time spent driving/observing the network
+        latency = {"materialize_sec": 0.0, "materialize_wait_sec": 0.0}
         try:
             if self.target == "geth":
-                # shared datadirs, per-round mutated configs: stop the
-                # baseline/previous round's processes, restart with the
-                # round's mutated configs, mesh, then drive
-                net.stop_all()
-                ops_by_node = {}
-                configs: dict[int, Path] = {}
-                for node_plan in plan.placements:
-                    if node_plan.role == "normal":
-                        continue
-                    base = self.adapter.build_default_config(
-                        plan.round_id * 100 + node_plan.node_index)
-                    cfg = round_work / f"node{node_plan.node_index}" / "conf.toml"
-                    exempt = {p for p, _, _ in node_plan.mutations}
-                    ops = self.adapter.apply_mutations(
-                        round_work / f"node{node_plan.node_index}", base,
-                        node_plan.mutations, self.catalog, exempt, cfg)
-                    ops_by_node[node_plan.node_index] = ops
-                    configs[node_plan.node_index] = cfg
-                net.start_all(configs, {0}, round_work / "logs")
-                verdicts = {}
-                for node_plan in plan.placements:
-                    if node_plan.role == "normal":
-                        continue
-                    admitted = self.adapter.probe_admission(
-                        net, node_plan.node_index, node_plan.node_index == 0)
-                    verdicts[node_plan.node_index] = bool(admitted)
-                    for op in ops_by_node.get(node_plan.node_index, []):
-                        item = next(i for i in self.catalog
-                                    if i.path == op.item_path)
-                        self.mei.record_admission(item, op.rule, op.new_value,
-                                                  bool(admitted))
-                    if admitted:
-                        self.scheduler.admit_config(
-                            f"round{plan.round_id}-node{node_plan.node_index}")
+                # shared datadirs, per-round mutated configs: restart only
+                # the nodes whose config changed since the previous round
+                # (normals stay up with their peers and head), then drive.
+                # The configs were staged by the prefetcher, mostly while
+                # the previous round was still running.
+                waited = time.monotonic()
+                with span("materialize_wait"):
+                    ready = staged.result()
+                latency["materialize_wait_sec"] = time.monotonic() - waited
+                latency["materialize_sec"] = ready.materialize_sec
+                latency["prefetch"] = {"hits": ready.hits,
+                                       "misses": ready.misses}
+                ops_by_node = {i: node.ops for i, node in ready.nodes.items()}
+                configs: dict[int, Path] = {i: node.config
+                                            for i, node in ready.nodes.items()}
+                with span("preadmission"):
+                    files_of = (lambda i: [configs[i]] if configs.get(i)
+                                else [])
+                    keys = self.admission_keys(lane, ops_by_node, files_of)
+                    predictions = self.preadmit(lane, plan, ops_by_node,
+                                                files_of, keys)
+                with span("restart"):
+                    restart = net.apply_configs(
+                        configs, {0}, round_work / "logs",
+                        hold={i for i, p in predictions.items()
+                              if not p["sampled"]})
+                with span("admission"):
+                    verdicts = self.admission_pass(lane, plan, ops_by_node,
+                                                   effects, predictions,
+                                                   keys)
             else:
-                ops_by_node = self.apply_placements(session, plan, round_work)
-                verdicts = self.admission_pass(
-                    session, plan, ops_by_node)
+                # live runtime configs, edited in place with the node
+                # stopped: nothing to stage ahead of the round
+                waited = time.monotonic()
+                with span("materialize"):
+                    ops_by_node = self.apply_placements(lane, plan,
+                                                        round_work)
+                latency["materialize_sec"] = latency["materialize_wait_sec"] = \
+                    time.monotonic() - waited
+                with span("preadmission"):
+                    files_of = (lambda i: adapter.pristine_files(net, i))
+                    keys = self.admission_keys(lane, ops_by_node, files_of)
+                    predictions = self.preadmit(lane, plan, ops_by_node,
+                                                files_of, keys)
+                with span("admission"):
+                    verdicts = self.admission_pass(lane, plan, ops_by_node,
+                                                   effects, predictions,
+                                                   keys)
                 # view-change aftershocks of the round's serial restarts
                 # must not count as storm signal (see oracle.settle_after_restarts)
-                self.oracle.settle_after_restarts(net, self.adapter)
+                with span("settle"):
+                    lane.oracle.settle_after_restarts(net, adapter)
         except Exception:
             traceback.print_exc()
-            return {"round_id": plan.round_id, "error": "setup",
-                    "elapsed": time.monotonic() - t0}
-        self.run_seeds(plan, seed_results)
-        sequences = self.run_sequences(plan, round_work)
+            return {"round_id": plan.round_id, "lane": lane.index,
+                    "error": "setup",
+                    "elapsed": time.monotonic() - t0}, effects
+        with span("seeds"):
+            self.run_seeds(lane, plan, picks, seed_results)
+        with span("sequences"):
+            sequences = self.run_sequences(lane, plan, round_work,
+                                           sequences)
         if self.target == "geth":
             # post-merge blocks are not p2p-announced: drive the normal
             # nodes to the producer's head every round, or the oracle's
@@ -416,7 +699,8 @@ class Campaign:
                 controlled = set(self.controlled)
                 heads = {i: net.height(i) for i in controlled}
                 source = max(heads, key=heads.get)
-                sync = net.sync_all(exclude=controlled, source=source)
+                with span("sync_normals"):
+                    sync = net.sync_all(exclude=controlled, source=source)
                 sequences.append({"seq": "sync_normals",
                                   "source": source,
                                   "heads": heads,
@@ -424,26 +708,24 @@ class Campaign:
                                              if ok and isinstance(i, int)],
                                   "heights_after": sync.get("_heights"),
                                   "converged": sync.get("_converged"),
+                                  "sync_timings": sync.get("_timings"),
                                   "sync_error": sync.get("_error")})
             except Exception as exc:
                 sequences.append({"seq": "sync_normals",
                                   "error": str(exc)})
         failures = []
         try:
-            failures = self.oracle.observe(
-                net, self.adapter, plan.round_id,
-                seed_results=seed_results, placement=plan)
+            with span("observe"):
+                failures = lane.oracle.observe(
+                    net, adapter, plan.round_id,
+                    seed_results=seed_results, placement=plan)
         except Exception:
             traceback.print_exc()
-        reports: list[dict] = []
-        for failure in failures:
-            report = self.oracle.report(failure, plan.round_id, plan,
-                                        [op for ops in ops_by_node.values()
-                                         for op in ops])
-            if report is not None:
-                reports.append(report)
+        effects["failures"] = failures
+        effects["ops"] = [op for ops in ops_by_node.values() for op in ops]
         record = {
             "round_id": plan.round_id,
+            "lane": lane.index,
             "placement_hash": plan.placement_hash,
             "verdicts": verdicts,
             "mutations": {node: [(op.item_path, op.rule, op.new_value)
@@ -454,18 +736,51 @@ class Campaign:
             "failures": [{"category": f.category, "signal": f.signal,
                           "node": f.node, "detail": f.detail}
                          for f in failures],
-            "mei": self.mei.status_counts(self.target, self.catalog),
+            # per-normal-node wall time of the observe() fan-out
+            "probe_latency": dict(lane.oracle.last_probe_latency),
+            "latency": latency,
             "elapsed": time.monotonic() - t0,
         }
-        self.timeline.append(record)
-        self.persist(plan.round_id, record)
-        if self.target == "geth":
-            net.stop_all()
+        latency["network_sec"] = record["elapsed"] - \
+            latency["materialize_wait_sec"]
+        if restart is not None:
+            record["restart"] = {**restart, "totals": dict(net.restart_totals)}
+        if predictions:
+            record["preadmission"] = predictions
+        return record, effects
+
+    def commit_round(self, plan: RoundPlan, record: dict, effects: dict,
+                     plan_sec: float = 0.0) -> dict:
+        """Fold one executed round into the campaign state.
+
+        Called in round order whichever lane ran the round, so the MEI,
+        the config pool and the report registry (self.oracle's: signature
+        dedup and bug ids across all lanes) evolve exactly as if the
+        rounds had run back to back.  `plan_sec` is the dispatcher's
+        planning time, reported with the round's host-side latency."""
+        t0 = time.monotonic()
+        for item, rule, value, admitted in effects["admissions"]:
+            self.mei.record_admission(item, rule, value, admitted)
+        for config_id in effects["admitted"]:
+            self.scheduler.admit_config(config_id)
+        for failure in effects["failures"]:
+            self.oracle.report(failure, plan.round_id, plan, effects["ops"])
+        if record.get("error"):
+            self.persist(plan.round_id, None, effects["admissions"])
+            return record
+        record["mei"] = self.mei.status_counts(self.target, self.catalog)
+        latency = record.setdefault("latency", {})
+        latency["plan_sec"] = plan_sec
+        latency["commit_sec"] = time.monotonic() - t0
+        _graft_span(record, "commit", latency["commit_sec"])
+        latency["host_sec"] = plan_sec + latency["commit_sec"] + \
+            latency.get("materialize_sec", 0.0)
+        self.persist(plan.round_id, record, effects["admissions"])
         return record
 
     # -------------------------------------------------------------- fuzz
 
-    def _warmup_fisco(self, net) -> None:
+    def _warmup_fisco(self, net, adapter=None) -> None:
         """Kick block production before baseline + round-1 restarts.
 
         A fresh 13-node PBFT net seals no blocks while the pool is empty
@@ -476,10 +791,11 @@ class Campaign:
         observe.  Send one wave through a normal node and wait for
         block 1 so the baseline and the first restarts happen on a chain
         that has committed."""
+        adapter = adapter or self.adapter
         seed = next(s for s in self.seeds
                     if s.seed_id == "fisco-t-transfer-wave")
         try:
-            out = self.adapter.submit_seed(net, seed, {"node_index": 4})
+            out = adapter.submit_seed(net, seed, {"node_index": 4})
             print(f"[warmup] fisco transfer wave via node4: {out}",
                   flush=True)
         except Exception:
@@ -499,49 +815,220 @@ class Campaign:
             time.sleep(3)
         print("[warmup] WARNING: no block 1 after 180 s", flush=True)
 
-    def run_fuzz(self, rounds: int | None, budget_minutes: int | None,
-                 round_deadline: float | None) -> dict:
-        session = NetSession(self.target, self.out_dir / "runtime", self.n_nodes,
-                             self.scheduler.round_id * 1000)
-        session.ensure_ready()
-        self.network = session.network
-        self.snapshot_pristine(session.network)
-        if self.target == "fisco":
-            self._warmup_fisco(session.network)
-        print(f"[baseline] registering idle window on {self.target}...",
+    def boot_lanes(self) -> list[Lane]:
+        """Bring up the campaign's network instances one after another.
+
+        Lane 0 is the classic single network (runtime/, the leg's port
+        offset, geth networkid 1337 with its stale-process sweep); lane k
+        gets runtime-<k>/, the k-th stacked port block (resources.
+        lane_offsets) and geth networkid 1337+k without the sweep, which
+        would otherwise kill lane 0's nodes.  Boots are serial: two
+        13-node boots at once starve each other's readiness waits, and
+        geth's setup() patches the shared genesis file."""
+        offsets: list[int | None] = [self.port_offset]
+        if self.instances > 1:
+            offsets = lane_offsets(
+                TARGET_PORTS.get(self.target, lambda n: [])(self.n_nodes),
+                self.port_offset or 0, self.instances)
+        for index in range(self.instances):
+            runtime = self.out_dir / ("runtime" if index == 0
+                                      else f"runtime-{index}")
+            if index == 0:
+                adapter, oracle = self.adapter, self.oracle
+            else:
+                adapter = load_adapter(
+                    self.target, random.Random(self.seed * 1000 + index))
+                oracle = BcbOracle(self.target, self.normal_nodes())
+            self.boot_lane(index, runtime, offsets[index], adapter, oracle,
+                           self.lanes)
+        self.network = self.lanes[0].network
+        return self.lanes
+
+    def normal_nodes(self) -> list[int]:
+        return [i for i in range(self.n_nodes)
+                if i not in set(self.controlled)]
+
+    def boot_lane(self, index: int, runtime: Path, port_offset: int | None,
+                  adapter: Any, oracle: BcbOracle, lanes: list[Lane],
+                  store: SnapshotStore | None = None) -> Lane:
+        """Bring up one network instance, appended to `lanes` before the
+        boot so a crash mid-boot still tears it down: ready, pristine
+        configs captured, baseline registered."""
+        session = NetSession(
+            self.target, runtime, self.n_nodes,
+            self.scheduler.round_id * 1000 + index,
+            port_offset=port_offset,
+            networkid=None if index == 0 else GETH_NETWORKID + index,
+            store=store)
+        lane = Lane(index, session, adapter, oracle)
+        lanes.append(lane)
+        session.ensure_ready(
+            warmup=(lambda net, a=adapter: self._warmup_fisco(net, a))
+            if self.target == "fisco" else None)
+        print(f"[ready] {self.target} lane {index} {session.ready_info}",
               flush=True)
+        if self.admission_cache is not None:
+            lane.binary = binary_digest(session.network.snapshot_identity())
+        self.snapshot_pristine(lane)
+        print(f"[baseline] registering idle window on {self.target} "
+              f"lane {index}...", flush=True)
         try:
-            self.oracle.register_baseline(session.network, self.adapter)
+            oracle.register_baseline(session.network, adapter)
         except Exception:
             traceback.print_exc()
+        return lane
+
+    def warm_mei(self) -> None:
+        """Start a fresh campaign's MEI from the admission cache's verdicts
+        for this target build (admission_cache.py)."""
+        if self.admission_cache is None or not self.lanes:
+            return
+        items = {item.path: item for item in self.catalog}
+        warmed = 0
+        for entry in self.admission_cache.known(self.target,
+                                                self.lanes[0].binary):
+            for item_path, rule, value in entry["ops"]:
+                item = items.get(item_path)
+                if item is not None:
+                    self.mei.record_admission(item, rule, value,
+                                              bool(entry["admitted"]))
+                    warmed += 1
+        self.admission_cache.stats["warmed"] = warmed
+        if warmed:
+            # the warm MEI is campaign state like any round's admissions
+            self.compact_state()
+            print(f"[admission-cache] {warmed} cached verdicts folded "
+                  "into the MEI", flush=True)
+
+    def _run_on(self, lane: Lane, plan: RoundPlan, picks: list,
+                staged: "Future[StagedRound] | None",
+                free: "queue.Queue[Lane]") -> tuple[dict, dict]:
+        try:
+            # every readiness wait of the round, against its budget, and
+            # the round's span tree (commit/persist are grafted on later)
+            with recording() as waits, \
+                    profiling("round", target=self.target) as root:
+                record, effects = self.run_round(lane, plan, picks, staged)
+            record["waits"] = summarize_waits(waits)
+            record["profile"] = root.to_dict()
+            return record, effects
+        finally:
+            free.put(lane)
+
+    def _start_prefetcher(self) -> None:
+        """geth builds every round's configs off-network: stage them on a
+        background worker (pipeline.py) with its own adapter instance."""
+        self.prefetcher = self.make_prefetcher(self.out_dir / "staging", 999)
+
+    def make_prefetcher(self, root: Path,
+                        stream: int) -> ConfigPrefetcher | None:
+        """A config stager under `root` whose adapter draws from rng
+        stream seed*1000+`stream` (None: the target edits live configs)."""
+        if self.target != "geth":
+            return None
+        materializer = load_adapter(self.target,
+                                    random.Random(self.seed * 1000 + stream))
+
+        def apply(node_plan, base: Path, node_dir: Path) -> list:
+            exempt = {p for p, _, _ in node_plan.mutations}
+            return materializer.apply_mutations(
+                node_dir, base, node_plan.mutations, self.catalog, exempt,
+                node_dir / "conf.toml")
+
+        return ConfigPrefetcher(
+            root,
+            lambda round_id, node: materializer.build_default_config(
+                round_id * 100 + node),
+            apply)
+
+    def run_fuzz(self, rounds: int | None, budget_minutes: int | None,
+                 round_deadline: float | None) -> dict:
+        """Plan rounds and hand each to the first free lane.
+
+        Round r is planned only once rounds <= r - instances are committed
+        (and no later one), so every plan sees the same MEI/pool state on
+        every run whatever order the lanes finish in; with one instance
+        this is the old plan-run-commit loop.  While the dispatcher waits
+        on a commit, the prefetcher stages a speculative plan of the next
+        round (scheduler fork), so its configs are usually ready when the
+        real plan arrives."""
+        self.lanes = []
         deadline = time.monotonic() + budget_minutes * 60 \
             if budget_minutes else None
         count = 0
-        last_plan = None
+        free: queue.Queue[Lane] = queue.Queue()
+        inflight: dict[int, tuple[RoundPlan, Future, float, float]] = {}
+
+        def commit_oldest() -> bool:
+            """Commit the oldest in-flight round; True to stop on the
+            round deadline."""
+            round_id = next(iter(inflight))
+            plan, future, started, plan_sec = inflight.pop(round_id)
+            record = self.commit_round(plan, *future.result(),
+                                       plan_sec=plan_sec)
+            latency = record.get("latency", {})
+            print(f"[round {plan.round_id}] verdicts="
+                  f"{record.get('verdicts')} "
+                  f"failures={len(record.get('failures', []))} "
+                  f"elapsed={record.get('elapsed', 0):.1f}s "
+                  f"(host {latency.get('host_sec', 0):.1f}s, "
+                  f"network {latency.get('network_sec', 0):.1f}s)",
+                  flush=True)
+            if round_deadline and time.monotonic() - started > round_deadline:
+                print(f"[round {plan.round_id}] exceeded deadline, "
+                      "stopping", flush=True)
+                return True
+            return False
+
         try:
-            while True:
-                count += 1
-                if rounds is not None and count > rounds:
-                    break
-                if deadline is not None and time.monotonic() > deadline:
-                    break
-                t0 = time.monotonic()
-                plan = self.scheduler.next_round(self.mei)
-                last_plan = plan
-                print(f"[round {plan.round_id}] placement="
-                      f"{plan.placement_hash[:12]}...", flush=True)
-                record = self.run_round(session, plan)
-                print(f"[round {plan.round_id}] verdicts="
-                      f"{record.get('verdicts')} "
-                      f"failures={len(record.get('failures', []))} "
-                      f"elapsed={record.get('elapsed', 0):.1f}s", flush=True)
-                if round_deadline and time.monotonic() - t0 > round_deadline:
-                    print(f"[round {plan.round_id}] exceeded deadline, "
-                          "stopping", flush=True)
-                    break
+            self._start_prefetcher()
+            self.boot_lanes()
+            if not self.resumed:
+                self.warm_mei()
+            for lane in self.lanes:
+                free.put(lane)
+            with ThreadPoolExecutor(max_workers=len(self.lanes),
+                                    thread_name_prefix="lane") as pool:
+                stop = False
+                while not stop:
+                    if len(inflight) >= len(self.lanes):
+                        stop = commit_oldest()
+                        continue
+                    count += 1
+                    if rounds is not None and count > rounds:
+                        break
+                    if deadline is not None and time.monotonic() > deadline:
+                        break
+                    lane = free.get()
+                    started = time.monotonic()
+                    plan = self.scheduler.next_round(self.mei)
+                    picks = self.pick_seeds(plan)
+                    plan_sec = time.monotonic() - started
+                    staged = self.prefetcher.materialize(plan) \
+                        if self.prefetcher is not None else None
+                    print(f"[round {plan.round_id}] placement="
+                          f"{plan.placement_hash[:12]}..."
+                          + (f" lane={lane.index}" if len(self.lanes) > 1
+                             else ""), flush=True)
+                    inflight[plan.round_id] = (
+                        plan, pool.submit(self._run_on, lane, plan, picks,
+                                          staged, free), started, plan_sec)
+                    if self.prefetcher is not None and \
+                            len(inflight) >= len(self.lanes):
+                        # the next plan waits for a commit: guess it now
+                        self.prefetcher.speculate(
+                            self.scheduler.fork().next_round(self.mei))
+                while inflight:
+                    commit_oldest()
         finally:
             # always tear down — a crash mid-round must not leak 13 nodes
-            session.teardown()
+            for lane in self.lanes:
+                lane.session.teardown()
+            if self.prefetcher is not None:
+                self.prefetch_stats = dict(self.prefetcher.stats)
+                self.prefetcher.close(
+                    remove=os.environ.get("BCFZ_KEEP_RUNTIME") != "1")
+                self.prefetcher = None
         return self.finish()
 
     # ------------------------------------------------------------- results
@@ -553,9 +1040,17 @@ class Campaign:
             "mei_summary": summarize(self.mei, self.catalog),
             "pool_size": self.scheduler.pool_size(),
             "reports": [r for r in self.oracle.reports],
-            "timeline": self.timeline,
+            # per-round records stream to timeline.jsonl as rounds commit
+            "timeline_file": "timeline.jsonl",
         }
+        if self.prefetch_stats:
+            result["prefetch"] = self.prefetch_stats
+        if self.preadmission.enabled:
+            result["preadmission"] = self.preadmission.summary()
+        if self.admission_cache is not None:
+            result["admission_cache"] = self.admission_cache.summary()
         self.out_dir.mkdir(parents=True, exist_ok=True)
+        self.compact_state()
         save_json(self.out_dir / "result.json", result)
         return result
 
@@ -563,7 +1058,8 @@ class Campaign:
 def main() -> int:
     parser = argparse.ArgumentParser(description=__doc__)
     parser.add_argument("--target", required=True,
-                        choices=["geth", "chainmaker", "fisco", "aptos"])
+                        choices=["geth", "chainmaker", "fisco", "aptos",
+                                 "sim"])
     parser.add_argument("--output", required=True, type=Path)
     parser.add_argument("--nodes", type=int, default=13)
     parser.add_argument("--controlled", type=int, default=4,
@@ -573,14 +1069,40 @@ def main() -> int:
     parser.add_argument("--round-deadline", type=float, default=None,
                         help="stop after a round exceeds this many seconds")
     parser.add_argument("--mode", default="fuzz",
-                        choices=["fuzz", "calibrate", "regress"])
+                        choices=["fuzz", "calibrate", "regress",
+                                 "minimize", "pocgen", "replay"])
     parser.add_argument("--bugs", default="",
-                        help="comma-separated bug ids (calibrate/regress)")
+                        help="comma-separated bug ids (calibrate/regress/"
+                             "minimize/pocgen)")
     parser.add_argument("--seed", type=int, default=7)
     parser.add_argument("--state", type=Path, default=None,
                         help="resume campaign state from this directory")
     parser.add_argument("--exploration-rounds", type=int, default=5)
+    parser.add_argument("--port-offset", type=int, default=None,
+                        help="leased port offset (bcfuzzer.launcher); default "
+                             "derives one from the runtime path")
+    parser.add_argument("--instances", type=int, default=1,
+                        help="independent network instances; rounds run "
+                             "on whichever is free")
+    parser.add_argument("--snapshot-dir", type=Path, default=None,
+                        help="warm-network template store (clone runtimes "
+                             f"instead of rebuilding; env {SNAPSHOT_ENV})")
+    parser.add_argument("--history-rounds", type=int, default=None,
+                        help="minimize: rounds replayed before the "
+                             "report's own")
+    parser.add_argument("--case", type=Path, default=None,
+                        help="replay: the case file a generated poc.sh "
+                             "embeds")
+    parser.add_argument("--cases-dir", type=Path, default=None,
+                        help="pocgen: test case root (default test_cases/)")
+    parser.add_argument("--admission-cache", type=Path, default=None,
+                        help="admission verdicts shared across campaigns "
+                             f"and calibrations (env {CACHE_ENV})")
     args = parser.parse_args()
+    if args.snapshot_dir is not None:
+        os.environ[SNAPSHOT_ENV] = str(args.snapshot_dir.resolve())
+    if args.admission_cache is not None:
+        os.environ[CACHE_ENV] = str(args.admission_cache.resolve())
 
     if args.mode == "calibrate":
         from bcfuzzer.calibration import run_calibration
@@ -590,9 +1112,52 @@ def main() -> int:
     if args.mode == "regress":
         from bcfuzzer.regression import run_regression
         bugs = [b.strip() for b in args.bugs.split(",") if b.strip()] or None
-        run_regression(args.target, bugs, args.output / "regression")
+        run_regression(args.target, bugs, args.output / "regression",
+                       jobs=args.instances)
+        return 0
+
+    if args.mode == "minimize":
+        from bcfuzzer.minimize import HISTORY_ROUNDS, run_minimization
+        bugs = [b.strip() for b in args.bugs.split(",") if b.strip()] or None
+        campaign = Campaign(args.target, args.output, args.nodes,
+                            list(range(args.controlled)), args.seed,
+                            args.state or args.output / "state",
+                            port_offset=args.port_offset,
+                            instances=args.instances)
+        records = run_minimization(
+            campaign, bugs,
+            history=HISTORY_ROUNDS if args.history_rounds is None
+            else args.history_rounds)
+        print(json.dumps(
+            {"target": args.target, "reports": len(records),
+             "verified": sum(1 for r in records if r.get("verified"))},
+            indent=2))
         return 0
 
+    if args.mode == "pocgen":
+        from bcfuzzer.pocgen import TEST_CASES, run_pocgen
+        bugs = [b.strip() for b in args.bugs.split(",") if b.strip()] or None
+        campaign = Campaign(args.target, args.output, args.nodes,
+                            list(range(args.controlled)), args.seed,
+                            args.state or args.output / "state")
+        written = run_pocgen(campaign, bugs, args.cases_dir or TEST_CASES)
+        print(json.dumps([spec["bug_id"] for spec in written]))
+        return 0
+    if args.mode == "replay":
+        from bcfuzzer.pocgen import run_replay
+        if args.case is None:
+            parser.error("--mode replay needs --case")
+        case = json.loads(args.case.read_text(encoding="utf-8"))
+        shutil.rmtree(args.output, ignore_errors=True)
+        campaign = Campaign(case["target"], args.output, case["nodes"],
+                            case["controlled"], case["seed"], None,
+                            port_offset=args.port_offset)
+        try:
+            return 0 if run_replay(campaign, case)["reproduced"] else 1
+        except Exception:
+            traceback.print_exc()
+            return 2
+
     if args.rounds is None and args.budget_minutes is None:
         args.rounds = 10
     shutil.rmtree(args.output, ignore_errors=True)
@@ -600,7 +1165,9 @@ def main() -> int:
     campaign = Campaign(args.target, args.output, args.nodes,
                         list(range(args.controlled)), args.seed,
                         args.state,
-                        exploration_rounds=args.exploration_rounds)
+                        exploration_rounds=args.exploration_rounds,
+                        port_offset=args.port_offset,
+                        instances=args.instances)
     try:
         result = campaign.run_fuzz(args.rounds, args.budget_minutes,
                                    args.round_deadline)
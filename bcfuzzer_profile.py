@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""bcfuzzer-profile: aggregate the per-round span trees of a campaign.
+
+Every fuzz round stores its span tree under "profile" in timeline.jsonl
+(bcfuzzer/profiler.py).  This folds the rounds of one or more timelines
+into a flame-style breakdown per target:
+
+  python3 bcfuzzer_profile.py /tmp/bcfz-geth /tmp/bcfz-fisco
+  python3 bcfuzzer_profile.py /tmp/bcfz-geth/timeline.jsonl --folded
+
+Arguments are campaign output dirs (their timeline.jsonl is read) or
+timeline files.  Default output is an indented table — calls, total and
+self seconds, share of all round time — with children ordered by total;
+--folded prints "round;seeds;seed.tx <self ms>" lines for flamegraph.pl
+or speedscope, --json the raw aggregate.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent))
+
+from bcfuzzer.profiler import aggregate  # noqa: E402
+
+
+def load_profiles(paths: list[Path]) -> dict[str, list[dict]]:
+    """{target: [profile tree, ...]} from timelines / campaign dirs."""
+    by_target: dict[str, list[dict]] = {}
+    for path in paths:
+        timeline = path / "timeline.jsonl" if path.is_dir() else path
+        if not timeline.is_file():
+            print(f"skip {path}: no timeline.jsonl", file=sys.stderr)
+            continue
+        for line in timeline.read_text().splitlines():
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                continue      # a line cut short by a killed campaign
+            profile = record.get("profile")
+            if profile:
+                by_target.setdefault(profile.get("target", "?"), []) \
+                    .append(profile)
+    return by_target
+
+
+def render_table(target: str, trees: list[dict], min_pct: float) -> str:
+    stats = aggregate(trees)
+    total = sum(e["sec"] for path, e in stats.items() if len(path) == 1)
+    lines = [f"== {target}: {len(trees)} rounds, {total:.1f}s",
+             f"{'span':<48} {'n':>6} {'total s':>10} {'self s':>10} "
+             f"{'%':>6}"]
+
+    def emit(path: tuple[str, ...]) -> None:
+        entry = stats[path]
+        pct = 100.0 * entry["sec"] / total if total else 0.0
+        if pct < min_pct:
+            return
+        label = "  " * (len(path) - 1) + path[-1]
+        lines.append(f"{label:<48} {entry['n']:>6} {entry['sec']:>10.2f} "
+                     f"{entry['self']:>10.2f} {pct:>6.1f}")
+        children = [p for p in stats
+                    if len(p) == len(path) + 1 and p[:-1] == path]
+        for child in sorted(children, key=lambda p: -stats[p]["sec"]):
+            emit(child)
+
+    for root in sorted((p for p in stats if len(p) == 1),
+                       key=lambda p: -stats[p]["sec"]):
+        emit(root)
+    return "\n".join(lines)
+
+
+def render_folded(target: str, trees: list[dict]) -> str:
+    return "\n".join(
+        f"{target};{';'.join(path)} {round(entry['self'] * 1000)}"
+        for path, entry in sorted(aggregate(trees).items())
+        if entry["self"] > 0)
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    parser.add_argument("paths", nargs="+", type=Path,
+                        help="campaign output dirs or timeline.jsonl files")
+    parser.add_argument("--target", default=None,
+                        help="only this target")
+    parser.add_argument("--min-pct", type=float, default=0.5,
+                        help="hide spans under this share of round time")
+    parser.add_argument("--folded", action="store_true",
+                        help="folded stacks (self ms) for flame graphs")
+    parser.add_argument("--json", action="store_true",
+                        help="raw aggregate per target")
+    args = parser.parse_args()
+
+    by_target = load_profiles(args.paths)
+    if args.target is not None:
+        by_target = {t: v for t, v in by_target.items() if t == args.target}
+    if not by_target:
+        print("no profiled rounds found", file=sys.stderr)
+        return 1
+    for target in sorted(by_target):
+        trees = by_target[target]
+        if args.json:
+            print(json.dumps({
+                "target": target, "rounds": len(trees),
+                "spans": [{"stack": list(path), "n": e["n"],
+                           "sec": round(e["sec"], 4),
+                           "self": round(e["self"], 4)}
+                          for path, e in sorted(aggregate(trees).items())]}))
+        elif args.folded:
+            print(render_folded(target, trees))
+        else:
+            print(render_table(target, trees, args.min_pct))
+            print()
+    return 0
+
+
+if __name__ == "__main__":
+    raise SystemExit(main())
@@ -0,0 +1,123 @@
+"""Live benchmark: ChainMaker invokes/sec, per-call cmc vs persistent client.
+
+Runs against an already-running runtime (--runtime, sdk-<org>.yml files
+present — e.g. a campaign's chainmaker runtime) or launches a fresh 13-org
+network in a temp dir and tears it down afterwards.  Times
+
+  cmc_serial   the pre-client path: one `cmc ... invoke` subprocess per
+               call with the 0.2 s inter-call sleep
+  client       ChainMakerClient.invoke_many (pipelined sdk waves when
+               chainmaker-sdk-python 3.0 is installed — see
+               requirements-chainmaker.txt — else the pooled cmc fallback)
+
+plus height reads per second on both paths, and prints one JSON object.
+
+  python3 benchmarks/bench_chainmaker_invoke.py --count 50
+  python3 benchmarks/bench_chainmaker_invoke.py --runtime /tmp/cm-rt
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.targets.chainmaker_client import (  # noqa: E402
+    ChainMakerClient, cmc_ok)
+from bcfuzzer.targets.chainmaker_net import ChainMakerNetwork  # noqa: E402
+from live_node_chainmaker import cmc_capture  # noqa: E402
+
+
+def _rate(n: int, seconds: float) -> float:
+    return round(n / seconds, 2) if seconds > 0 else 0.0
+
+
+def launch() -> ChainMakerNetwork:
+    net = ChainMakerNetwork(Path(tempfile.mkdtemp(prefix="cm13-bench-",
+                                                  dir="/tmp")))
+    net.prepare()
+    net.start_all()
+    deadline = time.monotonic() + 180
+    while time.monotonic() < deadline:
+        if net.height() > 0:
+            return net
+        time.sleep(2)
+    net.teardown()
+    raise SystemExit("network did not start producing blocks")
+
+
+def run(net: ChainMakerNetwork, org: str = "wx-org1", count: int = 50,
+        reads: int = 20) -> dict:
+    if org not in net.sdk_confs:
+        raise SystemExit(f"no sdk-{org}.yml under {net.runtime}")
+    if not net.ensure_contracts(org):
+        raise SystemExit("counter contract deployment failed")
+    sdk_conf = net.sdk_confs[org]
+    args = ["client", "contract", "user", "invoke", "--contract-name=counter",
+            "--method=increase", "--params={}", "--sync-result=true"]
+
+    start = time.monotonic()
+    old_ok = 0
+    for _ in range(count):
+        _, out = cmc_capture(sdk_conf, *args, timeout=30)
+        old_ok += cmc_ok(out)
+        time.sleep(0.2)
+    old_s = time.monotonic() - start
+
+    client = ChainMakerClient(org, sdk_conf)
+    start = time.monotonic()
+    new_ok = client.invoke_many("counter", "increase", count)
+    new_s = time.monotonic() - start
+
+    start = time.monotonic()
+    for _ in range(reads):
+        cmc_capture(sdk_conf, "consensus", "height")
+    old_reads_s = time.monotonic() - start
+    start = time.monotonic()
+    for _ in range(reads):
+        client.height()
+    new_reads_s = time.monotonic() - start
+    client.close()
+    return {
+        "org": org, "count": count, "backend": client.backend,
+        "cmc_serial_invokes_per_s": _rate(count, old_s),
+        "cmc_serial_accepted": old_ok,
+        "client_invokes_per_s": _rate(count, new_s),
+        "client_accepted": new_ok,
+        "cmc_height_reads_per_s": _rate(reads, old_reads_s),
+        "client_height_reads_per_s": _rate(reads, new_reads_s),
+        "client_calls": client.calls,
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--runtime", type=Path,
+                        help="running runtime to reuse (default: launch one)")
+    parser.add_argument("--org", default="wx-org1")
+    parser.add_argument("--count", type=int, default=50)
+    parser.add_argument("--reads", type=int, default=20)
+    args = parser.parse_args()
+    if args.runtime is not None:
+        net = ChainMakerNetwork(args.runtime)
+        net.sdk_confs = {o: args.runtime / f"sdk-{o}.yml" for o in net.orgs
+                         if (args.runtime / f"sdk-{o}.yml").is_file()}
+        print(json.dumps(run(net, args.org, args.count, args.reads),
+                         indent=2))
+        return 0
+    net = launch()
+    try:
+        print(json.dumps(run(net, args.org, args.count, args.reads),
+                         indent=2))
+    finally:
+        net.teardown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,444 @@
+"""Engine-overhead benchmark suite with a stored baseline.
+
+Times the engine's own host-side work on synthetic data — none of it
+needs a platform tree or a running network:
+
+  scheduler.next_round   plan one round, catalogs of 10 / 100 / 1000 items
+  scheduler.pick_seed    least-tested pick with preconditions, 10 / 100 /
+                         1000 seeds
+  mei.*                  record_admission, status_counts, save, load with
+                         10k+ explored (rule, value) pairs
+  editor.*               ConfigEditor read_value / write_value on large
+                         YAML / TOML / INI files, and per-edit cost of a
+                         batch of edits (one parse + one write per batch)
+  parse_lines            config_mutators.parse_lines on a large INI text
+  coverage               goc_utils.compute_line_coverage on a 100 MB profile
+  oracle.observe         BcbOracle.observe over a 13-node sim network whose
+                         logs hold 8 MB each: cold (first read) and warm
+                         (a round's worth of appended blocks)
+
+Every case reports seconds per operation, best of --repeat runs; sizes
+scale with --scale (0.1 for a quick pass).  `run` writes one JSON document,
+`compare` checks it against a stored baseline and exits 1 when a case got
+slower than --threshold x its baseline:
+
+  python3 benchmarks/bench_engine.py run --out /tmp/engine.json
+  python3 benchmarks/bench_engine.py compare /tmp/engine.json
+  python3 benchmarks/bench_engine.py run --out benchmarks/baseline.json  # re-baseline
+
+A case that got faster than 1/--threshold of its baseline is reported as
+stale: the stored number no longer describes the code, and a later
+regression back to the old speed would pass unnoticed.  A change that
+speeds a group up re-records just that group into the stored baseline
+(`compare --strict` exits 1 until it does):
+
+  python3 benchmarks/bench_engine.py run --only mei --merge \
+      --out benchmarks/baseline.json
+
+Baselines are only comparable on the host, --scale and --repeat they
+were taken with; `compare` warns when any of them differs.  Record a
+baseline with the --repeat its users will run (the default), so its
+numbers are the same best-of-N as theirs.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import platform
+import random
+import sys
+import tempfile
+import time
+from datetime import datetime, timezone
+from pathlib import Path
+from typing import Callable, Iterator
+
+import yaml
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.common import ItemSpec, Seed  # noqa: E402
+from bcfuzzer.mei import MeiState  # noqa: E402
+from bcfuzzer.mutator import RULES_FOR_KIND, ConfigEditor  # noqa: E402
+from bcfuzzer.oracle import BcbOracle  # noqa: E402
+from bcfuzzer.scheduler import TwoLevelScheduler  # noqa: E402
+from bcfuzzer.targets.sim_adapter import SimAdapter  # noqa: E402
+from bcfuzzer.targets.sim_net import SimNetwork, SimProfile  # noqa: E402
+from config_mutators import parse_lines  # noqa: E402
+from goc_utils import compute_line_coverage  # noqa: E402
+
+BASELINE = Path(__file__).parent / "baseline.json"
+THRESHOLD = 1.25                # slower than 1.25x baseline = regression
+NOISE_FLOOR_SEC = 2e-5          # both sides below this: never flagged
+BATCH_EDITS = 8                 # edits per editor.batch_write batch
+
+Result = tuple[str, float, dict]
+
+
+def best(fn: Callable[[], object], repeat: int, ops: int = 1) -> float:
+    """Best-of-`repeat` seconds per op for `fn` doing `ops` operations."""
+    timings = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        fn()
+        timings.append((time.perf_counter() - start) / ops)
+    return min(timings)
+
+
+def _scaled(n: int, scale: float, floor: int = 1) -> int:
+    return max(floor, int(n * scale))
+
+
+# ------------------------------------------------------------- synthetic data
+
+def synthetic_catalog(n: int) -> list[ItemSpec]:
+    items = []
+    for i in range(n):
+        kind = ("int", "bool", "enum")[i % 3]
+        items.append(ItemSpec(
+            path=f"section{i % 17}.key{i}", kind=kind, file="config.ini",
+            default={"int": 100, "bool": True, "enum": "a"}[kind],
+            bounds=(0, 10_000) if kind == "int" else None,
+            enum=["a", "b", "c"] if kind == "enum" else None,
+            dangerous_legal=[9_999] if kind == "int" and i % 5 == 0
+            else None))
+    return items
+
+
+def synthetic_seeds(n: int) -> list[Seed]:
+    roles = ("normal", "controlled", "normal", "engine")
+    # every fifth seed is gated on a config edit, as corpus T's are
+    return [Seed(seed_id=f"bench-{i:05d}", corpus="T" if i % 3 else "M",
+                 role=roles[i % len(roles)], target="bench",
+                 payload={"kind": "bench", "count": i % 30},
+                 preconditions={} if i % 5 else
+                 {"config": f"section{i % 3}.enabled=true"})
+            for i in range(n)]
+
+
+def explored_mei(catalog: list[ItemSpec], pairs_per_item: int,
+                 rng: random.Random) -> MeiState:
+    mei = MeiState()
+    for item in catalog:
+        rules = RULES_FOR_KIND[item.kind]
+        for j in range(pairs_per_item):
+            mei.record_admission(item, rules[j % len(rules)], j,
+                                 rng.random() < 0.2)
+    return mei
+
+
+def _nested(keys: int) -> dict:
+    return {f"section{s}": {f"key{k}": k * 7 for k in range(keys // 50)}
+            for s in range(50)}
+
+
+def write_configs(root: Path, keys: int) -> dict[str, Path]:
+    data = _nested(keys)
+    paths = {"yaml": root / "node.yaml", "toml": root / "geth.toml",
+             "ini": root / "config.ini"}
+    paths["yaml"].write_text(yaml.safe_dump(data, sort_keys=False))
+    flat = "".join(f"[{section}]\n" + "".join(
+        f"    {key} = {value}\n" for key, value in body.items()) + "\n"
+        for section, body in data.items())
+    paths["toml"].write_text(flat)
+    paths["ini"].write_text(flat)
+    return paths
+
+
+def write_profile(path: Path, size_mb: float, seed: int = 1) -> int:
+    """A Go cover profile of ~size_mb: 400 files, random block counts."""
+    rng = random.Random(seed)
+    target = int(size_mb * (1 << 20))
+    written = 0
+    with path.open("w", encoding="utf-8") as fh:
+        fh.write("mode: set\n")
+        while written < target:
+            lines = []
+            for _ in range(4096):
+                start = rng.randrange(1, 4000)
+                lines.append(
+                    f"github.com/bench/pkg{rng.randrange(40)}/"
+                    f"file{rng.randrange(10)}.go:{start}.2,"
+                    f"{start + rng.randrange(1, 12)}.16 "
+                    f"{rng.randrange(1, 6)} {rng.randrange(2)}\n")
+            block = "".join(lines)
+            fh.write(block)
+            written += len(block)
+    return written
+
+
+# ---------------------------------------------------------------------- cases
+
+def bench_scheduler(scale: float, repeat: int) -> Iterator[Result]:
+    rounds = _scaled(200, scale, 20)
+    for n_items in (10, 100, 1000):
+        catalog = synthetic_catalog(n_items)
+        seeds = synthetic_seeds(40)
+        mei = explored_mei(catalog, 3, random.Random(2))
+
+        def plan() -> None:
+            sched = TwoLevelScheduler("bench", catalog, seeds, 13,
+                                      [0, 1, 2, 3], random.Random(7),
+                                      exploration_rounds=rounds // 2)
+            for config in range(20):
+                sched.admit_config(f"cfg{config}")
+            for _ in range(rounds):
+                sched.next_round(mei)
+
+        yield (f"scheduler.next_round[items={n_items}]",
+               best(plan, repeat, rounds), {"rounds": rounds})
+    for n_seeds in (10, 100, 1000):
+        seeds = synthetic_seeds(n_seeds)
+        sched = TwoLevelScheduler("bench", synthetic_catalog(30), seeds, 13,
+                                  [0, 1, 2, 3], random.Random(7))
+        plans = [sched.next_round(MeiState()) for _ in range(50)]
+        picks = _scaled(2000, scale, 200)
+
+        def pick() -> None:
+            for i in range(picks):
+                plan = plans[i % len(plans)]
+                sched.pick_seed(plan, plan.placements[i % 4])
+
+        yield (f"scheduler.pick_seed[seeds={n_seeds}]",
+               best(pick, repeat, picks), {"picks": picks})
+
+
+def bench_mei(scale: float, repeat: int) -> Iterator[Result]:
+    catalog = synthetic_catalog(100)
+    pairs = _scaled(120, scale, 20)
+    mei = explored_mei(catalog, pairs, random.Random(3))
+    explored = sum(len(v) for v in mei.explored.values())
+    meta = {"explored_pairs": explored}
+    rng = random.Random(4)
+    records = _scaled(20_000, scale, 1000)
+
+    def record() -> None:
+        for i in range(records):
+            item = catalog[i % len(catalog)]
+            rules = RULES_FOR_KIND[item.kind]
+            mei.record_admission(item, rules[i % len(rules)],
+                                 i % (pairs * 2), rng.random() < 0.2)
+
+    yield ("mei.record_admission", best(record, repeat, records), meta)
+    yield ("mei.status_counts",
+           best(lambda: [mei.status_counts("bench", catalog)
+                         for _ in range(200)], repeat, 200), meta)
+    with tempfile.TemporaryDirectory(prefix="bcfz-bench-mei-") as tmp:
+        path = Path(tmp) / "mei.json"
+        yield ("mei.save", best(lambda: mei.save(path), repeat), meta)
+        yield ("mei.load", best(lambda: MeiState.load(path), repeat), meta)
+
+
+def bench_editor(scale: float, repeat: int) -> Iterator[Result]:
+    keys = _scaled(20_000, scale, 500)
+    with tempfile.TemporaryDirectory(prefix="bcfz-bench-edit-") as tmp:
+        paths = write_configs(Path(tmp), keys)
+        last = keys // 50 - 1
+        item = ItemSpec(path=f"section49.key{last}", kind="int",
+                        bounds=(0, 10**9))
+        for fmt, path in paths.items():
+            meta = {"keys": keys, "bytes": path.stat().st_size}
+            editor = ConfigEditor(Path(tmp))
+            yield (f"editor.read_value[{fmt}]",
+                   best(lambda: editor.read_value(path, item), repeat), meta)
+            values = iter(range(10**9))
+            yield (f"editor.write_value[{fmt}]",
+                   best(lambda: editor.write_value(path, item, next(values)),
+                        repeat), meta)
+
+            def batched() -> None:
+                with editor.batch():
+                    for _ in range(BATCH_EDITS):
+                        editor.write_value(path, item, next(values))
+
+            yield (f"editor.batch_write[{fmt}]",
+                   best(batched, repeat, BATCH_EDITS), meta)
+        text = paths["ini"].read_text() * _scaled(5, scale)
+        yield ("config_mutators.parse_lines",
+               best(lambda: parse_lines(text), repeat),
+               {"lines": text.count("\n")})
+
+
+def bench_coverage(scale: float, repeat: int) -> Iterator[Result]:
+    size_mb = max(1.0, 100 * scale)
+    with tempfile.TemporaryDirectory(prefix="bcfz-bench-cov-") as tmp:
+        profile = Path(tmp) / "cover.out"
+        nbytes = write_profile(profile, size_mb)
+        yield ("goc_utils.compute_line_coverage",
+               best(lambda: compute_line_coverage(profile),
+                    max(1, repeat - 1)),
+               {"mb": round(nbytes / (1 << 20), 1)})
+
+
+def bench_observe(scale: float, repeat: int) -> Iterator[Result]:
+    log_mb = max(0.5, 8 * scale)
+    normals = list(range(4, 13))
+    with tempfile.TemporaryDirectory(prefix="bcfz-bench-obs-") as tmp:
+        net = SimNetwork(Path(tmp) / "runtime", 13,
+                         profile=SimProfile(log_lines_per_block=8))
+        net.build()
+        net.start_all()
+        filler = "".join(f"t=0 DEBUG p2p gossip height=0 peer={i % 13} "
+                         f"hash=0x{i:016x}\n" for i in range(4096))
+        for index in range(13):
+            with (net.node_dir(index) / "log" / "node.log").open("a") as fh:
+                for _ in range(int(log_mb * (1 << 20)) // len(filler)):
+                    fh.write(filler)
+        adapter = SimAdapter(random.Random(1))
+        meta = {"nodes": 13, "log_mb_per_node": log_mb}
+        oracle = BcbOracle("sim", normals)
+        start = time.perf_counter()
+        oracle.observe(net, adapter, 1)
+        yield ("oracle.observe[cold]", time.perf_counter() - start, meta)
+        round_id = iter(range(2, 10**6))
+
+        def warm() -> None:
+            net.tick(30)
+            oracle.observe(net, adapter, next(round_id))
+
+        net_only = best(lambda: net.tick(30), repeat)
+        yield ("oracle.observe[warm]",
+               max(0.0, best(warm, repeat) - net_only),
+               {**meta, "blocks": 30})
+
+
+CASES: dict[str, Callable[[float, int], Iterator[Result]]] = {
+    "scheduler": bench_scheduler,
+    "mei": bench_mei,
+    "editor": bench_editor,
+    "coverage": bench_coverage,
+    "observe": bench_observe,
+}
+
+
+# ------------------------------------------------------------- run / compare
+
+def run(scale: float = 1.0, repeat: int = 3,
+        only: list[str] | None = None) -> dict:
+    cases: dict[str, dict] = {}
+    for group, fn in CASES.items():
+        if only and group not in only:
+            continue
+        for name, sec, meta in fn(scale, repeat):
+            cases[name] = {"sec_per_op": round(sec, 9), "group": group,
+                           **meta}
+            print(f"{name:<44} {sec * 1e3:12.4f} ms/op", file=sys.stderr,
+                  flush=True)
+    return {"suite": "engine", "scale": scale, "repeat": repeat,
+            "host": platform.node(), "python": platform.python_version(),
+            "created": datetime.now(timezone.utc).isoformat(
+                timespec="seconds"),
+            "cases": cases}
+
+
+def merge(result: dict, previous: dict) -> dict:
+    """`result` (a partial --only run) over the cases of `previous`."""
+    return {**result, "cases": {**previous.get("cases", {}),
+                                **result["cases"]}}
+
+
+def compare(current: dict, baseline: dict, threshold: float = THRESHOLD,
+            noise_floor: float = NOISE_FLOOR_SEC) -> tuple[list[str], list[dict]]:
+    """(regressed case names, per-case rows) of `current` vs `baseline`."""
+    rows = []
+    regressed = []
+    for name in sorted(set(current["cases"]) | set(baseline["cases"])):
+        now = current["cases"].get(name, {}).get("sec_per_op")
+        then = baseline["cases"].get(name, {}).get("sec_per_op")
+        row: dict = {"case": name, "baseline": then, "current": now}
+        if now is None or then is None:
+            row["status"] = "missing" if now is None else "new"
+        else:
+            ratio = now / then if then > 0 else float("inf")
+            row["ratio"] = round(ratio, 3)
+            if ratio > threshold and max(now, then) >= noise_floor:
+                row["status"] = "REGRESSION"
+                regressed.append(name)
+            elif ratio < 1 / threshold:
+                row["status"] = "faster"
+            else:
+                row["status"] = "ok"
+        rows.append(row)
+    return regressed, rows
+
+
+def _ms(value: float | None) -> str:
+    return "-" if value is None else f"{value * 1e3:.4f}"
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawTextHelpFormatter)
+    sub = parser.add_subparsers(dest="command", required=True)
+    run_cmd = sub.add_parser("run", help="run the suite, write JSON")
+    run_cmd.add_argument("--out", type=Path, default=None,
+                         help="result file (default: stdout)")
+    run_cmd.add_argument("--scale", type=float, default=1.0)
+    run_cmd.add_argument("--repeat", type=int, default=3)
+    run_cmd.add_argument("--only", default="",
+                         help=f"comma-separated groups of {sorted(CASES)}")
+    run_cmd.add_argument("--merge", action="store_true",
+                         help="keep the other cases already in --out "
+                              "(re-record some groups of a baseline)")
+    cmp_cmd = sub.add_parser("compare", help="flag regressions vs baseline")
+    cmp_cmd.add_argument("result", type=Path)
+    cmp_cmd.add_argument("--baseline", type=Path, default=BASELINE)
+    cmp_cmd.add_argument("--threshold", type=float, default=THRESHOLD,
+                         help="ratio over baseline that counts as a "
+                              "regression")
+    cmp_cmd.add_argument("--strict", action="store_true",
+                         help="also exit 1 on a stale (much faster) "
+                              "baseline case")
+    args = parser.parse_args()
+
+    if args.command == "run":
+        only = [g.strip() for g in args.only.split(",") if g.strip()]
+        result = run(args.scale, args.repeat, only or None)
+        if args.merge and args.out is not None and args.out.is_file():
+            previous = json.loads(args.out.read_text(encoding="utf-8"))
+            for key in ("scale", "repeat"):
+                if previous.get(key) != result[key]:
+                    print(f"error: {args.out} was taken at --{key} "
+                          f"{previous.get(key)}; not merging a --{key} "
+                          f"{result[key]} run into it", file=sys.stderr)
+                    return 2
+            result = merge(result, previous)
+        text = json.dumps(result, indent=2)
+        if args.out is None:
+            print(text)
+        else:
+            args.out.write_text(text + "\n", encoding="utf-8")
+        return 0
+
+    current = json.loads(args.result.read_text(encoding="utf-8"))
+    baseline = json.loads(args.baseline.read_text(encoding="utf-8"))
+    for key in ("host", "scale", "repeat"):
+        if current.get(key) != baseline.get(key):
+            print(f"warning: {key} differs (baseline {baseline.get(key)!r}, "
+                  f"current {current.get(key)!r}); ratios are indicative "
+                  "only", file=sys.stderr)
+    regressed, rows = compare(current, baseline, args.threshold)
+    print(f"{'case':<44} {'base ms':>12} {'now ms':>12} {'ratio':>7}  status")
+    for row in rows:
+        ratio = row.get("ratio")
+        print(f"{row['case']:<44} {_ms(row['baseline']):>12} "
+              f"{_ms(row['current']):>12} "
+              f"{'-' if ratio is None else f'{ratio:.2f}':>7}  "
+              f"{row['status']}")
+    stale = [row["case"] for row in rows if row["status"] == "faster"]
+    if stale:
+        groups = sorted({current["cases"][name].get("group", "?")
+                         for name in stale})
+        print(f"{len(stale)} stale baseline case(s): " + ", ".join(stale)
+              + f"\nre-record: run --only {','.join(groups)} --merge "
+              f"--out {args.baseline}", file=sys.stderr)
+    if regressed:
+        print(f"{len(regressed)} regression(s) over {args.threshold}x: "
+              + ", ".join(regressed), file=sys.stderr)
+        return 1
+    return 1 if stale and args.strict else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
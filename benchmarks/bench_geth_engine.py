@@ -0,0 +1,117 @@
+"""Live benchmark: geth blocks/sec, per-call engine RPC vs pooled EngineClient.
+
+Launches a small geth network (default 2 nodes, node0 producing) in a temp
+dir and times
+
+  legacy     the pre-client loop: jwtsecret read + JWT signed + fresh
+             connection per engine call, four calls per block, fixed
+             FAST_BLOCKS_PERIOD sleep
+  fixed      GethNetwork.engine_drive(period=FAST_BLOCKS_PERIOD)
+  adaptive   GethNetwork.engine_drive(period=None)
+  rotate     GethNetwork.rotate_producer(0, 1, blocks)
+
+and prints one JSON object.
+
+  python3 benchmarks/bench_geth_engine.py --blocks 100
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import requests
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.targets.geth_engine import (  # noqa: E402
+    BEACON_ROOT, FAST_BLOCKS_PERIOD, FEE_RECIPIENT, EngineClient,
+    extract_blob_hashes)
+from bcfuzzer.targets.geth_net import GethNetwork  # noqa: E402
+
+
+def _rate(n: int, seconds: float) -> float:
+    return round(n / seconds, 2) if seconds > 0 else 0.0
+
+
+def legacy_drive(net: GethNetwork, index: int, rounds: int) -> int:
+    """The historical engine_drive loop, one throwaway client per call."""
+
+    def rpc(method: str, params: list):
+        client = EngineClient(net.authrpc_port(index), net.jwtsecret(index))
+        response = requests.post(
+            client.url, timeout=30,
+            json={"jsonrpc": "2.0", "method": method, "params": params,
+                  "id": 1},
+            headers={"Authorization": f"Bearer {client.token()}"})
+        return response.json()["result"]
+
+    head_block = net.head(index)
+    head = head0 = head_block["hash"]
+    ts = int(head_block["timestamp"], 16) + 1
+    for i in range(rounds):
+        attrs = {"timestamp": hex(ts), "prevRandao": "0x" + f"{i:064x}",
+                 "suggestedFeeRecipient": FEE_RECIPIENT, "withdrawals": [],
+                 "parentBeaconBlockRoot": BEACON_ROOT}
+        fcu = rpc("engine_forkchoiceUpdatedV3", [
+            {"headBlockHash": head, "safeBlockHash": head,
+             "finalizedBlockHash": head0}, attrs])
+        time.sleep(FAST_BLOCKS_PERIOD)
+        payload = rpc("engine_getPayloadV5",
+                      [fcu["payloadId"]])["executionPayload"]
+        rpc("engine_newPayloadV4", [
+            payload, extract_blob_hashes(payload["transactions"]),
+            BEACON_ROOT, []])
+        head = payload["blockHash"]
+        rpc("engine_forkchoiceUpdatedV3", [
+            {"headBlockHash": head, "safeBlockHash": head,
+             "finalizedBlockHash": head0}, None])
+        ts += 1
+    return rounds
+
+
+def run(net: GethNetwork, blocks: int) -> dict:
+    out: dict = {"blocks": blocks}
+    start = time.monotonic()
+    legacy_drive(net, 0, blocks)
+    out["legacy_blocks_per_s"] = _rate(blocks, time.monotonic() - start)
+    for name, period in (("fixed", FAST_BLOCKS_PERIOD), ("adaptive", None)):
+        start = time.monotonic()
+        result = net.engine_drive(0, blocks, period=period)
+        out[f"{name}_blocks_per_s"] = _rate(result.get("blocks") or 0,
+                                            time.monotonic() - start)
+    start = time.monotonic()
+    result = net.rotate_producer(0, 1, blocks)
+    out["rotate_blocks_per_s"] = _rate(result.get("blocks") or 0,
+                                       time.monotonic() - start)
+    out["rotate_sync"] = result.get("sync")
+    out["engine_calls"] = {i: c.calls for i, c in net._engines.items()}
+    if out["legacy_blocks_per_s"]:
+        out["adaptive_speedup"] = round(
+            out["adaptive_blocks_per_s"] / out["legacy_blocks_per_s"], 2)
+    return out
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--nodes", type=int, default=2)
+    parser.add_argument("--blocks", type=int, default=100)
+    args = parser.parse_args()
+    work = Path(tempfile.mkdtemp(prefix="geth-bench-", dir="/tmp"))
+    net = GethNetwork(work, n_nodes=max(2, args.nodes))
+    try:
+        net.setup()
+        if not net.start_all({}, {0}, work / "logs"):
+            raise SystemExit("geth network did not start")
+        print(json.dumps(run(net, args.blocks), indent=2))
+    finally:
+        net.teardown()
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,165 @@
+"""Micro-benchmark: signature scanning over a synthetic node log.
+
+Writes a synthetic log of --size-mb (default 1 GiB) with signature lines
+sprinkled at --hit-rate, then times
+
+  naive     the pre-LogTail probe path: read_text() the whole file, then one
+            str.count per signature plus re.findall for the capture
+  combined  one alternation regex over the text (single pass, for reference)
+  literal   one str.count of a single signature (fastsearch's rate)
+  aho       a pyahocorasick automaton over the text, when it is installed
+  scanner   LogScanner.scan over the whole text (one call, all signatures)
+  tail      LogTail cold poll of the file, then a warm poll after a 1 MiB
+            append (the per-observe cost in a campaign)
+
+and prints one JSON object (MB/s per strategy + count agreement).
+
+  python3 benchmarks/bench_logscan.py --size-mb 1024
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import random
+import re
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+try:
+    import ahocorasick
+except ImportError:     # optional: only the "aho" strategy needs it
+    ahocorasick = None
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.logscan import LogScanner  # noqa: E402
+from bcfuzzer.logtail import LogTail  # noqa: E402
+
+# union of the per-target signature sets (fisco markers, chainmaker
+# PANIC_SIGNATURES, aptos NODE_LOG_SIGNATURES)
+SIGNATURES = (
+    "reachNewView", "triggerTimeout", "broadcastViewChange",
+    "verify sender for tx failed",
+    "index out of range [1", "index out of range", "concurrent map",
+    "panic:", "fatal error:", "nil pointer", "unexpected end of JSON",
+    "TxCount", "attempt enterNewRound", "propose timeout",
+    "panic", "Connection refused", "quorum", "timeout", "fatal",
+)
+CAPTURES = {"consensus_timeout": r"consensusTimeout=(\d+)"}
+
+FILLER = ("2024-05-01 12:00:00.{ms:03d}|INFO|[CONSENSUS][PBFT]"
+          "handlePrePrepareMsg,reqIndex={i},hash=0x{h:016x},view=12,idx=3\n")
+HITS = (
+    "2024-05-01 12:00:01.000|WARN|[PBFT]triggerTimeout,"
+    "consensusTimeout={t},view=13\n",
+    "2024-05-01 12:00:01.000|INFO|[PBFT]broadcastViewChange,view=14\n",
+    "panic: runtime error: index out of range [101] with length 3\n",
+    "2024-05-01 12:00:01.000|ERROR|verify sender for tx failed\n",
+)
+
+
+def write_log(path: Path, size_mb: int, hit_rate: float, seed: int = 1) -> int:
+    rng = random.Random(seed)
+    target = size_mb << 20
+    written = 0
+    with path.open("w", encoding="utf-8") as fh:
+        while written < target:
+            lines = []
+            for i in range(4096):
+                if rng.random() < hit_rate:
+                    lines.append(rng.choice(HITS).format(
+                        t=rng.choice((3000, 9000, 27000))))
+                else:
+                    lines.append(FILLER.format(ms=i % 1000, i=i,
+                                               h=rng.getrandbits(64)))
+            block = "".join(lines)
+            fh.write(block)
+            written += len(block)
+    return written
+
+
+def _mbps(nbytes: int, seconds: float) -> float:
+    return round(nbytes / (1 << 20) / seconds, 1) if seconds > 0 else 0.0
+
+
+def run(size_mb: int = 1024, hit_rate: float = 1e-4,
+        naive: bool = True) -> dict:
+    result: dict = {"size_mb": size_mb, "hit_rate": hit_rate,
+                    "signatures": len(SIGNATURES)}
+    scanner = LogScanner(SIGNATURES, CAPTURES)
+    with tempfile.TemporaryDirectory(prefix="bcfz-logscan-") as tmp:
+        path = Path(tmp) / "log_1.log"
+        nbytes = write_log(path, size_mb, hit_rate)
+
+        reference = None
+        if naive:
+            start = time.perf_counter()
+            text = path.read_text(errors="replace")
+            reference = {sig: text.count(sig) for sig in SIGNATURES}
+            re.findall(CAPTURES["consensus_timeout"], text)
+            result["naive_mbps"] = _mbps(nbytes, time.perf_counter() - start)
+
+            combined = re.compile("|".join(
+                re.escape(s) for s in sorted(SIGNATURES, key=len, reverse=True)))
+            start = time.perf_counter()
+            for _ in combined.finditer(text):
+                pass
+            result["combined_regex_mbps"] = _mbps(
+                nbytes, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            text.count("propose timeout")
+            result["literal_count_mbps"] = _mbps(
+                nbytes, time.perf_counter() - start)
+
+            if ahocorasick is not None:
+                automaton = ahocorasick.Automaton()
+                for sig in SIGNATURES:
+                    automaton.add_word(sig, sig)
+                automaton.make_automaton()
+                start = time.perf_counter()
+                for _ in automaton.iter(text):
+                    pass
+                result["aho_corasick_mbps"] = _mbps(
+                    nbytes, time.perf_counter() - start)
+
+            start = time.perf_counter()
+            counts, _ = scanner.scan(text)
+            result["scanner_mbps"] = _mbps(nbytes, time.perf_counter() - start)
+            del text
+
+        tail = LogTail(lambda: [path], scanner=scanner)
+        start = time.perf_counter()
+        tail.poll()
+        result["tail_cold_mbps"] = _mbps(nbytes, time.perf_counter() - start)
+        if reference is not None:
+            got = tail.counts()
+            result["counts_agree"] = all(got[s] == reference[s]
+                                         for s in SIGNATURES)
+        with path.open("a", encoding="utf-8") as fh:
+            fh.write(FILLER.format(ms=0, i=0, h=0) * ((1 << 20) // len(FILLER)))
+        start = time.perf_counter()
+        appended = tail.poll()
+        result["tail_warm_poll_ms"] = round(
+            (time.perf_counter() - start) * 1000, 2)
+        result["tail_warm_bytes"] = appended
+    return result
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--size-mb", type=int, default=1024)
+    parser.add_argument("--hit-rate", type=float, default=1e-4)
+    parser.add_argument("--skip-naive", action="store_true",
+                        help="skip the full-text strategies (memory: ~3x size)")
+    args = parser.parse_args()
+    print(json.dumps(run(args.size_mb, args.hit_rate, not args.skip_naive),
+                     indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -16,6 +16,18 @@ client, a malicious proposer mutation, or a special governance transaction.
 Those latter cases cannot be reached honestly by a single generic "send more
 transactions" loop, so the harness reuses the audited per-bug PoCs as
 reproduction profiles under a unified interface.
+
+The PoCs are independent across targets, so the suite runs them in
+parallel (`--jobs`, by default what the host's CPUs and memory hold —
+pass --jobs 1 for the former serial run): specs are grouped into lanes by target, since one target's PoCs
+bind the same fixed ports, and a lane runs one PoC at a time.  A combined
+`[suite]` progress line reports the running PoCs; summary.json/summary.md
+list the results in registry order whatever order they finished in.
+
+run_bug tails each PoC's run.log while it runs and records when the
+success or failure line appeared (time_to_verdict_seconds); with
+--stop-after-verdict GRACE the process group is stopped GRACE seconds
+later instead of sitting through the PoC's teardown tail.
 """
 
 from __future__ import annotations
@@ -26,12 +38,15 @@ import os
 import signal
 import subprocess
 import sys
+import threading
 import time
 from dataclasses import asdict, dataclass
 from pathlib import Path
 from typing import Iterable
 import os
 
+from bcfuzzer.logtail import LogTail
+
 # Workspace root: the directory holding the four blockchain source trees and
 # the inter-node bug corpus.  Defaults to the artifact repo's parent (so a
 # fresh clone beside the trees just works); override with BCFZ_WORKSPACE for
@@ -41,14 +56,35 @@ WORKSPACE = Path(os.environ.get("BCFZ_WORKSPACE", str(REPO_ROOT.parent)))
 BUG_ROOT = WORKSPACE / "inter-node-bugs-final"
 # the runner root is this repo itself in the flat artifact layout
 RUNNER_ROOT = REPO_ROOT
+# generated test cases (bcfuzzer/pocgen.py): <target>/NN_*/{poc.sh,bugspec.json}
+TEST_CASES = REPO_ROOT / "test_cases"
+GENERATED_SPEC = "bugspec.json"
 
 TARGET_REPOS = {
     "geth": WORKSPACE / "go-ethereum",
     "chainmaker": WORKSPACE / "chainmaker-go",
     "fisco": WORKSPACE / "FISCO-BCOS",
     "aptos": WORKSPACE / "aptos-core",
+    # the in-process model network needs no source tree
+    "sim": REPO_ROOT,
 }
 
+# targets whose PoCs run in-process and can overlap each other
+ISOLATED_TARGETS = {"sim"}
+
+# host share of one running PoC (a whole multi-node target network);
+# run_suite's default concurrency is what the host has room for
+LANE_CPUS = 2
+LANE_MEM_BYTES = 4 << 30
+PROGRESS_SECONDS = 30.0
+
+# the PoCs' own failure verdict lines; a success pattern still wins
+FAILURE_PATTERNS = ("[POC FAIL]", "[POC 复现失败", "复现失败", "结果: FAIL")
+# run_bug tails run.log this often while the PoC runs
+VERDICT_POLL_SECONDS = 0.2
+# stop a PoC this many seconds after its verdict line (unset: let it finish)
+VERDICT_GRACE_ENV = "BCFZ_VERDICT_GRACE"
+
 
 @dataclass(frozen=True)
 class BugSpec:
@@ -60,10 +96,21 @@ class BugSpec:
     timeout_seconds: int
     success_patterns: tuple[str, ...]
     argv_suffix: tuple[str, ...] = ()
+    # generated specs: scripts under TEST_CASES, and the fuzzer report
+    # they were generated from
+    root: Path = BUG_ROOT
+    source: str = ""
+    failure_patterns: tuple[str, ...] = FAILURE_PATTERNS
 
     @property
     def script_path(self) -> Path:
-        return BUG_ROOT / self.rel_script
+        return self.root / self.rel_script
+
+    @property
+    def lane(self) -> str:
+        """Specs sharing a lane never run at the same time: a target's PoCs
+        bind the same fixed ports, while sim replays share nothing."""
+        return self.bug_id if self.target in ISOLATED_TARGETS else self.target
 
     @property
     def workdir(self) -> Path:
@@ -77,6 +124,27 @@ class BugSpec:
         return argv
 
 
+def load_generated_specs(root: Path = TEST_CASES) -> tuple[BugSpec, ...]:
+    """BugSpecs of the test cases bcfuzzer/pocgen.py wrote under `root`.
+
+    Runs at import time, so an unreadable or half-written spec file is
+    skipped with a warning rather than breaking every importer."""
+    specs = []
+    for path in sorted(Path(root).glob(f"*/*/{GENERATED_SPEC}")):
+        try:
+            data = json.loads(path.read_text(encoding="utf-8"))
+            specs.append(BugSpec(
+                data["bug_id"], data["target"], data["title"],
+                data["category"], data["rel_script"],
+                int(data["timeout_seconds"]),
+                tuple(data["success_patterns"]), root=Path(root),
+                source=data.get("source", "")))
+        except (OSError, ValueError, KeyError, TypeError) as exc:
+            print(f"warning: skipping generated spec {path}: "
+                  f"{type(exc).__name__}: {exc}", file=sys.stderr)
+    return tuple(specs)
+
+
 BUG_SPECS: tuple[BugSpec, ...] = (
     # ChainMaker: 9
     BugSpec("cm-02", "chainmaker", "TBFT propose timeout stall",
@@ -149,7 +217,7 @@ BUG_SPECS: tuple[BugSpec, ...] = (
             "config+liveness", "aptos/03_safety_rules_dead_process/poc.sh",
             900, ('结果: PASS', '复现成功'),
             (str(TARGET_REPOS["aptos"]),)),
-)
+) + load_generated_specs()
 
 BUG_INDEX = {spec.bug_id: spec for spec in BUG_SPECS}
 
@@ -164,11 +232,20 @@ def selected_specs(targets: set[str], bug_ids: set[str]) -> list[BugSpec]:
     return specs
 
 
+def verdict_grace_from_env() -> float | None:
+    value = os.environ.get(VERDICT_GRACE_ENV, "")
+    return float(value) if value else None
+
+
 def classify_status(output: str, returncode: int, timed_out: bool,
-                    success_patterns: Iterable[str]) -> tuple[str, list[str]]:
+                    success_patterns: Iterable[str],
+                    stopped: bool = False) -> tuple[str, list[str]]:
     matches = [pattern for pattern in success_patterns if pattern in output]
     if timed_out:
         return "timeout", matches
+    if stopped and not matches:
+        # stopped by us after a failure verdict, not a crash
+        return "fail", matches
     if returncode != 0 and not matches:
         return "error", matches
     if matches:
@@ -194,14 +271,34 @@ def terminate_process_group(proc: subprocess.Popen) -> None:
         pass
 
 
-def run_bug(spec: BugSpec, out_root: Path) -> dict:
+def log_verdict(counts: dict[str, int], spec: BugSpec) -> str | None:
+    if any(counts.get(pattern) for pattern in spec.success_patterns):
+        return "pass"
+    if any(counts.get(pattern) for pattern in spec.failure_patterns):
+        return "fail"
+    return None
+
+
+def run_bug(spec: BugSpec, out_root: Path,
+            grace: float | None = None) -> dict:
+    """Run one PoC, tailing run.log for its verdict line as it is written.
+
+    The first success/failure line fixes time_to_verdict_seconds; with a
+    `grace`, the process group is stopped that many seconds after it
+    instead of running the PoC's teardown tail (or into the timeout).
+    """
     bug_dir = out_root / spec.target / spec.bug_id
     bug_dir.mkdir(parents=True, exist_ok=True)
     log_path = bug_dir / "run.log"
     meta_path = bug_dir / "result.json"
+    tail = LogTail(lambda: [log_path],
+                   spec.success_patterns + spec.failure_patterns)
 
     started = time.monotonic()
-    timed_out = False
+    deadline = started + spec.timeout_seconds
+    timed_out = stopped = False
+    verdict: str | None = None
+    verdict_at: float | None = None
     returncode = -1
     with log_path.open("w", encoding="utf-8") as log:
         log.write(f"$ cwd={spec.workdir}\n")
@@ -216,17 +313,31 @@ def run_bug(spec: BugSpec, out_root: Path) -> dict:
             start_new_session=True,
             env={**os.environ, "PYTHONUNBUFFERED": "1"},
         )
-        try:
-            returncode = proc.wait(timeout=spec.timeout_seconds)
-        except subprocess.TimeoutExpired:
-            timed_out = True
-            terminate_process_group(proc)
-            returncode = proc.poll() if proc.poll() is not None else -9
+        while True:
+            try:
+                returncode = proc.wait(timeout=max(0.0, min(
+                    VERDICT_POLL_SECONDS, deadline - time.monotonic())))
+                break
+            except subprocess.TimeoutExpired:
+                pass
+            now = time.monotonic()
+            if verdict is None:
+                verdict = log_verdict(tail.counts(), spec)
+                verdict_at = now if verdict else None
+            if now >= deadline or (verdict is not None and grace is not None
+                                   and now - verdict_at >= grace):
+                timed_out = now >= deadline
+                stopped = not timed_out
+                terminate_process_group(proc)
+                returncode = proc.poll() if proc.poll() is not None else -9
+                break
 
     elapsed = time.monotonic() - started
+    if verdict is None and log_verdict(tail.counts(), spec) is not None:
+        verdict_at = started + elapsed       # printed in the last poll gap
     output = log_path.read_text(encoding="utf-8", errors="replace")
     status, matches = classify_status(
-        output, returncode, timed_out, spec.success_patterns)
+        output, returncode, timed_out, spec.success_patterns, stopped)
 
     result = {
         "bug_id": spec.bug_id,
@@ -238,6 +349,9 @@ def run_bug(spec: BugSpec, out_root: Path) -> dict:
         "argv": spec.argv,
         "timeout_seconds": spec.timeout_seconds,
         "elapsed_seconds": round(elapsed, 1),
+        "time_to_verdict_seconds": (round(verdict_at - started, 1)
+                                    if verdict_at is not None else None),
+        "stopped_after_verdict": stopped,
         "timed_out": timed_out,
         "returncode": returncode,
         "status": status,
@@ -254,6 +368,40 @@ def run_bug(spec: BugSpec, out_root: Path) -> dict:
     return result
 
 
+def harness_error(spec: BugSpec, out_root: Path, exc: BaseException,
+                  elapsed: float) -> dict:
+    """run_bug's result for a PoC the harness itself failed to run (e.g.
+    a missing workdir), so it still shows up in the summary."""
+    bug_dir = out_root / spec.target / spec.bug_id
+    bug_dir.mkdir(parents=True, exist_ok=True)
+    result = {
+        "bug_id": spec.bug_id,
+        "target": spec.target,
+        "title": spec.title,
+        "category": spec.category,
+        "script": str(spec.script_path),
+        "workdir": str(spec.workdir),
+        "argv": spec.argv,
+        "timeout_seconds": spec.timeout_seconds,
+        "elapsed_seconds": round(elapsed, 1),
+        "time_to_verdict_seconds": None,
+        "stopped_after_verdict": False,
+        "timed_out": False,
+        "returncode": None,
+        "status": "error",
+        "matched_success_patterns": [],
+        "log": str(bug_dir / "run.log"),
+        "harness_error": f"{type(exc).__name__}: {exc}",
+    }
+    (bug_dir / "result.json").write_text(
+        json.dumps(result, indent=2, sort_keys=True) + "\n",
+        encoding="utf-8")
+    print(f"{spec.bug_id:6s} {spec.target:11s} {'error':7s} "
+          f"{elapsed:6.1f}s  {spec.title} ({result['harness_error']})",
+          flush=True)
+    return result
+
+
 def write_summary(out_root: Path, results: list[dict]) -> None:
     summary = {
         "workspace": str(WORKSPACE),
@@ -279,18 +427,150 @@ def write_summary(out_root: Path, results: list[dict]) -> None:
         f"- errors: {summary['errors']}",
         f"- timeouts: {summary['timeouts']}",
         "",
-        "| Bug | Target | Category | Status | Time (s) |",
-        "|---|---|---|---:|---:|",
+        "| Bug | Target | Category | Status | Time (s) | Verdict (s) |",
+        "|---|---|---|---:|---:|---:|",
     ]
     for result in results:
+        verdict = result["time_to_verdict_seconds"]
         lines.append(
             f"| {result['bug_id']} | {result['target']} | {result['category']} | "
-            f"{result['status']} | {result['elapsed_seconds']} |"
+            f"{result['status']} | {result['elapsed_seconds']} | "
+            f"{'-' if verdict is None else verdict} |"
         )
     (out_root / "summary.md").write_text("\n".join(lines) + "\n",
                                          encoding="utf-8")
 
 
+def host_jobs() -> int:
+    """Concurrent PoCs this host has CPUs and available memory for."""
+    jobs = (os.cpu_count() or 1) // LANE_CPUS
+    try:
+        with open("/proc/meminfo", encoding="utf-8") as meminfo:
+            for line in meminfo:
+                if line.startswith("MemAvailable:"):
+                    available = int(line.split()[1]) * 1024
+                    jobs = min(jobs, available // LANE_MEM_BYTES)
+                    break
+    except OSError:
+        pass
+    return max(1, jobs)
+
+
+class SuiteProgress:
+    """Combined live view of a parallel suite: one line every `interval`
+    seconds with the done/pass counts and each running PoC's elapsed time
+    against its timeout."""
+
+    def __init__(self, total: int, interval: float = PROGRESS_SECONDS):
+        self.total = total
+        self.interval = interval
+        self.running: dict[str, tuple[BugSpec, float]] = {}
+        self.statuses: dict[str, int] = {}
+        self.lock = threading.Lock()
+        self.done = threading.Event()
+        self.thread = threading.Thread(target=self._loop, daemon=True)
+
+    def __enter__(self) -> "SuiteProgress":
+        if self.interval > 0:
+            self.thread.start()
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self.done.set()
+        if self.thread.is_alive():
+            self.thread.join()
+
+    def started(self, spec: BugSpec) -> None:
+        with self.lock:
+            self.running[spec.bug_id] = (spec, time.monotonic())
+
+    def finished(self, spec: BugSpec, status: str) -> None:
+        with self.lock:
+            self.running.pop(spec.bug_id, None)
+            self.statuses[status] = self.statuses.get(status, 0) + 1
+
+    def line(self) -> str:
+        now = time.monotonic()
+        with self.lock:
+            done = sum(self.statuses.values())
+            counts = " ".join(f"{status} {n}" for status, n
+                              in sorted(self.statuses.items()))
+            running = ", ".join(
+                f"{spec.bug_id} {now - started:.0f}/{spec.timeout_seconds}s"
+                for spec, started in self.running.values())
+        return (f"[suite] {done}/{self.total} done"
+                + (f" ({counts})" if counts else "")
+                + (f" | running {running}" if running else ""))
+
+    def _loop(self) -> None:
+        while not self.done.wait(self.interval):
+            print(self.line(), flush=True)
+
+
+def run_suite(specs: list[BugSpec], out_root: Path, jobs: int = 1,
+              stop_on_failure: bool = False,
+              interval: float = PROGRESS_SECONDS,
+              grace: float | None = None) -> list[dict]:
+    """Run the specs on up to `jobs` workers, one spec per lane at a time.
+
+    A worker takes the first pending spec (in `specs` order) whose lane is
+    idle, so jobs=1 is the plain serial loop.  After a non-pass with
+    `stop_on_failure`, nothing new starts and the running PoCs finish.
+    Results come back in `specs` order, as the serial loop returned them.
+    """
+    pending = list(specs)
+    busy: set[str] = set()
+    results: dict[str, dict] = {}
+    stopped = False
+    cond = threading.Condition()
+    progress = SuiteProgress(len(pending), interval if jobs > 1 else 0)
+
+    def take() -> BugSpec | None:
+        with cond:
+            while pending and not stopped:
+                for index, spec in enumerate(pending):
+                    if spec.lane not in busy:
+                        busy.add(spec.lane)
+                        progress.started(spec)
+                        return pending.pop(index)
+                cond.wait()
+            return None
+
+    def worker() -> None:
+        nonlocal stopped
+        while (spec := take()) is not None:
+            started = time.monotonic()
+            try:
+                result = run_bug(spec, out_root, grace)
+            except Exception as exc:  # noqa: BLE001 — recorded as error
+                result = harness_error(spec, out_root, exc,
+                                       time.monotonic() - started)
+            finally:
+                with cond:
+                    busy.discard(spec.lane)
+                    cond.notify_all()
+            progress.finished(spec, result["status"])
+            with cond:
+                results[spec.bug_id] = result
+                if (result["status"] != "pass" and stop_on_failure
+                        and not stopped):
+                    stopped = True
+                    print(f"stopping after {spec.bug_id} with "
+                          f"status={result['status']}; use "
+                          "--continue-on-failure to keep going",
+                          file=sys.stderr)
+                cond.notify_all()
+
+    workers = [threading.Thread(target=worker, daemon=True)
+               for _ in range(max(1, min(jobs, len(pending))))]
+    with progress:
+        for thread in workers:
+            thread.start()
+        for thread in workers:
+            thread.join()
+    return [results[spec.bug_id] for spec in specs if spec.bug_id in results]
+
+
 def list_specs(specs: Iterable[BugSpec]) -> int:
     for spec in specs:
         print(f"{spec.bug_id:6s} {spec.target:11s} {spec.category:28s} {spec.rel_script}")
@@ -315,6 +595,19 @@ def main() -> int:
     parser.add_argument(
         "--continue-on-failure", action="store_true",
         help="continue even if one bug returns fail/error/timeout")
+    parser.add_argument(
+        "--jobs", type=int, default=int(os.environ.get("BCFZ_JOBS", "0")),
+        help="PoCs run at once, at most one per target (default: what "
+             "the host's CPUs and memory allow, so several targets now run "
+             "in parallel; --jobs 1 is the old serial run; env BCFZ_JOBS)")
+    parser.add_argument(
+        "--progress-interval", type=float, default=PROGRESS_SECONDS,
+        help="seconds between combined progress lines (0: off)")
+    parser.add_argument(
+        "--stop-after-verdict", type=float, metavar="GRACE",
+        default=verdict_grace_from_env(),
+        help="stop a PoC GRACE seconds after its success/failure line "
+             f"instead of waiting for its teardown (env {VERDICT_GRACE_ENV})")
     args = parser.parse_args()
 
     targets = {item.strip() for item in args.targets.split(",") if item.strip()}
@@ -330,17 +623,10 @@ def main() -> int:
         raise SystemExit("no bug specs selected")
 
     args.output.mkdir(parents=True, exist_ok=True)
-    results: list[dict] = []
-    for spec in specs:
-        result = run_bug(spec, args.output)
-        results.append(result)
-        if result["status"] != "pass" and not args.continue_on_failure:
-            print(
-                f"stopping after {spec.bug_id} with status={result['status']}; "
-                f"use --continue-on-failure to keep going",
-                file=sys.stderr,
-            )
-            break
+    results = run_suite(specs, args.output, args.jobs or host_jobs(),
+                        stop_on_failure=not args.continue_on_failure,
+                        interval=args.progress_interval,
+                        grace=args.stop_after_verdict)
     write_summary(args.output, results)
     return 0
 
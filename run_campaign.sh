@@ -3,22 +3,34 @@
 #
 # Each leg builds a 13-node network, assigns 4 controlled nodes, runs the
 # two-level scheduler with T/M corpora and the BCB Oracle for the budget,
-# then tears down before the next leg.  Legs run serially because the
-# network factories cannot boot reliably under concurrent 13-node loads.
+# then tears down.  By default the legs run concurrently through
+# bcfuzzer.launcher: each leg gets a leased, disjoint port block and a
+# private scratch root, and is admitted only once its CPU/memory
+# reservation fits on the host (bcfuzzer/resources.py).  BCFZ_PARALLEL=0
+# restores the historical one-leg-after-another run.  BCFZ_INSTANCES=N
+# runs N independent networks per leg (rounds go to whichever is free).
 set -u
 cd "$(dirname "$0")" || exit 1
 
 OUT="${BCFZ_OUT:-/tmp/bcfz-campaign}"
 SEED="${BCFZ_SEED:-42}"
 MINUTES="${BCFZ_MINUTES:-360}"   # 6h per leg
+INSTANCES="${BCFZ_INSTANCES:-1}"
 mkdir -p "$OUT"
 
+if [ "${BCFZ_PARALLEL:-1}" != "0" ]; then
+  python3 -u -m bcfuzzer.launcher --output "$OUT" --minutes "$MINUTES" \
+      --seed "$SEED" --targets geth,fisco,aptos,chainmaker \
+      --instances "$INSTANCES"
+  exit $?
+fi
+
 for target in geth fisco aptos chainmaker; do
   echo "=== $(date '+%F %H:%M:%S') campaign $target starting ==="
   rm -rf "$OUT/$target" "$OUT/$target.log"
   python3 -u bcfuzzer_campaign.py --target "$target" --output "$OUT/$target" \
       --nodes 13 --controlled 4 --budget-minutes "$MINUTES" --seed "$SEED" \
-      > "$OUT/$target.log" 2>&1
+      --instances "$INSTANCES" > "$OUT/$target.log" 2>&1
   echo "$target exit=$? $(date '+%F %H:%M:%S')" >> "$OUT/$target.log"
 done
 
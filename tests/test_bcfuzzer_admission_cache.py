@@ -0,0 +1,129 @@
+"""Admission cache: content keys, unanimous verdicts only, appends from
+other processes, compaction, and a fresh campaign's warm MEI."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.admission_cache import (  # noqa: E402
+    CACHE_ENV, AdmissionCache, config_key)
+from bcfuzzer_campaign import Campaign  # noqa: E402
+
+
+def _record(cache: AdmissionCache, key: str, admitted: bool) -> None:
+    cache.record(key, admitted, target="sim", binary="b1", context="node",
+                 ops=[["p2p.max_peers", "zero", 0]], latency=0.5,
+                 excerpt="ERROR config rejected: max_peers")
+
+
+def test_keys_verdicts_and_sharing() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        config = Path(tmp) / "config.ini"
+        config.write_text("[p2p]\nmax_peers = 0\n")
+        key = config_key("sim", "b1", "node", [config])
+        assert key == config_key("sim", "b1", "node", [config])
+        assert key != config_key("sim", "b2", "node", [config])
+        assert key != config_key("sim", "b1", "producer", [config])
+        assert config_key("sim", "b1", "node", []) is None
+        path = Path(tmp) / "cache.jsonl"
+        cache, other = AdmissionCache(path), AdmissionCache(path)
+        assert cache.verdict(key) is None
+        _record(cache, key, False)
+        # the other process's instance sees the append on lookup
+        assert other.verdict(key)["rejected"] == 1
+        sampled = [other.rejection(key, r, 0) for r in range(40)]
+        assert all(p["source"] == "cache" for p in sampled)
+        assert "max_peers" in sampled[0]["reason"]
+        assert 0 < sum(p["sampled"] for p in sampled) < 40
+        assert [e["ops"] for e in cache.known("sim", "b1")] == \
+            [[["p2p.max_peers", "zero", 0]]]
+        # a sampled re-probe admitted it: no longer unanimous, never used
+        _record(other, key, True)
+        assert cache.verdict(key) is None
+        assert cache.rejection(key, 0, 0) is None
+        assert cache.known("sim", "b1") == []
+
+
+def test_compaction_and_torn_line() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cache.jsonl"
+        cache = AdmissionCache(path)
+        for i in range(1100):
+            _record(cache, f"k{i % 3}", i % 3 != 0)
+        with path.open("a") as fh:
+            fh.write('{"key": "torn", "admi')
+        reloaded = AdmissionCache(path)
+        assert len(path.read_text().splitlines()) == 3
+        assert "torn" not in reloaded.entries
+        assert reloaded.entries["k0"]["rejected"] == 367
+        assert reloaded.entries["k1"]["admitted"] == 367
+        assert reloaded.entries["k2"]["admitted"] == 366
+
+
+def test_readers_follow_another_instance_compacting() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "cache.jsonl"
+        writer, reader = AdmissionCache(path), AdmissionCache(path)
+        for i in range(1100):
+            _record(writer, f"k{i % 3}", i % 3 != 0)
+        assert reader.verdict("k1")["admitted"] == 367
+        # a third process's load compacts the file reader is tailing
+        AdmissionCache(path)
+        assert len(path.read_text().splitlines()) == 3
+        _record(reader, "k3", True)
+        _record(writer, "k4", False)
+        for cache in (reader, writer):
+            assert cache.verdict("k3")["admitted"] == 1
+            assert cache.verdict("k4")["rejected"] == 1
+            assert cache.verdict("k1")["admitted"] == 367
+            assert cache.verdict("k0")["rejected"] == 367
+        # the file grows past the stale offsets: still whole lines only
+        for i in range(400):
+            _record(writer, f"n{i}", True)
+        assert reader.verdict("n399")["admitted"] == 1
+        assert len(reader.entries) == 405
+
+
+def test_fresh_campaign_starts_from_cached_verdicts() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        previous = os.environ.get(CACHE_ENV)
+        os.environ[CACHE_ENV] = str(Path(tmp) / "cache.jsonl")
+        try:
+            first = Campaign("sim", Path(tmp) / "a", 13, [0, 1, 2, 3],
+                             seed=9, resume_state=None)
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = first.run_fuzz(60, None, None)
+            assert result["admission_cache"]["recorded"] > 0
+            second = Campaign("sim", Path(tmp) / "b", 13, [0, 1, 2, 3],
+                              seed=5, resume_state=None)
+            with contextlib.redirect_stdout(io.StringIO()):
+                second.boot_lanes()
+                second.warm_mei()
+            known = second.admission_cache.known("sim",
+                                                 second.lanes[0].binary)
+            assert second.admission_cache.stats["warmed"] == \
+                sum(len(entry["ops"]) for entry in known) > 0
+            assert set(second.mei.valid) <= set(first.mei.valid)
+            assert second.mei.valid
+            for lane in second.lanes:
+                lane.session.teardown()
+        finally:
+            if previous is None:
+                os.environ.pop(CACHE_ENV, None)
+            else:
+                os.environ[CACHE_ENV] = previous
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all admission cache tests passed")
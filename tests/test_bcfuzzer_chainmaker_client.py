@@ -0,0 +1,170 @@
+"""ChainMaker client: one SDK channel per org, pipelined invoke waves, cmc
+fallback — against a fake ChainClient and a stubbed cmc."""
+
+from __future__ import annotations
+
+import json
+import sys
+import threading
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import bcfuzzer.targets.chainmaker_client as cm  # noqa: E402
+from bcfuzzer.targets.chainmaker_client import ChainMakerClient  # noqa: E402
+
+
+class _NotOnChain(Exception):
+    """Stands in for chainmaker.exceptions.RequestError."""
+
+
+class _FakeChainClient:
+    built = 0
+
+    def __init__(self) -> None:
+        self.log: list[tuple] = []
+        self.stopped = False
+        self.fail_submit_at: int | None = None
+        self.polls: dict[str, int] = {}
+
+    @classmethod
+    def from_conf(cls, path: str) -> "_FakeChainClient":
+        cls.built += 1
+        cls.last = cls()
+        return cls.last
+
+    def get_current_block_height(self) -> int:
+        self.log.append(("height",))
+        return 42
+
+    def get_consensus_state_json(self) -> dict:
+        return {"height": 42, "proposer": "wx-org3.chainmaker.org"}
+
+    def invoke_contract(self, contract, method, params, *, tx_id,
+                        with_sync_result, timeout, gas_limit=None):
+        submitted = sum(1 for entry in self.log if entry[0] == "submit")
+        if submitted == self.fail_submit_at:
+            raise ConnectionError("channel reset")
+        self.log.append(("submit", tx_id, with_sync_result, gas_limit))
+        return SimpleNamespace(code=0)
+
+    def get_tx_by_tx_id(self, tx_id: str):
+        self.log.append(("poll", tx_id))
+        self.polls[tx_id] = self.polls.get(tx_id, 0) + 1
+        if self.polls[tx_id] == 1:
+            raise _NotOnChain(tx_id)            # next block, not this one
+        code = 1 if tx_id.endswith("-3") else 0
+        return SimpleNamespace(transaction=SimpleNamespace(
+            result=SimpleNamespace(
+                code=0, contract_result=SimpleNamespace(code=code))))
+
+    def stop(self) -> None:
+        self.stopped = True
+
+
+class _StubCmc(ChainMakerClient):
+    """cmc without the binary: every call succeeds, concurrency tracked."""
+
+    def __init__(self, *args, **kwargs) -> None:
+        super().__init__(*args, **kwargs)
+        self.cmc_args: list[tuple] = []
+        self._active = 0
+        self.max_active = 0
+        self._guard = threading.Lock()
+
+    def cmc(self, *args: str, timeout: int = 30) -> tuple[bool, str]:
+        with self._guard:
+            self.calls["cmc"] += 1
+            self.cmc_args.append(args)
+            self._active += 1
+            self.max_active = max(self.max_active, self._active)
+        try:
+            return True, "code:0 ok"
+        finally:
+            with self._guard:
+                self._active -= 1
+
+
+class _fake_sdk:
+    """Swap the module's SDK names for the fake for one test."""
+
+    def __enter__(self) -> None:
+        self.saved = (cm.ChainClient, cm.SdkRequestError, cm.gen_rand_tx_id,
+                      cm.RESULT_POLL_SEC)
+        counter = iter(range(1 << 30))
+        _FakeChainClient.built = 0
+        cm.ChainClient = _FakeChainClient
+        cm.SdkRequestError = _NotOnChain
+        cm.gen_rand_tx_id = lambda: f"tx-{next(counter)}"
+        cm.RESULT_POLL_SEC = 0.0
+
+    def __exit__(self, *exc) -> None:
+        (cm.ChainClient, cm.SdkRequestError, cm.gen_rand_tx_id,
+         cm.RESULT_POLL_SEC) = self.saved
+
+
+def test_one_channel_per_org_and_pipelined_waves() -> None:
+    with _fake_sdk():
+        client = _StubCmc("wx-org1", Path("/nonexistent/sdk.yml"))
+        assert client.backend == "sdk"
+        assert client.height() == 42 and client.height() == 42
+        # tx-3 executes with a failing contract result
+        assert client.invoke_many("counter", "increase", 5,
+                                  gas_limit=9) == 4
+        assert client.invoke("counter", "increase")
+        assert _FakeChainClient.built == 1 and client.calls["cmc"] == 0
+        log = _FakeChainClient.last.log
+        wave = [entry for entry in log if entry[0] in ("submit", "poll")][:10]
+        # every invoke of the wave is submitted before any result is read
+        assert [entry[0] for entry in wave[:6]] == ["submit"] * 5 + ["poll"]
+        assert all(entry[2] is False and entry[3] == 9
+                   for entry in log if entry[0] == "submit"
+                   and entry[1] != "tx-5")
+        ok, out = client.status()
+        assert ok and json.loads(out)["proposer"].startswith("wx-org3")
+        # async invokes are not polled at all
+        polls = sum(1 for entry in log if entry[0] == "poll")
+        assert client.invoke_many("counter", "increase", 3, sync=False) == 3
+        assert sum(1 for entry in log if entry[0] == "poll") == polls
+        client.close()
+        assert _FakeChainClient.last.stopped
+
+
+def test_sdk_error_moves_the_rest_of_the_wave_to_cmc() -> None:
+    with _fake_sdk():
+        client = _StubCmc("wx-org2", Path("/nonexistent/sdk.yml"))
+        assert client.height() == 42
+        first = _FakeChainClient.last
+        first.fail_submit_at = 2
+        assert client.invoke_many("counter", "increase", 5) == 5
+        assert first.stopped and client.calls["sdk_errors"] == 1
+        # two went through the SDK, the other three through cmc
+        assert client.calls["cmc"] == 3
+        assert all("--sync-result=true" in args for args in client.cmc_args)
+        # the next call rebuilds the channel
+        assert client.height() == 42
+        assert _FakeChainClient.built == 2
+        assert client.calls["sdk_clients"] == 2
+
+
+def test_without_the_sdk_cmc_serves_every_call() -> None:
+    saved = cm.ChainClient
+    cm.ChainClient = None
+    try:
+        client = _StubCmc("wx-org3", Path("/nonexistent/sdk.yml"))
+        assert client.backend == "cmc"
+        assert client.invoke_many("counter", "increase", 12) == 12
+        assert client.calls == {"sdk": 0, "cmc": 12, "sdk_errors": 0,
+                                "sdk_clients": 0}
+        assert client.max_active <= cm.INVOKE_WORKERS
+    finally:
+        cm.ChainClient = saved
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all chainmaker client tests passed")
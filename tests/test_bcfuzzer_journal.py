@@ -0,0 +1,94 @@
+"""State journal: replay rebuilds the campaign state, overlaps with the
+snapshots are harmless, and a torn last line is dropped."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.journal import JOURNAL_NAME, read_journal  # noqa: E402
+from bcfuzzer_campaign import Campaign  # noqa: E402
+
+
+def _state(campaign: Campaign) -> dict:
+    mei, sched = campaign.mei, campaign.scheduler
+    return {
+        "valid": {k: sorted(map(repr, v)) for k, v in mei.valid.items()},
+        "invalid": mei.invalid,
+        "explored": {k: sorted(map(repr, v))
+                     for k, v in mei.explored.items()},
+        "round_id": sched.round_id,
+        "pool": sched.pool,
+        "counts": sched.counts.to_json(),
+        "reports": [(r.bug_id, r.signature, r.observed["occurrences"])
+                    for r in campaign.oracle.reports],
+        "baseline": campaign.oracle.baseline,
+    }
+
+
+def _campaign(out: Path, state: Path | None = None,
+              compact_every: int = 10**6) -> Campaign:
+    campaign = Campaign("sim", out, 7, [0, 1], seed=3, resume_state=state)
+    campaign.journal.compact_every = compact_every
+    return campaign
+
+
+def _run(campaign: Campaign, rounds: int) -> None:
+    campaign.finish = lambda: {}        # a crash: no final compaction
+    with contextlib.redirect_stdout(io.StringIO()):
+        campaign.run_fuzz(rounds, None, None)
+
+
+def test_resume_replays_journal_over_snapshots() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        live = _campaign(Path(tmp) / "leg", compact_every=7)
+        live.scheduler.counts.capacity = 3      # evictions journaled too
+        _run(live, 30)
+        assert any(live.scheduler.counts.cold)
+        state = Path(tmp) / "leg" / "state"
+        # compacted after round 28, rounds 29-30 only in the journal
+        assert json.loads((state / "campaign.json").read_text())[
+            "round_id"] == 28
+        assert len(list(read_journal(state / JOURNAL_NAME))) == 2
+        resumed = _campaign(Path(tmp) / "again", state)
+        assert _state(resumed) == _state(live)
+        assert resumed.scheduler.round_id == 30
+        # the resumed leg starts from full snapshots of its own
+        assert list(read_journal(
+            Path(tmp) / "again" / "state" / JOURNAL_NAME)) == []
+
+
+def test_overlap_and_torn_tail() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        live = _campaign(Path(tmp) / "leg")
+        _run(live, 12)
+        state = Path(tmp) / "leg" / "state"
+        lines = (state / JOURNAL_NAME).read_text().splitlines(True)
+        assert len(lines) == 12
+        expected = _state(live)
+        assert _state(_campaign(Path(tmp) / "r1", state)) == expected
+        # snapshots already holding the journal (crash before the reset)
+        live.compact_state()
+        (state / JOURNAL_NAME).write_text("".join(lines))
+        assert _state(_campaign(Path(tmp) / "r2", state)) == expected
+        # a torn final line is dropped, the rest replays
+        torn = Path(tmp) / "torn"
+        torn.mkdir()
+        (torn / JOURNAL_NAME).write_text("".join(lines[:5])
+                                         + lines[5][:len(lines[5]) // 2])
+        assert len(list(read_journal(torn / JOURNAL_NAME))) == 5
+        assert _campaign(Path(tmp) / "r3", torn).scheduler.round_id == 5
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all journal tests passed")
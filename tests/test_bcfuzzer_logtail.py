@@ -0,0 +1,93 @@
+"""Log tail + scanner: appends, partial lines, rotation, exact counts."""
+
+from __future__ import annotations
+
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.logscan import LogScanner, scanner_for  # noqa: E402
+from bcfuzzer.logtail import LogTail, glob_source  # noqa: E402
+
+
+def _full_count(files: list[Path], pattern: str) -> int:
+    return "".join(f.read_text() for f in files if f.exists()).count(pattern)
+
+
+def test_incremental_counts_match_full_reread() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        tail = LogTail(glob_source(lambda: root, "log*"),
+                       ("triggerTimeout", "reachNewView"),
+                       {"timeout": r"consensusTimeout=(\d+)"})
+        first = root / "log_1.log"
+        first.write_text("a triggerTimeout\nreachNewView consensusTimeout=3000\n")
+        assert tail.count("triggerTimeout") == 1
+        with first.open("a") as fh:
+            fh.write("b triggerTimeout triggerTimeout\npartial trigger")
+        assert tail.count("triggerTimeout") == 3
+        with first.open("a") as fh:
+            fh.write("Timeout consensusTimeout=9000\n")
+        assert tail.count("triggerTimeout") == 4
+        assert tail.captured("timeout") == {"3000", "9000"}
+        second = root / "log_2.log"
+        second.write_text("reachNewView\n")
+        files = sorted(root.glob("log*"))
+        assert tail.counts() == {
+            "triggerTimeout": _full_count(files, "triggerTimeout"),
+            "reachNewView": _full_count(files, "reachNewView"),
+        }
+        # an unregistered pattern is picked up with one full re-read
+        assert tail.count("consensusTimeout") == 2
+
+
+def test_rotation_truncation_and_removal() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "panic.log"
+        tail = LogTail(lambda: [path], ("panic:",))
+        assert tail.count("panic:") == 0
+        path.write_text("panic: one\npanic: two\n")
+        assert tail.count("panic:") == 2
+        # unlink + re-create (chainmaker start_process) → fresh file
+        path.unlink()
+        path.write_text("panic: three\n")
+        assert tail.count("panic:") == 1
+        # truncated in place, then regrown
+        path.write_text("")
+        assert tail.count("panic:") == 0
+        path.write_text("x\npanic: four\n")
+        assert tail.count("panic:") == 1
+        path.unlink()
+        assert tail.count("panic:") == 0
+
+
+def test_scanner_matches_per_pattern_counts() -> None:
+    signatures = ("index out of range [1", "index out of range", "timeout",
+                  "propose timeout", "panic:", "panic")
+    scanner = LogScanner(signatures, {"t": r"consensusTimeout=(\d+)"})
+    chunks = [
+        "propose timeout x timeout\npanic: runtime error: index out of "
+        "range [101]\nconsensusTimeout=3000\n",
+        "nothing here\n",
+        "index out of range [7]\npanicking consensusTimeout=9000\n",
+    ]
+    for text in chunks:
+        counts, captures = scanner.scan(text)
+        assert dict(counts) == {s: text.count(s) for s in signatures
+                                if text.count(s)}, text
+    _, captures = scanner.scan("".join(chunks))
+    assert captures == {"t": {"3000", "9000"}}
+    # target scanners carry the oracle's PANIC_SIGNAL_MAP fragments
+    cm = scanner_for("chainmaker", ("panic:",))
+    assert "nil pointer" in cm.patterns and cm is scanner_for(
+        "chainmaker", ("panic:",))
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all logtail tests passed")
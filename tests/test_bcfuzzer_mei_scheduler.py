@@ -2,6 +2,7 @@
 
 from __future__ import annotations
 
+import json
 import random
 import sys
 import tempfile
@@ -13,8 +14,10 @@ sys.path.insert(0, str(Path(__file__).parent.parent / "bcfuzzer"))
 from bcfuzzer.common import Seed  # noqa: E402
 from bcfuzzer.item_catalog import GETH_ITEMS, item_by_path  # noqa: E402
 from bcfuzzer.mei import CONSISTENT_THRESHOLD, MeiState, summarize  # noqa: E402
+import bcfuzzer.scheduler as scheduler_mod  # noqa: E402
 from bcfuzzer.scheduler import (  # noqa: E402
-    RoundPlan, TwoLevelScheduler, placement_hash)
+    NodePlan, RoundPlan, SeedCounters, TwoLevelScheduler, placement_hash,
+    precondition_key)
 
 
 def test_mei_classification() -> None:
@@ -51,6 +54,33 @@ def test_mei_roundtrip() -> None:
     assert mei2.rejected_count(item) == 1
 
 
+def test_mei_indexes_match_catalog_scans() -> None:
+    rng = random.Random(21)
+    catalog = list(GETH_ITEMS)
+    mei = MeiState()
+    mei.status_counts("geth", catalog)          # index built before writes
+    for step in range(600):
+        item = rng.choice(catalog)
+        mei.record_admission(item, rng.choice(["min", "max", "dangerous"]),
+                             rng.randrange(40), rng.random() < 0.05)
+        if step % 50 == 0:
+            with tempfile.TemporaryDirectory() as tmp:
+                mei.save(Path(tmp) / "mei.json")
+                mei = MeiState.load(Path(tmp) / "mei.json")
+        scanned = {"consistent": 0, "inconsistent": 0, "unexplored": 0}
+        for entry in catalog:
+            scanned[mei._classify(entry.path)] += 1
+        assert mei.status_counts("geth", catalog) == scanned
+        assert mei.least_explored(catalog) is min(
+            catalog, key=lambda i: (len(mei.explored.get(i.path, ())), i.path))
+        assert mei.inconsistent_items(catalog) == [
+            i for i in catalog if mei._classify(i.path) == "inconsistent"]
+    item = catalog[0]
+    mei.record_admission(item, "min", [1, 2], admitted=True)
+    mei.record_admission(item, "min", [1, 2], admitted=True)
+    assert mei.valid_pairs(item).count(("min", [1, 2])) == 1
+
+
 def _plan_from(plan: RoundPlan, index: int):
     return plan.placement_for(index)
 
@@ -127,6 +157,99 @@ def test_pick_seed_preconditions_and_starvation_bound() -> None:
     assert chosen is not None and chosen.seed_id == "ok"
 
 
+def test_pick_seed_decides_each_precondition_key_once() -> None:
+    batch = {"config": "txpool.pool_type=batch"}
+    seeds = ([Seed(seed_id=f"cfg-{i}", corpus="T", role="controlled",
+                   preconditions=dict(batch)) for i in range(6)]
+             + [Seed(seed_id="m-0", corpus="M", role="controlled",
+                     preconditions={"role": "proposer"}),
+                Seed(seed_id="z-plain", corpus="T", role="controlled")])
+    sched = TwoLevelScheduler("fisco", GETH_ITEMS, seeds, 13, [0],
+                              random.Random(2))
+    plan = sched.next_round(MeiState())
+    stock = NodePlan(node_index=0, role="fuzzing", config_id="default")
+    batched = NodePlan(node_index=0, role="fuzzing", config_id="c1",
+                       mutations=[("txpool.pool_type", "enum", "BATCH")])
+    calls: list[tuple] = []
+    real = scheduler_mod.preconditions_hold
+
+    def counting(target, key, node):
+        calls.append(key)
+        return real(target, key, node)
+
+    scheduler_mod.preconditions_hold = counting
+    try:
+        # the six config seeds come first, but their key is decided once
+        # and all six are skipped by it
+        assert sched.pick_seed(plan, stock).seed_id == "z-plain"
+        assert calls == [precondition_key(batch),
+                         precondition_key({"role": "proposer"})]
+        calls.clear()
+        picked = [sched.pick_seed(plan, batched).seed_id for _ in range(3)]
+        assert picked == ["cfg-0", "cfg-1", "cfg-2"]
+        assert calls == [precondition_key(batch)] * 3
+    finally:
+        scheduler_mod.preconditions_hold = real
+    # role=proposer only holds on chainmaker
+    key = precondition_key({"role": "proposer"})
+    assert not scheduler_mod.preconditions_hold("fisco", key, stock)
+    assert scheduler_mod.preconditions_hold("chainmaker", key, stock)
+    # every candidate blocked: no pick
+    only = TwoLevelScheduler("fisco", GETH_ITEMS, seeds[:6], 13, [0],
+                             random.Random(2))
+    plan = only.next_round(MeiState())
+    assert only.pick_seed(plan, stock) is None
+
+
+def test_seed_counters_evict_into_aggregate() -> None:
+    counters = SeedCounters(["b", "a", "c"], capacity=2)
+    counters.bump("p1", "a")
+    counters.bump("p1", "a")
+    counters.bump("p2", "b")
+    counters.bump("p3", "c")                    # evicts p1
+    assert len(counters) == 2 and counters.get("p1", "a") == 0
+    assert counters.to_json() == ({"p2": {"b": 1}, "p3": {"c": 1}},
+                                  {"a": 2})
+    delta = counters.drain()
+    assert delta["evicted"] == ["p1"] and delta["cold"] == {"a": 2}
+    # replaying the drained delta over the pre-eviction rows is exact
+    replica = SeedCounters(["a", "b", "c"], capacity=2)
+    replica.restore({"p1": {"a": 2}})
+    replica.restore(delta["counts"], delta.get("cold"), delta["evicted"])
+    assert replica.to_json() == counters.to_json()
+
+    # a fresh placement orders equally-tested seeds by the aggregate (its
+    # row evicts p2 too: cold a=2, b=1, c=0)
+    seeds = [Seed(seed_id=i, corpus="T", role="normal") for i in "abc"]
+    sched = TwoLevelScheduler("geth", GETH_ITEMS, seeds, 13, [0],
+                              random.Random(1))
+    sched.counts = counters
+    plan = sched.next_round(MeiState())
+    node = plan.placement_for(5)
+    assert [sched.pick_seed(plan, node).seed_id for _ in range(4)] == \
+        ["c", "b", "a", "c"]
+
+
+def test_scheduler_loads_unbounded_counts() -> None:
+    seeds = [Seed(seed_id=f"t-{i}", corpus="T", role="normal")
+             for i in range(3)]
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "scheduler.json"
+        path.write_text(json.dumps({
+            "target": "geth", "round_id": 9, "pool": ["default"],
+            "controlled": [0],
+            "counts": {f"h{i}": {"t-1": i, "gone": 4}
+                       for i in range(1, 6)}}))
+        sched = TwoLevelScheduler.load(path, GETH_ITEMS, seeds,
+                                       random.Random(1), 13)
+        sched.counts.capacity = 2
+        sched.counts.trim()
+        sched.save(path)
+        saved = json.loads(path.read_text())
+    assert saved["counts"] == {"h4": {"t-1": 4}, "h5": {"t-1": 5}}
+    assert saved["cold_counts"] == {"t-1": 6}
+
+
 def test_pool_admission() -> None:
     rng = random.Random(8)
     sched = TwoLevelScheduler("geth", GETH_ITEMS, [], 13, [0, 1, 2, 3], rng)
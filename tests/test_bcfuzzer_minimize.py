@@ -0,0 +1,143 @@
+"""Minimize mode: ddmin is 1-minimal, and a sim campaign's reports shrink
+to the steps that trigger them, including an earlier round's mutation."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.minimize import (  # noqa: E402
+    TRIAL_ATTEMPTS, Minimizer, Step, ddmin, run_minimization)
+from bcfuzzer_campaign import Campaign  # noqa: E402
+
+
+def test_ddmin_finds_the_needed_items() -> None:
+    batches = []
+
+    def test(candidates: list[list[int]]) -> int | None:
+        batches.append(len(candidates))
+        return next((i for i, c in enumerate(candidates)
+                     if {3, 11} <= set(c)), None)
+
+    assert ddmin(list(range(16)), test) == [3, 11]
+    assert max(batches) > 2             # chunks and complements together
+    assert ddmin([5], test) == [5]
+
+
+class _FlakyMinimizer(Minimizer):
+    """Reproduces when steps 3 and 11 are both kept; a step set errors on
+    its first `flaky` runs."""
+
+    def __init__(self, campaign, flaky: int) -> None:
+        super().__init__(campaign, [], workers=2)
+        self.flaky = flaky
+        self.runs: dict[frozenset, int] = {}
+
+    def _trial(self, steps, rounds, want, stop):
+        key = frozenset(steps)
+        with self._lock:
+            self.runs[key] = self.runs.get(key, 0) + 1
+            if self.runs[key] <= self.flaky:
+                return {"error": "RuntimeError: boot failed"}
+        failures = {want} if {3, 11} <= key else set()
+        return {"failures": failures, "complete": True, "ops": []}
+
+
+def test_errored_trials_are_retried_not_taken_as_verdicts() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        campaign = Campaign("sim", Path(tmp), 13, [0, 1, 2, 3], seed=9,
+                            resume_state=None)
+        want = ("sim_verifier_panic", 4)
+        flaky = _FlakyMinimizer(campaign, flaky=TRIAL_ATTEMPTS - 1)
+        with contextlib.redirect_stdout(io.StringIO()):
+            kept = ddmin(list(range(16)), lambda candidates:
+                         flaky.first_reproducing(candidates, [1], want))
+        assert kept == [3, 11]
+        assert flaky.stats["retries"] > 0 and flaky.stats["unresolved"] == 0
+        broken = _FlakyMinimizer(campaign, flaky=TRIAL_ATTEMPTS)
+        assert broken.first_reproducing([list(range(16))], [1], want) is None
+        assert broken.stats["unresolved"] == 1
+        assert broken.runs[frozenset(range(16))] == TRIAL_ATTEMPTS
+
+
+class _TwoWaveMinimizer(Minimizer):
+    """Reproduces only when the seed is submitted twice and X is kept."""
+
+    def __init__(self, campaign) -> None:
+        super().__init__(campaign, [], workers=1)
+        self.ran: list[tuple] = []
+
+    def _trial(self, steps, rounds, want, stop):
+        self.ran.append(tuple(steps))
+        waves = sum(1 for step in steps if step.name == "sim-seed-a")
+        hit = waves == 2 and any(step.name == "x" for step in steps)
+        return {"failures": {want} if hit else set(), "complete": True,
+                "ops": [tuple(steps)]}
+
+
+def test_repeated_seed_steps_are_distinct_trials() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        campaign = Campaign("sim", Path(tmp), 13, [0, 1, 2, 3], seed=9,
+                            resume_state=None)
+        want = ("sim_verifier_panic", 4)
+        seed = Step("seed", 1, "sim-seed-a", 5)
+        steps = [seed, seed, Step("seq", 1, "x"), Step("seq", 1, "y")]
+        minimizer = _TwoWaveMinimizer(campaign)
+        kept = ddmin(steps, lambda candidates:
+                     minimizer.first_reproducing(candidates, [1], want))
+        assert kept == [seed, seed, Step("seq", 1, "x")]
+        # the result is a trial that ran, not a memo hit of a longer one
+        assert tuple(kept) in minimizer.ran
+        assert (seed, Step("seq", 1, "x")) in minimizer.ran
+
+
+def test_sim_reports_minimize_and_recheck() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        out = Path(tmp)
+        with contextlib.redirect_stdout(io.StringIO()):
+            Campaign("sim", out, 13, [0, 1, 2, 3], seed=9,
+                     resume_state=None).run_fuzz(12, None, None)
+            campaign = Campaign("sim", out, 13, [0, 1, 2, 3], seed=9,
+                                resume_state=out / "state", instances=2)
+            records = run_minimization(
+                campaign, ["bcfuzzer-000", "bcfuzzer-001", "bcfuzzer-009"])
+        collapse, sibling, panic = records
+        # reported in round 5, armed by round 3's gas ceiling
+        assert collapse["rounds"] == [3, 4, 5]
+        assert collapse["steps"] == ["r3 node1 dangerous(miner.gas_ceil "
+                                     "= 5000)"]
+        assert sibling["steps"] == collapse["steps"]
+        assert panic["steps_after"] < panic["steps_before"]
+        assert any("verifier.pool_type" in s for s in panic["steps"])
+        assert any("sim-t-batch-wave" in s for s in panic["steps"])
+        reports = {r.bug_id: r for r in campaign.oracle.reports}
+        report = reports["bcfuzzer-000"]
+        assert report.verified is True
+        assert [op.new_value for op in report.minimized_ops] == [5000]
+        assert "--mode minimize" in report.repro
+        assert reports["bcfuzzer-002"].verified is None   # not selected
+        saved = json.loads((out / "state" / "oracle.json").read_text())
+        assert saved["reports"][0]["verified"] is True
+        # a verified report is re-checked with its minimal set only
+        with contextlib.redirect_stdout(io.StringIO()):
+            again = Campaign("sim", out, 13, [0, 1, 2, 3], seed=9,
+                             resume_state=out / "state")
+            recheck, = run_minimization(again, ["bcfuzzer-009"])
+        assert recheck["status"] == "rechecked" and recheck["verified"]
+        stats = json.loads((out / "minimize.json").read_text())["stats"]
+        assert stats["trials"] == 1
+        assert not (out / "minimize").exists()
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all minimize tests passed")
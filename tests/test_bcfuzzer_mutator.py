@@ -165,6 +165,91 @@ def test_aptos_nested_ops() -> None:
         assert cfg.read_text(encoding="utf-8") == APTOS_YAML
 
 
+def _mutate_all(tmp: Path, fmt_name: str, text: str, plan: list,
+                batched: bool, sanitize=None
+                ) -> tuple[bytes, list, ConfigEditor, Path]:
+    tmp.mkdir()
+    cfg = tmp / fmt_name
+    cfg.write_text(text, encoding="utf-8")
+    editor = ConfigEditor(tmp)
+    rng = random.Random(5)
+    ops = []
+
+    def run() -> None:
+        for i, (target, path, rule) in enumerate(plan):
+            ops.append(mutate_one(editor, cfg, item_by_path(target, path),
+                                  rule, rng, i))
+        if sanitize is not None:
+            doc = editor.document(cfg)
+            sanitize(doc)
+            editor.done(doc)
+
+    if batched:
+        with editor.batch():
+            run()
+    else:
+        run()
+    return cfg.read_bytes(), ops, editor, cfg
+
+
+def test_batch_matches_call_by_call_edits() -> None:
+    def clamp_pool(doc) -> None:
+        if doc.data["txpool"]["batch_max_size"] > 10_000:
+            doc.data["txpool"]["batch_max_size"] = 10_000
+            doc.touch()
+
+    cases = [
+        ("geth.toml", GETH_TOML, [
+            ("geth", "Eth.Miner.GasCeil", "dangerous"),
+            ("geth", "Eth.TxPool.PriceBump", "scale_10"),
+            ("geth", "Eth.TxPool.PriceBump", "add_one")], None),
+        ("config.ini", FISCO_INI, [
+            ("fisco", "txpool.limit", "max"),
+            ("fisco", "experimental.check_transaction_signature",
+             "set_false"),
+            ("fisco", "consensus.min_seal_time", "zero")], None),
+        ("chainmaker.yml", CHAINMAKER_YAML, [
+            ("chainmaker", "txpool.batch_max_size", "scale_10"),
+            ("chainmaker", "net.seeds", "append_elem"),
+            ("chainmaker", "net.seeds", "reorder"),
+            ("chainmaker", "txpool.pool_type", "dangerous")], clamp_pool),
+    ]
+    for name, text, plan, sanitize in cases:
+        with tempfile.TemporaryDirectory() as tmp:
+            plain, plain_ops, _, _ = _mutate_all(
+                Path(tmp) / "plain", name, text, plan, False, sanitize)
+            batch, batch_ops, editor, cfg = _mutate_all(
+                Path(tmp) / "batch", name, text, plan, True, sanitize)
+            assert batch == plain, name
+            assert [(o.old_value, o.new_value) for o in batch_ops] == \
+                [(o.old_value, o.new_value) for o in plain_ops], name
+            # one parse, one serialize for the whole round
+            assert editor.stats == {"parsed": 1, "written": 1}, editor.stats
+            editor.rollback()
+            assert cfg.read_text(encoding="utf-8") == text, name
+
+
+def test_batch_old_values_are_snapshots_and_errors_write_nothing() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        cfg = Path(tmp) / "chainmaker.yml"
+        cfg.write_text(CHAINMAKER_YAML, encoding="utf-8")
+        editor = ConfigEditor(Path(tmp))
+        seeds = item_by_path("chainmaker", "net.seeds")
+        rng = random.Random(2)
+        with editor.batch():
+            first = mutate_one(editor, cfg, seeds, "append_elem", rng, 0)
+            mutate_one(editor, cfg, seeds, "empty_list", rng, 1)
+        assert len(first.old_value) == 2    # not the list emptied later
+        editor.rollback()
+        try:
+            with editor.batch():
+                mutate_one(editor, cfg, seeds, "empty_list", rng, 2)
+                raise RuntimeError("sanitizer failed")
+        except RuntimeError:
+            pass
+        assert cfg.read_text(encoding="utf-8") == CHAINMAKER_YAML
+
+
 def test_all_catalogs_wellformed() -> None:
     for items in (GETH_ITEMS, CHAINMAKER_ITEMS, FISCO_ITEMS, APTOS_ITEMS):
         for item in items:
@@ -0,0 +1,62 @@
+"""Oracle probe fan-out: concurrency, per-probe timeout, latency record."""
+
+from __future__ import annotations
+
+import sys
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.oracle import BcbOracle  # noqa: E402
+
+
+class _SlowAdapter:
+    """node_probes sleeps `delay[i]`; node 99 raises."""
+
+    def __init__(self, delay: dict[int, float]) -> None:
+        self.delay = delay
+        self.threads: set[str] = set()
+        self.release = threading.Event()
+
+    def node_probes(self, net, index: int) -> dict:
+        self.threads.add(threading.current_thread().name)
+        if index == 99:
+            raise RuntimeError("rpc down")
+        self.release.wait(self.delay.get(index, 0.0))
+        return {"alive": True, "height": 10 + index, "timeout_events": 0}
+
+
+def test_probe_all_runs_concurrently_with_timeout() -> None:
+    adapter = _SlowAdapter({0: 0.2, 1: 0.2, 2: 0.2, 3: 5.0})
+    oracle = BcbOracle("fisco", [0, 1, 2, 3, 99], probe_timeout=0.6)
+    start = time.monotonic()
+    probes = oracle.probe_all(None, adapter)
+    took = time.monotonic() - start
+    adapter.release.set()
+    assert took < 1.5, took                      # not 0.6 + 3 * 0.2 serial
+    assert len(adapter.threads) > 1
+    assert probes[0]["height"] == 10 and probes[2]["height"] == 12
+    assert probes[3] == {"probe_timeout": True}
+    assert "probe_error" in probes[99]
+    assert oracle.last_probe_latency[3] is None
+    assert 0.15 <= oracle.last_probe_latency[1] < 0.6
+
+
+def test_observe_keeps_window_state_for_blind_probes() -> None:
+    adapter = _SlowAdapter({1: 5.0})
+    oracle = BcbOracle("fisco", [0, 1], probe_timeout=0.3)
+    oracle._view_change_last = {0: 4, 1: 7}
+    failures = oracle.observe(None, adapter, round_id=1)
+    adapter.release.set()
+    assert not failures
+    assert oracle._view_change_last == {0: 0, 1: 7}
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all oracle tests passed")
@@ -0,0 +1,82 @@
+"""Config prefetcher: speculative staging, reuse on match, base reuse on miss."""
+
+from __future__ import annotations
+
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.common import Seed  # noqa: E402
+from bcfuzzer.item_catalog import GETH_ITEMS  # noqa: E402
+from bcfuzzer.mei import MeiState  # noqa: E402
+from bcfuzzer.pipeline import ConfigPrefetcher  # noqa: E402
+from bcfuzzer.scheduler import NodePlan, RoundPlan, TwoLevelScheduler  # noqa: E402
+
+
+def _prefetcher(root: Path, built: list, applied: list) -> ConfigPrefetcher:
+    def base_config(round_id: int, node: int) -> Path:
+        built.append((round_id, node))
+        path = root / "base" / f"{round_id}-{node}.toml"
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(f"round={round_id}\n")
+        return path
+
+    def apply(node_plan: NodePlan, base: Path, node_dir: Path) -> list:
+        applied.append(node_plan.node_index)
+        node_dir.mkdir(parents=True, exist_ok=True)
+        (node_dir / "conf.toml").write_text(
+            base.read_text() + repr(node_plan.mutations))
+        return list(node_plan.mutations)
+
+    return ConfigPrefetcher(root / "staging", base_config, apply)
+
+
+def _plan(round_id: int, value0: int, value1: int) -> RoundPlan:
+    return RoundPlan(round_id, [
+        NodePlan(0, "exploration", "default", [("Eth.A", "min", value0)]),
+        NodePlan(1, "fuzzing", "default", [("Eth.B", "max", value1)]),
+        NodePlan(2, "normal", "default")])
+
+
+def test_speculation_reused_where_mutations_match() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        built: list = []
+        applied: list = []
+        prefetcher = _prefetcher(Path(tmp), built, applied)
+        prefetcher.speculate(_plan(2, 1, 5))
+        staged = prefetcher.materialize(_plan(2, 1, 6)).result()
+        assert (staged.hits, staged.misses) == (1, 1)
+        # node 1 re-staged from the speculated base: built once per node
+        assert built == [(2, 0), (2, 1)] and applied == [0, 1, 1]
+        assert staged.nodes[1].config.read_text().endswith("6)]")
+        assert staged.nodes[0].config.is_file() and 2 not in staged.nodes
+        assert len(list((Path(tmp) / "staging" / "round-2").iterdir())) == 2
+        # no speculation: everything is built on demand
+        cold = prefetcher.materialize(_plan(3, 1, 5)).result()
+        assert (cold.hits, cold.misses) == (0, 2)
+        prefetcher.close()
+        assert not (Path(tmp) / "staging").exists()
+
+
+def test_scheduler_fork_predicts_uncommitted_next_round() -> None:
+    seeds = [Seed(seed_id="t-normal", corpus="T", role="normal")]
+    sched = TwoLevelScheduler("geth", GETH_ITEMS, seeds, 6, [0, 1],
+                              random.Random(3), exploration_rounds=2)
+    mei = MeiState()
+    sched.next_round(mei)
+    guess = sched.fork().next_round(mei)
+    real = sched.next_round(mei)
+    assert guess.round_id == real.round_id == 2
+    assert [p.mutations for p in guess.placements] == \
+        [p.mutations for p in real.placements]
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all pipeline tests passed")
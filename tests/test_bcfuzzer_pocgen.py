@@ -0,0 +1,78 @@
+"""pocgen: a minimized sim report becomes a deterministic case directory
+whose poc.sh passes on its own and runs as a generated BugSpec."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.minimize import run_minimization  # noqa: E402
+from bcfuzzer.pocgen import oracle_line, run_pocgen  # noqa: E402
+from bcfuzzer_campaign import Campaign  # noqa: E402
+from full_bcfuzzer import load_generated_specs, run_bug  # noqa: E402
+
+REPO = Path(__file__).resolve().parent.parent
+
+
+def test_minimized_report_becomes_a_passing_case() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        out, cases = Path(tmp) / "campaign", Path(tmp) / "cases"
+        with contextlib.redirect_stdout(io.StringIO()):
+            Campaign("sim", out, 13, [0, 1, 2, 3], seed=9,
+                     resume_state=None).run_fuzz(12, None, None)
+            campaign = Campaign("sim", out, 13, [0, 1, 2, 3], seed=9,
+                                resume_state=out / "state")
+            run_minimization(campaign, ["bcfuzzer-000", "bcfuzzer-001"])
+            specs = run_pocgen(campaign, None, cases)
+        # sibling reports of one failure share the first one's case
+        spec, = specs
+        assert spec["bug_id"] == "sm-fz01"
+        assert spec["source"].startswith("bcfuzzer-000@")
+        case_dir = Path(spec["dir"])
+        assert case_dir.name == "01_gaslimit_collapse"
+        files = {p.name: p.read_bytes() for p in case_dir.iterdir()}
+        assert sorted(files) == ["README.md", "bugspec.json", "poc.sh"]
+        assert b"miner.gas_ceil = 5000" in files["poc.sh"]
+        # regeneration is byte-identical and reuses the directory
+        with contextlib.redirect_stdout(io.StringIO()):
+            again = run_pocgen(campaign, ["bcfuzzer-000"], cases)
+        assert again[0]["dir"] == spec["dir"]
+        assert {p.name: p.read_bytes() for p in case_dir.iterdir()} == files
+
+        # a half-written or incomplete spec is skipped, not fatal
+        for name, text in (("02_truncated", '{"bug_id": "sm-fz02", "ta'),
+                           ("03_incomplete", '{"bug_id": "sm-fz03"}')):
+            (cases / "sim" / name).mkdir()
+            (cases / "sim" / name / "bugspec.json").write_text(text)
+        with contextlib.redirect_stderr(io.StringIO()) as err:
+            generated, = load_generated_specs(cases)
+        assert err.getvalue().count("warning: skipping") == 2
+        assert generated.bug_id == "sm-fz01" and generated.target == "sim"
+        assert generated.script_path == case_dir / "poc.sh"
+        os.environ["BCFZ_REPO"] = str(REPO)
+        try:
+            with contextlib.redirect_stdout(io.StringIO()):
+                result = run_bug(generated, Path(tmp) / "regress")
+        finally:
+            del os.environ["BCFZ_REPO"]
+        assert result["status"] == "pass", result
+        log = (Path(tmp) / "regress" / "sim" / "sm-fz01" /
+               "run.log").read_text()
+        pattern, = json.loads(files["bugspec.json"])["success_patterns"]
+        assert pattern == oracle_line("sim_gaslimit_collapse", 4)
+        assert pattern in log and "[POC PASS]" in log
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all pocgen tests passed")
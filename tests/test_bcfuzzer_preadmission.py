@@ -0,0 +1,91 @@
+"""Static pre-admission: known rules predict rejections, unknowns never do,
+sampled contradictions retire an item, and predicted nodes skip restarts."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import json
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.common import ItemSpec, MutationOp  # noqa: E402
+from bcfuzzer.preadmission import (PreAdmission, _coerce,  # noqa: E402
+                                   value_error)
+from bcfuzzer_campaign import Campaign  # noqa: E402
+
+
+def test_value_rules() -> None:
+    port = ItemSpec("p2p.port", "int", 30303, bounds=(1, 65535),
+                    dangerous_legal=[0])
+    assert value_error(port, 8545) is None
+    assert value_error(port, 0) is None             # dangerous but legal
+    assert "outside" in value_error(port, 70000)
+    assert "not an int" in value_error(port, "abc")
+    assert value_error(port, None) is None          # unread: no verdict
+    assert _coerce("70000", port) == 70000
+    assert _coerce('"70000"', port) == "70000"       # quoted stays a string
+    sync = ItemSpec("sync.mode", "enum", "snap", enum=["snap", "full"])
+    assert value_error(sync, "full") is None
+    assert "not in" in value_error(sync, "light")
+    seeds = ItemSpec("net.seeds", "list", [])
+    good = "/ip4/127.0.0.1/tcp/11301/p2p/QmXjnH3Yq8Vt4D8cVnJ3K7hN2sRtGgF5"
+    assert value_error(seeds, [good]) is None
+    assert "malformed" in value_error(seeds, [good, "127.0.0.1:11301"])
+    service = ItemSpec("safety_rules.service", "nested", None,
+                       enum=[{"type": "local"},
+                             {"type": "process", "server_address": ""}],
+                       nested_members=["server_address"])
+    assert value_error(service, {"type": "local"}) is None
+    assert "missing" in value_error(service, {"type": "process"})
+    assert "unknown variant" in value_error(service, {"type": "thread"})
+
+
+def test_sampling_and_untrusted_items() -> None:
+    item = ItemSpec("a.b", "int", 1, bounds=(0, 10), file="node.ini")
+    op = MutationOp("m1", "a.b", "boundary", 1, 99, file="node.ini")
+    with tempfile.TemporaryDirectory() as tmp:
+        path = Path(tmp) / "node.ini"
+        path.write_text("[a]\nb = 99\n")
+        checker = PreAdmission([item], sample_every=4)
+        assert "outside" in checker.check([path], [op])
+        assert "dry run: refused" in checker.check(
+            [path], [MutationOp("m2", "x.y", "flip", file="node.ini")],
+            dry_run=lambda: "refused")
+        picks = [checker.sampled(r, 0) for r in range(200)]
+        assert 0 < sum(picks) < 200
+        assert picks == [checker.sampled(r, 0) for r in range(200)]
+        checker.settle([op], admitted=True)         # the rule was wrong
+        assert checker.check([path], [op]) is None
+        assert checker.summary()["untrusted"] == ["a.b"]
+        assert PreAdmission([item], sample_every=0).check([path], [op]) \
+            is None
+
+
+def test_sim_campaign_skips_predicted_restarts() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        campaign = Campaign("sim", Path(tmp), 13, [0, 1, 2, 3], seed=9,
+                            resume_state=None)
+        with contextlib.redirect_stdout(io.StringIO()):
+            campaign.run_fuzz(300, None, None)
+        stats = campaign.preadmission.summary()
+        assert stats["skipped"] > 0 and stats["contradicted"] == 0
+        rows = [json.loads(line) for line in
+                (Path(tmp) / "timeline.jsonl").read_text().splitlines()]
+        predicted = [(row, node) for row in rows
+                     for node, p in row.get("preadmission", {}).items()
+                     if not p["sampled"]]
+        assert len(predicted) == stats["skipped"]
+        for row, node in predicted:
+            assert row["verdicts"][str(node)] is False
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all preadmission tests passed")
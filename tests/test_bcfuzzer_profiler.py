@@ -0,0 +1,77 @@
+"""Span profiler: nesting, no-op without a profile, aggregation, report."""
+
+from __future__ import annotations
+
+import json
+import sys
+import tempfile
+import threading
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.profiler import aggregate, profiled, profiling, span  # noqa: E402
+from bcfuzzer.readiness import wait_until  # noqa: E402
+from bcfuzzer_profile import load_profiles, render_folded, render_table  # noqa: E402
+
+
+class _Net:
+    @profiled()
+    def restart_node(self) -> str:
+        with span("inner"):
+            return "ok"
+
+
+def test_spans_nest_under_the_open_profile() -> None:
+    with profiling("round", target="geth") as root:
+        with span("admission", nodes=2):
+            assert _Net().restart_node() == "ok"
+        wait_until("peers", lambda: True, 1)
+    tree = root.to_dict()
+    assert tree["target"] == "geth" and tree["name"] == "round"
+    admission, wait = tree["children"]
+    assert admission["nodes"] == 2
+    assert admission["children"][0]["name"] == "_Net.restart_node"
+    assert admission["children"][0]["children"][0]["name"] == "inner"
+    assert wait["name"] == "wait.peers"
+    assert tree["sec"] >= admission["sec"] >= 0
+
+
+def test_spans_are_noops_without_a_profile() -> None:
+    with span("loose") as node:
+        assert node is None
+    assert _Net().restart_node() == "ok"
+    # another thread's profile does not collect this thread's spans
+    with profiling("round") as root:
+        worker = threading.Thread(target=_Net().restart_node)
+        worker.start()
+        worker.join()
+    assert root.children == []
+
+
+def test_aggregate_and_report() -> None:
+    tree = {"name": "round", "sec": 10.0, "target": "fisco", "children": [
+        {"name": "seeds", "sec": 6.0, "children": [
+            {"name": "seed.tx", "sec": 4.0}]},
+        {"name": "observe", "sec": 3.0}]}
+    stats = aggregate([tree, tree])
+    assert stats[("round",)] == {"n": 2, "sec": 20.0, "self": 2.0}
+    assert stats[("round", "seeds")]["self"] == 4.0
+    with tempfile.TemporaryDirectory() as tmp:
+        timeline = Path(tmp) / "timeline.jsonl"
+        timeline.write_text(json.dumps({"round": 1, "profile": tree}) + "\n"
+                            + json.dumps({"round": 2}) + "\n{truncated")
+        by_target = load_profiles([Path(tmp)])
+    assert list(by_target) == ["fisco"] and len(by_target["fisco"]) == 1
+    table = render_table("fisco", by_target["fisco"], 0.0)
+    assert "    seed.tx" in table.splitlines()[4]
+    assert "fisco;round;seeds;seed.tx 4000" in \
+        render_folded("fisco", by_target["fisco"]).splitlines()
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all profiler tests passed")
@@ -0,0 +1,89 @@
+"""Readiness waits: early return, deadlines, log wakeups, per-round records."""
+
+from __future__ import annotations
+
+import socket
+import sys
+import tempfile
+import threading
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.logtail import LogTail  # noqa: E402
+from bcfuzzer.readiness import (  # noqa: E402
+    DirWatch, port_open, recording, summarize, wait_closed, wait_log,
+    wait_until)
+
+
+def test_wait_returns_on_condition_and_records_budget() -> None:
+    ready_at = time.monotonic() + 0.3
+    with recording() as waits:
+        t0 = time.monotonic()
+        assert wait_until("cond", lambda: time.monotonic() >= ready_at, 10)
+        assert time.monotonic() - t0 < 2.0
+        assert not wait_until("never", lambda: False, 0.3)
+        # a raising condition is "not yet"; fail() aborts before the deadline
+        t0 = time.monotonic()
+        assert not wait_until("dead", lambda: 1 / 0, 10, fail=lambda: True)
+        assert time.monotonic() - t0 < 1.0
+    summary = summarize(waits)
+    assert summary["cond"]["n"] == 1 and summary["cond"]["timeouts"] == 0
+    assert summary["cond"]["budget"] == 10 and summary["cond"]["sec"] < 2.0
+    assert summary["never"]["timeouts"] == 1
+    assert summary["dead"]["timeouts"] == 1
+
+
+def test_recording_is_per_thread_and_nests() -> None:
+    with recording() as outer:
+        with recording() as inner:
+            wait_until("a", lambda: True, 1)
+        other = threading.Thread(
+            target=lambda: wait_until("b", lambda: True, 1))
+        other.start()
+        other.join()
+    assert [w.name for w in inner] == ["a"]
+    assert [w.name for w in outer] == ["a"]
+
+
+def test_log_wait_wakes_on_append() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        log_dir = Path(tmp)
+        log = log_dir / "node.log"
+        log.write_text("boot\n")
+        tail = LogTail(lambda: sorted(log_dir.glob("*.log")),
+                       patterns=["reachNewView"])
+
+        def append() -> None:
+            time.sleep(0.3)
+            with log.open("a") as fh:
+                fh.write("reachNewView view=1\n")
+
+        writer = threading.Thread(target=append)
+        writer.start()
+        t0 = time.monotonic()
+        assert wait_log("log", tail, "reachNewView", timeout=10)
+        assert time.monotonic() - t0 < 2.5
+        writer.join()
+        with DirWatch([log_dir]) as watch:
+            log.write_text("x\n")
+            assert watch.wait(1.0) or watch.fd < 0
+
+
+def test_port_waits() -> None:
+    server = socket.socket()
+    server.bind(("127.0.0.1", 0))
+    server.listen()
+    port = server.getsockname()[1]
+    assert port_open(port)
+    threading.Timer(0.2, server.close).start()
+    assert wait_closed("closed", port, 5)
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all readiness tests passed")
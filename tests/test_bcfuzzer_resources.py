@@ -0,0 +1,124 @@
+"""Resource pool: disjoint port blocks, admission control, stale leases."""
+
+from __future__ import annotations
+
+import os
+import subprocess
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.resources import (  # noqa: E402
+    LEASE_ENV, RESOURCE_ENV, TARGET_PORTS, ResourcePool, claim_ports,
+    free_offset, lane_families, lane_offsets)
+
+
+def _ports(lease) -> set[int]:
+    return {p for base, count in lease.ranges for p in range(base, base + count)}
+
+
+def test_concurrent_legs_get_disjoint_ports_and_scratch() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = ResourcePool(Path(tmp), capacity=(64.0, 256.0))
+        leases = [pool.try_acquire(f"leg-{t}", t, 13)
+                  for t in ("fisco", "geth", "chainmaker", "aptos")]
+        assert all(leases)
+        # geth's p2p range (30310+) would sit inside fisco's at offset 0
+        assert leases[0].port_offset == 0 and leases[1].port_offset > 0
+        seen: set[int] = set()
+        for lease in leases:
+            assert not (_ports(lease) & seen)
+            seen |= _ports(lease)
+        assert len({lease.scratch for lease in leases}) == 4
+        assert all(Path(lease.scratch).is_dir() for lease in leases)
+        pool.release(leases[0])
+        again = pool.try_acquire("leg-fisco-2", "fisco", 13)
+        assert again.port_offset == 0
+
+
+def test_admission_waits_for_capacity_and_reclaims_dead_owners() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = ResourcePool(Path(tmp), capacity=(10.0, 20.0),
+                            headroom=(0.0, 0.0))
+        first = pool.try_acquire("a", "aptos")          # 8 cores, 16 GiB
+        assert first is not None
+        assert pool.try_acquire("b", "geth") is None    # 12 > 10 cores
+        # a lease owned by a pid that no longer exists is reclaimed
+        dead = subprocess.Popen([sys.executable, "-c", "pass"])
+        dead.wait()
+        pool.release(first)
+        assert pool.try_acquire("c", "aptos", pid=dead.pid) is not None
+        assert pool.try_acquire("b", "geth") is not None
+        # an idle host always admits one leg, however large
+        small = ResourcePool(Path(tmp) / "small", capacity=(2.0, 2.0))
+        assert small.try_acquire("big", "aptos") is not None
+
+
+def test_free_offset_skips_taken_blocks() -> None:
+    families = TARGET_PORTS["fisco"](13)
+    assert free_offset(families, []) == 0
+    assert free_offset(families, [(30305, 1)]) == 100
+    assert free_offset(families, [(20200, 300)]) == 300
+
+
+def test_instance_lanes_stack_disjoint_port_blocks() -> None:
+    families = TARGET_PORTS["geth"](13)
+    offsets = lane_offsets(families, 200, 3)
+    assert offsets[0] == 200 and len(set(offsets)) == 3
+    lanes = [{p for base, count in families
+              for p in range(base + off, base + off + count)}
+             for off in offsets]
+    assert not (lanes[0] & lanes[1]) and not (lanes[1] & lanes[2])
+    assert lane_offsets(families, 200, 1) == [200]
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = ResourcePool(Path(tmp), capacity=(64.0, 256.0))
+        lease = pool.try_acquire("leg-geth", "geth", 13, instances=3)
+        assert lease.cores == 12.0
+        assert len(lease.ranges) == len(lane_families(families, 3))
+        # a second leg clears every lane of the first
+        other = pool.try_acquire("leg-fisco", "fisco", 13)
+        assert not (_ports(other) & _ports(lease))
+
+
+def test_aptos_claims_its_swarm_ports_after_launch() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        pool = ResourcePool(Path(tmp), capacity=(64.0, 256.0))
+        aptos = pool.try_acquire("leg-aptos", "aptos", 4)
+        assert aptos.ranges == [] and aptos.env()[LEASE_ENV] == "leg-aptos"
+        # forge bound a validator port inside fisco's offset-0 block
+        assert pool.claim("leg-aptos", [(30302, 1), (8080, 1)]) == []
+        assert pool.claim("leg-aptos", [(8080, 1)]) == []      # idempotent
+        fisco = pool.try_acquire("leg-fisco", "fisco", 13)
+        assert fisco.port_offset == 100
+        assert 30302 not in _ports(fisco) and 8080 not in _ports(fisco)
+        # a port already in another lease is reported back as a clash
+        assert pool.claim("leg-aptos", [(30400, 1)]) == [(30400, 1)]
+        # only the launcher's legs claim; an unknown leg changes nothing
+        assert pool.claim("nobody", [(9000, 1)]) == []
+        env = {RESOURCE_ENV: tmp, LEASE_ENV: "leg-aptos"}
+        saved = {k: os.environ.get(k) for k in env}
+        os.environ.update(env)
+        try:
+            assert claim_ports([(30401, 1)]) == [(30401, 1)]
+            del os.environ[LEASE_ENV]
+            assert claim_ports([(30402, 1)]) == []
+        finally:
+            for k, v in saved.items():
+                if v is None:
+                    os.environ.pop(k, None)
+                else:
+                    os.environ[k] = v
+        claimed = next(lease for lease in pool._live_leases()
+                       if lease.leg == "leg-aptos")
+        assert [30401, 1] in claimed.ranges
+        assert [30402, 1] not in claimed.ranges
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all resources tests passed")
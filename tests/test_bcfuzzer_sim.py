@@ -0,0 +1,115 @@
+"""Sim target: model consensus, catalog admission, planted faults, and a
+deterministic end-to-end campaign."""
+
+from __future__ import annotations
+
+import json
+import random
+import re
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.common import Seed  # noqa: E402
+from bcfuzzer.targets.sim_adapter import SimAdapter  # noqa: E402
+from bcfuzzer.targets.sim_net import (  # noqa: E402
+    MIN_GAS_LIMIT, SimFault, SimNetwork, SimProfile)
+from bcfuzzer_campaign import Campaign  # noqa: E402
+
+
+def _network(tmp: str, faults: list[str] | None = None) -> SimNetwork:
+    net = SimNetwork(Path(tmp) / "runtime", n_nodes=5,
+                     profile=SimProfile(faults=faults or []))
+    net.build()
+    assert net.start_all()
+    return net
+
+
+def _set(net: SimNetwork, index: int, key: str, value: str) -> None:
+    config = net.node_dir(index) / "config.ini"
+    config.write_text(re.sub(rf"(?m)^(\s*{key} = ).*$", rf"\g<1>{value}",
+                             config.read_text()), encoding="utf-8")
+
+
+def test_blocks_rotate_leaders_and_grow_logs() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        net = _network(tmp)
+        assert net.tick(10) == 10
+        assert {net.height(i) for i in range(5)} == {12}
+        net.stop_node(2)
+        sealed = net.tick(5)            # node 2's turn costs a view change
+        assert sealed == 4 and net.height(2) == -1 and net.nodes[2].height == 12
+        assert net.log_counts(0)["triggerTimeout"] == 1
+        lines = (net.node_dir(0) / "log" / "node.log").read_text()
+        assert lines.count("commit block") == 16
+
+
+def test_admission_follows_the_catalog() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        net = _network(tmp)
+        adapter = SimAdapter(random.Random(1))
+        _set(net, 1, "block_interval_ms", "0")          # below bounds
+        assert not adapter.probe_admission(net, 1)
+        assert not net.alive(1)
+        assert net.log_counts(1)["config rejected"] == 1
+        _set(net, 1, "block_interval_ms", "1000")
+        _set(net, 1, "max_peers", "1")                  # legal, isolated
+        assert not adapter.probe_admission(net, 1) and net.alive(1)
+
+
+def test_planted_faults() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        net = _network(tmp, ["stall@*+10/5", "panic@3+20"])
+        adapter = SimAdapter(random.Random(1))
+        net.tick(8)
+        before = net.height(0)
+        assert net.tick(5) < 3                          # consensus halted
+        net.tick(10)
+        assert not net.alive(3) and net.height(0) > before
+        # sim-02: a collapsed leader drags the head gas limit down
+        _set(net, 0, "gas_ceil", "0")
+        net.start_node(0)
+        net.rotate_leader(0)
+        net.tick()
+        assert net.gas_limit(1) < 10 * MIN_GAS_LIMIT
+        # sim-03: a batch wave on a batch-pool leader panics the verifiers
+        _set(net, 4, "pool_type", "batch")
+        net.start_node(4)
+        wave = Seed("w", "T", payload={"kind": "batch_wave", "count": 10})
+        assert adapter.submit_seed(net, wave, {"node_index": 4})["invoked"]
+        net.rotate_leader(4)
+        net.tick()
+        probe = adapter.node_probes(net, 1)
+        assert probe["panic_signatures"]["index out of range"] == 1
+    assert SimFault.parse("stall@*+3/2").active(4)
+    assert not SimFault.parse("crash@1+3").active(2)
+
+
+def _run(tmp: Path) -> tuple[list[dict], dict]:
+    campaign = Campaign("sim", tmp, 7, [0, 1], seed=5, resume_state=None)
+    result = campaign.run_fuzz(25, None, None)
+    timeline = [json.loads(line) for line in
+                (tmp / "timeline.jsonl").read_text().splitlines()]
+    return timeline, result
+
+
+def test_campaign_is_deterministic() -> None:
+    with tempfile.TemporaryDirectory() as a, \
+            tempfile.TemporaryDirectory() as b:
+        first, result = _run(Path(a))
+        second, _ = _run(Path(b))
+    assert result["rounds"] == 25 and len(first) == 25
+    keys = ("round_id", "verdicts", "mutations", "seeds", "failures")
+    assert [{k: r[k] for k in keys} for r in first] == \
+        [json.loads(json.dumps({k: r[k] for k in keys})) for r in second]
+    assert first[0]["profile"]["target"] == "sim"
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all sim tests passed")
@@ -0,0 +1,152 @@
+"""Snapshot store: keying, log-free freeze, clone with root rewrite."""
+
+from __future__ import annotations
+
+import os
+import sys
+import tempfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from bcfuzzer.resources import TARGET_PORTS  # noqa: E402
+from bcfuzzer.snapshot import SnapshotStore, rebase_port_text  # noqa: E402
+from bcfuzzer.targets.sim_net import SimNetwork  # noqa: E402
+
+
+class _Net:
+    def __init__(self, binary: Path, offset: int) -> None:
+        self.binary = binary
+        self.offset = offset
+        self.attached = 0
+
+    def snapshot_identity(self) -> dict:
+        return {"binaries": [self.binary], "layout": {"port_offset": self.offset}}
+
+    def attach(self) -> None:
+        self.attached += 1
+
+
+def _populate(runtime: Path) -> None:
+    node = runtime / "node0"
+    (node / "log").mkdir(parents=True)
+    (node / "log" / "log_2024.log").write_text("reachNewView\n")
+    (node / "data").mkdir()
+    (node / "data" / "block.db").write_bytes(b"\0\1" + str(runtime).encode())
+    (node / "config.ini").write_text(f"data_path={runtime}/node0/data\n")
+    (node / "start.log").write_text("old run\n")
+    (node / "conf").symlink_to(runtime / "node0" / "data")
+
+
+def test_key_tracks_binary_and_layout() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        binary = Path(tmp) / "node-bin"
+        binary.write_bytes(b"v1")
+        store = SnapshotStore(Path(tmp) / "store")
+        key = store.key("fisco", _Net(binary, 7).snapshot_identity())
+        assert key == store.key("fisco", _Net(binary, 7).snapshot_identity())
+        assert key != store.key("fisco", _Net(binary, 8).snapshot_identity())
+        assert key != store.key("fisco", _Net(binary, 7).snapshot_identity(),
+                                stage="built")
+        binary.write_bytes(b"v2-rebuilt")
+        os.utime(binary, ns=(1, 1))
+        assert key != store.key("fisco", _Net(binary, 7).snapshot_identity())
+
+
+def test_freeze_and_clone_rewrites_root() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        binary = tmp / "node-bin"
+        binary.write_bytes(b"v1")
+        store = SnapshotStore(tmp / "store")
+        first = tmp / "rt-a"
+        _populate(first)
+        net = _Net(binary, 1)
+        built: list[int] = []
+        assert not store.provision(net, "fisco", first,
+                                   lambda: built.append(1))
+        assert built == [1] and store.stats["freezes"] == 1
+
+        second = tmp / "rt-b"
+        (second / "stale").mkdir(parents=True)
+        assert store.provision(net, "fisco", second, lambda: built.append(2))
+        assert built == [1] and net.attached == 1
+        node = second / "node0"
+        assert not (second / "stale").exists()
+        assert (node / "log").is_dir() and not list((node / "log").iterdir())
+        assert not (node / "start.log").exists()
+        assert (node / "config.ini").read_text() == \
+            f"data_path={second}/node0/data\n"
+        assert os.readlink(node / "conf") == str(second / "node0" / "data")
+        # binary data files are cloned byte for byte, never rewritten
+        assert (node / "data" / "block.db").read_bytes() == \
+            b"\0\1" + str(first).encode()
+        # the template itself is untouched by the clone's writes
+        (node / "config.ini").write_text("mutated\n")
+        third = tmp / "rt-c"
+        store.clone(store.key("fisco", net.snapshot_identity(), "built"), third)
+        assert (third / "node0" / "config.ini").read_text() == \
+            f"data_path={third}/node0/data\n"
+
+
+class _PortedNet(_Net):
+    """A network whose configs bake in its port offset."""
+
+    def __init__(self, binary: Path, offset: int) -> None:
+        super().__init__(binary, offset)
+        self.port_offset = offset
+        self.rebased: list[int] = []
+
+    def snapshot_identity(self) -> dict:
+        return {"binaries": [self.binary], "layout": {"n": 4}}
+
+    def rebase_ports(self, old_offset: int) -> None:
+        self.rebased.append(old_offset)
+
+
+def test_one_template_serves_every_port_offset() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        tmp = Path(tmp)
+        store = SnapshotStore(tmp / "store")
+        # the key no longer depends on the runtime path or lane offset
+        keys = {store.key("sim", SimNetwork(tmp / rt, 4, port_offset=off)
+                          .snapshot_identity())
+                for rt, off in (("a", 0), ("b", 200), ("c", 400))}
+        assert len(keys) == 1
+        binary = tmp / "node-bin"
+        binary.write_bytes(b"v1")
+        first = tmp / "rt-a"
+        _populate(first)
+        built = _PortedNet(binary, 100)
+        assert not store.provision(built, "fisco", first, lambda: None)
+        same = _PortedNet(binary, 100)
+        assert store.provision(same, "fisco", tmp / "rt-b", lambda: None)
+        assert same.rebased == [] and same.attached == 1
+        moved = _PortedNet(binary, 300)
+        assert store.provision(moved, "fisco", tmp / "rt-c", lambda: None)
+        assert moved.rebased == [100] and moved.attached == 1
+
+
+def test_rebase_port_text_moves_only_family_ports() -> None:
+    families = TARGET_PORTS["fisco"](4)
+    config = ("[p2p]\n    listen_ip=0.0.0.0\n    listen_port=30402\n"
+              "[rpc]\n    listen_port=20302\n    thread_count=8\n"
+              "[tx]\n    gas_limit=3000000000\n")
+    moved = rebase_port_text(config, families, 100, 2000)
+    assert "listen_port=32302" in moved and "listen_port=22202" in moved
+    # numbers outside the port families stay as they were
+    assert "thread_count=8" in moved
+    assert "gas_limit=3000000000" in moved and "0.0.0.0" in moved
+    # a port past the network's node count is not one of its ports
+    peers = '{"nodes":["127.0.0.1:30400","127.0.0.1:30403","127.0.0.1:30404"]}'
+    assert rebase_port_text(peers, families, 100, 0) == \
+        '{"nodes":["127.0.0.1:30300","127.0.0.1:30303","127.0.0.1:30404"]}'
+    assert rebase_port_text(config, families, 100, 100) == config
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all snapshot tests passed")
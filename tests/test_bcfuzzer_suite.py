@@ -0,0 +1,133 @@
+"""Parallel PoC suite: a target's specs never overlap, independent lanes
+do, results keep the registry order whatever finishes first, and a PoC's
+verdict line is seen as it is printed."""
+
+from __future__ import annotations
+
+import contextlib
+import io
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+import full_bcfuzzer  # noqa: E402
+from full_bcfuzzer import BugSpec, run_suite  # noqa: E402
+
+
+def _spec(root: Path, bug_id: str, target: str, seconds: float,
+          verdict: str = "[POC PASS]", teardown: float = 0) -> BugSpec:
+    script = root / f"{bug_id}.sh"
+    script.write_text(
+        f'echo "start $(date +%s.%N)" >> "{root}/{bug_id}.times"\n'
+        f"sleep {seconds}\n"
+        f'echo "end $(date +%s.%N)" >> "{root}/{bug_id}.times"\n'
+        f'echo "{verdict}"\n'
+        f"sleep {teardown}\n", encoding="utf-8")
+    return BugSpec(bug_id, target, bug_id, "test", script.name, 30,
+                   ("[POC PASS]",), root=root)
+
+
+def _window(root: Path, bug_id: str) -> tuple[float, float]:
+    stamps = dict(line.split() for line in
+                  (root / f"{bug_id}.times").read_text().splitlines())
+    return float(stamps["start"]), float(stamps["end"])
+
+
+def _run(specs: list[BugSpec], out: Path, jobs: int,
+         stop: bool = False, grace: float | None = None) -> list[dict]:
+    saved = dict(full_bcfuzzer.TARGET_REPOS)
+    full_bcfuzzer.TARGET_REPOS["geth"] = out.parent
+    try:
+        with contextlib.redirect_stdout(io.StringIO()), \
+                contextlib.redirect_stderr(io.StringIO()):
+            return run_suite(specs, out, jobs, stop_on_failure=stop,
+                             interval=0.1, grace=grace)
+    finally:
+        full_bcfuzzer.TARGET_REPOS.clear()
+        full_bcfuzzer.TARGET_REPOS.update(saved)
+
+
+def test_lanes_serialize_a_target_and_overlap_the_rest() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        specs = [_spec(root, "ge-a", "geth", 0.6),
+                 _spec(root, "ge-b", "geth", 0.1),
+                 _spec(root, "sm-a", "sim", 0.6),
+                 _spec(root, "sm-b", "sim", 0.6)]
+        started = time.monotonic()
+        results = _run(specs, root / "out", jobs=4)
+        elapsed = time.monotonic() - started
+        assert [r["bug_id"] for r in results] == ["ge-a", "ge-b",
+                                                  "sm-a", "sm-b"]
+        assert all(r["status"] == "pass" for r in results)
+        # one geth PoC at a time; the sim replays ran beside them
+        assert _window(root, "ge-a")[1] <= _window(root, "ge-b")[0]
+        assert _window(root, "sm-a")[0] < _window(root, "ge-a")[1]
+        assert _window(root, "sm-b")[0] < _window(root, "sm-a")[1]
+        assert elapsed < 1.6
+
+
+def test_stop_on_failure_starts_nothing_new() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        specs = [_spec(root, "ge-a", "geth", 0, verdict="no"),
+                 _spec(root, "ge-b", "geth", 0)]
+        results = _run(specs, root / "out", jobs=2, stop=True)
+        assert [(r["bug_id"], r["status"]) for r in results] == \
+            [("ge-a", "fail")]
+        assert not (root / "ge-b.times").exists()
+        assert len(_run(specs, root / "again", jobs=1)) == 2
+
+
+def test_a_harness_error_is_recorded_not_dropped() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        specs = [_spec(root, "ge-a", "geth", 0),
+                 _spec(root, "sm-a", "sim", 0)]
+        saved = dict(full_bcfuzzer.TARGET_REPOS)
+        full_bcfuzzer.TARGET_REPOS["sim"] = root / "missing"
+        try:
+            results = _run(specs, root / "out", jobs=2)
+        finally:
+            full_bcfuzzer.TARGET_REPOS.clear()
+            full_bcfuzzer.TARGET_REPOS.update(saved)
+        assert [(r["bug_id"], r["status"]) for r in results] == \
+            [("ge-a", "pass"), ("sm-a", "error")]
+        assert "FileNotFoundError" in results[1]["harness_error"]
+        assert (root / "out" / "sim" / "sm-a" / "result.json").exists()
+
+
+def test_verdict_is_streamed_and_can_stop_the_teardown() -> None:
+    with tempfile.TemporaryDirectory() as tmp:
+        root = Path(tmp)
+        specs = [_spec(root, "sm-a", "sim", 0.2, teardown=1.0),
+                 _spec(root, "sm-b", "sim", 0.2, verdict="[POC FAIL]",
+                       teardown=30),
+                 _spec(root, "sm-c", "sim", 0.2, verdict="still going",
+                       teardown=0)]
+        waited, = _run(specs[:1], root / "waited", jobs=1)
+        assert waited["status"] == "pass"
+        assert not waited["stopped_after_verdict"]
+        assert waited["time_to_verdict_seconds"] < 0.8
+        assert waited["elapsed_seconds"] >= 1.2
+        started = time.monotonic()
+        passed, failed, silent = _run(specs, root / "stopped", jobs=3,
+                                      grace=0.2)
+        assert time.monotonic() - started < 5
+        assert passed["status"] == "pass" and passed["stopped_after_verdict"]
+        assert passed["elapsed_seconds"] < 1.0
+        # stopped after its own failure line: a fail, not an error
+        assert failed["status"] == "fail" and failed["stopped_after_verdict"]
+        assert silent["status"] == "fail"
+        assert silent["time_to_verdict_seconds"] is None
+
+
+if __name__ == "__main__":
+    for name, fn in sorted(globals().items()):
+        if name.startswith("test_") and callable(fn):
+            fn()
+            print(f"PASS {name}")
+    print("all suite tests passed")